@@ -22,6 +22,7 @@
 #ifndef FAST_DDS_GENERATED__ICD_PKG_ICD_HPP
 #define FAST_DDS_GENERATED__ICD_PKG_ICD_HPP
 
+#include <array>
 #include <cstdint>
 #include <string>
 #include <utility>
@@ -217,6 +218,386 @@ public:
 
 
 
+private:
+
+    uint32_t m_index{0};
+    std::string m_message;
+
+};
+
+const uint32_t FIXED_MESSAGE_CAPACITY = 4096;
+/*!
+ * @brief This class represents the structure HelloWorldFixed defined by the user in the IDL file.
+ * @ingroup ICD
+ */
+class HelloWorldFixed
+{
+public:
+
+    /*!
+     * @brief Default constructor.
+     */
+    eProsima_user_DllExport HelloWorldFixed()
+    {
+    }
+
+    /*!
+     * @brief Default destructor.
+     */
+    eProsima_user_DllExport ~HelloWorldFixed()
+    {
+    }
+
+    /*!
+     * @brief Copy constructor.
+     * @param x Reference to the object HelloWorldFixed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldFixed(
+            const HelloWorldFixed& x)
+    {
+                    m_index = x.m_index;
+
+                    m_length = x.m_length;
+
+                    m_message = x.m_message;
+
+    }
+
+    /*!
+     * @brief Move constructor.
+     * @param x Reference to the object HelloWorldFixed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldFixed(
+            HelloWorldFixed&& x) noexcept
+    {
+        m_index = x.m_index;
+        m_length = x.m_length;
+        m_message = std::move(x.m_message);
+    }
+
+    /*!
+     * @brief Copy assignment.
+     * @param x Reference to the object HelloWorldFixed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldFixed& operator =(
+            const HelloWorldFixed& x)
+    {
+
+                    m_index = x.m_index;
+
+                    m_length = x.m_length;
+
+                    m_message = x.m_message;
+
+        return *this;
+    }
+
+    /*!
+     * @brief Move assignment.
+     * @param x Reference to the object HelloWorldFixed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldFixed& operator =(
+            HelloWorldFixed&& x) noexcept
+    {
+
+        m_index = x.m_index;
+        m_length = x.m_length;
+        m_message = std::move(x.m_message);
+        return *this;
+    }
+
+    /*!
+     * @brief Comparison operator.
+     * @param x HelloWorldFixed object to compare.
+     */
+    eProsima_user_DllExport bool operator ==(
+            const HelloWorldFixed& x) const
+    {
+        return (m_index == x.m_index &&
+           m_length == x.m_length &&
+           m_message == x.m_message);
+    }
+
+    /*!
+     * @brief Comparison operator.
+     * @param x HelloWorldFixed object to compare.
+     */
+    eProsima_user_DllExport bool operator !=(
+            const HelloWorldFixed& x) const
+    {
+        return !(*this == x);
+    }
+
+    /*!
+     * @brief This function sets a value in member index
+     * @param _index New value for member index
+     */
+    eProsima_user_DllExport void index(
+            uint32_t _index)
+    {
+        m_index = _index;
+    }
+
+    /*!
+     * @brief This function returns the value of member index
+     * @return Value of member index
+     */
+    eProsima_user_DllExport uint32_t index() const
+    {
+        return m_index;
+    }
+
+    /*!
+     * @brief This function returns a reference to member index
+     * @return Reference to member index
+     */
+    eProsima_user_DllExport uint32_t& index()
+    {
+        return m_index;
+    }
+
+
+    /*!
+     * @brief This function sets a value in member length
+     * @param _length New value for member length
+     */
+    eProsima_user_DllExport void length(
+            uint32_t _length)
+    {
+        m_length = _length;
+    }
+
+    /*!
+     * @brief This function returns the value of member length
+     * @return Value of member length
+     */
+    eProsima_user_DllExport uint32_t length() const
+    {
+        return m_length;
+    }
+
+    /*!
+     * @brief This function returns a reference to member length
+     * @return Reference to member length
+     */
+    eProsima_user_DllExport uint32_t& length()
+    {
+        return m_length;
+    }
+
+
+    /*!
+     * @brief This function copies the value in member message
+     * @param _message New value to be copied in member message
+     */
+    eProsima_user_DllExport void message(
+            const std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY>& _message)
+    {
+        m_message = _message;
+    }
+
+    /*!
+     * @brief This function moves the value in member message
+     * @param _message New value to be moved in member message
+     */
+    eProsima_user_DllExport void message(
+            std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY>&& _message)
+    {
+        m_message = std::move(_message);
+    }
+
+    /*!
+     * @brief This function returns a constant reference to member message
+     * @return Constant reference to member message
+     */
+    eProsima_user_DllExport const std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY>& message() const
+    {
+        return m_message;
+    }
+
+    /*!
+     * @brief This function returns a reference to member message
+     * @return Reference to member message
+     */
+    eProsima_user_DllExport std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY>& message()
+    {
+        return m_message;
+    }
+
+
+
+private:
+
+    uint32_t m_index{0};
+    uint32_t m_length{0};
+    std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY> m_message{0};
+
+};
+
+/*!
+ * @brief This class represents the structure HelloWorldKeyed defined by the user in the IDL file.
+ * @ingroup ICD
+ */
+class HelloWorldKeyed
+{
+public:
+
+    /*!
+     * @brief Default constructor.
+     */
+    eProsima_user_DllExport HelloWorldKeyed()
+    {
+    }
+
+    /*!
+     * @brief Default destructor.
+     */
+    eProsima_user_DllExport ~HelloWorldKeyed()
+    {
+    }
+
+    /*!
+     * @brief Copy constructor.
+     * @param x Reference to the object HelloWorldKeyed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldKeyed(
+            const HelloWorldKeyed& x)
+    {
+                    m_index = x.m_index;
+
+                    m_message = x.m_message;
+
+    }
+
+    /*!
+     * @brief Move constructor.
+     * @param x Reference to the object HelloWorldKeyed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldKeyed(
+            HelloWorldKeyed&& x) noexcept
+    {
+        m_index = x.m_index;
+        m_message = std::move(x.m_message);
+    }
+
+    /*!
+     * @brief Copy assignment.
+     * @param x Reference to the object HelloWorldKeyed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldKeyed& operator =(
+            const HelloWorldKeyed& x)
+    {
+
+                    m_index = x.m_index;
+
+                    m_message = x.m_message;
+
+        return *this;
+    }
+
+    /*!
+     * @brief Move assignment.
+     * @param x Reference to the object HelloWorldKeyed that will be copied.
+     */
+    eProsima_user_DllExport HelloWorldKeyed& operator =(
+            HelloWorldKeyed&& x) noexcept
+    {
+
+        m_index = x.m_index;
+        m_message = std::move(x.m_message);
+        return *this;
+    }
+
+    /*!
+     * @brief Comparison operator.
+     * @param x HelloWorldKeyed object to compare.
+     */
+    eProsima_user_DllExport bool operator ==(
+            const HelloWorldKeyed& x) const
+    {
+        return (m_index == x.m_index &&
+           m_message == x.m_message);
+    }
+
+    /*!
+     * @brief Comparison operator.
+     * @param x HelloWorldKeyed object to compare.
+     */
+    eProsima_user_DllExport bool operator !=(
+            const HelloWorldKeyed& x) const
+    {
+        return !(*this == x);
+    }
+
+    /*!
+     * @brief This function sets a value in member index
+     * @param _index New value for member index
+     */
+    eProsima_user_DllExport void index(
+            uint32_t _index)
+    {
+        m_index = _index;
+    }
+
+    /*!
+     * @brief This function returns the value of member index
+     * @return Value of member index
+     */
+    eProsima_user_DllExport uint32_t index() const
+    {
+        return m_index;
+    }
+
+    /*!
+     * @brief This function returns a reference to member index
+     * @return Reference to member index
+     */
+    eProsima_user_DllExport uint32_t& index()
+    {
+        return m_index;
+    }
+
+
+    /*!
+     * @brief This function copies the value in member message
+     * @param _message New value to be copied in member message
+     */
+    eProsima_user_DllExport void message(
+            const std::string& _message)
+    {
+        m_message = _message;
+    }
+
+    /*!
+     * @brief This function moves the value in member message
+     * @param _message New value to be moved in member message
+     */
+    eProsima_user_DllExport void message(
+            std::string&& _message)
+    {
+        m_message = std::move(_message);
+    }
+
+    /*!
+     * @brief This function returns a constant reference to member message
+     * @return Constant reference to member message
+     */
+    eProsima_user_DllExport const std::string& message() const
+    {
+        return m_message;
+    }
+
+    /*!
+     * @brief This function returns a reference to member message
+     * @return Reference to member message
+     */
+    eProsima_user_DllExport std::string& message()
+    {
+        return m_message;
+    }
+
+
+
 private:
 
     uint32_t m_index{0};
@@ -24,6 +24,12 @@
 
 #include "ICD.hpp"
 
+constexpr uint32_t ICD_pkg_HelloWorldKeyed_max_cdr_typesize {268UL};
+constexpr uint32_t ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize {4UL};
+
+constexpr uint32_t ICD_pkg_HelloWorldFixed_max_cdr_typesize {4104UL};
+constexpr uint32_t ICD_pkg_HelloWorldFixed_max_key_cdr_typesize {0UL};
+
 constexpr uint32_t ICD_pkg_HelloWorld_max_cdr_typesize {268UL};
 constexpr uint32_t ICD_pkg_HelloWorld_max_key_cdr_typesize {0UL};
 
@@ -38,6 +44,14 @@ eProsima_user_DllExport void serialize_key(
         eprosima::fastcdr::Cdr& scdr,
         const ICD_pkg::HelloWorld& data);
 
+eProsima_user_DllExport void serialize_key(
+        eprosima::fastcdr::Cdr& scdr,
+        const ICD_pkg::HelloWorldFixed& data);
+
+eProsima_user_DllExport void serialize_key(
+        eprosima::fastcdr::Cdr& scdr,
+        const ICD_pkg::HelloWorldKeyed& data);
+
 
 } // namespace fastcdr
 } // namespace eprosima
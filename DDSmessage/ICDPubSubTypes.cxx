@@ -214,6 +214,370 @@ namespace ICD_pkg {
         register_HelloWorld_type_identifier(type_identifiers_);
     }
 
+    HelloWorldFixedPubSubType::HelloWorldFixedPubSubType()
+    {
+        set_name("ICD_pkg::HelloWorldFixed");
+        uint32_t type_size = ICD_pkg_HelloWorldFixed_max_cdr_typesize;
+        type_size += static_cast<uint32_t>(eprosima::fastcdr::Cdr::alignment(type_size, 4)); /* possible submessage alignment */
+        max_serialized_type_size = type_size + 4; /*encapsulation*/
+        is_compute_key_provided = false;
+        uint32_t key_length = ICD_pkg_HelloWorldFixed_max_key_cdr_typesize > 16 ? ICD_pkg_HelloWorldFixed_max_key_cdr_typesize : 16;
+        key_buffer_ = reinterpret_cast<unsigned char*>(malloc(key_length));
+        memset(key_buffer_, 0, key_length);
+    }
+
+    HelloWorldFixedPubSubType::~HelloWorldFixedPubSubType()
+    {
+        if (key_buffer_ != nullptr)
+        {
+            free(key_buffer_);
+        }
+    }
+
+    bool HelloWorldFixedPubSubType::serialize(
+            const void* const data,
+            SerializedPayload_t& payload,
+            DataRepresentationId_t data_representation)
+    {
+        const HelloWorldFixed* p_type = static_cast<const HelloWorldFixed*>(data);
+
+        // Object that manages the raw buffer.
+        eprosima::fastcdr::FastBuffer fastbuffer(reinterpret_cast<char*>(payload.data), payload.max_size);
+        // Object that serializes the data.
+        eprosima::fastcdr::Cdr ser(fastbuffer, eprosima::fastcdr::Cdr::DEFAULT_ENDIAN,
+                data_representation == DataRepresentationId_t::XCDR_DATA_REPRESENTATION ?
+                eprosima::fastcdr::CdrVersion::XCDRv1 : eprosima::fastcdr::CdrVersion::XCDRv2);
+        payload.encapsulation = ser.endianness() == eprosima::fastcdr::Cdr::BIG_ENDIANNESS ? CDR_BE : CDR_LE;
+        ser.set_encoding_flag(
+            data_representation == DataRepresentationId_t::XCDR_DATA_REPRESENTATION ?
+            eprosima::fastcdr::EncodingAlgorithmFlag::PLAIN_CDR  :
+            eprosima::fastcdr::EncodingAlgorithmFlag::PLAIN_CDR2);
+
+        try
+        {
+            // Serialize encapsulation
+            ser.serialize_encapsulation();
+            // Serialize the object.
+            ser << *p_type;
+            ser.set_dds_cdr_options({0,0});
+        }
+        catch (eprosima::fastcdr::exception::Exception& /*exception*/)
+        {
+            return false;
+        }
+
+        // Get the serialized length
+        payload.length = static_cast<uint32_t>(ser.get_serialized_data_length());
+        return true;
+    }
+
+    bool HelloWorldFixedPubSubType::deserialize(
+            SerializedPayload_t& payload,
+            void* data)
+    {
+        try
+        {
+            // Convert DATA to pointer of your type
+            HelloWorldFixed* p_type = static_cast<HelloWorldFixed*>(data);
+
+            // Object that manages the raw buffer.
+            eprosima::fastcdr::FastBuffer fastbuffer(reinterpret_cast<char*>(payload.data), payload.length);
+
+            // Object that deserializes the data.
+            eprosima::fastcdr::Cdr deser(fastbuffer, eprosima::fastcdr::Cdr::DEFAULT_ENDIAN);
+
+            // Deserialize encapsulation.
+            deser.read_encapsulation();
+            payload.encapsulation = deser.endianness() == eprosima::fastcdr::Cdr::BIG_ENDIANNESS ? CDR_BE : CDR_LE;
+
+            // Deserialize the object.
+            deser >> *p_type;
+        }
+        catch (eprosima::fastcdr::exception::Exception& /*exception*/)
+        {
+            return false;
+        }
+
+        return true;
+    }
+
+    uint32_t HelloWorldFixedPubSubType::calculate_serialized_size(
+            const void* const data,
+            DataRepresentationId_t data_representation)
+    {
+        try
+        {
+            eprosima::fastcdr::CdrSizeCalculator calculator(
+                data_representation == DataRepresentationId_t::XCDR_DATA_REPRESENTATION ?
+                eprosima::fastcdr::CdrVersion::XCDRv1 :eprosima::fastcdr::CdrVersion::XCDRv2);
+            size_t current_alignment {0};
+            return static_cast<uint32_t>(calculator.calculate_serialized_size(
+                        *static_cast<const HelloWorldFixed*>(data), current_alignment)) +
+                    4u /*encapsulation*/;
+        }
+        catch (eprosima::fastcdr::exception::Exception& /*exception*/)
+        {
+            return 0;
+        }
+    }
+
+    void* HelloWorldFixedPubSubType::create_data()
+    {
+        return reinterpret_cast<void*>(new HelloWorldFixed());
+    }
+
+    void HelloWorldFixedPubSubType::delete_data(
+            void* data)
+    {
+        delete(reinterpret_cast<HelloWorldFixed*>(data));
+    }
+
+    bool HelloWorldFixedPubSubType::compute_key(
+            SerializedPayload_t& payload,
+            InstanceHandle_t& handle,
+            bool force_md5)
+    {
+        if (!is_compute_key_provided)
+        {
+            return false;
+        }
+
+        HelloWorldFixed data;
+        if (deserialize(payload, static_cast<void*>(&data)))
+        {
+            return compute_key(static_cast<void*>(&data), handle, force_md5);
+        }
+
+        return false;
+    }
+
+    bool HelloWorldFixedPubSubType::compute_key(
+            const void* const data,
+            InstanceHandle_t& handle,
+            bool force_md5)
+    {
+        if (!is_compute_key_provided)
+        {
+            return false;
+        }
+
+        const HelloWorldFixed* p_type = static_cast<const HelloWorldFixed*>(data);
+
+        // Object that manages the raw buffer.
+        eprosima::fastcdr::FastBuffer fastbuffer(reinterpret_cast<char*>(key_buffer_),
+                ICD_pkg_HelloWorldFixed_max_key_cdr_typesize);
+
+        // Object that serializes the data.
+        eprosima::fastcdr::Cdr ser(fastbuffer, eprosima::fastcdr::Cdr::BIG_ENDIANNESS, eprosima::fastcdr::CdrVersion::XCDRv2);
+        ser.set_encoding_flag(eprosima::fastcdr::EncodingAlgorithmFlag::PLAIN_CDR2);
+        eprosima::fastcdr::serialize_key(ser, *p_type);
+        if (force_md5 || ICD_pkg_HelloWorldFixed_max_key_cdr_typesize > 16)
+        {
+            md5_.init();
+            md5_.update(key_buffer_, static_cast<unsigned int>(ser.get_serialized_data_length()));
+            md5_.finalize();
+            for (uint8_t i = 0; i < 16; ++i)
+            {
+                handle.value[i] = md5_.digest[i];
+            }
+        }
+        else
+        {
+            for (uint8_t i = 0; i < 16; ++i)
+            {
+                handle.value[i] = key_buffer_[i];
+            }
+        }
+        return true;
+    }
+
+    void HelloWorldFixedPubSubType::register_type_object_representation()
+    {
+        register_HelloWorldFixed_type_identifier(type_identifiers_);
+    }
+
+    HelloWorldKeyedPubSubType::HelloWorldKeyedPubSubType()
+    {
+        set_name("ICD_pkg::HelloWorldKeyed");
+        uint32_t type_size = ICD_pkg_HelloWorldKeyed_max_cdr_typesize;
+        type_size += static_cast<uint32_t>(eprosima::fastcdr::Cdr::alignment(type_size, 4)); /* possible submessage alignment */
+        max_serialized_type_size = type_size + 4; /*encapsulation*/
+        is_compute_key_provided = true;
+        uint32_t key_length = ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize > 16 ? ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize : 16;
+        key_buffer_ = reinterpret_cast<unsigned char*>(malloc(key_length));
+        memset(key_buffer_, 0, key_length);
+    }
+
+    HelloWorldKeyedPubSubType::~HelloWorldKeyedPubSubType()
+    {
+        if (key_buffer_ != nullptr)
+        {
+            free(key_buffer_);
+        }
+    }
+
+    bool HelloWorldKeyedPubSubType::serialize(
+            const void* const data,
+            SerializedPayload_t& payload,
+            DataRepresentationId_t data_representation)
+    {
+        const HelloWorldKeyed* p_type = static_cast<const HelloWorldKeyed*>(data);
+
+        // Object that manages the raw buffer.
+        eprosima::fastcdr::FastBuffer fastbuffer(reinterpret_cast<char*>(payload.data), payload.max_size);
+        // Object that serializes the data.
+        eprosima::fastcdr::Cdr ser(fastbuffer, eprosima::fastcdr::Cdr::DEFAULT_ENDIAN,
+                data_representation == DataRepresentationId_t::XCDR_DATA_REPRESENTATION ?
+                eprosima::fastcdr::CdrVersion::XCDRv1 : eprosima::fastcdr::CdrVersion::XCDRv2);
+        payload.encapsulation = ser.endianness() == eprosima::fastcdr::Cdr::BIG_ENDIANNESS ? CDR_BE : CDR_LE;
+        ser.set_encoding_flag(
+            data_representation == DataRepresentationId_t::XCDR_DATA_REPRESENTATION ?
+            eprosima::fastcdr::EncodingAlgorithmFlag::PLAIN_CDR  :
+            eprosima::fastcdr::EncodingAlgorithmFlag::DELIMIT_CDR2);
+
+        try
+        {
+            // Serialize encapsulation
+            ser.serialize_encapsulation();
+            // Serialize the object.
+            ser << *p_type;
+            ser.set_dds_cdr_options({0,0});
+        }
+        catch (eprosima::fastcdr::exception::Exception& /*exception*/)
+        {
+            return false;
+        }
+
+        // Get the serialized length
+        payload.length = static_cast<uint32_t>(ser.get_serialized_data_length());
+        return true;
+    }
+
+    bool HelloWorldKeyedPubSubType::deserialize(
+            SerializedPayload_t& payload,
+            void* data)
+    {
+        try
+        {
+            // Convert DATA to pointer of your type
+            HelloWorldKeyed* p_type = static_cast<HelloWorldKeyed*>(data);
+
+            // Object that manages the raw buffer.
+            eprosima::fastcdr::FastBuffer fastbuffer(reinterpret_cast<char*>(payload.data), payload.length);
+
+            // Object that deserializes the data.
+            eprosima::fastcdr::Cdr deser(fastbuffer, eprosima::fastcdr::Cdr::DEFAULT_ENDIAN);
+
+            // Deserialize encapsulation.
+            deser.read_encapsulation();
+            payload.encapsulation = deser.endianness() == eprosima::fastcdr::Cdr::BIG_ENDIANNESS ? CDR_BE : CDR_LE;
+
+            // Deserialize the object.
+            deser >> *p_type;
+        }
+        catch (eprosima::fastcdr::exception::Exception& /*exception*/)
+        {
+            return false;
+        }
+
+        return true;
+    }
+
+    uint32_t HelloWorldKeyedPubSubType::calculate_serialized_size(
+            const void* const data,
+            DataRepresentationId_t data_representation)
+    {
+        try
+        {
+            eprosima::fastcdr::CdrSizeCalculator calculator(
+                data_representation == DataRepresentationId_t::XCDR_DATA_REPRESENTATION ?
+                eprosima::fastcdr::CdrVersion::XCDRv1 :eprosima::fastcdr::CdrVersion::XCDRv2);
+            size_t current_alignment {0};
+            return static_cast<uint32_t>(calculator.calculate_serialized_size(
+                        *static_cast<const HelloWorldKeyed*>(data), current_alignment)) +
+                    4u /*encapsulation*/;
+        }
+        catch (eprosima::fastcdr::exception::Exception& /*exception*/)
+        {
+            return 0;
+        }
+    }
+
+    void* HelloWorldKeyedPubSubType::create_data()
+    {
+        return reinterpret_cast<void*>(new HelloWorldKeyed());
+    }
+
+    void HelloWorldKeyedPubSubType::delete_data(
+            void* data)
+    {
+        delete(reinterpret_cast<HelloWorldKeyed*>(data));
+    }
+
+    bool HelloWorldKeyedPubSubType::compute_key(
+            SerializedPayload_t& payload,
+            InstanceHandle_t& handle,
+            bool force_md5)
+    {
+        if (!is_compute_key_provided)
+        {
+            return false;
+        }
+
+        HelloWorldKeyed data;
+        if (deserialize(payload, static_cast<void*>(&data)))
+        {
+            return compute_key(static_cast<void*>(&data), handle, force_md5);
+        }
+
+        return false;
+    }
+
+    bool HelloWorldKeyedPubSubType::compute_key(
+            const void* const data,
+            InstanceHandle_t& handle,
+            bool force_md5)
+    {
+        if (!is_compute_key_provided)
+        {
+            return false;
+        }
+
+        const HelloWorldKeyed* p_type = static_cast<const HelloWorldKeyed*>(data);
+
+        // Object that manages the raw buffer.
+        eprosima::fastcdr::FastBuffer fastbuffer(reinterpret_cast<char*>(key_buffer_),
+                ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize);
+
+        // Object that serializes the data.
+        eprosima::fastcdr::Cdr ser(fastbuffer, eprosima::fastcdr::Cdr::BIG_ENDIANNESS, eprosima::fastcdr::CdrVersion::XCDRv2);
+        ser.set_encoding_flag(eprosima::fastcdr::EncodingAlgorithmFlag::PLAIN_CDR2);
+        eprosima::fastcdr::serialize_key(ser, *p_type);
+        if (force_md5 || ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize > 16)
+        {
+            md5_.init();
+            md5_.update(key_buffer_, static_cast<unsigned int>(ser.get_serialized_data_length()));
+            md5_.finalize();
+            for (uint8_t i = 0; i < 16; ++i)
+            {
+                handle.value[i] = md5_.digest[i];
+            }
+        }
+        else
+        {
+            for (uint8_t i = 0; i < 16; ++i)
+            {
+                handle.value[i] = key_buffer_[i];
+            }
+        }
+        return true;
+    }
+
+    void HelloWorldKeyedPubSubType::register_type_object_representation()
+    {
+        register_HelloWorldKeyed_type_identifier(type_identifiers_);
+    }
+
 } // namespace ICD_pkg
 
 
@@ -120,6 +120,222 @@ namespace ICD_pkg
         unsigned char* key_buffer_;
 
     };
+
+    #ifndef SWIG
+    namespace detail {
+
+    template<typename Tag, typename Tag::type M>
+    struct HelloWorldFixed_rob
+    {
+        friend constexpr typename Tag::type get(
+                Tag)
+        {
+            return M;
+        }
+
+    };
+
+    struct HelloWorldFixed_f
+    {
+        typedef std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY> HelloWorldFixed::* type;
+        friend constexpr type get(
+                HelloWorldFixed_f);
+    };
+
+    template struct HelloWorldFixed_rob<HelloWorldFixed_f, &HelloWorldFixed::m_message>;
+
+    template <typename T, typename Tag>
+    inline size_t constexpr HelloWorldFixed_offset_of()
+    {
+        return ((::size_t) &reinterpret_cast<char const volatile&>((((T*)0)->*get(Tag()))));
+    }
+
+    } // namespace detail
+    #endif // ifndef SWIG
+
+
+    /*!
+     * @brief This class represents the TopicDataType of the type HelloWorldFixed defined by the user in the IDL file.
+     * @ingroup ICD
+     */
+    class HelloWorldFixedPubSubType : public eprosima::fastdds::dds::TopicDataType
+    {
+    public:
+
+        typedef HelloWorldFixed type;
+
+        eProsima_user_DllExport HelloWorldFixedPubSubType();
+
+        eProsima_user_DllExport ~HelloWorldFixedPubSubType() override;
+
+        eProsima_user_DllExport bool serialize(
+                const void* const data,
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) override;
+
+        eProsima_user_DllExport bool deserialize(
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                void* data) override;
+
+        eProsima_user_DllExport uint32_t calculate_serialized_size(
+                const void* const data,
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) override;
+
+        eProsima_user_DllExport bool compute_key(
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                eprosima::fastdds::rtps::InstanceHandle_t& ihandle,
+                bool force_md5 = false) override;
+
+        eProsima_user_DllExport bool compute_key(
+                const void* const data,
+                eprosima::fastdds::rtps::InstanceHandle_t& ihandle,
+                bool force_md5 = false) override;
+
+        eProsima_user_DllExport void* create_data() override;
+
+        eProsima_user_DllExport void delete_data(
+                void* data) override;
+
+        //Register TypeObject representation in Fast DDS TypeObjectRegistry
+        eProsima_user_DllExport void register_type_object_representation() override;
+
+    #ifdef TOPIC_DATA_TYPE_API_HAS_IS_BOUNDED
+        eProsima_user_DllExport inline bool is_bounded() const override
+        {
+            return true;
+        }
+
+    #endif  // TOPIC_DATA_TYPE_API_HAS_IS_BOUNDED
+
+    #ifdef TOPIC_DATA_TYPE_API_HAS_IS_PLAIN
+
+        eProsima_user_DllExport inline bool is_plain(
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) const override
+        {
+            if (data_representation == eprosima::fastdds::dds::DataRepresentationId_t::XCDR2_DATA_REPRESENTATION)
+            {
+                return is_plain_xcdrv2_impl();
+            }
+            else
+            {
+                return is_plain_xcdrv1_impl();
+            }
+        }
+
+    #endif  // TOPIC_DATA_TYPE_API_HAS_IS_PLAIN
+
+    #ifdef TOPIC_DATA_TYPE_API_HAS_CONSTRUCT_SAMPLE
+        eProsima_user_DllExport inline bool construct_sample(
+                void* memory) const override
+        {
+            new (memory) HelloWorldFixed();
+            return true;
+        }
+
+    #endif  // TOPIC_DATA_TYPE_API_HAS_CONSTRUCT_SAMPLE
+
+    private:
+
+        eprosima::fastdds::MD5 md5_;
+        unsigned char* key_buffer_;
+
+
+        static constexpr bool is_plain_xcdrv1_impl()
+        {
+            return 4104ULL ==
+                   (detail::HelloWorldFixed_offset_of<HelloWorldFixed, detail::HelloWorldFixed_f>() +
+                   sizeof(std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY>));
+        }
+
+        static constexpr bool is_plain_xcdrv2_impl()
+        {
+            return 4104ULL ==
+                   (detail::HelloWorldFixed_offset_of<HelloWorldFixed, detail::HelloWorldFixed_f>() +
+                   sizeof(std::array<char, ICD_pkg::FIXED_MESSAGE_CAPACITY>));
+        }
+
+    };
+
+    /*!
+     * @brief This class represents the TopicDataType of the type HelloWorldKeyed defined by the user in the IDL file.
+     * @ingroup ICD
+     */
+    class HelloWorldKeyedPubSubType : public eprosima::fastdds::dds::TopicDataType
+    {
+    public:
+
+        typedef HelloWorldKeyed type;
+
+        eProsima_user_DllExport HelloWorldKeyedPubSubType();
+
+        eProsima_user_DllExport ~HelloWorldKeyedPubSubType() override;
+
+        eProsima_user_DllExport bool serialize(
+                const void* const data,
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) override;
+
+        eProsima_user_DllExport bool deserialize(
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                void* data) override;
+
+        eProsima_user_DllExport uint32_t calculate_serialized_size(
+                const void* const data,
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) override;
+
+        eProsima_user_DllExport bool compute_key(
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                eprosima::fastdds::rtps::InstanceHandle_t& ihandle,
+                bool force_md5 = false) override;
+
+        eProsima_user_DllExport bool compute_key(
+                const void* const data,
+                eprosima::fastdds::rtps::InstanceHandle_t& ihandle,
+                bool force_md5 = false) override;
+
+        eProsima_user_DllExport void* create_data() override;
+
+        eProsima_user_DllExport void delete_data(
+                void* data) override;
+
+        //Register TypeObject representation in Fast DDS TypeObjectRegistry
+        eProsima_user_DllExport void register_type_object_representation() override;
+
+    #ifdef TOPIC_DATA_TYPE_API_HAS_IS_BOUNDED
+        eProsima_user_DllExport inline bool is_bounded() const override
+        {
+            return false;
+        }
+
+    #endif  // TOPIC_DATA_TYPE_API_HAS_IS_BOUNDED
+
+    #ifdef TOPIC_DATA_TYPE_API_HAS_IS_PLAIN
+
+        eProsima_user_DllExport inline bool is_plain(
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) const override
+        {
+            static_cast<void>(data_representation);
+            return false;
+        }
+
+    #endif  // TOPIC_DATA_TYPE_API_HAS_IS_PLAIN
+
+    #ifdef TOPIC_DATA_TYPE_API_HAS_CONSTRUCT_SAMPLE
+        eProsima_user_DllExport inline bool construct_sample(
+                void* memory) const override
+        {
+            static_cast<void>(memory);
+            return false;
+        }
+
+    #endif  // TOPIC_DATA_TYPE_API_HAS_CONSTRUCT_SAMPLE
+
+    private:
+
+        eprosima::fastdds::MD5 md5_;
+        unsigned char* key_buffer_;
+
+    };
 } // namespace ICD_pkg
 
 #endif // FAST_DDS_GENERATED__ICD_PKG_ICD_PUBSUBTYPES_HPP
@@ -137,5 +137,257 @@ void register_HelloWorld_type_identifier(
     }
 }
 
+// TypeIdentifier is returned by reference: dependent structures/unions are registered in this same method
+void register_HelloWorldFixed_type_identifier(
+        TypeIdentifierPair& type_ids_HelloWorldFixed)
+{
+
+    ReturnCode_t return_code_HelloWorldFixed {eprosima::fastdds::dds::RETCODE_OK};
+    return_code_HelloWorldFixed =
+        eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+        "ICD_pkg::HelloWorldFixed", type_ids_HelloWorldFixed);
+    if (eprosima::fastdds::dds::RETCODE_OK != return_code_HelloWorldFixed)
+    {
+        StructTypeFlag struct_flags_HelloWorldFixed = TypeObjectUtils::build_struct_type_flag(eprosima::fastdds::dds::xtypes::ExtensibilityKind::FINAL,
+                false, false);
+        QualifiedTypeName type_name_HelloWorldFixed = "ICD_pkg::HelloWorldFixed";
+        eprosima::fastcdr::optional<AppliedBuiltinTypeAnnotations> type_ann_builtin_HelloWorldFixed;
+        eprosima::fastcdr::optional<AppliedAnnotationSeq> ann_custom_HelloWorldFixed;
+        CompleteTypeDetail detail_HelloWorldFixed = TypeObjectUtils::build_complete_type_detail(type_ann_builtin_HelloWorldFixed, ann_custom_HelloWorldFixed, type_name_HelloWorldFixed.to_string());
+        CompleteStructHeader header_HelloWorldFixed;
+        header_HelloWorldFixed = TypeObjectUtils::build_complete_struct_header(TypeIdentifier(), detail_HelloWorldFixed);
+        CompleteStructMemberSeq member_seq_HelloWorldFixed;
+        {
+            TypeIdentifierPair type_ids_index;
+            ReturnCode_t return_code_index {eprosima::fastdds::dds::RETCODE_OK};
+            return_code_index =
+                eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+                "_uint32_t", type_ids_index);
+
+            if (eprosima::fastdds::dds::RETCODE_OK != return_code_index)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                        "index Structure member TypeIdentifier unknown to TypeObjectRegistry.");
+                return;
+            }
+            StructMemberFlag member_flags_index = TypeObjectUtils::build_struct_member_flag(eprosima::fastdds::dds::xtypes::TryConstructFailAction::DISCARD,
+                    false, false, false, false);
+            MemberId member_id_index = 0x00000000;
+            bool common_index_ec {false};
+            CommonStructMember common_index {TypeObjectUtils::build_common_struct_member(member_id_index, member_flags_index, TypeObjectUtils::retrieve_complete_type_identifier(type_ids_index, common_index_ec))};
+            if (!common_index_ec)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION, "Structure index member TypeIdentifier inconsistent.");
+                return;
+            }
+            MemberName name_index = "index";
+            eprosima::fastcdr::optional<AppliedBuiltinMemberAnnotations> member_ann_builtin_index;
+            ann_custom_HelloWorldFixed.reset();
+            CompleteMemberDetail detail_index = TypeObjectUtils::build_complete_member_detail(name_index, member_ann_builtin_index, ann_custom_HelloWorldFixed);
+            CompleteStructMember member_index = TypeObjectUtils::build_complete_struct_member(common_index, detail_index);
+            TypeObjectUtils::add_complete_struct_member(member_seq_HelloWorldFixed, member_index);
+        }
+        {
+            TypeIdentifierPair type_ids_length;
+            ReturnCode_t return_code_length {eprosima::fastdds::dds::RETCODE_OK};
+            return_code_length =
+                eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+                "_uint32_t", type_ids_length);
+
+            if (eprosima::fastdds::dds::RETCODE_OK != return_code_length)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                        "length Structure member TypeIdentifier unknown to TypeObjectRegistry.");
+                return;
+            }
+            StructMemberFlag member_flags_length = TypeObjectUtils::build_struct_member_flag(eprosima::fastdds::dds::xtypes::TryConstructFailAction::DISCARD,
+                    false, false, false, false);
+            MemberId member_id_length = 0x00000001;
+            bool common_length_ec {false};
+            CommonStructMember common_length {TypeObjectUtils::build_common_struct_member(member_id_length, member_flags_length, TypeObjectUtils::retrieve_complete_type_identifier(type_ids_length, common_length_ec))};
+            if (!common_length_ec)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION, "Structure length member TypeIdentifier inconsistent.");
+                return;
+            }
+            MemberName name_length = "length";
+            eprosima::fastcdr::optional<AppliedBuiltinMemberAnnotations> member_ann_builtin_length;
+            ann_custom_HelloWorldFixed.reset();
+            CompleteMemberDetail detail_length = TypeObjectUtils::build_complete_member_detail(name_length, member_ann_builtin_length, ann_custom_HelloWorldFixed);
+            CompleteStructMember member_length = TypeObjectUtils::build_complete_struct_member(common_length, detail_length);
+            TypeObjectUtils::add_complete_struct_member(member_seq_HelloWorldFixed, member_length);
+        }
+        {
+            TypeIdentifierPair type_ids_message;
+            ReturnCode_t return_code_message {eprosima::fastdds::dds::RETCODE_OK};
+            return_code_message =
+                eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+                "anonymous_array_char_4096", type_ids_message);
+
+            if (eprosima::fastdds::dds::RETCODE_OK != return_code_message)
+            {
+                return_code_message =
+                    eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+                    "_char", type_ids_message);
+
+                if (eprosima::fastdds::dds::RETCODE_OK != return_code_message)
+                {
+                    EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                            "Array element TypeIdentifier unknown to TypeObjectRegistry.");
+                    return;
+                }
+                bool element_identifier_anonymous_array_char_4096_ec {false};
+                TypeIdentifier* element_identifier_anonymous_array_char_4096 {new TypeIdentifier(TypeObjectUtils::retrieve_complete_type_identifier(type_ids_message, element_identifier_anonymous_array_char_4096_ec))};
+                if (!element_identifier_anonymous_array_char_4096_ec)
+                {
+                    EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION, "Array element TypeIdentifier inconsistent.");
+                    return;
+                }
+                EquivalenceKind equiv_kind_anonymous_array_char_4096 = EK_COMPLETE;
+                if (TK_NONE == type_ids_message.type_identifier2()._d())
+                {
+                    equiv_kind_anonymous_array_char_4096 = EK_BOTH;
+                }
+                CollectionElementFlag element_flags_anonymous_array_char_4096 = 0;
+                PlainCollectionHeader header_anonymous_array_char_4096 = TypeObjectUtils::build_plain_collection_header(equiv_kind_anonymous_array_char_4096, element_flags_anonymous_array_char_4096);
+                {
+                    LBoundSeq array_bound_seq;
+                        TypeObjectUtils::add_array_dimension(array_bound_seq, static_cast<LBound>(ICD_pkg::FIXED_MESSAGE_CAPACITY));
+
+                    PlainArrayLElemDefn array_ldefn = TypeObjectUtils::build_plain_array_l_elem_defn(header_anonymous_array_char_4096, array_bound_seq,
+                                eprosima::fastcdr::external<TypeIdentifier>(element_identifier_anonymous_array_char_4096));
+                    if (eprosima::fastdds::dds::RETCODE_BAD_PARAMETER ==
+                            TypeObjectUtils::build_and_register_l_array_type_identifier(array_ldefn, "anonymous_array_char_4096", type_ids_message))
+                    {
+                        EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                            "anonymous_array_char_4096 already registered in TypeObjectRegistry for a different type.");
+                    }
+                }
+            }
+            StructMemberFlag member_flags_message = TypeObjectUtils::build_struct_member_flag(eprosima::fastdds::dds::xtypes::TryConstructFailAction::DISCARD,
+                    false, false, false, false);
+            MemberId member_id_message = 0x00000002;
+            bool common_message_ec {false};
+            CommonStructMember common_message {TypeObjectUtils::build_common_struct_member(member_id_message, member_flags_message, TypeObjectUtils::retrieve_complete_type_identifier(type_ids_message, common_message_ec))};
+            if (!common_message_ec)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION, "Structure message member TypeIdentifier inconsistent.");
+                return;
+            }
+            MemberName name_message = "message";
+            eprosima::fastcdr::optional<AppliedBuiltinMemberAnnotations> member_ann_builtin_message;
+            ann_custom_HelloWorldFixed.reset();
+            CompleteMemberDetail detail_message = TypeObjectUtils::build_complete_member_detail(name_message, member_ann_builtin_message, ann_custom_HelloWorldFixed);
+            CompleteStructMember member_message = TypeObjectUtils::build_complete_struct_member(common_message, detail_message);
+            TypeObjectUtils::add_complete_struct_member(member_seq_HelloWorldFixed, member_message);
+        }
+        CompleteStructType struct_type_HelloWorldFixed = TypeObjectUtils::build_complete_struct_type(struct_flags_HelloWorldFixed, header_HelloWorldFixed, member_seq_HelloWorldFixed);
+        if (eprosima::fastdds::dds::RETCODE_BAD_PARAMETER ==
+                TypeObjectUtils::build_and_register_struct_type_object(struct_type_HelloWorldFixed, type_name_HelloWorldFixed.to_string(), type_ids_HelloWorldFixed))
+        {
+            EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                    "ICD_pkg::HelloWorldFixed already registered in TypeObjectRegistry for a different type.");
+        }
+    }
+}
+
+// TypeIdentifier is returned by reference: dependent structures/unions are registered in this same method
+void register_HelloWorldKeyed_type_identifier(
+        TypeIdentifierPair& type_ids_HelloWorldKeyed)
+{
+
+    ReturnCode_t return_code_HelloWorldKeyed {eprosima::fastdds::dds::RETCODE_OK};
+    return_code_HelloWorldKeyed =
+        eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+        "ICD_pkg::HelloWorldKeyed", type_ids_HelloWorldKeyed);
+    if (eprosima::fastdds::dds::RETCODE_OK != return_code_HelloWorldKeyed)
+    {
+        StructTypeFlag struct_flags_HelloWorldKeyed = TypeObjectUtils::build_struct_type_flag(eprosima::fastdds::dds::xtypes::ExtensibilityKind::APPENDABLE,
+                false, false);
+        QualifiedTypeName type_name_HelloWorldKeyed = "ICD_pkg::HelloWorldKeyed";
+        eprosima::fastcdr::optional<AppliedBuiltinTypeAnnotations> type_ann_builtin_HelloWorldKeyed;
+        eprosima::fastcdr::optional<AppliedAnnotationSeq> ann_custom_HelloWorldKeyed;
+        CompleteTypeDetail detail_HelloWorldKeyed = TypeObjectUtils::build_complete_type_detail(type_ann_builtin_HelloWorldKeyed, ann_custom_HelloWorldKeyed, type_name_HelloWorldKeyed.to_string());
+        CompleteStructHeader header_HelloWorldKeyed;
+        header_HelloWorldKeyed = TypeObjectUtils::build_complete_struct_header(TypeIdentifier(), detail_HelloWorldKeyed);
+        CompleteStructMemberSeq member_seq_HelloWorldKeyed;
+        {
+            TypeIdentifierPair type_ids_index;
+            ReturnCode_t return_code_index {eprosima::fastdds::dds::RETCODE_OK};
+            return_code_index =
+                eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+                "_uint32_t", type_ids_index);
+
+            if (eprosima::fastdds::dds::RETCODE_OK != return_code_index)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                        "index Structure member TypeIdentifier unknown to TypeObjectRegistry.");
+                return;
+            }
+            StructMemberFlag member_flags_index = TypeObjectUtils::build_struct_member_flag(eprosima::fastdds::dds::xtypes::TryConstructFailAction::DISCARD,
+                    false, true, true, false);
+            MemberId member_id_index = 0x00000000;
+            bool common_index_ec {false};
+            CommonStructMember common_index {TypeObjectUtils::build_common_struct_member(member_id_index, member_flags_index, TypeObjectUtils::retrieve_complete_type_identifier(type_ids_index, common_index_ec))};
+            if (!common_index_ec)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION, "Structure index member TypeIdentifier inconsistent.");
+                return;
+            }
+            MemberName name_index = "index";
+            eprosima::fastcdr::optional<AppliedBuiltinMemberAnnotations> member_ann_builtin_index;
+            ann_custom_HelloWorldKeyed.reset();
+            CompleteMemberDetail detail_index = TypeObjectUtils::build_complete_member_detail(name_index, member_ann_builtin_index, ann_custom_HelloWorldKeyed);
+            CompleteStructMember member_index = TypeObjectUtils::build_complete_struct_member(common_index, detail_index);
+            TypeObjectUtils::add_complete_struct_member(member_seq_HelloWorldKeyed, member_index);
+        }
+        {
+            TypeIdentifierPair type_ids_message;
+            ReturnCode_t return_code_message {eprosima::fastdds::dds::RETCODE_OK};
+            return_code_message =
+                eprosima::fastdds::dds::DomainParticipantFactory::get_instance()->type_object_registry().get_type_identifiers(
+                "anonymous_string_unbounded", type_ids_message);
+
+            if (eprosima::fastdds::dds::RETCODE_OK != return_code_message)
+            {
+                {
+                    SBound bound = 0;
+                    StringSTypeDefn string_sdefn = TypeObjectUtils::build_string_s_type_defn(bound);
+                    if (eprosima::fastdds::dds::RETCODE_BAD_PARAMETER ==
+                            TypeObjectUtils::build_and_register_s_string_type_identifier(string_sdefn,
+                            "anonymous_string_unbounded", type_ids_message))
+                    {
+                        EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                            "anonymous_string_unbounded already registered in TypeObjectRegistry for a different type.");
+                    }
+                }
+            }
+            StructMemberFlag member_flags_message = TypeObjectUtils::build_struct_member_flag(eprosima::fastdds::dds::xtypes::TryConstructFailAction::DISCARD,
+                    false, false, false, false);
+            MemberId member_id_message = 0x00000001;
+            bool common_message_ec {false};
+            CommonStructMember common_message {TypeObjectUtils::build_common_struct_member(member_id_message, member_flags_message, TypeObjectUtils::retrieve_complete_type_identifier(type_ids_message, common_message_ec))};
+            if (!common_message_ec)
+            {
+                EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION, "Structure message member TypeIdentifier inconsistent.");
+                return;
+            }
+            MemberName name_message = "message";
+            eprosima::fastcdr::optional<AppliedBuiltinMemberAnnotations> member_ann_builtin_message;
+            ann_custom_HelloWorldKeyed.reset();
+            CompleteMemberDetail detail_message = TypeObjectUtils::build_complete_member_detail(name_message, member_ann_builtin_message, ann_custom_HelloWorldKeyed);
+            CompleteStructMember member_message = TypeObjectUtils::build_complete_struct_member(common_message, detail_message);
+            TypeObjectUtils::add_complete_struct_member(member_seq_HelloWorldKeyed, member_message);
+        }
+        CompleteStructType struct_type_HelloWorldKeyed = TypeObjectUtils::build_complete_struct_type(struct_flags_HelloWorldKeyed, header_HelloWorldKeyed, member_seq_HelloWorldKeyed);
+        if (eprosima::fastdds::dds::RETCODE_BAD_PARAMETER ==
+                TypeObjectUtils::build_and_register_struct_type_object(struct_type_HelloWorldKeyed, type_name_HelloWorldKeyed.to_string(), type_ids_HelloWorldKeyed))
+        {
+            EPROSIMA_LOG_ERROR(XTYPES_TYPE_REPRESENTATION,
+                    "ICD_pkg::HelloWorldKeyed already registered in TypeObjectRegistry for a different type.");
+        }
+    }
+}
+
 } // namespace ICD_pkg
 
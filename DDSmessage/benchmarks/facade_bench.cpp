@@ -0,0 +1,315 @@
+// Round-trip latency and throughput of the C facade, swept over transports,
+// QoS and message sizes, reported as JSON (see benchmarks/README.md at the
+// repository root for the schema shared with the Python and Node suites).
+//
+// For each combination the benchmark forks an echo process that writes every
+// sample it receives on the ping topic back on a pong topic. The parent then
+// measures --pings round trips with one sample in flight (p50/p99/p999) and a
+// burst of --burst samples timed until the last echo is back (msgs/s, MB/s).
+//
+// Usage: facade_bench [--sizes 64,1024,16384] [--transports udp,shm]
+//                     [--qos reliable,best_effort] [--pings 1000] [--burst 5000]
+//                     [--output results.json]          (POSIX only)
+
+#include "dds_facade.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <sstream>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include <signal.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+namespace {
+
+const uint32_t kStopIndex = 0xFFFFFFFFu;
+const uint32_t kBatch = 256;
+
+struct Options {
+    std::vector<uint32_t> sizes = { 64, 1024, 16384 };
+    std::vector<std::string> transports = { "udp", "shm" };
+    std::vector<std::string> qos = { "reliable", "best_effort" };
+    int pings = 1000;
+    uint32_t burst = 5000;
+    const char* output = nullptr;
+};
+
+int32_t transport_id(const std::string& name) {
+    if (name == "udp") return DDS_TRANSPORT_UDP;
+    if (name == "shm") return DDS_TRANSPORT_SHM;
+    if (name == "default") return DDS_TRANSPORT_DEFAULT;
+    return -1;
+}
+
+// Both profiles keep a whole burst, so only best-effort delivery can drop samples
+bool make_qos(const std::string& name, uint32_t burst, dds_qos_t& qos) {
+    std::memset(&qos, 0, sizeof(qos));
+    if (name == "reliable") {
+        qos.reliability = DDS_RELIABILITY_RELIABLE;
+        qos.history_kind = DDS_HISTORY_KEEP_ALL;
+        qos.max_samples = static_cast<int32_t>(burst + kBatch);
+        qos.max_samples_per_instance = qos.max_samples;
+    } else if (name == "best_effort") {
+        qos.reliability = DDS_RELIABILITY_BEST_EFFORT;
+        qos.history_kind = DDS_HISTORY_KEEP_LAST;
+        qos.history_depth = static_cast<int32_t>(burst + kBatch);
+    } else {
+        return false;
+    }
+    return true;
+}
+
+struct Endpoints {
+    dds_participant_t* participant = nullptr;
+    dds_writer_t* writer = nullptr;
+    dds_reader_t* reader = nullptr;
+
+    bool open(int32_t transport, const dds_qos_t& qos, const std::string& out_topic, const std::string& in_topic) {
+        participant = dds_participant_create_with_transport(0, transport);
+        if (!participant) return false;
+        writer = dds_writer_create_with_qos(participant, out_topic.c_str(), &qos);
+        reader = dds_reader_create_with_qos(participant, in_topic.c_str(), &qos);
+        return writer && reader;
+    }
+
+    void close() {
+        dds_writer_delete(writer);
+        dds_reader_delete(reader);
+        dds_participant_delete(participant);
+    }
+};
+
+struct Batch {
+    std::vector<uint32_t> indices;
+    std::vector<uint32_t> offsets;
+    std::vector<char> buffer;
+
+    explicit Batch(uint32_t message_size)
+        : indices(kBatch), offsets(kBatch + 1), buffer(static_cast<size_t>(kBatch) * std::max<uint32_t>(message_size, 1)) {}
+
+    int take(dds_reader_t* reader) {
+        return dds_reader_take_batch(reader, kBatch, indices.data(), buffer.data(),
+                                     static_cast<uint32_t>(buffer.size()), offsets.data());
+    }
+};
+
+int run_echo(int32_t transport, const dds_qos_t& qos, const std::string& ping, const std::string& pong, uint32_t size) {
+    Endpoints e;
+    if (!e.open(transport, qos, pong, ping)) return 1;
+    Batch batch(size);
+    // Exits on the stop sample, or once the parent has gone quiet (a lost best-effort stop)
+    int idle_ms = 0;
+    bool running = true;
+    while (running && idle_ms < 10000) {
+        if (!dds_reader_wait_for_data(e.reader, 500)) {
+            idle_ms += 500;
+            continue;
+        }
+        idle_ms = 0;
+        int n = batch.take(e.reader);
+        for (int i = 0; i < n; ++i) {
+            if (batch.indices[i] == kStopIndex) running = false;
+        }
+        if (n > 0) dds_writer_write_batch(e.writer, static_cast<uint32_t>(n), batch.indices.data(), batch.buffer.data(), batch.offsets.data());
+    }
+    e.close();
+    return 0;
+}
+
+double now_us() {
+    using namespace std::chrono;
+    return duration_cast<duration<double, std::micro>>(steady_clock::now().time_since_epoch()).count();
+}
+
+// Receive until an echo of `index` arrives; false on timeout
+bool await_echo(dds_reader_t* reader, Batch& batch, uint32_t index, int32_t timeout_ms) {
+    while (dds_reader_wait_for_data(reader, timeout_ms)) {
+        int n = batch.take(reader);
+        for (int i = 0; i < n; ++i) {
+            if (batch.indices[i] == index) return true;
+        }
+    }
+    return false;
+}
+
+// Nearest-rank percentile of sorted values
+double percentile(const std::vector<double>& sorted, double p) {
+    if (sorted.empty()) return 0;
+    size_t rank = static_cast<size_t>(std::ceil(p * sorted.size()));
+    return sorted[std::min(sorted.size() - 1, rank > 0 ? rank - 1 : 0)];
+}
+
+// Stop the echo process: the stop sample may be lost under best effort, so repeat it
+void stop_echo(dds_writer_t* writer, pid_t child) {
+    int status = 0;
+    for (int attempt = 0; attempt < 20; ++attempt) {
+        if (writer) dds_writer_write(writer, kStopIndex, "");
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        if (waitpid(child, &status, WNOHANG) == child) return;
+    }
+    kill(child, SIGTERM);
+    waitpid(child, &status, 0);
+}
+
+// One JSON result object, or an empty string if the combination could not run
+std::string run_case(const std::string& transport, const std::string& qos_name, uint32_t size, const Options& options) {
+    dds_qos_t qos;
+    make_qos(qos_name, options.burst, qos);
+    std::string suffix = transport + "_" + qos_name + "_" + std::to_string(size) + "_" + std::to_string(getpid());
+    std::string ping = "FacadeBenchPing_" + suffix;
+    std::string pong = "FacadeBenchPong_" + suffix;
+
+    pid_t child = fork();
+    if (child == 0) {
+        std::exit(run_echo(transport_id(transport), qos, ping, pong, size));
+    }
+
+    Endpoints e;
+    std::string message(size, 'x');
+    Batch batch(size);
+    std::ostringstream json;
+    if (!e.open(transport_id(transport), qos, ping, pong)) {
+        std::fprintf(stderr, "%s/%s/%u: failed to create endpoints\n", transport.c_str(), qos_name.c_str(), size);
+    } else {
+        // Discovery: probe until the echo process answers
+        bool matched = false;
+        for (int attempt = 0; attempt < 50 && !matched; ++attempt) {
+            dds_writer_write(e.writer, 0, message.c_str());
+            matched = await_echo(e.reader, batch, 0, 100);
+        }
+        if (!matched) {
+            std::fprintf(stderr, "%s/%s/%u: echo process never matched\n", transport.c_str(), qos_name.c_str(), size);
+        } else {
+            while (batch.take(e.reader) > 0) {}
+
+            std::vector<double> rtts;
+            double total_us = 0;
+            for (int i = 1; i <= options.pings; ++i) {
+                double start = now_us();
+                dds_writer_write(e.writer, static_cast<uint32_t>(i), message.c_str());
+                if (await_echo(e.reader, batch, static_cast<uint32_t>(i), 1000)) {
+                    rtts.push_back(now_us() - start);
+                    total_us += rtts.back();
+                }
+            }
+            std::sort(rtts.begin(), rtts.end());
+
+            std::vector<uint32_t> indices(options.burst);
+            std::vector<uint32_t> offsets(options.burst + 1);
+            std::string packed;
+            packed.reserve(static_cast<size_t>(options.burst) * size);
+            for (uint32_t i = 0; i < options.burst; ++i) {
+                indices[i] = 1000000u + i;
+                packed += message;
+                offsets[i + 1] = static_cast<uint32_t>(packed.size());
+            }
+            uint32_t received = 0;
+            double start = now_us();
+            double last = start;
+            dds_writer_write_batch(e.writer, options.burst, indices.data(), packed.data(), offsets.data());
+            while (received < options.burst && dds_reader_wait_for_data(e.reader, 2000)) {
+                received += static_cast<uint32_t>(std::max(0, batch.take(e.reader)));
+                last = now_us();
+            }
+            double elapsed_s = std::max(last - start, 1.0) / 1e6;
+
+            json << "{\"binding\": \"c\", \"transport\": \"" << transport << "\", \"qos\": \"" << qos_name
+                 << "\", \"size\": " << size << ", \"pings\": " << options.pings
+                 << ", \"lost_pings\": " << (options.pings - static_cast<int>(rtts.size()))
+                 << ", \"latency_us\": {\"p50\": " << percentile(rtts, 0.50) << ", \"p99\": " << percentile(rtts, 0.99)
+                 << ", \"p999\": " << percentile(rtts, 0.999) << ", \"mean\": " << (rtts.empty() ? 0 : total_us / rtts.size())
+                 << "}, \"burst\": " << options.burst << ", \"received\": " << received
+                 << ", \"msgs_per_s\": " << received / elapsed_s
+                 << ", \"mb_per_s\": " << static_cast<double>(received) * size / elapsed_s / 1e6 << "}";
+            std::fprintf(stderr, "%-6s %-12s %8u  p50 %9.1f us  p99 %9.1f us  %12.0f msgs/s\n", transport.c_str(),
+                         qos_name.c_str(), size, percentile(rtts, 0.50), percentile(rtts, 0.99), received / elapsed_s);
+        }
+    }
+    stop_echo(e.writer, child);
+    e.close();
+    return json.str();
+}
+
+template <typename T, typename Parse>
+std::vector<T> split(const char* list, Parse parse) {
+    std::vector<T> items;
+    std::stringstream stream(list);
+    std::string item;
+    while (std::getline(stream, item, ',')) {
+        if (!item.empty()) items.push_back(parse(item));
+    }
+    return items;
+}
+
+bool parse_options(int argc, char** argv, Options& options) {
+    for (int i = 1; i + 1 < argc; i += 2) {
+        const char* flag = argv[i];
+        const char* value = argv[i + 1];
+        if (std::strcmp(flag, "--sizes") == 0) {
+            options.sizes = split<uint32_t>(value, [](const std::string& s) { return static_cast<uint32_t>(std::atoi(s.c_str())); });
+        } else if (std::strcmp(flag, "--transports") == 0) {
+            options.transports = split<std::string>(value, [](const std::string& s) { return s; });
+        } else if (std::strcmp(flag, "--qos") == 0) {
+            options.qos = split<std::string>(value, [](const std::string& s) { return s; });
+        } else if (std::strcmp(flag, "--pings") == 0) {
+            options.pings = std::atoi(value);
+        } else if (std::strcmp(flag, "--burst") == 0) {
+            options.burst = static_cast<uint32_t>(std::atoi(value));
+        } else if (std::strcmp(flag, "--output") == 0) {
+            options.output = value;
+        } else {
+            return false;
+        }
+    }
+    if (argc % 2 == 0 || options.pings <= 0 || options.burst == 0) return false;
+    dds_qos_t qos;
+    for (const std::string& name : options.qos) {
+        if (!make_qos(name, options.burst, qos)) return false;
+    }
+    for (const std::string& name : options.transports) {
+        if (transport_id(name) < 0) return false;
+    }
+    for (uint32_t size : options.sizes) {
+        if (size == 0) return false;
+    }
+    return true;
+}
+
+} // namespace
+
+int main(int argc, char** argv) {
+    Options options;
+    if (!parse_options(argc, argv, options)) {
+        std::fprintf(stderr, "usage: %s [--sizes 64,1024,16384] [--transports udp,shm] [--qos reliable,best_effort]\n"
+                             "       [--pings 1000] [--burst 5000] [--output results.json]\n", argv[0]);
+        return 2;
+    }
+
+    std::string results;
+    for (const std::string& transport : options.transports) {
+        for (const std::string& qos : options.qos) {
+            for (uint32_t size : options.sizes) {
+                std::string result = run_case(transport, qos, size, options);
+                if (result.empty()) continue;
+                results += (results.empty() ? "\n    " : ",\n    ") + result;
+            }
+        }
+    }
+
+    FILE* out = options.output ? std::fopen(options.output, "w") : stdout;
+    if (!out) {
+        std::perror(options.output);
+        return 1;
+    }
+    std::fprintf(out, "{\"schema\": 1, \"binding\": \"c\", \"results\": [%s\n]}\n", results.c_str());
+    if (out != stdout) std::fclose(out);
+    return 0;
+}
@@ -0,0 +1,136 @@
+// Startup cost of the single-topic API, with and without participant reuse
+// (dds_set_keep_participant).
+//
+// Runs dds_init / first sample / dds_shutdown cycles in two modes: "fresh"
+// creates a new participant on every dds_init, "reuse" keeps the first one.
+// A peer participant, created once, subscribes to the topic, so each cycle
+// also pays the discovery a remote subscriber sees. Each cycle reports:
+//   init         the dds_init call
+//   local        time to the first sample at the dds_init reader (dds_get_startup_stats)
+//   peer         time to the first sample at the peer reader, writing every millisecond
+//   shutdown     the dds_shutdown call
+// All times are in ms since the start of dds_init (shutdown: of the call). The
+// first cycle of each mode is reported on its own, the rest as medians.
+//
+// Usage: startup_bench [cycles] [domain]
+
+#include "dds_facade.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <vector>
+
+namespace {
+
+typedef std::chrono::steady_clock Clock;
+
+double ms_since(Clock::time_point start) {
+    return std::chrono::duration<double, std::milli>(Clock::now() - start).count();
+}
+
+struct Cycle {
+    double init_ms;
+    double local_ms;
+    double peer_ms;
+    double shutdown_ms;
+};
+
+const double kTimeoutMs = 10000;
+
+// One init / first sample / shutdown cycle; peer_ms is negative on timeout
+bool run_cycle(const char* topic, uint32_t domain, dds_reader_t* peer, uint32_t marker, Cycle& cycle) {
+    char buffer[64];
+    uint32_t index;
+    // Leftovers of the previous cycle
+    while (dds_reader_take(peer, &index, buffer, sizeof(buffer))) {}
+
+    Clock::time_point start = Clock::now();
+    if (!dds_init_with_domain(topic, domain)) return false;
+    cycle.init_ms = ms_since(start);
+
+    cycle.peer_ms = -1;
+    while (ms_since(start) < kTimeoutMs) {
+        dds_write(marker, "startup");
+        if (dds_reader_wait_for_data(peer, 1) && dds_reader_take(peer, &index, buffer, sizeof(buffer)) && index == marker) {
+            cycle.peer_ms = ms_since(start);
+            break;
+        }
+    }
+
+    dds_startup_stats_t stats;
+    cycle.local_ms = dds_get_startup_stats(&stats) ? stats.first_sample_ns / 1e6 : 0;
+
+    Clock::time_point shutdown = Clock::now();
+    dds_shutdown();
+    cycle.shutdown_ms = ms_since(shutdown);
+    return true;
+}
+
+double median(std::vector<double> values) {
+    if (values.empty()) return 0;
+    std::sort(values.begin(), values.end());
+    return values[values.size() / 2];
+}
+
+void print_row(const char* mode, const char* label, double init, double local, double peer, double shutdown) {
+    std::printf("%-6s %-10s %10.2f %10.2f %10.2f %10.2f\n", mode, label, init, local, peer, shutdown);
+}
+
+} // namespace
+
+int main(int argc, char** argv) {
+    int cycles = argc > 1 ? std::atoi(argv[1]) : 10;
+    uint32_t domain = argc > 2 ? static_cast<uint32_t>(std::atoi(argv[2])) : 0;
+    if (cycles < 2) {
+        std::fprintf(stderr, "usage: %s [cycles >= 2] [domain]\n", argv[0]);
+        return 2;
+    }
+    const char* topic = "StartupBench";
+
+    dds_participant_t* participant = dds_participant_create(domain);
+    dds_reader_t* peer = participant ? dds_reader_create(participant, topic) : nullptr;
+    if (!peer) {
+        std::fprintf(stderr, "failed to create the peer reader\n");
+        return 1;
+    }
+
+    std::printf("%-6s %-10s %10s %10s %10s %10s\n", "mode", "cycle", "init ms", "local ms", "peer ms", "shutdown");
+    const char* modes[2] = { "fresh", "reuse" };
+    uint32_t marker = 0;
+    int timeouts = 0;
+    for (int keep = 0; keep < 2; ++keep) {
+        dds_set_keep_participant(keep);
+        std::vector<Cycle> results;
+        for (int i = 0; i < cycles; ++i) {
+            Cycle cycle;
+            if (!run_cycle(topic, domain, peer, ++marker, cycle)) {
+                std::fprintf(stderr, "dds_init failed\n");
+                return 1;
+            }
+            if (cycle.peer_ms < 0) ++timeouts;
+            results.push_back(cycle);
+        }
+        // Releases the participant kept by the reuse mode
+        dds_set_keep_participant(0);
+
+        const Cycle& first = results.front();
+        print_row(modes[keep], "first", first.init_ms, first.local_ms, first.peer_ms, first.shutdown_ms);
+        std::vector<double> init, local, peer_times, shutdown;
+        for (size_t i = 1; i < results.size(); ++i) {
+            init.push_back(results[i].init_ms);
+            local.push_back(results[i].local_ms);
+            peer_times.push_back(results[i].peer_ms);
+            shutdown.push_back(results[i].shutdown_ms);
+        }
+        print_row(modes[keep], "re-init", median(init), median(local), median(peer_times), median(shutdown));
+    }
+    if (timeouts) {
+        std::printf("\n%d cycle(s) timed out before the peer received a sample (peer ms -1)\n", timeouts);
+    }
+
+    dds_reader_delete(peer);
+    dds_participant_delete(participant);
+    return 0;
+}
@@ -0,0 +1,97 @@
+// Cost of statistics collection (dds_stats_enable) on the facade hot paths.
+//
+// Times two calls with collection off and on: a take on a reader with no data
+// (the cheapest facade call, so the overhead is most visible) and a 64-byte
+// best-effort write with no reader matched. Rounds alternate between off and
+// on so frequency scaling affects both alike. Reports ns/call for each and the
+// difference, then the write latency percentiles that were collected.
+//
+// Usage: stats_overhead [calls] [rounds]
+
+#include "dds_facade.hpp"
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+
+namespace {
+
+typedef std::chrono::steady_clock Clock;
+
+double empty_takes(dds_reader_t* reader, uint32_t calls) {
+    uint32_t indices[16];
+    uint32_t offsets[17];
+    char buffer[1024];
+    Clock::time_point start = Clock::now();
+    for (uint32_t i = 0; i < calls; ++i) {
+        dds_reader_take_batch(reader, 16, indices, buffer, sizeof(buffer), offsets);
+    }
+    return std::chrono::duration<double, std::nano>(Clock::now() - start).count() / calls;
+}
+
+double writes(dds_writer_t* writer, const std::string& message, uint32_t calls) {
+    Clock::time_point start = Clock::now();
+    for (uint32_t i = 0; i < calls; ++i) {
+        dds_writer_write(writer, i, message.c_str());
+    }
+    return std::chrono::duration<double, std::nano>(Clock::now() - start).count() / calls;
+}
+
+} // namespace
+
+int main(int argc, char** argv) {
+    uint32_t calls = argc > 1 ? static_cast<uint32_t>(std::atoi(argv[1])) : 1000000;
+    uint32_t rounds = argc > 2 ? static_cast<uint32_t>(std::atoi(argv[2])) : 5;
+    if (calls == 0 || rounds == 0) {
+        std::fprintf(stderr, "usage: %s [calls] [rounds]\n", argv[0]);
+        return 2;
+    }
+
+    dds_qos_t qos;
+    std::memset(&qos, 0, sizeof(qos));
+    qos.reliability = DDS_RELIABILITY_BEST_EFFORT;
+    qos.history_kind = DDS_HISTORY_KEEP_LAST;
+    qos.history_depth = 1;
+
+    // Separate topics, so the writer has no matched reader and the reader never gets data
+    dds_participant_t* participant = dds_participant_create(0);
+    dds_writer_t* writer = participant ? dds_writer_create_with_qos(participant, "StatsOverheadWrite", &qos) : nullptr;
+    dds_reader_t* reader = writer ? dds_reader_create_with_qos(participant, "StatsOverheadTake", &qos) : nullptr;
+    if (!reader) {
+        std::fprintf(stderr, "failed to create DDS entities\n");
+        return 1;
+    }
+
+    const std::string message(64, 'x');
+    double take_ns[2] = { 0, 0 };
+    double write_ns[2] = { 0, 0 };
+    for (uint32_t round = 0; round < rounds; ++round) {
+        for (int enabled = 0; enabled < 2; ++enabled) {
+            dds_stats_enable(enabled);
+            take_ns[enabled] += empty_takes(reader, calls) / rounds;
+            write_ns[enabled] += writes(writer, message, calls / 10) / rounds;
+        }
+    }
+    dds_stats_enable(0);
+
+    std::printf("%-12s %12s %12s %12s\n", "ns/call", "stats off", "stats on", "overhead");
+    std::printf("%-12s %12.1f %12.1f %12.1f\n", "empty take", take_ns[0], take_ns[1], take_ns[1] - take_ns[0]);
+    std::printf("%-12s %12.1f %12.1f %12.1f\n", "write", write_ns[0], write_ns[1], write_ns[1] - write_ns[0]);
+
+    dds_writer_stats_t stats;
+    if (dds_writer_get_stats(writer, &stats)) {
+        std::printf("\nwrite latency over %llu calls: p50 %llu ns, p99 %llu ns, p99.9 %llu ns, max %llu ns\n",
+                    static_cast<unsigned long long>(stats.write_latency.count),
+                    static_cast<unsigned long long>(dds_histogram_percentile(&stats.write_latency, 0.50)),
+                    static_cast<unsigned long long>(dds_histogram_percentile(&stats.write_latency, 0.99)),
+                    static_cast<unsigned long long>(dds_histogram_percentile(&stats.write_latency, 0.999)),
+                    static_cast<unsigned long long>(stats.write_latency.max_ns));
+    }
+
+    dds_reader_delete(reader);
+    dds_writer_delete(writer);
+    dds_participant_delete(participant);
+    return 0;
+}
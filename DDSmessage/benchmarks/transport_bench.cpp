@@ -0,0 +1,200 @@
+// Same-host latency and throughput per transport: UDPv4, shared memory, and
+// shared memory with data-sharing delivery of fixed-size samples.
+//
+// For each mode the benchmark forks an echo process. The parent publishes on
+// a ping topic, the child writes every sample back on a pong topic, and the
+// parent measures round trips (one sample in flight) and then bulk throughput
+// (a burst of samples, timed until every echo is back). Separate processes
+// keep Fast DDS from short-circuiting delivery through intra-process queues.
+//
+// Usage: transport_bench [message_size] [pings] [burst]   (POSIX only)
+
+#include "dds_facade.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+#include <vector>
+
+#include <sys/wait.h>
+#include <unistd.h>
+
+namespace {
+
+const uint32_t kStopIndex = 0xFFFFFFFFu;
+const uint32_t kBatch = 256;
+
+struct Mode {
+    const char* name;
+    int32_t transport;
+    bool fixed;
+    int32_t data_sharing;
+};
+
+const Mode kModes[] = {
+    { "udp", DDS_TRANSPORT_UDP, false, DDS_QOS_DEFAULT },
+    { "shm", DDS_TRANSPORT_SHM, false, DDS_QOS_DEFAULT },
+    { "shm-fixed", DDS_TRANSPORT_SHM, true, DDS_DATA_SHARING_OFF },
+    { "data-sharing", DDS_TRANSPORT_SHM, true, DDS_DATA_SHARING_ON },
+};
+
+struct Endpoints {
+    dds_participant_t* participant = nullptr;
+    dds_writer_t* writer = nullptr;
+    dds_reader_t* reader = nullptr;
+
+    bool open(const Mode& mode, const std::string& out_topic, const std::string& in_topic, uint32_t burst) {
+        // Room for a whole burst, so the writer never blocks on a full history
+        dds_qos_t qos;
+        std::memset(&qos, 0, sizeof(qos));
+        qos.reliability = DDS_RELIABILITY_RELIABLE;
+        qos.history_kind = DDS_HISTORY_KEEP_ALL;
+        qos.max_samples = static_cast<int32_t>(burst + kBatch);
+        qos.max_samples_per_instance = qos.max_samples;
+        qos.data_sharing = mode.data_sharing;
+
+        participant = dds_participant_create_with_transport(0, mode.transport);
+        if (!participant) return false;
+        writer = mode.fixed ? dds_writer_create_fixed(participant, out_topic.c_str(), &qos)
+                            : dds_writer_create_with_qos(participant, out_topic.c_str(), &qos);
+        reader = mode.fixed ? dds_reader_create_fixed(participant, in_topic.c_str(), &qos)
+                            : dds_reader_create_with_qos(participant, in_topic.c_str(), &qos);
+        return writer && reader;
+    }
+
+    void close() {
+        dds_writer_delete(writer);
+        dds_reader_delete(reader);
+        dds_participant_delete(participant);
+    }
+};
+
+struct Batch {
+    std::vector<uint32_t> indices = std::vector<uint32_t>(kBatch);
+    std::vector<uint32_t> offsets = std::vector<uint32_t>(kBatch + 1);
+    std::vector<char> buffer = std::vector<char>(kBatch * DDS_FIXED_MESSAGE_CAPACITY);
+
+    int take(dds_reader_t* reader) {
+        return dds_reader_take_batch(reader, kBatch, indices.data(), buffer.data(),
+                                     static_cast<uint32_t>(buffer.size()), offsets.data());
+    }
+};
+
+int run_echo(const Mode& mode, const std::string& ping, const std::string& pong, uint32_t burst) {
+    Endpoints e;
+    if (!e.open(mode, pong, ping, burst)) return 1;
+    Batch batch;
+    bool running = true;
+    while (running) {
+        if (!dds_reader_wait_for_data(e.reader, 1000)) continue;
+        int n = batch.take(e.reader);
+        for (int i = 0; i < n; ++i) {
+            if (batch.indices[i] == kStopIndex) running = false;
+        }
+        if (n > 0) dds_writer_write_batch(e.writer, static_cast<uint32_t>(n), batch.indices.data(), batch.buffer.data(), batch.offsets.data());
+    }
+    e.close();
+    return 0;
+}
+
+double now_us() {
+    using namespace std::chrono;
+    return duration_cast<duration<double, std::micro>>(steady_clock::now().time_since_epoch()).count();
+}
+
+// Receive until an echo of `index` arrives; false on timeout
+bool await_echo(dds_reader_t* reader, Batch& batch, uint32_t index, int32_t timeout_ms) {
+    while (dds_reader_wait_for_data(reader, timeout_ms)) {
+        int n = batch.take(reader);
+        for (int i = 0; i < n; ++i) {
+            if (batch.indices[i] == index) return true;
+        }
+    }
+    return false;
+}
+
+void run_mode(const Mode& mode, size_t message_size, int pings, uint32_t burst) {
+    std::string suffix = std::string(mode.name) + "_" + std::to_string(getpid());
+    std::string ping = "TransportBenchPing_" + suffix;
+    std::string pong = "TransportBenchPong_" + suffix;
+
+    pid_t child = fork();
+    if (child == 0) {
+        std::exit(run_echo(mode, ping, pong, burst));
+    }
+
+    Endpoints e;
+    std::string message(message_size, 'x');
+    Batch batch;
+    if (!e.open(mode, ping, pong, burst)) {
+        std::printf("%-14s failed to create endpoints\n", mode.name);
+    } else {
+        // Discovery: probe until the echo process answers
+        bool matched = false;
+        for (int attempt = 0; attempt < 50 && !matched; ++attempt) {
+            dds_writer_write(e.writer, 0, message.c_str());
+            matched = await_echo(e.reader, batch, 0, 100);
+        }
+        if (!matched) {
+            std::printf("%-14s echo process never matched\n", mode.name);
+        } else {
+            while (batch.take(e.reader) > 0) {}
+
+            std::vector<double> rtts;
+            for (int i = 1; i <= pings; ++i) {
+                double start = now_us();
+                dds_writer_write(e.writer, static_cast<uint32_t>(i), message.c_str());
+                if (await_echo(e.reader, batch, static_cast<uint32_t>(i), 1000)) rtts.push_back(now_us() - start);
+            }
+            std::sort(rtts.begin(), rtts.end());
+
+            std::vector<uint32_t> indices(burst);
+            std::vector<uint32_t> offsets(burst + 1);
+            std::string packed;
+            packed.reserve(burst * message_size);
+            for (uint32_t i = 0; i < burst; ++i) {
+                indices[i] = 1000000u + i;
+                packed += message;
+                offsets[i + 1] = static_cast<uint32_t>(packed.size());
+            }
+            uint32_t received = 0;
+            double start = now_us();
+            dds_writer_write_batch(e.writer, burst, indices.data(), packed.data(), offsets.data());
+            while (received < burst && dds_reader_wait_for_data(e.reader, 2000)) {
+                received += static_cast<uint32_t>(std::max(0, batch.take(e.reader)));
+            }
+            double elapsed_s = (now_us() - start) / 1e6;
+
+            double p50 = rtts.empty() ? 0 : rtts[rtts.size() / 2];
+            double p99 = rtts.empty() ? 0 : rtts[std::min(rtts.size() - 1, rtts.size() * 99 / 100)];
+            std::printf("%-14s %10.1f %10.1f %14.0f %10.1f\n", mode.name, p50, p99,
+                        received / elapsed_s, received * message_size / elapsed_s / (1024 * 1024));
+        }
+        dds_writer_write(e.writer, kStopIndex, "");
+    }
+    e.close();
+    int status = 0;
+    waitpid(child, &status, 0);
+}
+
+} // namespace
+
+int main(int argc, char** argv) {
+    size_t message_size = argc > 1 ? static_cast<size_t>(std::atoi(argv[1])) : 256;
+    int pings = argc > 2 ? std::atoi(argv[2]) : 1000;
+    uint32_t burst = argc > 3 ? static_cast<uint32_t>(std::atoi(argv[3])) : 10000;
+    if (message_size > DDS_FIXED_MESSAGE_CAPACITY || pings <= 0 || burst == 0) {
+        std::fprintf(stderr, "usage: %s [message_size <= %d] [pings] [burst]\n", argv[0], DDS_FIXED_MESSAGE_CAPACITY);
+        return 2;
+    }
+
+    std::printf("%zu-byte messages, %d pings, burst of %u\n", message_size, pings, burst);
+    std::printf("%-14s %10s %10s %14s %10s\n", "mode", "p50 us", "p99 us", "samples/s", "MiB/s");
+    for (const Mode& mode : kModes) {
+        run_mode(mode, message_size, pings, burst);
+    }
+    return 0;
+}
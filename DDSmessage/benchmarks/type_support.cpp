@@ -0,0 +1,113 @@
+// Serialization cost of the generated HelloWorld type support versus the
+// hand-written fast path (fast_type_support.hpp).
+//
+// For each message size both type supports serialize the same sample into a
+// payload and deserialize it back into a reused sample, with no DDS entity
+// involved. Reports ns/sample for each step. First the fast payload is compared
+// byte for byte with HelloWorldPubSubType::serialize output, and each type
+// support deserializes the other's payload, so a layout mismatch fails the run.
+//
+// Usage: type_support [xcdr1|xcdr2] [megabytes per measurement]
+
+#include "ICD.hpp"
+#include "ICDPubSubTypes.hpp"
+#include "fast_type_support.hpp"
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+
+using eprosima::fastdds::dds::DataRepresentationId_t;
+using eprosima::fastdds::rtps::SerializedPayload_t;
+
+namespace {
+
+const uint32_t kSizes[] = { 16, 256, 4u << 10, 64u << 10, 1u << 20 };
+
+typedef std::chrono::steady_clock Clock;
+
+double ns_per(Clock::time_point start, uint32_t iterations) {
+    return std::chrono::duration<double, std::nano>(Clock::now() - start).count() / iterations;
+}
+
+struct Result {
+    double serialize_ns;
+    double deserialize_ns;
+};
+
+bool measure(eprosima::fastdds::dds::TopicDataType& type, const ICD_pkg::HelloWorld& sample,
+             DataRepresentationId_t representation, uint32_t iterations, SerializedPayload_t& payload, Result& result) {
+    Clock::time_point start = Clock::now();
+    for (uint32_t i = 0; i < iterations; ++i) {
+        if (!type.serialize(&sample, payload, representation)) return false;
+    }
+    result.serialize_ns = ns_per(start, iterations);
+
+    ICD_pkg::HelloWorld out;
+    start = Clock::now();
+    for (uint32_t i = 0; i < iterations; ++i) {
+        if (!type.deserialize(payload, &out)) return false;
+    }
+    result.deserialize_ns = ns_per(start, iterations);
+    return out == sample;
+}
+
+} // namespace
+
+int main(int argc, char** argv) {
+    const bool xcdr1 = argc > 1 && std::strcmp(argv[1], "xcdr1") == 0;
+    if (argc > 1 && !xcdr1 && std::strcmp(argv[1], "xcdr2") != 0) {
+        std::fprintf(stderr, "usage: %s [xcdr1|xcdr2] [megabytes per measurement]\n", argv[0]);
+        return 2;
+    }
+    const double megabytes = argc > 2 ? std::atof(argv[2]) : 256;
+    const DataRepresentationId_t representation = xcdr1
+            ? DataRepresentationId_t::XCDR_DATA_REPRESENTATION
+            : DataRepresentationId_t::XCDR2_DATA_REPRESENTATION;
+
+    ICD_pkg::HelloWorldPubSubType generated;
+    ICD_pkg::HelloWorldFastPubSubType fast;
+
+    std::printf("%s, ns/sample\n", xcdr1 ? "XCDR1" : "XCDR2");
+    std::printf("%-10s %14s %14s %14s %14s\n", "size", "gen ser", "fast ser", "gen deser", "fast deser");
+    for (uint32_t size : kSizes) {
+        ICD_pkg::HelloWorld sample;
+        sample.index(42);
+        sample.message(std::string(size, 'x'));
+        const uint32_t payload_size = generated.calculate_serialized_size(&sample, representation);
+        if (payload_size != fast.calculate_serialized_size(&sample, representation)) {
+            std::fprintf(stderr, "size mismatch at %u bytes\n", size);
+            return 1;
+        }
+
+        SerializedPayload_t generated_payload(payload_size);
+        SerializedPayload_t fast_payload(payload_size);
+        if (!generated.serialize(&sample, generated_payload, representation) ||
+            !fast.serialize(&sample, fast_payload, representation) ||
+            generated_payload.length != fast_payload.length ||
+            std::memcmp(generated_payload.data, fast_payload.data, fast_payload.length) != 0) {
+            std::fprintf(stderr, "payload mismatch at %u bytes\n", size);
+            return 1;
+        }
+        ICD_pkg::HelloWorld from_generated, from_fast;
+        if (!fast.deserialize(generated_payload, &from_generated) || !(from_generated == sample) ||
+            !generated.deserialize(fast_payload, &from_fast) || !(from_fast == sample)) {
+            std::fprintf(stderr, "cross deserialization failed at %u bytes\n", size);
+            return 1;
+        }
+
+        const double total = megabytes * 1024 * 1024 / size;
+        const uint32_t iterations = total < 100 ? 100 : total > 10000000 ? 10000000 : static_cast<uint32_t>(total);
+        Result gen_result, fast_result;
+        if (!measure(generated, sample, representation, iterations, generated_payload, gen_result) ||
+            !measure(fast, sample, representation, iterations, fast_payload, fast_result)) {
+            std::fprintf(stderr, "round trip failed at %u bytes\n", size);
+            return 1;
+        }
+        std::printf("%-10u %14.1f %14.1f %14.1f %14.1f\n", size, gen_result.serialize_ns, fast_result.serialize_ns,
+                    gen_result.deserialize_ns, fast_result.deserialize_ns);
+    }
+    return 0;
+}
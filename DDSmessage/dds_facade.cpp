@@ -1,80 +1,993 @@
+#ifdef _WIN32
+#include <winsock2.h>  // must precede anything pulling in windows.h
+#else
+#include <unistd.h>    // for write
+#endif
 #include "dds_facade.hpp"
 #include "ICD.hpp"
 #include "ICDPubSubTypes.hpp"
+#include "fast_type_support.hpp"
 
 #include <fastdds/dds/domain/DomainParticipantFactory.hpp>
 #include <fastdds/dds/domain/DomainParticipant.hpp>
 #include <fastdds/dds/publisher/Publisher.hpp>
 #include <fastdds/dds/publisher/DataWriter.hpp>
+#include <fastdds/dds/publisher/DataWriterListener.hpp>
+#include <fastdds/dds/publisher/qos/DataWriterQos.hpp>
 #include <fastdds/dds/subscriber/Subscriber.hpp>
 #include <fastdds/dds/subscriber/DataReader.hpp>
+#include <fastdds/dds/subscriber/DataReaderListener.hpp>
+#include <fastdds/dds/subscriber/qos/DataReaderQos.hpp>
 #include <fastdds/dds/topic/Topic.hpp>
+#include <fastdds/dds/topic/ContentFilteredTopic.hpp>
 #include <fastdds/dds/subscriber/SampleInfo.hpp>
 #include <fastdds/dds/core/status/StatusMask.hpp>
+#include <fastdds/dds/core/status/PublicationMatchedStatus.hpp>
+#include <fastdds/dds/core/status/SubscriptionMatchedStatus.hpp>
+#include <fastdds/dds/core/status/SampleLostStatus.hpp>
+#include <fastdds/dds/core/status/SampleRejectedStatus.hpp>
+#include <fastdds/dds/core/LoanableSequence.hpp>
 #include <fastdds/dds/topic/TypeSupport.hpp>
+#include <fastdds/rtps/attributes/BuiltinTransports.hpp>
+#include <algorithm>
+#include <cmath>
+#include <map>
+#include <memory>
 #include <mutex>
+#include <atomic>
+#include <condition_variable>
+#include <chrono>
+#include <deque>
+#include <thread>
 #include <string>
+#include <vector>
+#include <cstring>  // for memcpy, strcmp
 #include <cstdlib>  // for getenv, atoi
+#ifdef _MSC_VER
+#include <intrin.h> // for _BitScanReverse64
+#endif
 
 using namespace eprosima::fastdds::dds;
 
+// Entities behind the opaque handles declared in dds_facade.hpp
+struct dds_participant_s {
+    DomainParticipant* participant = nullptr;
+    Publisher* publisher = nullptr;
+    Subscriber* subscriber = nullptr;
+    eprosima::fastdds::dds::TypeSupport type; // holds HelloWorldFastPubSubType instance
+    eprosima::fastdds::dds::TypeSupport fixed_type; // holds HelloWorldFixedPubSubType instance
+    eprosima::fastdds::dds::TypeSupport keyed_type; // holds HelloWorldKeyedPubSubType instance
+
+    // Topics are shared by every writer/reader on the same name
+    struct TopicEntry {
+        Topic* topic;
+        int refs;
+    };
+    std::mutex mutex;
+    std::map<std::string, TopicEntry> topics;
+    int endpoints = 0;
+    // Set when the single-topic API let go of the participant while a retired reader
+    // still used it; that reader deletes the participant with itself (under mutex)
+    bool orphaned = false;
+};
+
 namespace {
-std::mutex g_mutex;
-DomainParticipant* g_participant = nullptr;
-Publisher* g_publisher = nullptr;
-Subscriber* g_subscriber = nullptr;
-Topic* g_topic = nullptr;
-DataWriter* g_writer = nullptr;
-DataReader* g_reader = nullptr;
-eprosima::fastdds::dds::TypeSupport g_type; // holds HelloWorldPubSubType instance
-std::string g_topic_name;
 
-void cleanup_locked() {
-    if (g_writer) { g_publisher->delete_datawriter(g_writer); g_writer = nullptr; }
-    if (g_reader) { g_subscriber->delete_datareader(g_reader); g_reader = nullptr; }
-    if (g_topic) { g_participant->delete_topic(g_topic); g_topic = nullptr; }
-    if (g_publisher) { g_participant->delete_publisher(g_publisher); g_publisher = nullptr; }
-    if (g_subscriber) { g_participant->delete_subscriber(g_subscriber); g_subscriber = nullptr; }
-    if (g_participant) { DomainParticipantFactory::get_instance()->delete_participant(g_participant); g_participant = nullptr; }
+// Data-arrival signalling for one reader. Shared (not owned) by the reader so a
+// waiter that raced with dds_reader_delete still wakes up on valid memory.
+// Kept apart from any facade lock so the DDS listener thread never contends
+// with writers or lifecycle calls.
+class ReaderSignal {
+public:
+    uint64_t sequence() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return seq_;
+    }
+
+    void notify() {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            ++seq_;
+        }
+        cv_.notify_all();
+
+        {
+            // Held while the callback runs, so set_callback() never returns mid-call
+            std::lock_guard<std::mutex> lock(callback_mutex_);
+            if (callback_) callback_(callback_context_);
+        }
+
+        intptr_t fd = notify_fd_.load();
+        if (fd != -1) {
+            // Best effort: a full pipe/socket already means the watcher has a wakeup pending
+            const char byte = 1;
+#ifdef _WIN32
+            (void)::send(static_cast<SOCKET>(fd), &byte, 1, 0);
+#else
+            ssize_t written = ::write(static_cast<int>(fd), &byte, 1);
+            (void)written;
+#endif
+        }
+    }
+
+    void close() {
+        // Wakes waiters and watchers only; the reader is going away, nothing to take
+        set_callback(nullptr, nullptr);
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            closed_ = true;
+        }
+        notify();
+    }
+
+    // Wait for a notification newer than seq. Returns 1 if signalled, 0 on timeout or close.
+    int wait(uint64_t seq, int32_t timeout_ms) {
+        std::unique_lock<std::mutex> lock(mutex_);
+        auto signalled = [this, seq]() { return seq_ != seq || closed_; };
+        if (timeout_ms < 0) {
+            cv_.wait(lock, signalled);
+        } else if (!cv_.wait_for(lock, std::chrono::milliseconds(timeout_ms), signalled)) {
+            return 0;
+        }
+        return closed_ ? 0 : 1;
+    }
+
+    void set_notify_fd(intptr_t fd) {
+        notify_fd_.store(fd);
+    }
+
+    void set_callback(dds_data_callback_t callback, void* context) {
+        std::lock_guard<std::mutex> lock(callback_mutex_);
+        callback_ = callback;
+        callback_context_ = context;
+    }
+
+private:
+    std::mutex mutex_;
+    std::condition_variable cv_;
+    uint64_t seq_ = 0;
+    bool closed_ = false;
+    std::atomic<intptr_t> notify_fd_{-1};
+    std::mutex callback_mutex_;
+    dds_data_callback_t callback_ = nullptr;
+    void* callback_context_ = nullptr;
+};
+
+class FacadeReaderListener : public DataReaderListener {
+public:
+    explicit FacadeReaderListener(const std::shared_ptr<ReaderSignal>& signal) : signal_(signal) {}
+
+    void on_data_available(DataReader* /*reader*/) override {
+        signal_->notify();
+    }
+
+private:
+    std::shared_ptr<ReaderSignal> signal_;
+};
+
+} // namespace
+
+namespace {
+
+// Sample type carried by a writer/reader's topic
+enum class SampleKind {
+    plain, // ICD_pkg::HelloWorld
+    fixed, // ICD_pkg::HelloWorldFixed
+    keyed, // ICD_pkg::HelloWorldKeyed
+};
+
+// Hot-path statistics (dds_stats_enable). While they are off a write or take only
+// tests this flag. Counters are relaxed atomics: each is exact, but a snapshot
+// taken under traffic is not a consistent cut across them.
+std::atomic<bool> g_stats_enabled(false);
+
+uint64_t now_ns() {
+    return static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now().time_since_epoch()).count());
 }
 
-// Internal initialization function with configurable domain ID
-int dds_init_internal(const char* topic_name, uint32_t domain_id) {
-    std::lock_guard<std::mutex> lock(g_mutex);
-    cleanup_locked();
+// Start time of a timed facade call, 0 when statistics are off
+inline uint64_t stats_start() {
+    return g_stats_enabled.load(std::memory_order_relaxed) ? now_ns() : 0;
+}
 
-    DomainParticipantQos pqos;
-    pqos.name("ICDFacadeParticipant");
-    g_participant = DomainParticipantFactory::get_instance()->create_participant(domain_id, pqos);
-    if (!g_participant) return 0;
+// Log-linear buckets: 2^kSubBucketBits per power of two, exact below that
+const unsigned kSubBucketBits = 3;
+const uint32_t kSubBuckets = 1u << kSubBucketBits;
+
+inline unsigned highest_bit(uint64_t value) {
+#ifdef _MSC_VER
+    unsigned long bit;
+    _BitScanReverse64(&bit, value);
+    return static_cast<unsigned>(bit);
+#else
+    return 63 - static_cast<unsigned>(__builtin_clzll(value));
+#endif
+}
+
+inline uint32_t histogram_bucket(uint64_t ns) {
+    if (ns < kSubBuckets) return static_cast<uint32_t>(ns);
+    unsigned msb = highest_bit(ns);
+    uint32_t bucket = (msb - kSubBucketBits + 1) * kSubBuckets +
+        static_cast<uint32_t>((ns >> (msb - kSubBucketBits)) & (kSubBuckets - 1));
+    return std::min<uint32_t>(bucket, DDS_HISTOGRAM_BUCKETS - 1);
+}
+
+class Histogram {
+public:
+    void record(uint64_t ns) {
+        count_.fetch_add(1, std::memory_order_relaxed);
+        total_ns_.fetch_add(ns, std::memory_order_relaxed);
+        uint64_t max = max_ns_.load(std::memory_order_relaxed);
+        while (ns > max && !max_ns_.compare_exchange_weak(max, ns, std::memory_order_relaxed)) {}
+        buckets_[histogram_bucket(ns)].fetch_add(1, std::memory_order_relaxed);
+    }
+
+    void snapshot(dds_histogram_t& out) const {
+        out.count = count_.load(std::memory_order_relaxed);
+        out.total_ns = total_ns_.load(std::memory_order_relaxed);
+        out.max_ns = max_ns_.load(std::memory_order_relaxed);
+        for (uint32_t i = 0; i < DDS_HISTOGRAM_BUCKETS; ++i) {
+            out.buckets[i] = buckets_[i].load(std::memory_order_relaxed);
+        }
+    }
+
+private:
+    std::atomic<uint64_t> count_{0};
+    std::atomic<uint64_t> total_ns_{0};
+    std::atomic<uint64_t> max_ns_{0};
+    std::atomic<uint64_t> buckets_[DDS_HISTOGRAM_BUCKETS] = {};
+};
+
+struct WriterStats {
+    std::atomic<uint64_t> samples{0};
+    std::atomic<uint64_t> bytes{0};
+    std::atomic<uint64_t> failures{0};
+    Histogram latency;
+
+    // One facade write call that started at start and wrote written of attempted samples
+    void record(uint64_t start, uint32_t written, uint32_t attempted, uint64_t byte_count) {
+        latency.record(now_ns() - start);
+        samples.fetch_add(written, std::memory_order_relaxed);
+        bytes.fetch_add(byte_count, std::memory_order_relaxed);
+        if (written < attempted) failures.fetch_add(1, std::memory_order_relaxed);
+    }
+};
+
+struct ReaderStats {
+    std::atomic<uint64_t> samples{0};
+    std::atomic<uint64_t> bytes{0};
+    std::atomic<uint64_t> empty_takes{0};
+    Histogram latency;
+
+    // One facade take call that started at start and handed out taken samples
+    // (-1: a batched take whose buffer was too small for the next message)
+    void record(uint64_t start, int taken, uint64_t byte_count) {
+        latency.record(now_ns() - start);
+        if (taken <= 0) {
+            if (taken == 0) empty_takes.fetch_add(1, std::memory_order_relaxed);
+            return;
+        }
+        samples.fetch_add(static_cast<uint64_t>(taken), std::memory_order_relaxed);
+        bytes.fetch_add(byte_count, std::memory_order_relaxed);
+    }
+};
+
+// Samples a batched take could not fit into the caller's buffer. They have left
+// the DataReader already, so every take on the reader hands them out first.
+class Backlog {
+public:
+    struct Entry {
+        uint32_t index;
+        std::string message;
+    };
+
+    // Checked by every take; the lock is only taken when something is queued
+    bool empty() const { return size_.load(std::memory_order_acquire) == 0; }
+    size_t size() const { return size_.load(std::memory_order_acquire); }
+
+    void push(const dds_sample_t* samples, size_t count) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        for (size_t i = 0; i < count; ++i) {
+            entries_.push_back(Entry{samples[i].index, std::string(samples[i].message, samples[i].length)});
+        }
+        size_.store(entries_.size(), std::memory_order_release);
+    }
+
+    // Removes the oldest entries, in order, for as long as accept(entry) returns true
+    template <typename Accept>
+    void pop_while(Accept accept) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        while (!entries_.empty() && accept(entries_.front())) entries_.pop_front();
+        size_.store(entries_.size(), std::memory_order_release);
+    }
+
+    bool pop(Entry& out) {
+        bool popped = false;
+        pop_while([&](Entry& entry) {
+            if (popped) return false;
+            out = std::move(entry);
+            return popped = true;
+        });
+        return popped;
+    }
+
+private:
+    std::mutex mutex_;
+    std::deque<Entry> entries_;
+    std::atomic<size_t> size_{0};
+};
+
+// Packs samples into the caller's buffers of a batched take (dds_take_batch layout)
+class BatchOutput {
+public:
+    BatchOutput(uint32_t max_samples, uint32_t* indices, char* buffer, uint32_t capacity, uint32_t* offsets)
+        : max_samples_(max_samples), indices_(indices), buffer_(buffer), capacity_(capacity), offsets_(offsets) {
+        offsets_[0] = 0;
+    }
+
+    // Appends one sample; returns false, writing nothing, once it does not fit or the
+    // batch is done
+    bool add(uint32_t index, const char* message, size_t length) {
+        if (done()) return false;
+        uint32_t used = offsets_[count_];
+        if (length > capacity_ - used) {
+            if (count_ == 0) required_ = static_cast<uint32_t>(length);
+            stopped_ = true;
+            return false;
+        }
+        if (length > 0) std::memcpy(buffer_ + used, message, length);
+        indices_[count_] = index;
+        offsets_[++count_] = used + static_cast<uint32_t>(length);
+        return true;
+    }
+
+    bool done() const { return stopped_ || count_ == max_samples_; }
+    uint32_t count() const { return count_; }
+    uint32_t remaining() const { return max_samples_ - count_; }
+
+    // The dds_take_batch return value
+    int result() {
+        if (count_ == 0 && stopped_) {
+            offsets_[1] = required_;
+            return -1;
+        }
+        return static_cast<int>(count_);
+    }
+
+private:
+    uint32_t max_samples_;
+    uint32_t* indices_;
+    char* buffer_;
+    uint32_t capacity_;
+    uint32_t* offsets_;
+    uint32_t count_ = 0;
+    uint32_t required_ = 0;
+    bool stopped_ = false;
+};
+
+} // namespace
+
+struct dds_writer_s {
+    dds_participant_t* owner = nullptr;
+    Topic* topic = nullptr;
+    DataWriter* writer = nullptr;
+    SampleKind kind = SampleKind::plain;
+    WriterStats stats;
+};
+
+struct dds_reader_s {
+    dds_participant_t* owner = nullptr;
+    Topic* topic = nullptr;
+    DataReader* reader = nullptr;
+    SampleKind kind = SampleKind::plain;
+    ContentFilteredTopic* filtered = nullptr; // set for content-filtered readers
+    Backlog backlog;
+    ReaderStats stats;
+    std::shared_ptr<ReaderSignal> signal = std::make_shared<ReaderSignal>();
+    FacadeReaderListener listener{signal};
+    // dds_init readers only: one reference for the slot plus one per dds_take_loan
+    // loan, so that a reader retired with loans out is deleted with the last loan
+    std::atomic<int> refs{1};
+};
+
+namespace {
+
+Topic* acquire_topic(dds_participant_t* p, const char* topic_name, const TypeSupport& type) {
+    std::lock_guard<std::mutex> lock(p->mutex);
+    std::string name = topic_name ? topic_name : "HelloWorldTopic";
+    auto it = p->topics.find(name);
+    if (it != p->topics.end()) {
+        if (it->second.topic->get_type_name() != type.get_type_name()) return nullptr;
+        ++it->second.refs;
+        ++p->endpoints;
+        return it->second.topic;
+    }
+    Topic* topic = p->participant->create_topic(name, type.get_type_name(), TOPIC_QOS_DEFAULT, nullptr, eprosima::fastdds::dds::StatusMask::none());
+    if (!topic) return nullptr;
+    p->topics[name] = dds_participant_s::TopicEntry{topic, 1};
+    ++p->endpoints;
+    return topic;
+}
+
+void release_topic(dds_participant_t* p, Topic* topic) {
+    std::lock_guard<std::mutex> lock(p->mutex);
+    --p->endpoints;
+    for (auto it = p->topics.begin(); it != p->topics.end(); ++it) {
+        if (it->second.topic == topic) {
+            if (--it->second.refs == 0) {
+                p->participant->delete_topic(topic);
+                p->topics.erase(it);
+            }
+            return;
+        }
+    }
+}
+
+std::vector<std::string> filter_parameters(const char* const* parameters, uint32_t parameter_count) {
+    std::vector<std::string> result;
+    if (!parameters) return result;
+    result.reserve(parameter_count);
+    for (uint32_t i = 0; i < parameter_count; ++i) {
+        result.emplace_back(parameters[i] ? parameters[i] : "");
+    }
+    return result;
+}
+
+// Message access for both sample types, so the write and take paths below are shared
+bool set_message(ICD_pkg::HelloWorld& sample, const char* data, size_t len) {
+    sample.message().assign(data, len);
+    return true;
+}
 
-    // Register type
-    g_type = TypeSupport(new ICD_pkg::HelloWorldPubSubType());
-    if (g_participant->register_type(g_type) != eprosima::fastdds::dds::RETCODE_OK) {
-        cleanup_locked();
+bool set_message(ICD_pkg::HelloWorldFixed& sample, const char* data, size_t len) {
+    // Rejected rather than truncated: the writer cannot tell the caller how much was sent
+    if (len > sample.message().size()) return false;
+    if (len > 0) std::memcpy(sample.message().data(), data, len);
+    sample.length(static_cast<uint32_t>(len));
+    return true;
+}
+
+bool set_message(ICD_pkg::HelloWorldKeyed& sample, const char* data, size_t len) {
+    sample.message().assign(data, len);
+    return true;
+}
+
+const char* message_data(const ICD_pkg::HelloWorld& sample) { return sample.message().data(); }
+size_t message_size(const ICD_pkg::HelloWorld& sample) { return sample.message().size(); }
+const char* message_data(const ICD_pkg::HelloWorldKeyed& sample) { return sample.message().data(); }
+size_t message_size(const ICD_pkg::HelloWorldKeyed& sample) { return sample.message().size(); }
+const char* message_data(const ICD_pkg::HelloWorldFixed& sample) { return sample.message().data(); }
+size_t message_size(const ICD_pkg::HelloWorldFixed& sample) {
+    // length comes off the wire; never trust it past the array
+    return std::min<size_t>(sample.length(), sample.message().size());
+}
+
+template <typename Sample>
+int write_one(DataWriter* writer, uint32_t index, const char* message, size_t len) {
+    Sample data;
+    data.index(index);
+    if (!set_message(data, message, len)) return 0;
+    return writer->write(&data) == eprosima::fastdds::dds::RETCODE_OK ? 1 : 0;
+}
+
+template <typename Sample>
+int write_batch(DataWriter* writer, uint32_t count, const uint32_t* indices, const char* messages, const uint32_t* offsets) {
+    // One sample object reused for the whole batch; the message string keeps its capacity
+    Sample data;
+    uint32_t written = 0;
+    for (; written < count; ++written) {
+        data.index(indices[written]);
+        if (!set_message(data, messages + offsets[written], offsets[written + 1] - offsets[written])) break;
+        if (writer->write(&data) != eprosima::fastdds::dds::RETCODE_OK) break;
+    }
+    return static_cast<int>(written);
+}
+
+// NUL-terminated copy for dds_take, truncated to buffer_len - 1 bytes. Returns the
+// bytes copied, NUL excluded.
+size_t copy_message(const char* message, size_t len, char* message_buffer, int buffer_len) {
+    if (!message_buffer || buffer_len <= 0) return 0;
+    if (len >= static_cast<size_t>(buffer_len)) {
+        // truncate
+        len = static_cast<size_t>(buffer_len - 1);
+    }
+    std::memcpy(message_buffer, message, len);
+    message_buffer[len] = '\0';
+    return len;
+}
+
+// Returns the bytes copied into message_buffer, or -1 if no sample was taken
+template <typename Sample>
+int64_t take_one(DataReader* reader, uint32_t* index_out, char* message_buffer, int buffer_len) {
+    Sample data;
+    SampleInfo info;
+    if (reader->take_next_sample(&data, &info) == eprosima::fastdds::dds::RETCODE_OK) {
+        if (info.instance_state == ALIVE_INSTANCE_STATE) {
+            if (index_out) *index_out = data.index();
+            return static_cast<int64_t>(copy_message(message_data(data), message_size(data), message_buffer, buffer_len));
+        }
+    }
+    return -1;
+}
+
+// take_next_sample as Sample, copied into a HelloWorld
+template <typename Sample>
+int take_struct_as(DataReader* reader, ICD_pkg::HelloWorld* hello_world_out) {
+    Sample data;
+    SampleInfo info;
+    if (reader->take_next_sample(&data, &info) != eprosima::fastdds::dds::RETCODE_OK ||
+        info.instance_state != ALIVE_INSTANCE_STATE) {
         return 0;
     }
+    hello_world_out->index(data.index());
+    hello_world_out->message().assign(message_data(data), message_size(data));
+    return 1;
+}
+
+// Overlay the non-default fields of qos on an endpoint QoS (DataWriterQos or DataReaderQos)
+template <typename EndpointQos>
+void apply_qos(EndpointQos& q, const dds_qos_t& qos) {
+    if (qos.reliability == DDS_RELIABILITY_BEST_EFFORT) q.reliability().kind = BEST_EFFORT_RELIABILITY_QOS;
+    else if (qos.reliability == DDS_RELIABILITY_RELIABLE) q.reliability().kind = RELIABLE_RELIABILITY_QOS;
+
+    if (qos.durability == DDS_DURABILITY_VOLATILE) q.durability().kind = VOLATILE_DURABILITY_QOS;
+    else if (qos.durability == DDS_DURABILITY_TRANSIENT_LOCAL) q.durability().kind = TRANSIENT_LOCAL_DURABILITY_QOS;
+
+    if (qos.history_kind == DDS_HISTORY_KEEP_LAST) q.history().kind = KEEP_LAST_HISTORY_QOS;
+    else if (qos.history_kind == DDS_HISTORY_KEEP_ALL) q.history().kind = KEEP_ALL_HISTORY_QOS;
+    if (qos.history_depth > 0) q.history().depth = qos.history_depth;
+
+    ResourceLimitsQosPolicy& limits = q.resource_limits();
+    if (qos.max_samples != DDS_QOS_DEFAULT) limits.max_samples = qos.max_samples;
+    if (qos.max_instances != DDS_QOS_DEFAULT) limits.max_instances = qos.max_instances;
+    if (qos.max_samples_per_instance != DDS_QOS_DEFAULT) limits.max_samples_per_instance = qos.max_samples_per_instance;
+
+    // Fast DDS rejects a KEEP_LAST depth above max_samples_per_instance, and that above
+    // max_samples; grow the limits the caller left at their defaults instead of failing
+    if (qos.max_samples_per_instance == DDS_QOS_DEFAULT && limits.max_samples_per_instance > 0 &&
+        q.history().depth > limits.max_samples_per_instance) {
+        limits.max_samples_per_instance = q.history().depth;
+    }
+    if (qos.max_samples == DDS_QOS_DEFAULT && limits.max_samples > 0 &&
+        (limits.max_samples_per_instance <= 0 || limits.max_samples_per_instance > limits.max_samples)) {
+        limits.max_samples = limits.max_samples_per_instance;
+    }
+    // It also rejects max_samples below max_instances * max_samples_per_instance. For a
+    // caller's max_instances, size the defaults from it: under KEEP_LAST an instance never
+    // holds more than depth samples
+    if (qos.max_instances != DDS_QOS_DEFAULT && limits.max_instances > 0) {
+        if (qos.max_samples_per_instance == DDS_QOS_DEFAULT && q.history().kind == KEEP_LAST_HISTORY_QOS &&
+            limits.max_samples_per_instance > q.history().depth) {
+            limits.max_samples_per_instance = q.history().depth;
+        }
+        const int64_t needed = static_cast<int64_t>(limits.max_instances) * limits.max_samples_per_instance;
+        if (qos.max_samples == DDS_QOS_DEFAULT && limits.max_samples > 0 && limits.max_samples_per_instance > 0 &&
+            needed > limits.max_samples) {
+            limits.max_samples = static_cast<int32_t>(std::min<int64_t>(needed, INT32_MAX));
+        }
+    }
+
+    if (qos.data_sharing == DDS_DATA_SHARING_AUTO) q.data_sharing().automatic();
+    else if (qos.data_sharing == DDS_DATA_SHARING_ON) q.data_sharing().on("");
+    else if (qos.data_sharing == DDS_DATA_SHARING_OFF) q.data_sharing().off();
+}
+
+// DDS_TRANSPORT environment variable for the single-topic API
+int32_t transport_from_env() {
+    const char* env = std::getenv("DDS_TRANSPORT");
+    if (!env) return DDS_TRANSPORT_DEFAULT;
+    if (std::strcmp(env, "udp") == 0) return DDS_TRANSPORT_UDP;
+    if (std::strcmp(env, "shm") == 0) return DDS_TRANSPORT_SHM;
+    if (std::strcmp(env, "large_data") == 0) return DDS_TRANSPORT_LARGE_DATA;
+    return DDS_TRANSPORT_DEFAULT;
+}
+
+// Lock-free slot for an entity of the single-topic API. Hot paths pin the
+// current entity with a user count instead of taking a lock, so publisher and
+// subscriber threads never block each other (Fast DDS writers/readers are
+// thread-safe). Lifecycle calls retire() the entity, which waits for pinned
+// calls to drain before the caller deletes it.
+template <typename T>
+class EntitySlot {
+public:
+    class Pin {
+    public:
+        explicit Pin(EntitySlot& slot) : slot_(slot) {
+            // seq_cst ordering: either retire() sees this user, or we see nullptr
+            slot_.users_.fetch_add(1);
+            entity_ = slot_.entity_.load();
+        }
+        ~Pin() { slot_.users_.fetch_sub(1); }
+        T* get() const { return entity_; }
+
+    private:
+        Pin(const Pin&) = delete;
+        Pin& operator=(const Pin&) = delete;
+        EntitySlot& slot_;
+        T* entity_;
+    };
+
+    void publish(T* entity) { entity_.store(entity); }
+
+    // Lifecycle lock must be held
+    T* retire() {
+        T* old = entity_.exchange(nullptr);
+        while (users_.load() != 0) {
+            std::this_thread::yield();
+        }
+        return old;
+    }
+
+    // Lifecycle lock must be held; no concurrent retire()
+    T* peek() const { return entity_.load(); }
+
+private:
+    std::atomic<T*> entity_{nullptr};
+    std::atomic<int> users_{0};
+};
+
+// Startup timings of the single-topic API (dds_get_startup_stats), in ns since
+// the start of the last dds_init call. Only the first of each mark counts.
+class StartupClock {
+public:
+    void begin(uint64_t start, bool reused) {
+        start_.store(start);
+        reused_.store(reused);
+        init_.store(0);
+        writer_matched_.store(0);
+        reader_matched_.store(0);
+        first_sample_.store(0);
+    }
+
+    void mark_initialized() { mark(init_); }
+    void mark_writer_matched() { mark(writer_matched_); }
+    void mark_reader_matched() { mark(reader_matched_); }
+    void mark_first_sample() {
+        // Checked first: this runs on every data arrival at the dds_init reader
+        if (first_sample_.load(std::memory_order_relaxed) == 0) mark(first_sample_);
+    }
+
+    void snapshot(dds_startup_stats_t& out) const {
+        out.init_ns = init_.load();
+        out.writer_matched_ns = writer_matched_.load();
+        out.reader_matched_ns = reader_matched_.load();
+        out.first_sample_ns = first_sample_.load();
+        out.participant_reused = reused_.load() ? 1 : 0;
+    }
 
-    g_topic_name = topic_name ? topic_name : "HelloWorldTopic";
-    g_topic = g_participant->create_topic(g_topic_name, g_type.get_type_name(), TOPIC_QOS_DEFAULT, nullptr, eprosima::fastdds::dds::StatusMask::none());
-    if (!g_topic) { cleanup_locked(); return 0; }
+private:
+    void mark(std::atomic<uint64_t>& field) {
+        // Never 0, which means "not yet"
+        uint64_t elapsed = std::max<uint64_t>(now_ns() - start_.load(), 1);
+        uint64_t expected = 0;
+        field.compare_exchange_strong(expected, elapsed);
+    }
+
+    std::atomic<uint64_t> start_{0};
+    std::atomic<bool> reused_{false};
+    std::atomic<uint64_t> init_{0};
+    std::atomic<uint64_t> writer_matched_{0};
+    std::atomic<uint64_t> reader_matched_{0};
+    std::atomic<uint64_t> first_sample_{0};
+};
 
-    g_publisher = g_participant->create_publisher(PUBLISHER_QOS_DEFAULT, nullptr);
-    if (!g_publisher) { cleanup_locked(); return 0; }
+StartupClock g_startup;
 
-    g_writer = g_publisher->create_datawriter(g_topic, DATAWRITER_QOS_DEFAULT, nullptr, eprosima::fastdds::dds::StatusMask::none());
-    if (!g_writer) { cleanup_locked(); return 0; }
+class StartupWriterListener : public DataWriterListener {
+public:
+    void on_publication_matched(DataWriter* /*writer*/, const PublicationMatchedStatus& status) override {
+        if (status.current_count_change > 0) g_startup.mark_writer_matched();
+    }
+};
 
-    g_subscriber = g_participant->create_subscriber(SUBSCRIBER_QOS_DEFAULT, nullptr);
-    if (!g_subscriber) { cleanup_locked(); return 0; }
+// Listener of the dds_init reader: the usual data signalling plus the startup marks
+class StartupReaderListener : public FacadeReaderListener {
+public:
+    explicit StartupReaderListener(const std::shared_ptr<ReaderSignal>& signal) : FacadeReaderListener(signal) {}
 
-    g_reader = g_subscriber->create_datareader(g_topic, DATAREADER_QOS_DEFAULT, nullptr, eprosima::fastdds::dds::StatusMask::none());
-    if (!g_reader) { cleanup_locked(); return 0; }
+    void on_data_available(DataReader* reader) override {
+        g_startup.mark_first_sample();
+        FacadeReaderListener::on_data_available(reader);
+    }
+
+    void on_subscription_matched(DataReader* /*reader*/, const SubscriptionMatchedStatus& status) override {
+        if (status.current_count_change > 0) g_startup.mark_reader_matched();
+    }
+};
+
+// Single-topic API state: one default participant, writer and reader.
+// g_lifecycle_mutex serialises init/shutdown only; writes and takes go through
+// the slots. Each slot sits on its own cache line so pub and sub don't share one.
+std::mutex g_lifecycle_mutex;
+dds_participant_t* g_participant = nullptr;
+alignas(64) EntitySlot<dds_writer_t> g_writer;
+alignas(64) EntitySlot<dds_reader_t> g_reader;
+std::atomic<intptr_t> g_notify_fd(-1);
+// Applied to every reader dds_init creates; guarded by g_lifecycle_mutex
+dds_data_callback_t g_data_callback = nullptr;
+void* g_data_callback_context = nullptr;
+// Participant reuse (dds_set_keep_participant), guarded by g_lifecycle_mutex:
+// -1 until set, then DDS_KEEP_PARTICIPANT decides. The domain and transport of
+// g_participant tell whether the next dds_init can reuse it.
+int g_keep_participant = -1;
+uint32_t g_participant_domain = 0;
+int32_t g_participant_transport = DDS_TRANSPORT_DEFAULT;
+StartupWriterListener g_startup_writer_listener;
+std::unique_ptr<StartupReaderListener> g_startup_reader_listener;
+
+bool keep_participant_locked() {
+    if (g_keep_participant < 0) {
+        const char* env = std::getenv("DDS_KEEP_PARTICIPANT");
+        g_keep_participant = env && std::strcmp(env, "") != 0 && std::strcmp(env, "0") != 0 ? 1 : 0;
+    }
+    return g_keep_participant == 1;
+}
+
+// Deletes the participant, or leaves that to the last retired reader that still uses it
+void delete_or_orphan_participant(dds_participant_t* participant) {
+    {
+        std::lock_guard<std::mutex> lock(participant->mutex);
+        if (participant->endpoints > 0) {
+            participant->orphaned = true;
+            return;
+        }
+    }
+    dds_participant_delete(participant);
+}
 
+// Drops a reference on a dds_init reader; the last one deletes it, and its
+// participant if the single-topic API has let go of it meanwhile
+void release_reader(dds_reader_t* reader) {
+    if (reader->refs.fetch_sub(1) != 1) return;
+    dds_participant_t* owner = reader->owner;
+    dds_reader_delete(reader);
+    bool last = false;
+    {
+        std::lock_guard<std::mutex> lock(owner->mutex);
+        last = owner->orphaned && owner->endpoints == 0;
+    }
+    if (last) dds_participant_delete(owner);
+}
+
+void delete_participant_locked() {
+    if (g_participant) { delete_or_orphan_participant(g_participant); g_participant = nullptr; }
+}
+
+// Deletes the writer and reader, and the participant unless it is kept. A reader
+// with dds_take_loan loans out is only detached here: the caller may hold them
+// itself, so waiting for them could never end. The last loan returned deletes it.
+void cleanup_locked() {
+    dds_writer_delete(g_writer.retire());
+    if (dds_reader_t* reader = g_reader.retire()) {
+        // The startup listener goes below; wake anyone blocked in dds_wait_for_data
+        reader->reader->set_listener(nullptr);
+        reader->signal->close();
+        release_reader(reader);
+    }
+    g_startup_reader_listener.reset();
+    if (!keep_participant_locked()) delete_participant_locked();
+}
+
+// Internal initialization function with configurable domain ID; a non-null
+// filter_expression makes the reader content-filtered
+int dds_init_internal(const char* topic_name, uint32_t domain_id, const dds_qos_t* qos,
+                      const char* filter_expression = nullptr, const char* const* parameters = nullptr, uint32_t parameter_count = 0) {
+    uint64_t start = now_ns();
+    std::lock_guard<std::mutex> lock(g_lifecycle_mutex);
+    cleanup_locked();
+
+    // A kept participant already has its types registered and has been discovered
+    // by its peers; only the topic, writer and reader are created again
+    int32_t transport = transport_from_env();
+    bool reused = g_participant && g_participant_domain == domain_id && g_participant_transport == transport;
+    if (!reused) {
+        delete_participant_locked();
+        g_participant = dds_participant_create_with_transport(domain_id, transport);
+        if (!g_participant) return 0;
+        g_participant_domain = domain_id;
+        g_participant_transport = transport;
+    }
+    g_startup.begin(start, reused);
+
+    dds_writer_t* writer = dds_writer_create_with_qos(g_participant, topic_name, qos);
+    if (!writer) { cleanup_locked(); return 0; }
+
+    dds_reader_t* reader = filter_expression
+        ? dds_reader_create_filtered(g_participant, topic_name, qos, filter_expression, parameters, parameter_count)
+        : dds_reader_create_with_qos(g_participant, topic_name, qos);
+    if (!reader) { dds_writer_delete(writer); cleanup_locked(); return 0; }
+    dds_reader_set_data_notify_fd(reader, g_notify_fd.load());
+    dds_reader_set_data_callback(reader, g_data_callback, g_data_callback_context);
+
+    writer->writer->set_listener(&g_startup_writer_listener, StatusMask::publication_matched());
+    g_startup_reader_listener.reset(new StartupReaderListener(reader->signal));
+    reader->reader->set_listener(g_startup_reader_listener.get(),
+        StatusMask::data_available() << StatusMask::subscription_matched());
+    // Matches and samples that came in before the listeners were set
+    PublicationMatchedStatus publication;
+    if (writer->writer->get_publication_matched_status(publication) == eprosima::fastdds::dds::RETCODE_OK &&
+        publication.current_count > 0) {
+        g_startup.mark_writer_matched();
+    }
+    SubscriptionMatchedStatus subscription;
+    if (reader->reader->get_subscription_matched_status(subscription) == eprosima::fastdds::dds::RETCODE_OK &&
+        subscription.current_count > 0) {
+        g_startup.mark_reader_matched();
+    }
+    if (reader->reader->get_unread_count() > 0) g_startup.mark_first_sample();
+
+    g_writer.publish(writer);
+    g_reader.publish(reader);
+    g_startup.mark_initialized();
     return 1;
 }
+
+const TypeSupport& type_of(const dds_participant_t* participant, SampleKind kind) {
+    switch (kind) {
+        case SampleKind::fixed: return participant->fixed_type;
+        case SampleKind::keyed: return participant->keyed_type;
+        default: return participant->type;
+    }
 }
 
+dds_writer_t* create_writer(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos, SampleKind kind) {
+    if (!participant) return nullptr;
+    std::unique_ptr<dds_writer_t> w(new dds_writer_t());
+    w->owner = participant;
+    w->kind = kind;
+    w->topic = acquire_topic(participant, topic_name, type_of(participant, kind));
+    if (!w->topic) return nullptr;
+
+    DataWriterQos wqos;
+    participant->publisher->get_default_datawriter_qos(wqos);
+    if (qos) {
+        apply_qos(wqos, *qos);
+        if (qos->publish_mode == DDS_PUBLISH_SYNCHRONOUS) wqos.publish_mode().kind = SYNCHRONOUS_PUBLISH_MODE;
+        else if (qos->publish_mode == DDS_PUBLISH_ASYNCHRONOUS) wqos.publish_mode().kind = ASYNCHRONOUS_PUBLISH_MODE;
+    }
+    w->writer = participant->publisher->create_datawriter(w->topic, wqos, nullptr, eprosima::fastdds::dds::StatusMask::none());
+    if (!w->writer) {
+        release_topic(participant, w->topic);
+        return nullptr;
+    }
+    return w.release();
+}
+
+// A non-null filter_expression subscribes through a ContentFilteredTopic of its own
+dds_reader_t* create_reader(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos, SampleKind kind,
+                            const char* filter_expression = nullptr, const char* const* parameters = nullptr, uint32_t parameter_count = 0) {
+    if (!participant) return nullptr;
+    std::unique_ptr<dds_reader_t> r(new dds_reader_t());
+    r->owner = participant;
+    r->kind = kind;
+    r->topic = acquire_topic(participant, topic_name, type_of(participant, kind));
+    if (!r->topic) return nullptr;
+
+    TopicDescription* description = r->topic;
+    if (filter_expression) {
+        // Filtered topic names must be unique within the participant
+        static std::atomic<uint32_t> filtered_count(0);
+        std::string name = r->topic->get_name() + "/filtered/" + std::to_string(++filtered_count);
+        r->filtered = participant->participant->create_contentfilteredtopic(name, r->topic, filter_expression,
+            filter_parameters(parameters, parameter_count));
+        if (!r->filtered) {
+            release_topic(participant, r->topic);
+            return nullptr;
+        }
+        description = r->filtered;
+    }
+
+    DataReaderQos rqos;
+    participant->subscriber->get_default_datareader_qos(rqos);
+    if (qos) apply_qos(rqos, *qos);
+    r->reader = participant->subscriber->create_datareader(description, rqos, &r->listener, eprosima::fastdds::dds::StatusMask::data_available());
+    if (!r->reader) {
+        if (r->filtered) participant->participant->delete_contentfilteredtopic(r->filtered);
+        release_topic(participant, r->topic);
+        return nullptr;
+    }
+    return r.release();
+}
+
+} // namespace
+
+// Samples of one loaned take. Single-topic loans keep the reader pinned, so
+// dds_shutdown cannot delete it while the caller still reads the messages.
+struct dds_take_loan_s {
+    virtual ~dds_take_loan_s() {}
+    std::vector<dds_sample_t> samples;
+    dds_reader_t* owner = nullptr; // set by dds_take_loan, which holds a reference on it
+};
+
+namespace {
+
+template <typename Sample>
+struct TakeLoan : dds_take_loan_s {
+    DataReader* reader = nullptr; // set once the take succeeded
+    LoanableSequence<Sample> data;
+    SampleInfoSeq infos;
+
+    ~TakeLoan() override {
+        if (reader) reader->return_loan(data, infos);
+    }
+};
+
+template <typename Sample>
+dds_take_loan_t* take_loan(DataReader* reader, uint32_t max_samples) {
+    std::unique_ptr<TakeLoan<Sample>> loan(new TakeLoan<Sample>());
+    if (reader->take(loan->data, loan->infos, static_cast<int32_t>(max_samples)) != eprosima::fastdds::dds::RETCODE_OK) {
+        return nullptr;
+    }
+    loan->reader = reader;
+    loan->samples.reserve(loan->infos.length());
+    for (LoanableCollection::size_type i = 0; i < loan->infos.length(); ++i) {
+        if (!loan->infos[i].valid_data || loan->infos[i].instance_state != ALIVE_INSTANCE_STATE) continue;
+        dds_sample_t sample;
+        sample.index = loan->data[i].index();
+        sample.length = static_cast<uint32_t>(message_size(loan->data[i]));
+        sample.message = message_data(loan->data[i]);
+        loan->samples.push_back(sample);
+    }
+    // Nothing to hand out (e.g. only disposals): give the samples straight back
+    if (loan->samples.empty()) return nullptr;
+    return loan.release();
+}
+
+int hand_out(dds_take_loan_t* loan, const dds_sample_t** samples_out, dds_take_loan_t** loan_out) {
+    if (!loan) return 0;
+    *samples_out = loan->samples.data();
+    *loan_out = loan;
+    return static_cast<int>(loan->samples.size());
+}
+
+// Samples from a reader's backlog, owned by the loan rather than by the reader
+struct BacklogLoan : dds_take_loan_s {
+    std::vector<Backlog::Entry> entries;
+};
+
+dds_take_loan_t* take_backlog_loan(Backlog& backlog, uint32_t max_samples) {
+    std::unique_ptr<BacklogLoan> loan(new BacklogLoan());
+    backlog.pop_while([&](Backlog::Entry& entry) {
+        if (loan->entries.size() == max_samples) return false;
+        loan->entries.push_back(std::move(entry));
+        return true;
+    });
+    if (loan->entries.empty()) return nullptr;
+    // The entries no longer move, so the samples can point into them
+    loan->samples.reserve(loan->entries.size());
+    for (const Backlog::Entry& entry : loan->entries) {
+        dds_sample_t sample;
+        sample.index = entry.index;
+        sample.length = static_cast<uint32_t>(entry.message.size());
+        sample.message = entry.message.data();
+        loan->samples.push_back(sample);
+    }
+    return loan.release();
+}
+
+template <typename Sample>
+void take_batch(dds_reader_t* reader, BatchOutput& out) {
+    // Samples carried over from an earlier call are older than any still in the reader
+    if (!reader->backlog.empty()) {
+        reader->backlog.pop_while([&out](Backlog::Entry& entry) {
+            return out.add(entry.index, entry.message.data(), entry.message.size());
+        });
+        if (out.done()) return;
+    }
+
+    // Loaned take: samples stay in the reader's pool, no per-sample copy into a local sample
+    std::unique_ptr<dds_take_loan_t> loan(take_loan<Sample>(reader->reader, out.remaining()));
+    if (!loan) return;
+    const std::vector<dds_sample_t>& samples = loan->samples;
+    size_t i = 0;
+    while (i < samples.size() && out.add(samples[i].index, samples[i].message, samples[i].length)) ++i;
+    // Taken but out of room: keep them for the next take rather than drop them
+    if (i < samples.size()) reader->backlog.push(samples.data() + i, samples.size() - i);
+}
+
+} // namespace
+
 extern "C" {
 
 int dds_init(const char* topic_name) {
@@ -84,76 +997,562 @@ int dds_init(const char* topic_name) {
     if (env_domain) {
         domain_id = static_cast<uint32_t>(std::atoi(env_domain));
     }
-    return dds_init_internal(topic_name, domain_id);
+    return dds_init_internal(topic_name, domain_id, nullptr);
 }
 
 int dds_init_with_domain(const char* topic_name, uint32_t domain_id) {
-    return dds_init_internal(topic_name, domain_id);
+    return dds_init_internal(topic_name, domain_id, nullptr);
+}
+
+int dds_init_with_qos(const char* topic_name, uint32_t domain_id, const dds_qos_t* qos) {
+    return dds_init_internal(topic_name, domain_id, qos);
+}
+
+int dds_init_filtered(const char* topic_name, uint32_t domain_id, const dds_qos_t* qos,
+                      const char* filter_expression, const char* const* parameters, uint32_t parameter_count) {
+    if (!filter_expression) return 0;
+    return dds_init_internal(topic_name, domain_id, qos, filter_expression, parameters, parameter_count);
+}
+
+int dds_set_filter_parameters(const char* const* parameters, uint32_t parameter_count) {
+    EntitySlot<dds_reader_t>::Pin reader(g_reader);
+    return dds_reader_set_filter_parameters(reader.get(), parameters, parameter_count);
 }
 
 int dds_write(uint32_t index, const char* message) {
-    std::lock_guard<std::mutex> lock(g_mutex);
-    if (!g_writer) return 0;
-    ICD_pkg::HelloWorld data;
-    data.index(index);
-    data.message(message ? message : "");
-    return g_writer->write(&data) == eprosima::fastdds::dds::RETCODE_OK ? 1 : 0;
+    EntitySlot<dds_writer_t>::Pin writer(g_writer);
+    return dds_writer_write(writer.get(), index, message);
+}
+
+int dds_write_batch(uint32_t count, const uint32_t* indices, const char* messages, const uint32_t* offsets) {
+    EntitySlot<dds_writer_t>::Pin writer(g_writer);
+    return dds_writer_write_batch(writer.get(), count, indices, messages, offsets);
 }
 
 int dds_take(uint32_t* index_out, char* message_buffer, int buffer_len) {
-    std::lock_guard<std::mutex> lock(g_mutex);
-    if (!g_reader) return 0;
-    ICD_pkg::HelloWorld data;
-    SampleInfo info;
-    if (g_reader->take_next_sample(&data, &info) == eprosima::fastdds::dds::RETCODE_OK) {
-        if (info.instance_state == ALIVE_INSTANCE_STATE) {
-            if (index_out) *index_out = data.index();
-            if (message_buffer && buffer_len > 0) {
-                std::string msg = data.message();
-                if ((int)msg.size() >= buffer_len) {
-                    // truncate
-                    msg.resize(static_cast<size_t>(buffer_len - 1));
-                }
-                std::memcpy(message_buffer, msg.c_str(), msg.size());
-                message_buffer[msg.size()] = '\0';
-            }
-            return 1;
-        }
+    EntitySlot<dds_reader_t>::Pin reader(g_reader);
+    return dds_reader_take(reader.get(), index_out, message_buffer, buffer_len);
+}
+
+int dds_take_batch(uint32_t max_samples, uint32_t* indices_out, char* message_buffer, uint32_t buffer_len, uint32_t* offsets_out) {
+    EntitySlot<dds_reader_t>::Pin reader(g_reader);
+    return dds_reader_take_batch(reader.get(), max_samples, indices_out, message_buffer, buffer_len, offsets_out);
+}
+
+int dds_wait_for_data(int32_t timeout_ms) {
+    std::shared_ptr<ReaderSignal> signal;
+    uint64_t seq;
+    {
+        EntitySlot<dds_reader_t>::Pin reader(g_reader);
+        if (!reader.get()) return 0;
+        // Anything arriving after this snapshot bumps the sequence, so no wakeup is lost
+        signal = reader.get()->signal;
+        seq = signal->sequence();
+        if (!reader.get()->backlog.empty() || reader.get()->reader->get_unread_count() > 0) return 1;
     }
-    return 0;
+    // Wait unpinned so dds_shutdown is not held up by blocked waiters
+    return signal->wait(seq, timeout_ms);
+}
+
+void dds_set_data_notify_fd(intptr_t fd) {
+    std::lock_guard<std::mutex> lock(g_lifecycle_mutex);
+    g_notify_fd.store(fd);
+    dds_reader_set_data_notify_fd(g_reader.peek(), fd);
+}
+
+void dds_set_data_callback(dds_data_callback_t callback, void* context) {
+    std::lock_guard<std::mutex> lock(g_lifecycle_mutex);
+    g_data_callback = callback;
+    g_data_callback_context = context;
+    dds_reader_set_data_callback(g_reader.peek(), callback, context);
 }
 
 void dds_shutdown() {
-    std::lock_guard<std::mutex> lock(g_mutex);
+    std::lock_guard<std::mutex> lock(g_lifecycle_mutex);
     cleanup_locked();
 }
 
+void dds_set_keep_participant(int keep) {
+    std::lock_guard<std::mutex> lock(g_lifecycle_mutex);
+    g_keep_participant = keep ? 1 : 0;
+    // An idle kept participant goes now; one in use goes with the next dds_shutdown
+    if (!keep && !g_writer.peek()) delete_participant_locked();
+}
+
+int dds_keep_participant() {
+    std::lock_guard<std::mutex> lock(g_lifecycle_mutex);
+    return keep_participant_locked() ? 1 : 0;
+}
+
+int dds_get_startup_stats(dds_startup_stats_t* stats_out) {
+    if (!stats_out) return 0;
+    std::lock_guard<std::mutex> lock(g_lifecycle_mutex);
+    if (!g_writer.peek()) return 0;
+    g_startup.snapshot(*stats_out);
+    return 1;
+}
+
 const char* dds_take_message(uint32_t* index_out) {
     static thread_local std::string storage;
-    char buf[1024];
-    if (dds_take(index_out, buf, static_cast<int>(sizeof(buf))) == 1) {
-        storage = buf;
-        return storage.c_str();
+    const dds_sample_t* sample = nullptr;
+    dds_take_loan_t* loan = nullptr;
+    if (dds_take_loan(1, &sample, &loan) == 0) return nullptr;
+    if (index_out) *index_out = sample->index;
+    // The only copy: from the loaned sample into the returned storage
+    storage.assign(sample->message, sample->length);
+    dds_take_loan_return(loan);
+    return storage.c_str();
+}
+
+int dds_take_loan(uint32_t max_samples, const dds_sample_t** samples_out, dds_take_loan_t** loan_out) {
+    if (max_samples == 0 || !samples_out || !loan_out) return 0;
+    EntitySlot<dds_reader_t>::Pin reader(g_reader);
+    int count = dds_reader_take_loan(reader.get(), max_samples, samples_out, loan_out);
+    if (count > 0) {
+        // Still pinned, so the reader cannot be retired before it holds this reference
+        reader.get()->refs.fetch_add(1);
+        (*loan_out)->owner = reader.get();
     }
-    return nullptr;
+    return count;
+}
+
+void dds_take_loan_return(dds_take_loan_t* loan) {
+    if (!loan) return;
+    dds_reader_t* owner = loan->owner;
+    // The samples go back to the DataReader before it can be deleted
+    delete loan;
+    if (owner) release_reader(owner);
 }
 
 // NEW: Write a complete HelloWorld struct
 int dds_write_struct(const ICD_pkg::HelloWorld* hello_world) {
-    std::lock_guard<std::mutex> lock(g_mutex);
-    if (!g_writer || !hello_world) return 0;
-    return g_writer->write(hello_world) == eprosima::fastdds::dds::RETCODE_OK ? 1 : 0;
+    EntitySlot<dds_writer_t>::Pin writer(g_writer);
+    return dds_writer_write_struct(writer.get(), hello_world);
 }
 
 // NEW: Take a complete HelloWorld struct
 int dds_take_struct(ICD_pkg::HelloWorld* hello_world_out) {
-    std::lock_guard<std::mutex> lock(g_mutex);
-    if (!g_reader || !hello_world_out) return 0;
-    SampleInfo info;
-    if (g_reader->take_next_sample(hello_world_out, &info) == eprosima::fastdds::dds::RETCODE_OK) {
-        return info.instance_state == ALIVE_INSTANCE_STATE ? 1 : 0;
+    EntitySlot<dds_reader_t>::Pin reader(g_reader);
+    return dds_reader_take_struct(reader.get(), hello_world_out);
+}
+
+// ---------------------------------------------------------------------------
+// Handle-based API
+// ---------------------------------------------------------------------------
+
+dds_participant_t* dds_participant_create(uint32_t domain_id) {
+    return dds_participant_create_with_transport(domain_id, DDS_TRANSPORT_DEFAULT);
+}
+
+dds_participant_t* dds_participant_create_with_transport(uint32_t domain_id, int32_t transport) {
+    std::unique_ptr<dds_participant_t> p(new dds_participant_t());
+
+    DomainParticipantQos pqos;
+    pqos.name("ICDFacadeParticipant");
+    switch (transport) {
+        case DDS_TRANSPORT_DEFAULT: break;
+        case DDS_TRANSPORT_UDP: pqos.setup_transports(eprosima::fastdds::rtps::BuiltinTransports::UDPv4); break;
+        case DDS_TRANSPORT_SHM: pqos.setup_transports(eprosima::fastdds::rtps::BuiltinTransports::SHM); break;
+        case DDS_TRANSPORT_LARGE_DATA: pqos.setup_transports(eprosima::fastdds::rtps::BuiltinTransports::LARGE_DATA); break;
+        default: return nullptr;
+    }
+    p->participant = DomainParticipantFactory::get_instance()->create_participant(domain_id, pqos);
+    if (!p->participant) return nullptr;
+
+    // Register type once; every topic of this participant reuses it
+    p->type = TypeSupport(new ICD_pkg::HelloWorldFastPubSubType());
+    p->fixed_type = TypeSupport(new ICD_pkg::HelloWorldFixedPubSubType());
+    p->keyed_type = TypeSupport(new ICD_pkg::HelloWorldKeyedPubSubType());
+    if (p->participant->register_type(p->type) == eprosima::fastdds::dds::RETCODE_OK &&
+        p->participant->register_type(p->fixed_type) == eprosima::fastdds::dds::RETCODE_OK &&
+        p->participant->register_type(p->keyed_type) == eprosima::fastdds::dds::RETCODE_OK) {
+        p->publisher = p->participant->create_publisher(PUBLISHER_QOS_DEFAULT, nullptr);
+        p->subscriber = p->participant->create_subscriber(SUBSCRIBER_QOS_DEFAULT, nullptr);
+    }
+    if (!p->publisher || !p->subscriber) {
+        p->participant->delete_contained_entities();
+        DomainParticipantFactory::get_instance()->delete_participant(p->participant);
+        return nullptr;
+    }
+    return p.release();
+}
+
+int dds_participant_delete(dds_participant_t* participant) {
+    if (!participant) return 0;
+    {
+        std::lock_guard<std::mutex> lock(participant->mutex);
+        if (participant->endpoints > 0) return 0;
+    }
+    participant->participant->delete_publisher(participant->publisher);
+    participant->participant->delete_subscriber(participant->subscriber);
+    DomainParticipantFactory::get_instance()->delete_participant(participant->participant);
+    delete participant;
+    return 1;
+}
+
+dds_writer_t* dds_writer_create(dds_participant_t* participant, const char* topic_name) {
+    return dds_writer_create_with_qos(participant, topic_name, nullptr);
+}
+
+dds_writer_t* dds_writer_create_with_qos(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos) {
+    return create_writer(participant, topic_name, qos, SampleKind::plain);
+}
+
+dds_writer_t* dds_writer_create_fixed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos) {
+    return create_writer(participant, topic_name, qos, SampleKind::fixed);
+}
+
+dds_writer_t* dds_writer_create_keyed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos) {
+    return create_writer(participant, topic_name, qos, SampleKind::keyed);
+}
+
+void dds_writer_delete(dds_writer_t* writer) {
+    if (!writer) return;
+    writer->owner->publisher->delete_datawriter(writer->writer);
+    release_topic(writer->owner, writer->topic);
+    delete writer;
+}
+
+int dds_writer_write(dds_writer_t* writer, uint32_t index, const char* message) {
+    if (!writer) return 0;
+    if (!message) message = "";
+    size_t len = std::strlen(message);
+    uint64_t start = stats_start();
+    int ok;
+    switch (writer->kind) {
+        case SampleKind::fixed: ok = write_one<ICD_pkg::HelloWorldFixed>(writer->writer, index, message, len); break;
+        case SampleKind::keyed: ok = write_one<ICD_pkg::HelloWorldKeyed>(writer->writer, index, message, len); break;
+        default: ok = write_one<ICD_pkg::HelloWorld>(writer->writer, index, message, len); break;
+    }
+    if (start) writer->stats.record(start, ok, 1, ok ? len : 0);
+    return ok;
+}
+
+int dds_writer_write_struct(dds_writer_t* writer, const ICD_pkg::HelloWorld* hello_world) {
+    if (!writer || !hello_world) return 0;
+    uint64_t start = stats_start();
+    int ok;
+    switch (writer->kind) {
+        case SampleKind::fixed:
+            ok = write_one<ICD_pkg::HelloWorldFixed>(writer->writer, hello_world->index(),
+                hello_world->message().data(), hello_world->message().size());
+            break;
+        case SampleKind::keyed:
+            ok = write_one<ICD_pkg::HelloWorldKeyed>(writer->writer, hello_world->index(),
+                hello_world->message().data(), hello_world->message().size());
+            break;
+        default:
+            ok = writer->writer->write(hello_world) == eprosima::fastdds::dds::RETCODE_OK ? 1 : 0;
+            break;
+    }
+    if (start) writer->stats.record(start, ok, 1, ok ? hello_world->message().size() : 0);
+    return ok;
+}
+
+int dds_writer_write_batch(dds_writer_t* writer, uint32_t count, const uint32_t* indices, const char* messages, const uint32_t* offsets) {
+    if (!writer || !indices || !offsets || (!messages && count > 0 && offsets[count] > offsets[0])) return 0;
+    uint64_t start = stats_start();
+    int written;
+    switch (writer->kind) {
+        case SampleKind::fixed: written = write_batch<ICD_pkg::HelloWorldFixed>(writer->writer, count, indices, messages, offsets); break;
+        case SampleKind::keyed: written = write_batch<ICD_pkg::HelloWorldKeyed>(writer->writer, count, indices, messages, offsets); break;
+        default: written = write_batch<ICD_pkg::HelloWorld>(writer->writer, count, indices, messages, offsets); break;
+    }
+    if (start) writer->stats.record(start, written, count, offsets[written] - offsets[0]);
+    return written;
+}
+
+int dds_writer_loan(dds_writer_t* writer, dds_loan_t* loan_out) {
+    if (!writer || !loan_out || writer->kind != SampleKind::fixed) return 0;
+    // No initialization: the caller overwrites the bytes it publishes
+    void* sample = nullptr;
+    if (writer->writer->loan_sample(sample) != eprosima::fastdds::dds::RETCODE_OK) return 0;
+    ICD_pkg::HelloWorldFixed* data = static_cast<ICD_pkg::HelloWorldFixed*>(sample);
+    loan_out->sample = data;
+    loan_out->message = data->message().data();
+    loan_out->capacity = static_cast<uint32_t>(data->message().size());
+    return 1;
+}
+
+int dds_writer_write_loan(dds_writer_t* writer, dds_loan_t* loan, uint32_t index, uint32_t length) {
+    if (!writer || !loan || !loan->sample) return 0;
+    ICD_pkg::HelloWorldFixed* data = loan->sample;
+    uint64_t start = stats_start();
+    int ok = 0;
+    if (length <= data->message().size()) {
+        data->index(index);
+        data->length(length);
+        // On success the writer takes the sample back; on failure the loan is still ours
+        ok = writer->writer->write(data) == eprosima::fastdds::dds::RETCODE_OK ? 1 : 0;
+    }
+    if (!ok) {
+        void* sample = data;
+        writer->writer->discard_loan(sample);
+    }
+    if (start) writer->stats.record(start, ok, 1, ok ? length : 0);
+    *loan = dds_loan_t();
+    return ok;
+}
+
+void dds_writer_discard_loan(dds_writer_t* writer, dds_loan_t* loan) {
+    if (!writer || !loan || !loan->sample) return;
+    void* sample = loan->sample;
+    writer->writer->discard_loan(sample);
+    *loan = dds_loan_t();
+}
+
+dds_reader_t* dds_reader_create(dds_participant_t* participant, const char* topic_name) {
+    return dds_reader_create_with_qos(participant, topic_name, nullptr);
+}
+
+dds_reader_t* dds_reader_create_with_qos(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos) {
+    return create_reader(participant, topic_name, qos, SampleKind::plain);
+}
+
+dds_reader_t* dds_reader_create_fixed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos) {
+    return create_reader(participant, topic_name, qos, SampleKind::fixed);
+}
+
+dds_reader_t* dds_reader_create_keyed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos) {
+    return create_reader(participant, topic_name, qos, SampleKind::keyed);
+}
+
+dds_reader_t* dds_reader_create_filtered(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos,
+                                         const char* filter_expression, const char* const* parameters, uint32_t parameter_count) {
+    if (!filter_expression) return nullptr;
+    return create_reader(participant, topic_name, qos, SampleKind::plain, filter_expression, parameters, parameter_count);
+}
+
+int dds_reader_set_filter_parameters(dds_reader_t* reader, const char* const* parameters, uint32_t parameter_count) {
+    if (!reader || !reader->filtered) return 0;
+    return reader->filtered->set_expression_parameters(filter_parameters(parameters, parameter_count)) ==
+        eprosima::fastdds::dds::RETCODE_OK ? 1 : 0;
+}
+
+void dds_reader_delete(dds_reader_t* reader) {
+    if (!reader) return;
+    reader->owner->subscriber->delete_datareader(reader->reader);
+    if (reader->filtered) reader->owner->participant->delete_contentfilteredtopic(reader->filtered);
+    release_topic(reader->owner, reader->topic);
+    // Wake waiters; they only touch the shared signal from here on
+    reader->signal->close();
+    delete reader;
+}
+
+int dds_reader_take(dds_reader_t* reader, uint32_t* index_out, char* message_buffer, int buffer_len) {
+    if (!reader) return 0;
+    uint64_t start = stats_start();
+    int64_t copied;
+    Backlog::Entry carried;
+    if (!reader->backlog.empty() && reader->backlog.pop(carried)) {
+        if (index_out) *index_out = carried.index;
+        copied = static_cast<int64_t>(copy_message(carried.message.data(), carried.message.size(), message_buffer, buffer_len));
+    } else switch (reader->kind) {
+        case SampleKind::fixed: copied = take_one<ICD_pkg::HelloWorldFixed>(reader->reader, index_out, message_buffer, buffer_len); break;
+        case SampleKind::keyed: copied = take_one<ICD_pkg::HelloWorldKeyed>(reader->reader, index_out, message_buffer, buffer_len); break;
+        default: copied = take_one<ICD_pkg::HelloWorld>(reader->reader, index_out, message_buffer, buffer_len); break;
+    }
+    const int taken = copied >= 0 ? 1 : 0;
+    if (start) reader->stats.record(start, taken, taken ? static_cast<uint64_t>(copied) : 0);
+    return taken;
+}
+
+int dds_reader_take_struct(dds_reader_t* reader, ICD_pkg::HelloWorld* hello_world_out) {
+    if (!reader || !hello_world_out) return 0;
+    uint64_t start = stats_start();
+    int taken = 0;
+    Backlog::Entry carried;
+    if (!reader->backlog.empty() && reader->backlog.pop(carried)) {
+        hello_world_out->index(carried.index);
+        hello_world_out->message(std::move(carried.message));
+        taken = 1;
+    } else if (reader->kind == SampleKind::fixed) {
+        taken = take_struct_as<ICD_pkg::HelloWorldFixed>(reader->reader, hello_world_out);
+    } else if (reader->kind == SampleKind::keyed) {
+        taken = take_struct_as<ICD_pkg::HelloWorldKeyed>(reader->reader, hello_world_out);
+    } else {
+        SampleInfo info;
+        if (reader->reader->take_next_sample(hello_world_out, &info) == eprosima::fastdds::dds::RETCODE_OK) {
+            taken = info.instance_state == ALIVE_INSTANCE_STATE ? 1 : 0;
+        }
+    }
+    if (start) reader->stats.record(start, taken, taken ? hello_world_out->message().size() : 0);
+    return taken;
+}
+
+int dds_reader_take_batch(dds_reader_t* reader, uint32_t max_samples, uint32_t* indices_out, char* message_buffer, uint32_t buffer_len, uint32_t* offsets_out) {
+    if (!reader || max_samples == 0 || !indices_out || !offsets_out) return 0;
+    if (!message_buffer) buffer_len = 0;
+    uint64_t start = stats_start();
+    BatchOutput out(max_samples, indices_out, message_buffer, buffer_len, offsets_out);
+    switch (reader->kind) {
+        case SampleKind::fixed: take_batch<ICD_pkg::HelloWorldFixed>(reader, out); break;
+        case SampleKind::keyed: take_batch<ICD_pkg::HelloWorldKeyed>(reader, out); break;
+        default: take_batch<ICD_pkg::HelloWorld>(reader, out); break;
+    }
+    int taken = out.result();
+    if (start) reader->stats.record(start, taken, taken > 0 ? offsets_out[taken] : 0);
+    return taken;
+}
+
+int dds_reader_take_loan(dds_reader_t* reader, uint32_t max_samples, const dds_sample_t** samples_out, dds_take_loan_t** loan_out) {
+    if (!reader || max_samples == 0 || !samples_out || !loan_out) return 0;
+    uint64_t start = stats_start();
+    dds_take_loan_t* loan;
+    if (!reader->backlog.empty()) {
+        loan = take_backlog_loan(reader->backlog, max_samples);
+    } else switch (reader->kind) {
+        case SampleKind::fixed: loan = take_loan<ICD_pkg::HelloWorldFixed>(reader->reader, max_samples); break;
+        case SampleKind::keyed: loan = take_loan<ICD_pkg::HelloWorldKeyed>(reader->reader, max_samples); break;
+        default: loan = take_loan<ICD_pkg::HelloWorld>(reader->reader, max_samples); break;
+    }
+    if (start) {
+        uint64_t bytes = 0;
+        if (loan) {
+            for (const dds_sample_t& sample : loan->samples) bytes += sample.length;
+        }
+        reader->stats.record(start, loan ? static_cast<int>(loan->samples.size()) : 0, bytes);
+    }
+    return hand_out(loan, samples_out, loan_out);
+}
+
+int dds_reader_lookup_instance(dds_reader_t* reader, uint32_t index) {
+    if (!reader || reader->kind != SampleKind::keyed) return 0;
+    ICD_pkg::HelloWorldKeyed key;
+    key.index(index);
+    return reader->reader->lookup_instance(&key) != HANDLE_NIL ? 1 : 0;
+}
+
+int dds_reader_read_instance(dds_reader_t* reader, uint32_t index, char* message_buffer, uint32_t buffer_len, uint32_t* length_out) {
+    if (!reader || reader->kind != SampleKind::keyed) return 0;
+    ICD_pkg::HelloWorldKeyed key;
+    key.index(index);
+    InstanceHandle_t handle = reader->reader->lookup_instance(&key);
+    if (handle == HANDLE_NIL) return 0;
+
+    // Non-destructive loaned read of just this instance; with KEEP_LAST 1 that is one sample
+    LoanableSequence<ICD_pkg::HelloWorldKeyed> data;
+    SampleInfoSeq infos;
+    if (reader->reader->read_instance(data, infos, LENGTH_UNLIMITED, handle) != eprosima::fastdds::dds::RETCODE_OK) {
+        return 0;
+    }
+    // Samples come oldest first: the last valid one is the current value
+    int found = 0;
+    for (LoanableCollection::size_type i = infos.length(); i-- > 0;) {
+        if (!infos[i].valid_data) continue;
+        if (infos[i].instance_state == ALIVE_INSTANCE_STATE) {
+            size_t len = message_size(data[i]);
+            if (length_out) *length_out = static_cast<uint32_t>(len);
+            if (message_buffer && buffer_len > 0) {
+                // truncate
+                if (len >= buffer_len) len = buffer_len - 1;
+                std::memcpy(message_buffer, message_data(data[i]), len);
+                message_buffer[len] = '\0';
+            }
+            found = 1;
+        }
+        break;
+    }
+    reader->reader->return_loan(data, infos);
+    return found;
+}
+
+int dds_reader_wait_for_data(dds_reader_t* reader, int32_t timeout_ms) {
+    if (!reader) return 0;
+    std::shared_ptr<ReaderSignal> signal = reader->signal;
+    uint64_t seq = signal->sequence();
+    if (!reader->backlog.empty() || reader->reader->get_unread_count() > 0) return 1;
+    return signal->wait(seq, timeout_ms);
+}
+
+void dds_reader_set_data_notify_fd(dds_reader_t* reader, intptr_t fd) {
+    if (reader) reader->signal->set_notify_fd(fd);
+}
+
+void dds_reader_set_data_callback(dds_reader_t* reader, dds_data_callback_t callback, void* context) {
+    if (reader) reader->signal->set_callback(callback, context);
+}
+
+// ---------------------------------------------------------------------------
+// Statistics
+// ---------------------------------------------------------------------------
+
+void dds_stats_enable(int enabled) {
+    g_stats_enabled.store(enabled != 0);
+}
+
+int dds_stats_enabled() {
+    return g_stats_enabled.load() ? 1 : 0;
+}
+
+int dds_writer_get_stats(dds_writer_t* writer, dds_writer_stats_t* stats_out) {
+    if (!writer || !stats_out) return 0;
+    *stats_out = dds_writer_stats_t();
+    stats_out->samples = writer->stats.samples.load(std::memory_order_relaxed);
+    stats_out->bytes = writer->stats.bytes.load(std::memory_order_relaxed);
+    stats_out->failures = writer->stats.failures.load(std::memory_order_relaxed);
+    writer->stats.latency.snapshot(stats_out->write_latency);
+
+    PublicationMatchedStatus matched;
+    if (writer->writer->get_publication_matched_status(matched) == eprosima::fastdds::dds::RETCODE_OK) {
+        stats_out->matched_readers = matched.current_count;
+        stats_out->matched_readers_total = matched.total_count;
+    }
+    return 1;
+}
+
+int dds_reader_get_stats(dds_reader_t* reader, dds_reader_stats_t* stats_out) {
+    if (!reader || !stats_out) return 0;
+    *stats_out = dds_reader_stats_t();
+    stats_out->samples = reader->stats.samples.load(std::memory_order_relaxed);
+    stats_out->bytes = reader->stats.bytes.load(std::memory_order_relaxed);
+    stats_out->empty_takes = reader->stats.empty_takes.load(std::memory_order_relaxed);
+    reader->stats.latency.snapshot(stats_out->take_latency);
+
+    SubscriptionMatchedStatus matched;
+    if (reader->reader->get_subscription_matched_status(matched) == eprosima::fastdds::dds::RETCODE_OK) {
+        stats_out->matched_writers = matched.current_count;
+        stats_out->matched_writers_total = matched.total_count;
+    }
+    SampleLostStatus lost;
+    if (reader->reader->get_sample_lost_status(lost) == eprosima::fastdds::dds::RETCODE_OK) {
+        stats_out->samples_lost = lost.total_count;
+    }
+    SampleRejectedStatus rejected;
+    if (reader->reader->get_sample_rejected_status(rejected) == eprosima::fastdds::dds::RETCODE_OK) {
+        stats_out->samples_rejected = rejected.total_count;
+        stats_out->last_rejected_reason = static_cast<int32_t>(rejected.last_reason);
+    }
+    stats_out->unread_samples = reader->reader->get_unread_count() + reader->backlog.size();
+    return 1;
+}
+
+int dds_get_stats(dds_stats_t* stats_out) {
+    if (!stats_out) return 0;
+    EntitySlot<dds_writer_t>::Pin writer(g_writer);
+    EntitySlot<dds_reader_t>::Pin reader(g_reader);
+    if (!writer.get() || !reader.get()) return 0;
+    return dds_writer_get_stats(writer.get(), &stats_out->writer) & dds_reader_get_stats(reader.get(), &stats_out->reader);
+}
+
+uint64_t dds_histogram_bucket_lower(uint32_t bucket) {
+    if (bucket >= DDS_HISTOGRAM_BUCKETS) return UINT64_MAX;
+    if (bucket < kSubBuckets) return bucket;
+    unsigned msb = bucket / kSubBuckets + kSubBucketBits - 1;
+    return static_cast<uint64_t>(kSubBuckets + bucket % kSubBuckets) << (msb - kSubBucketBits);
+}
+
+uint64_t dds_histogram_percentile(const dds_histogram_t* histogram, double fraction) {
+    if (!histogram || histogram->count == 0) return 0;
+    // Nearest rank, reported as the highest value of its bucket
+    double rank = std::ceil(std::min(std::max(fraction, 0.0), 1.0) * static_cast<double>(histogram->count));
+    uint64_t target = std::max<uint64_t>(1, static_cast<uint64_t>(rank));
+    uint64_t seen = 0;
+    for (uint32_t i = 0; i < DDS_HISTOGRAM_BUCKETS; ++i) {
+        seen += histogram->buckets[i];
+        if (seen >= target) return std::min(dds_histogram_bucket_lower(i + 1) - 1, histogram->max_ns);
     }
-    return 0;
+    return histogram->max_ns;
 }
 
 } // extern C
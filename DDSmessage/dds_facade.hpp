@@ -1,9 +1,11 @@
 #pragma once
 #include <cstdint>
+#include <cstddef>  // for intptr_t
 
 // Forward declaration for HelloWorld struct
 namespace ICD_pkg {
     class HelloWorld;
+    class HelloWorldFixed;
 }
 
 #ifdef _WIN32
@@ -16,31 +18,318 @@ namespace ICD_pkg {
   #define ICD_API
 #endif
 
+// QoS for facade writers and readers. Zero-initialise a dds_qos_t and set only the
+// fields you need: DDS_QOS_DEFAULT (0) keeps the Fast DDS default of each endpoint.
+#define DDS_QOS_DEFAULT 0
+#define DDS_RELIABILITY_BEST_EFFORT 1
+#define DDS_RELIABILITY_RELIABLE 2
+#define DDS_DURABILITY_VOLATILE 1
+#define DDS_DURABILITY_TRANSIENT_LOCAL 2
+#define DDS_HISTORY_KEEP_LAST 1
+#define DDS_HISTORY_KEEP_ALL 2
+#define DDS_PUBLISH_SYNCHRONOUS 1
+#define DDS_PUBLISH_ASYNCHRONOUS 2
+#define DDS_LENGTH_UNLIMITED (-1)
+#define DDS_DATA_SHARING_AUTO 1
+#define DDS_DATA_SHARING_ON 2
+#define DDS_DATA_SHARING_OFF 3
+
+// Transports for dds_participant_create_with_transport. dds_init reads the same choice from the
+// DDS_TRANSPORT environment variable ("default", "udp", "shm" or "large_data").
+#define DDS_TRANSPORT_DEFAULT 0       // Fast DDS builtin: shared memory + UDPv4
+#define DDS_TRANSPORT_UDP 1           // UDPv4 only
+#define DDS_TRANSPORT_SHM 2           // shared memory only, same host
+#define DDS_TRANSPORT_LARGE_DATA 3    // UDPv4 discovery, TCPv4 + shared memory for data
+
+// Message capacity in bytes of fixed-size endpoints (ICD_pkg::HelloWorldFixed)
+#define DDS_FIXED_MESSAGE_CAPACITY 4096
+
 // Simple C façade for publishing/subscribing HelloWorld samples from C#.
 // Return values: 1 success, 0 failure / no data.
 extern "C" {
 
+typedef struct dds_qos_s {
+    int32_t reliability;              // DDS_RELIABILITY_*
+    int32_t durability;               // DDS_DURABILITY_*
+    int32_t history_kind;             // DDS_HISTORY_*
+    int32_t history_depth;            // KEEP_LAST depth
+    // Resource limits; DDS_LENGTH_UNLIMITED removes the limit. A history_depth above the
+    // default max_samples_per_instance raises that limit (and max_samples) to match, and
+    // so does max_instances for max_samples (Fast DDS defaults to 10 instances).
+    int32_t max_samples;
+    int32_t max_instances;
+    int32_t max_samples_per_instance;
+    int32_t publish_mode;             // DDS_PUBLISH_*, writers only
+    // DDS_DATA_SHARING_*; only bounded types (fixed-size endpoints) can use data-sharing
+    int32_t data_sharing;
+} dds_qos_t;
+
 // Initialize (or reinitialize) DDS entities. Returns 1 on success.
 ICD_API int dds_init(const char* topic_name);
 
 // Initialize (or reinitialize) DDS entities with domain ID. Returns 1 on success.
 ICD_API int dds_init_with_domain(const char* topic_name, uint32_t domain_id);
 
+// Initialize (or reinitialize) DDS entities with domain ID and QoS applied to both the
+// writer and the reader. qos may be nullptr for defaults. Returns 1 on success.
+ICD_API int dds_init_with_qos(const char* topic_name, uint32_t domain_id, const dds_qos_t* qos);
+
+// Content filtering: a filtered reader only receives the samples matching
+// filter_expression, a DDS-SQL condition over the HelloWorld fields where %0..%n
+// refer to parameters[0..n], e.g. "index BETWEEN %0 AND %1" with {"100", "199"}, or
+// "message LIKE %0" with {"'alarm/%'"} (string parameters are quoted). Fast DDS
+// writers evaluate the filter before sending where they can, so rejected samples
+// cost the subscriber neither bandwidth nor a take; otherwise the reader drops them
+// on arrival. parameters may be nullptr when parameter_count is 0.
+
+// Same as dds_init_with_qos, with a content-filtered reader. Returns 1 on success,
+// 0 also for an invalid expression or parameters.
+ICD_API int dds_init_filtered(const char* topic_name, uint32_t domain_id, const dds_qos_t* qos,
+                              const char* filter_expression, const char* const* parameters, uint32_t parameter_count);
+// Replace the filter parameters of the dds_init_filtered reader at runtime (the
+// expression is kept). Returns 1 on success; 0 for an unfiltered reader or invalid
+// parameters, in which case the previous ones stay in effect.
+ICD_API int dds_set_filter_parameters(const char* const* parameters, uint32_t parameter_count);
+
 // LEGACY: Write a HelloWorld sample with index + message. Returns 1 on success.
 ICD_API int dds_write(uint32_t index, const char* message);
 
 // NEW: Write a complete HelloWorld struct. Returns 1 on success.
 ICD_API int dds_write_struct(const ICD_pkg::HelloWorld* hello_world);
 
+// Batched write: publishes count samples in one native loop under a single lock.
+// indices holds count entries and offsets count + 1 entries; sample i carries the UTF-8 bytes
+// messages[offsets[i], offsets[i + 1]) (no terminators needed). Stops at the first failed write.
+// Returns the number of samples written.
+ICD_API int dds_write_batch(uint32_t count, const uint32_t* indices, const char* messages, const uint32_t* offsets);
+
 // LEGACY: Try take one sample. If a sample is available, fills outputs and returns 1; otherwise returns 0.
+// The message is truncated to buffer_len - 1 bytes; dds_take_loan returns messages of any size.
 ICD_API int dds_take(uint32_t* index_out, char* message_buffer, int buffer_len);
 
 // NEW: Take a complete HelloWorld struct. Returns 1 if data available, 0 if not.
 ICD_API int dds_take_struct(ICD_pkg::HelloWorld* hello_world_out);
 
+// Batched take: drains up to max_samples samples with a single loaned DataReader::take().
+// indices_out must hold max_samples entries and offsets_out max_samples + 1 entries.
+// Messages are packed back to back (no terminators) into message_buffer; sample i occupies
+// [offsets_out[i], offsets_out[i + 1]). The batch stops before the first message that does
+// not fit in the remaining buffer space; that sample and any taken after it are kept, in
+// order, for the next take on the reader, whichever take function it uses. Returns the
+// number of samples taken (0 if none), or -1 if the next message alone is longer than
+// buffer_len: nothing is handed out and offsets_out[1] holds the buffer_len it needs.
+ICD_API int dds_take_batch(uint32_t max_samples, uint32_t* indices_out, char* message_buffer, uint32_t buffer_len, uint32_t* offsets_out);
+
+// Block until the reader has unread data, the timeout expires or dds_shutdown is called.
+// timeout_ms < 0 waits forever. Returns 1 if data is available, 0 on timeout / not initialized.
+ICD_API int dds_wait_for_data(int32_t timeout_ms);
+
+// Register a descriptor (POSIX fd of a pipe/socket, or a SOCKET on Windows) that receives one
+// byte whenever data reaches the reader, so event loops (asyncio add_reader, epoll, ...) can
+// watch it. The caller owns the descriptor and should make it non-blocking. Pass -1 to disable.
+ICD_API void dds_set_data_notify_fd(intptr_t fd);
+
+// Callback run on the DDS listener thread whenever data reaches the reader. Keep it short and
+// non-blocking (hand off to another thread); it must not call the *_set_data_callback functions.
+// Pass nullptr to disable: once that call returns, the previous callback is no longer running.
+typedef void (*dds_data_callback_t)(void* context);
+ICD_API void dds_set_data_callback(dds_data_callback_t callback, void* context);
+
 // Convenience: take one sample and return message as const char* (nullptr if none). Index stored in *index_out if provided.
+// The full message is returned; the pointer stays valid until the calling thread's next call.
 ICD_API const char* dds_take_message(uint32_t* index_out);
 
+// Loaned take: messages of any size, read in place from the reader's sample pool.
+typedef struct dds_sample_s {
+    uint32_t index;
+    uint32_t length;        // message bytes
+    const char* message;    // not NUL-terminated; valid until the loan is returned
+} dds_sample_t;
+typedef struct dds_take_loan_s dds_take_loan_t;
+
+// Takes up to max_samples samples without copying them. Returns the number of samples and
+// points *samples_out at them, with *loan_out to hand back through dds_take_loan_return;
+// returns 0 (and no loan) when there is no data. dds_shutdown and re-init do not wait for
+// outstanding loans (the calling thread may hold them): their samples stay valid, and the
+// old reader is deleted when the last of them is returned.
+ICD_API int dds_take_loan(uint32_t max_samples, const dds_sample_t** samples_out, dds_take_loan_t** loan_out);
+// Returns the samples of a dds_take_loan / dds_reader_take_loan to the reader.
+ICD_API void dds_take_loan_return(dds_take_loan_t* loan);
+
 // Shutdown and release all entities.
 ICD_API void dds_shutdown();
+
+// Participant reuse: while on (keep != 0), dds_shutdown deletes the writer, reader and topic but
+// keeps the participant with its registered types, and the next dds_init on the same domain and
+// DDS_TRANSPORT reuses it. That skips participant creation and, for peers that already know it,
+// participant discovery. A different domain or transport replaces the participant. Turning reuse
+// off deletes an idle kept participant at once, otherwise at the next dds_shutdown. Until this is
+// called, reuse is on if the DDS_KEEP_PARTICIPANT environment variable is set and not "0".
+ICD_API void dds_set_keep_participant(int keep);
+ICD_API int dds_keep_participant();
+
+// Startup timings of the last dds_init* call, in ns since it started. The match and sample
+// times are 0 until the event happens; local endpoints count, so the dds_init writer and reader
+// also match each other.
+typedef struct dds_startup_stats_s {
+    uint64_t init_ns;                 // until the call returned
+    uint64_t writer_matched_ns;       // until the writer matched its first reader
+    uint64_t reader_matched_ns;       // until the reader matched its first writer
+    uint64_t first_sample_ns;         // until the first sample arrived at the reader
+    int32_t participant_reused;       // 1 if the call reused a kept participant
+} dds_startup_stats_t;
+
+// Returns 0 if not initialized.
+ICD_API int dds_get_startup_stats(dds_startup_stats_t* stats_out);
+
+// ---------------------------------------------------------------------------
+// Handle-based API: one DomainParticipant shared by any number of topics,
+// writers and readers. Independent of the single-topic functions above.
+// Create functions return nullptr on failure. A participant can only be
+// deleted once all of its writers and readers have been deleted.
+// ---------------------------------------------------------------------------
+typedef struct dds_participant_s dds_participant_t;
+typedef struct dds_writer_s dds_writer_t;
+typedef struct dds_reader_s dds_reader_t;
+
+ICD_API dds_participant_t* dds_participant_create(uint32_t domain_id);
+// transport is one of DDS_TRANSPORT_*.
+ICD_API dds_participant_t* dds_participant_create_with_transport(uint32_t domain_id, int32_t transport);
+// Returns 1 on success, 0 if writers/readers are still alive.
+ICD_API int dds_participant_delete(dds_participant_t* participant);
+
+ICD_API dds_writer_t* dds_writer_create(dds_participant_t* participant, const char* topic_name);
+// qos may be nullptr for defaults.
+ICD_API dds_writer_t* dds_writer_create_with_qos(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos);
+ICD_API void dds_writer_delete(dds_writer_t* writer);
+ICD_API int dds_writer_write(dds_writer_t* writer, uint32_t index, const char* message);
+ICD_API int dds_writer_write_struct(dds_writer_t* writer, const ICD_pkg::HelloWorld* hello_world);
+// Same layout as dds_write_batch.
+ICD_API int dds_writer_write_batch(dds_writer_t* writer, uint32_t count, const uint32_t* indices, const char* messages, const uint32_t* offsets);
+
+ICD_API dds_reader_t* dds_reader_create(dds_participant_t* participant, const char* topic_name);
+// qos may be nullptr for defaults; publish_mode is ignored.
+ICD_API dds_reader_t* dds_reader_create_with_qos(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos);
+ICD_API void dds_reader_delete(dds_reader_t* reader);
+ICD_API int dds_reader_take(dds_reader_t* reader, uint32_t* index_out, char* message_buffer, int buffer_len);
+ICD_API int dds_reader_take_struct(dds_reader_t* reader, ICD_pkg::HelloWorld* hello_world_out);
+// Same layout as dds_take_batch.
+ICD_API int dds_reader_take_batch(dds_reader_t* reader, uint32_t max_samples, uint32_t* indices_out, char* message_buffer, uint32_t buffer_len, uint32_t* offsets_out);
+// Same semantics as dds_take_loan. Loans must be returned before the reader is deleted.
+ICD_API int dds_reader_take_loan(dds_reader_t* reader, uint32_t max_samples, const dds_sample_t** samples_out, dds_take_loan_t** loan_out);
+// Same semantics as dds_init_filtered / dds_set_filter_parameters, for a reader of the
+// given participant (regular HelloWorld topics only).
+ICD_API dds_reader_t* dds_reader_create_filtered(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos,
+                                                 const char* filter_expression, const char* const* parameters, uint32_t parameter_count);
+ICD_API int dds_reader_set_filter_parameters(dds_reader_t* reader, const char* const* parameters, uint32_t parameter_count);
+// Same semantics as dds_wait_for_data; also returns 0 once the reader is deleted.
+ICD_API int dds_reader_wait_for_data(dds_reader_t* reader, int32_t timeout_ms);
+// Same semantics as dds_set_data_notify_fd, for this reader only.
+ICD_API void dds_reader_set_data_notify_fd(dds_reader_t* reader, intptr_t fd);
+
+// Same semantics as dds_set_data_callback, for this reader only.
+ICD_API void dds_reader_set_data_callback(dds_reader_t* reader, dds_data_callback_t callback, void* context);
+
+// Fixed-size endpoints carry ICD_pkg::HelloWorldFixed, which stores up to
+// DDS_FIXED_MESSAGE_CAPACITY message bytes in place. The type is plain, so same-host
+// peers can exchange samples through data-sharing instead of serializing them. All the
+// dds_writer_* / dds_reader_* functions above accept these handles; writes of longer
+// messages fail. Fixed and regular endpoints cannot share a topic.
+ICD_API dds_writer_t* dds_writer_create_fixed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos);
+ICD_API dds_reader_t* dds_reader_create_fixed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos);
+
+// Loaned writes on fixed-size writers: the sample lives in the writer's pool, the caller
+// fills message[0, length) in place and publishes it without any intermediate copy (and,
+// with data-sharing, without serializing it). Bytes past length are unspecified.
+typedef struct dds_loan_s {
+    ICD_pkg::HelloWorldFixed* sample; // nullptr when no loan is held
+    char* message;                    // capacity writable bytes inside sample
+    uint32_t capacity;                // DDS_FIXED_MESSAGE_CAPACITY
+} dds_loan_t;
+
+// Returns 1 and fills loan_out on success; 0 for regular writers or an exhausted pool.
+ICD_API int dds_writer_loan(dds_writer_t* writer, dds_loan_t* loan_out);
+// Publishes the loaned sample with the first length message bytes. The loan is released
+// whether or not the write succeeds (loan is reset). Returns 1 on success.
+ICD_API int dds_writer_write_loan(dds_writer_t* writer, dds_loan_t* loan, uint32_t index, uint32_t length);
+// Returns an unpublished loan to the writer's pool (loan is reset).
+ICD_API void dds_writer_discard_loan(dds_writer_t* writer, dds_loan_t* loan);
+
+// Keyed endpoints carry ICD_pkg::HelloWorldKeyed, whose index is the key: every index is
+// its own instance, so history depth and resource limits apply per index (KEEP_LAST 1
+// keeps the latest value of each). All the dds_writer_* / dds_reader_* functions above
+// accept these handles. Keyed and other endpoints cannot share a topic.
+ICD_API dds_writer_t* dds_writer_create_keyed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos);
+ICD_API dds_reader_t* dds_reader_create_keyed(dds_participant_t* participant, const char* topic_name, const dds_qos_t* qos);
+// 1 if the keyed reader currently holds the instance for index, 0 otherwise (and for
+// non-keyed readers).
+ICD_API int dds_reader_lookup_instance(dds_reader_t* reader, uint32_t index);
+// Copies the newest message of the instance for index without taking it (it stays in
+// the reader cache). Truncates like dds_take; length_out (may be nullptr) receives the
+// full length so the caller can retry with a larger buffer. Returns 1 on success, 0 if
+// the instance is unknown, disposed or has no data.
+ICD_API int dds_reader_read_instance(dds_reader_t* reader, uint32_t index, char* message_buffer, uint32_t buffer_len, uint32_t* length_out);
+
+// ---------------------------------------------------------------------------
+// Statistics. Off by default; while off, the write and take functions only test a
+// flag. While on, every write/take call of the functions above updates its endpoint's
+// counters (relaxed atomics, two clock reads per call). Counters accumulate from the
+// endpoint's creation, including any earlier enabled periods.
+// ---------------------------------------------------------------------------
+
+// Latency histograms are log-linear (HDR style): exact below 8 ns, then 8 buckets per
+// power of two, so a value is known to within 12.5%. Bucket i counts durations d with
+// dds_histogram_bucket_lower(i) <= d < dds_histogram_bucket_lower(i + 1); the last
+// bucket starts at dds_histogram_bucket_lower(255) = 15 * 2^30 ns (about 16.1 s) and
+// also counts everything longer.
+#define DDS_HISTOGRAM_BUCKETS 256
+
+typedef struct dds_histogram_s {
+    uint64_t count;                           // recorded calls
+    uint64_t total_ns;                        // time spent in those calls
+    uint64_t max_ns;
+    uint64_t buckets[DDS_HISTOGRAM_BUCKETS];
+} dds_histogram_t;
+
+typedef struct dds_writer_stats_s {
+    uint64_t samples;                 // samples written
+    uint64_t bytes;                   // message bytes of those samples
+    uint64_t failures;                // calls that did not write every sample they were given
+    dds_histogram_t write_latency;    // per call (a batch is one call), DataWriter::write included
+    int32_t matched_readers;          // PublicationMatchedStatus: current_count
+    int32_t matched_readers_total;    // and total_count
+} dds_writer_stats_t;
+
+typedef struct dds_reader_stats_s {
+    uint64_t samples;                 // samples taken
+    uint64_t bytes;                   // message bytes handed out (after truncation)
+    uint64_t empty_takes;             // calls that found no data
+    dds_histogram_t take_latency;     // per call (a batch is one call), copy-out included
+    int32_t matched_writers;          // SubscriptionMatchedStatus: current_count
+    int32_t matched_writers_total;    // and total_count
+    int32_t samples_lost;             // SampleLostStatus: total_count
+    uint32_t samples_rejected;        // SampleRejectedStatus: total_count
+    int32_t last_rejected_reason;     // SampleRejectedStatusKind: 0 not rejected, 1 instances,
+                                      // 2 samples, 3 samples per instance limit
+    uint64_t unread_samples;          // received but not yet taken (DataReader::get_unread_count)
+} dds_reader_stats_t;
+
+typedef struct dds_stats_s {
+    dds_writer_stats_t writer;
+    dds_reader_stats_t reader;
+} dds_stats_t;
+
+// Turns statistics collection on (non-zero) or off for every endpoint.
+ICD_API void dds_stats_enable(int enabled);
+ICD_API int dds_stats_enabled();
+// Snapshot of the dds_init writer and reader. Returns 0 if not initialized.
+ICD_API int dds_get_stats(dds_stats_t* stats_out);
+// Snapshot of one endpoint; the Fast DDS statuses are read even while collection is off.
+ICD_API int dds_writer_get_stats(dds_writer_t* writer, dds_writer_stats_t* stats_out);
+ICD_API int dds_reader_get_stats(dds_reader_t* reader, dds_reader_stats_t* stats_out);
+// Lower bound in ns of a histogram bucket; UINT64_MAX for bucket DDS_HISTOGRAM_BUCKETS.
+ICD_API uint64_t dds_histogram_bucket_lower(uint32_t bucket);
+// Duration in ns below which fraction (0..1, e.g. 0.99) of the recorded calls fall,
+// to bucket precision and at most max_ns. 0 for an empty histogram.
+ICD_API uint64_t dds_histogram_percentile(const dds_histogram_t* histogram, double fraction);
 }
@@ -0,0 +1,146 @@
+#include "fast_type_support.hpp"
+
+#include <fastcdr/Cdr.h>
+
+#include <cstring>  // for memcpy, memchr
+
+using SerializedPayload_t = eprosima::fastdds::rtps::SerializedPayload_t;
+using DataRepresentationId_t = eprosima::fastdds::dds::DataRepresentationId_t;
+
+namespace {
+
+// Second byte of the encapsulation header: the encoding Fast CDR writes for
+// HelloWorld, with the low bit set for little endian
+const unsigned char kPlainCdr = static_cast<unsigned char>(eprosima::fastcdr::EncodingAlgorithmFlag::PLAIN_CDR);
+const unsigned char kDelimitCdr2 = static_cast<unsigned char>(eprosima::fastcdr::EncodingAlgorithmFlag::DELIMIT_CDR2);
+
+// Fast CDR writes in host order (Cdr::DEFAULT_ENDIAN), and so do we
+const bool kHostLittle = eprosima::fastcdr::Cdr::DEFAULT_ENDIAN == eprosima::fastcdr::Cdr::LITTLE_ENDIANNESS;
+
+uint32_t swap32(uint32_t value) {
+    return (value >> 24) | ((value >> 8) & 0xff00u) | ((value << 8) & 0xff0000u) | (value << 24);
+}
+
+unsigned char* put_u32(unsigned char* out, uint32_t value) {
+    std::memcpy(out, &value, 4);
+    return out + 4;
+}
+
+bool get_u32(const unsigned char*& in, const unsigned char* end, bool swap, uint32_t& value) {
+    if (end - in < 4) return false;
+    std::memcpy(&value, in, 4);
+    if (swap) value = swap32(value);
+    in += 4;
+    return true;
+}
+
+// Payload size, encapsulation included, for a message of message_length bytes
+uint32_t payload_size(size_t message_length, bool xcdr2) {
+    return static_cast<uint32_t>(4 + (xcdr2 ? 4 : 0) + 4 + 4 + message_length + 1);
+}
+
+// Fields of a serialized HelloWorld, read in place. Returns false for a
+// malformed payload, or with *other_encoding set for one this fast path does
+// not handle (left to the generated code).
+bool parse(const SerializedPayload_t& payload, uint32_t& index, const char*& message, uint32_t& length,
+           bool& other_encoding) {
+    other_encoding = false;
+    if (payload.length < 4) return false;
+    const unsigned char* in = payload.data;
+    const unsigned char* end = in + payload.length;
+    const unsigned char kind = static_cast<unsigned char>(in[1] & ~1u);
+    const bool swap = ((in[1] & 1u) != 0) != kHostLittle;
+    if (in[0] != 0 || (kind != kPlainCdr && kind != kDelimitCdr2)) {
+        other_encoding = true;
+        return false;
+    }
+    in += 4;
+    if (kind == kDelimitCdr2) {
+        // Appendable: members past the ones we know are skipped with the rest of the body
+        uint32_t body = 0;
+        if (!get_u32(in, end, swap, body) || body > static_cast<size_t>(end - in)) return false;
+        end = in + body;
+    }
+    uint32_t size = 0;
+    if (!get_u32(in, end, swap, index) || !get_u32(in, end, swap, size) || size > static_cast<size_t>(end - in)) {
+        return false;
+    }
+    message = reinterpret_cast<const char*>(in);
+    // The serialized length counts the terminating NUL
+    length = size > 0 && in[size - 1] == '\0' ? size - 1 : size;
+    return true;
+}
+
+} // namespace
+
+namespace ICD_pkg {
+
+    bool HelloWorldFastPubSubType::serialize(
+            const void* const data,
+            SerializedPayload_t& payload,
+            DataRepresentationId_t data_representation)
+    {
+        const HelloWorld* p_type = static_cast<const HelloWorld*>(data);
+        const std::string& message = p_type->message();
+        const bool xcdr2 = data_representation != DataRepresentationId_t::XCDR_DATA_REPRESENTATION;
+        // Fast CDR refuses strings with embedded NULs; so do we
+        if (message.size() > 0xffff0000u || std::memchr(message.data(), '\0', message.size()) != nullptr)
+        {
+            return false;
+        }
+        const uint32_t size = payload_size(message.size(), xcdr2);
+        if (size > payload.max_size)
+        {
+            return false;
+        }
+
+        unsigned char* out = payload.data;
+        out[0] = 0;
+        out[1] = static_cast<unsigned char>((xcdr2 ? kDelimitCdr2 : kPlainCdr) | (kHostLittle ? 1 : 0));
+        out[2] = 0;
+        out[3] = 0;
+        out += 4;
+        if (xcdr2)
+        {
+            out = put_u32(out, size - 8); // DHEADER: the body after it
+        }
+        out = put_u32(out, p_type->index());
+        out = put_u32(out, static_cast<uint32_t>(message.size() + 1));
+        std::memcpy(out, message.data(), message.size());
+        out[message.size()] = '\0';
+
+        payload.length = size;
+        payload.encapsulation = kHostLittle ? CDR_LE : CDR_BE;
+        return true;
+    }
+
+    bool HelloWorldFastPubSubType::deserialize(
+            SerializedPayload_t& payload,
+            void* data)
+    {
+        uint32_t index = 0;
+        uint32_t length = 0;
+        const char* message = nullptr;
+        bool other_encoding = false;
+        if (!parse(payload, index, message, length, other_encoding))
+        {
+            return other_encoding && HelloWorldPubSubType::deserialize(payload, data);
+        }
+
+        HelloWorld* p_type = static_cast<HelloWorld*>(data);
+        p_type->index(index);
+        // assign() reuses the capacity of a recycled sample
+        p_type->message().assign(message, length);
+        payload.encapsulation = (payload.data[1] & 1u) ? CDR_LE : CDR_BE;
+        return true;
+    }
+
+    uint32_t HelloWorldFastPubSubType::calculate_serialized_size(
+            const void* const data,
+            DataRepresentationId_t data_representation)
+    {
+        return payload_size(static_cast<const HelloWorld*>(data)->message().size(),
+                data_representation != DataRepresentationId_t::XCDR_DATA_REPRESENTATION);
+    }
+
+} // namespace ICD_pkg
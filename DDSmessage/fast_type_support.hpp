@@ -0,0 +1,39 @@
+#pragma once
+// Hand-written fast path for the HelloWorld type support (not generated).
+//
+// HelloWorld is a uint32 plus a string, so its CDR layout is fixed:
+//
+//   XCDR1 (PLAIN_CDR):     encapsulation | index | length + 1 | message | NUL
+//   XCDR2 (DELIMIT_CDR2):  encapsulation | DHEADER | index | length + 1 | message | NUL
+//
+// HelloWorldFastPubSubType writes and reads that layout directly: sizes are
+// computed arithmetically, no FastBuffer/Cdr/CdrSizeCalculator is built per
+// sample, and deserialization assigns into the sample's existing string
+// storage. The output is byte for byte what HelloWorldPubSubType produces;
+// payloads in any other encoding, and keys (HelloWorld has none), are handed
+// to the generated code. It registers under the same type name, so both
+// interoperate on the wire.
+
+#include "ICDPubSubTypes.hpp"
+
+namespace ICD_pkg {
+
+    class HelloWorldFastPubSubType : public HelloWorldPubSubType
+    {
+    public:
+
+        eProsima_user_DllExport bool serialize(
+                const void* const data,
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) override;
+
+        eProsima_user_DllExport bool deserialize(
+                eprosima::fastdds::rtps::SerializedPayload_t& payload,
+                void* data) override;
+
+        eProsima_user_DllExport uint32_t calculate_serialized_size(
+                const void* const data,
+                eprosima::fastdds::dds::DataRepresentationId_t data_representation) override;
+    };
+
+} // namespace ICD_pkg
@@ -0,0 +1,98 @@
+// dds_reader_take_batch: a batch stops before the first message that does not
+// fit, and the samples it leaves behind reach the next take of any kind.
+
+#include "test_support.hpp"
+
+namespace {
+
+struct Batch {
+    std::vector<uint32_t> indices;
+    std::vector<uint32_t> offsets;
+    std::vector<char> buffer;
+
+    Batch(uint32_t max_samples, uint32_t buffer_len)
+        : indices(max_samples), offsets(max_samples + 1), buffer(buffer_len) {}
+
+    int take(dds_reader_t* reader) {
+        return dds_reader_take_batch(reader, static_cast<uint32_t>(indices.size()), indices.data(),
+                                     buffer.data(), static_cast<uint32_t>(buffer.size()), offsets.data());
+    }
+
+    std::string message(int i) const {
+        return std::string(buffer.data() + offsets[i], offsets[i + 1] - offsets[i]);
+    }
+};
+
+} // namespace
+
+TEST(batch_stops_before_message_that_does_not_fit) {
+    icd_test::Endpoints dds("BatchFit");
+    REQUIRE(dds.ready());
+    REQUIRE(dds.publish({ "aaaaaaaaaa", "bbbbbbbbbb", "cccccccccc" }));
+
+    Batch batch(8, 25);
+    REQUIRE(batch.take(dds.reader) == 2);
+    CHECK(batch.indices[0] == 0 && batch.indices[1] == 1);
+    CHECK(batch.message(0) == "aaaaaaaaaa");
+    CHECK(batch.message(1) == "bbbbbbbbbb");
+    CHECK(batch.offsets[2] == 20);
+
+    // The third sample was taken from DDS but kept for the next call
+    dds_reader_stats_t stats;
+    REQUIRE(dds_reader_get_stats(dds.reader, &stats));
+    CHECK(stats.unread_samples == 1);
+
+    REQUIRE(batch.take(dds.reader) == 1);
+    CHECK(batch.indices[0] == 2);
+    CHECK(batch.message(0) == "cccccccccc");
+    CHECK(batch.take(dds.reader) == 0);
+}
+
+TEST(batch_reports_length_of_message_longer_than_buffer) {
+    icd_test::Endpoints dds("BatchTooLong");
+    REQUIRE(dds.ready());
+    std::string long_message(100, 'x');
+    REQUIRE(dds.publish({ long_message, "short" }));
+
+    Batch small(8, 50);
+    REQUIRE(small.take(dds.reader) == -1);
+    CHECK(small.offsets[0] == 0);
+    CHECK(small.offsets[1] == 100);
+
+    Batch large(8, small.offsets[1] + 5);
+    REQUIRE(large.take(dds.reader) == 2);
+    CHECK(large.message(0) == long_message);
+    CHECK(large.message(1) == "short");
+}
+
+TEST(carried_samples_reach_other_take_functions_in_order) {
+    icd_test::Endpoints dds("BatchCarry");
+    REQUIRE(dds.ready());
+    REQUIRE(dds.publish({ "first", "second", "third", "fourth" }));
+
+    Batch batch(8, 8);
+    REQUIRE(batch.take(dds.reader) == 1);
+    CHECK(batch.message(0) == "first");
+
+    // Only carried samples are left; waiting must see them
+    CHECK(dds_reader_wait_for_data(dds.reader, 0) == 1);
+
+    uint32_t index = 99;
+    char message[16];
+    REQUIRE(dds_reader_take(dds.reader, &index, message, sizeof(message)) == 1);
+    CHECK(index == 1);
+    CHECK(std::strcmp(message, "second") == 0);
+
+    const dds_sample_t* samples;
+    dds_take_loan_t* loan;
+    int count = dds_reader_take_loan(dds.reader, 8, &samples, &loan);
+    REQUIRE(count == 2);
+    CHECK(samples[0].index == 2 && std::string(samples[0].message, samples[0].length) == "third");
+    CHECK(samples[1].index == 3 && std::string(samples[1].message, samples[1].length) == "fourth");
+    dds_take_loan_return(loan);
+
+    CHECK(dds_reader_wait_for_data(dds.reader, 0) == 0);
+    CHECK(dds_reader_take(dds.reader, &index, message, sizeof(message)) == 0);
+}
+
+ICD_TEST_MAIN()
@@ -0,0 +1,120 @@
+// dds_write_batch / dds_writer_write_batch: samples of a packed batch arrive
+// in order and intact, and a batch stops at the first sample it cannot write.
+
+#include "test_support.hpp"
+
+namespace {
+
+// Packs messages back to back with count + 1 offsets, as the batch API takes them
+struct Packed {
+    std::vector<uint32_t> indices;
+    std::vector<uint32_t> offsets;
+    std::string bytes;
+
+    Packed(const std::vector<std::string>& messages, uint32_t first_index = 0) {
+        offsets.push_back(0);
+        for (size_t i = 0; i < messages.size(); ++i) {
+            indices.push_back(first_index + static_cast<uint32_t>(i));
+            bytes += messages[i];
+            offsets.push_back(static_cast<uint32_t>(bytes.size()));
+        }
+    }
+
+    uint32_t count() const { return static_cast<uint32_t>(indices.size()); }
+};
+
+// Takes every sample the reader holds as (index, message) with loaned takes
+std::vector<std::pair<uint32_t, std::string> > take_all(dds_reader_t* reader) {
+    std::vector<std::pair<uint32_t, std::string> > received;
+    const dds_sample_t* samples;
+    dds_take_loan_t* loan;
+    int count;
+    while ((count = dds_reader_take_loan(reader, 64, &samples, &loan)) > 0) {
+        for (int i = 0; i < count; ++i) {
+            received.push_back(std::make_pair(samples[i].index, std::string(samples[i].message, samples[i].length)));
+        }
+        dds_take_loan_return(loan);
+    }
+    return received;
+}
+
+} // namespace
+
+TEST(batch_arrives_in_order_and_intact) {
+    icd_test::Endpoints dds("WriteBatch");
+    REQUIRE(dds.ready());
+    // An empty message, UTF-8 and a byte that would end a C string early if copied as one
+    std::vector<std::string> messages = { "alpha", "", "\xc3\xa9t\xc3\xa9", std::string("nul\0byte", 8), "omega" };
+    Packed batch(messages, 10);
+
+    REQUIRE(dds_writer_write_batch(dds.writer, batch.count(), batch.indices.data(), batch.bytes.data(), batch.offsets.data()) == 5);
+    REQUIRE(icd_test::wait_unread(dds.reader, messages.size()));
+
+    std::vector<std::pair<uint32_t, std::string> > received = take_all(dds.reader);
+    REQUIRE(received.size() == messages.size());
+    for (size_t i = 0; i < messages.size(); ++i) {
+        CHECK(received[i].first == 10 + i);
+        CHECK(received[i].second == messages[i]);
+    }
+}
+
+TEST(empty_batch_writes_nothing) {
+    icd_test::Endpoints dds("WriteBatchEmpty");
+    REQUIRE(dds.writer);
+    uint32_t offset = 0;
+    CHECK(dds_writer_write_batch(dds.writer, 0, nullptr, nullptr, &offset) == 0);
+    CHECK(dds_writer_write_batch(nullptr, 1, &offset, "x", &offset) == 0);
+}
+
+TEST(batch_stops_at_first_sample_it_cannot_write) {
+    dds_qos_t qos = icd_test::reliable_qos();
+    dds_participant_t* participant = dds_participant_create(icd_test::domain());
+    REQUIRE(participant);
+    std::string name = icd_test::topic("WriteBatchFixed");
+    dds_writer_t* writer = dds_writer_create_fixed(participant, name.c_str(), &qos);
+    dds_reader_t* reader = dds_reader_create_fixed(participant, name.c_str(), &qos);
+    if (writer && reader && icd_test::wait_matched(writer)) {
+        // The second message exceeds the fixed capacity, so only the first is written
+        Packed batch({ "fits", std::string(DDS_FIXED_MESSAGE_CAPACITY + 1, 'x'), "never" });
+        dds_stats_enable(1);
+        CHECK(dds_writer_write_batch(writer, batch.count(), batch.indices.data(), batch.bytes.data(), batch.offsets.data()) == 1);
+        CHECK(icd_test::wait_unread(reader, 1));
+        std::vector<std::pair<uint32_t, std::string> > received = take_all(reader);
+        CHECK(received.size() == 1 && received[0].second == "fits");
+
+        dds_writer_stats_t stats;
+        CHECK(dds_writer_get_stats(writer, &stats) && stats.failures == 1 && stats.samples == 1);
+        dds_stats_enable(0);
+    } else {
+        CHECK(!"fixed endpoints did not match");
+    }
+    dds_reader_delete(reader);
+    dds_writer_delete(writer);
+    dds_participant_delete(participant);
+}
+
+TEST(single_topic_batch_uses_dds_init_endpoints) {
+    std::string name = icd_test::topic("WriteBatchInit");
+    dds_qos_t qos = icd_test::reliable_qos();
+    REQUIRE(dds_init_with_qos(name.c_str(), icd_test::domain(), &qos));
+    Packed batch({ "one", "two", "three" });
+    CHECK(dds_write_batch(batch.count(), batch.indices.data(), batch.bytes.data(), batch.offsets.data()) == 3);
+
+    std::vector<std::pair<uint32_t, std::string> > received;
+    icd_test::wait_until([&] {
+        uint32_t indices[8], offsets[9];
+        char buffer[64];
+        int count = dds_take_batch(8, indices, buffer, sizeof(buffer), offsets);
+        for (int i = 0; i < count; ++i) {
+            received.push_back(std::make_pair(indices[i], std::string(buffer + offsets[i], offsets[i + 1] - offsets[i])));
+        }
+        return received.size() >= 3;
+    });
+    dds_shutdown();
+    REQUIRE(received.size() == 3);
+    CHECK(received[0].first == 0 && received[0].second == "one");
+    CHECK(received[1].first == 1 && received[1].second == "two");
+    CHECK(received[2].first == 2 && received[2].second == "three");
+}
+
+ICD_TEST_MAIN()
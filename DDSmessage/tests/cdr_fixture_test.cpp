@@ -0,0 +1,174 @@
+// The generated type support against the byte fixtures in cdr_fixtures.txt,
+// which the Python codec tests decode as well, so both agree on the wire format.
+// Each fixture is serialized through the generated CDR functions in its own
+// endianness (and through HelloWorldPubSubType / HelloWorldFixedPubSubType in the
+// host's) and must match byte for byte; each is deserialized back by the
+// generated type support. HelloWorld fixtures also go through the fast path
+// (fast_type_support.hpp). No DDS entity is created.
+
+#include "test_support.hpp"
+
+#include "ICDCdrAux.hpp"
+#include "ICDPubSubTypes.hpp"
+#include "fast_type_support.hpp"
+
+#include <fastcdr/Cdr.h>
+
+#include <fstream>
+#include <sstream>
+
+using eprosima::fastcdr::Cdr;
+using eprosima::fastcdr::CdrVersion;
+using eprosima::fastcdr::EncodingAlgorithmFlag;
+using eprosima::fastdds::dds::DataRepresentationId_t;
+using eprosima::fastdds::rtps::SerializedPayload_t;
+
+namespace {
+
+struct Fixture {
+    std::string type;       // hello or fixed
+    bool xcdr2;
+    bool big_endian;
+    uint32_t index;
+    std::string message;
+    std::vector<char> payload;
+};
+
+std::vector<Fixture> load_fixtures() {
+    std::vector<Fixture> fixtures;
+    std::ifstream file(ICD_CDR_FIXTURES);
+    std::string line;
+    while (std::getline(file, line)) {
+        if (line.empty() || line[0] == '#') continue;
+        std::istringstream fields(line);
+        Fixture fixture;
+        std::string version, endianness, hex;
+        size_t length = 0;
+        fields >> fixture.type >> version >> endianness >> fixture.index >> fixture.message >> hex;
+        if (!(fields >> length)) length = hex.size() / 2;
+        fixture.xcdr2 = version == "xcdr2";
+        fixture.big_endian = endianness == "be";
+        fixture.payload.assign(length, 0);
+        for (size_t i = 0; i + 1 < hex.size(); i += 2) {
+            fixture.payload[i / 2] = static_cast<char>(std::stoi(hex.substr(i, 2), nullptr, 16));
+        }
+        fixtures.push_back(fixture);
+    }
+    return fixtures;
+}
+
+ICD_pkg::HelloWorldFixed make_fixed(const Fixture& fixture) {
+    ICD_pkg::HelloWorldFixed sample;
+    sample.index(fixture.index);
+    sample.length(static_cast<uint32_t>(fixture.message.size()));
+    std::memcpy(sample.message().data(), fixture.message.data(), fixture.message.size());
+    return sample;
+}
+
+// What the generated serialize writes, in the fixture's endianness
+template<typename T>
+std::vector<char> serialize(const T& sample, const Fixture& fixture, EncodingAlgorithmFlag xcdr2_encoding) {
+    std::vector<char> out(fixture.payload.size() + 64);
+    eprosima::fastcdr::FastBuffer buffer(out.data(), out.size());
+    Cdr ser(buffer, fixture.big_endian ? Cdr::BIG_ENDIANNESS : Cdr::LITTLE_ENDIANNESS,
+            fixture.xcdr2 ? CdrVersion::XCDRv2 : CdrVersion::XCDRv1);
+    ser.set_encoding_flag(fixture.xcdr2 ? xcdr2_encoding : EncodingAlgorithmFlag::PLAIN_CDR);
+    ser.serialize_encapsulation();
+    ser << sample;
+    ser.set_dds_cdr_options({0, 0});
+    out.resize(ser.get_serialized_data_length());
+    return out;
+}
+
+// What the type support writes; it always serializes in host order
+template<typename Type, typename T>
+std::vector<char> serialize_with_type(const T& sample, bool xcdr2) {
+    Type type;
+    DataRepresentationId_t representation = xcdr2 ? DataRepresentationId_t::XCDR2_DATA_REPRESENTATION
+                                                  : DataRepresentationId_t::XCDR_DATA_REPRESENTATION;
+    SerializedPayload_t payload(type.calculate_serialized_size(&sample, representation));
+    if (!type.serialize(&sample, payload, representation)) return std::vector<char>();
+    return std::vector<char>(payload.data, payload.data + payload.length);
+}
+
+template<typename Type, typename T>
+bool deserialize(const Fixture& fixture, T& sample) {
+    Type type;
+    SerializedPayload_t payload(static_cast<uint32_t>(fixture.payload.size()));
+    std::memcpy(payload.data, fixture.payload.data(), fixture.payload.size());
+    payload.length = static_cast<uint32_t>(fixture.payload.size());
+    return type.deserialize(payload, &sample);
+}
+
+bool host_order(const Fixture& fixture) {
+    return fixture.big_endian == (Cdr::DEFAULT_ENDIAN == Cdr::BIG_ENDIANNESS);
+}
+
+} // namespace
+
+TEST(fixtures_cover_both_types_versions_and_endiannesses) {
+    std::vector<Fixture> fixtures = load_fixtures();
+    REQUIRE(fixtures.size() == 8);
+    for (const Fixture& fixture : fixtures) {
+        CHECK(fixture.type == "hello" || fixture.type == "fixed");
+    }
+}
+
+TEST(hello_world_serializes_to_the_fixtures) {
+    for (const Fixture& fixture : load_fixtures()) {
+        if (fixture.type != "hello") continue;
+        ICD_pkg::HelloWorld sample;
+        sample.index(fixture.index);
+        sample.message(fixture.message);
+        CHECK(serialize(sample, fixture, EncodingAlgorithmFlag::DELIMIT_CDR2) == fixture.payload);
+        if (host_order(fixture)) {
+            CHECK((serialize_with_type<ICD_pkg::HelloWorldPubSubType>(sample, fixture.xcdr2) == fixture.payload));
+        }
+    }
+}
+
+TEST(hello_world_deserializes_the_fixtures) {
+    for (const Fixture& fixture : load_fixtures()) {
+        if (fixture.type != "hello") continue;
+        ICD_pkg::HelloWorld sample;
+        REQUIRE(deserialize<ICD_pkg::HelloWorldPubSubType>(fixture, sample));
+        CHECK(sample.index() == fixture.index);
+        CHECK(sample.message() == fixture.message);
+    }
+}
+
+TEST(fast_path_matches_the_fixtures) {
+    for (const Fixture& fixture : load_fixtures()) {
+        if (fixture.type != "hello") continue;
+        ICD_pkg::HelloWorld sample;
+        REQUIRE(deserialize<ICD_pkg::HelloWorldFastPubSubType>(fixture, sample));
+        CHECK(sample.index() == fixture.index);
+        CHECK(sample.message() == fixture.message);
+        if (host_order(fixture)) {
+            CHECK((serialize_with_type<ICD_pkg::HelloWorldFastPubSubType>(sample, fixture.xcdr2) == fixture.payload));
+        }
+    }
+}
+
+TEST(fixed_serializes_to_the_fixtures) {
+    for (const Fixture& fixture : load_fixtures()) {
+        if (fixture.type != "fixed") continue;
+        ICD_pkg::HelloWorldFixed sample = make_fixed(fixture);
+        CHECK(serialize(sample, fixture, EncodingAlgorithmFlag::PLAIN_CDR2) == fixture.payload);
+        if (host_order(fixture)) {
+            CHECK((serialize_with_type<ICD_pkg::HelloWorldFixedPubSubType>(sample, fixture.xcdr2) == fixture.payload));
+        }
+    }
+}
+
+TEST(fixed_deserializes_the_fixtures) {
+    for (const Fixture& fixture : load_fixtures()) {
+        if (fixture.type != "fixed") continue;
+        ICD_pkg::HelloWorldFixed sample;
+        REQUIRE(deserialize<ICD_pkg::HelloWorldFixedPubSubType>(fixture, sample));
+        CHECK(sample.index() == fixture.index);
+        CHECK(std::string(sample.message().data(), sample.length()) == fixture.message);
+    }
+}
+
+ICD_TEST_MAIN()
@@ -0,0 +1,140 @@
+// Content-filtered readers: only matching samples are delivered, parameters can be
+// replaced at runtime, and invalid expressions or parameters are refused.
+
+#include "test_support.hpp"
+
+#include <set>
+
+namespace {
+
+struct FilteredPair {
+    dds_participant_t* participant;
+    dds_writer_t* writer = nullptr;
+    dds_reader_t* reader = nullptr;
+
+    FilteredPair(const char* base, const char* expression, const std::vector<const char*>& parameters) {
+        std::string name = icd_test::topic(base);
+        dds_qos_t qos = icd_test::reliable_qos();
+        participant = dds_participant_create(icd_test::domain());
+        if (participant) {
+            writer = dds_writer_create_with_qos(participant, name.c_str(), &qos);
+            reader = dds_reader_create_filtered(participant, name.c_str(), &qos, expression,
+                                                parameters.empty() ? nullptr : parameters.data(),
+                                                static_cast<uint32_t>(parameters.size()));
+        }
+    }
+
+    FilteredPair(const FilteredPair&) = delete;
+    FilteredPair& operator=(const FilteredPair&) = delete;
+
+    ~FilteredPair() {
+        dds_reader_delete(reader);
+        dds_writer_delete(writer);
+        dds_participant_delete(participant);
+    }
+
+    bool ready() const { return writer && reader && icd_test::wait_matched(writer); }
+};
+
+// Takes until the sample with the sentinel message has arrived; samples from one
+// reliable writer arrive in order, so every earlier one was delivered or filtered out
+std::vector<uint32_t> take_until(dds_reader_t* reader, const char* sentinel) {
+    std::vector<uint32_t> indices;
+    bool done = false;
+    icd_test::wait_until([&] {
+        uint32_t index;
+        char buffer[64];
+        while (!done && dds_reader_take(reader, &index, buffer, sizeof(buffer)) == 1) {
+            if (std::strcmp(buffer, sentinel) == 0) done = true;
+            else indices.push_back(index);
+        }
+        return done;
+    });
+    return indices;
+}
+
+} // namespace
+
+TEST(index_filter_delivers_only_matching_samples) {
+    FilteredPair pair("FilterIndex", "index BETWEEN %0 AND %1", { "3", "5" });
+    REQUIRE(pair.ready());
+    for (uint32_t index = 0; index < 10; ++index) CHECK(dds_writer_write(pair.writer, index, "sample"));
+    CHECK(dds_writer_write(pair.writer, 4, "end"));
+    CHECK((take_until(pair.reader, "end") == std::vector<uint32_t>{ 3, 4, 5 }));
+}
+
+TEST(message_filter_matches_quoted_parameters) {
+    FilteredPair pair("FilterMessage", "message LIKE %0", { "'alarm/%'" });
+    REQUIRE(pair.ready());
+    CHECK(dds_writer_write(pair.writer, 1, "alarm/overheat"));
+    CHECK(dds_writer_write(pair.writer, 2, "status/ok"));
+    CHECK(dds_writer_write(pair.writer, 3, "alarm/door"));
+    CHECK(dds_writer_write(pair.writer, 4, "alarm/end"));
+    CHECK((take_until(pair.reader, "alarm/end") == std::vector<uint32_t>{ 1, 3 }));
+}
+
+TEST(new_parameters_apply_to_later_samples) {
+    FilteredPair pair("FilterParameters", "index BETWEEN %0 AND %1", { "0", "9" });
+    REQUIRE(pair.ready());
+    const char* moved[] = { "10", "19" };
+    REQUIRE(dds_reader_set_filter_parameters(pair.reader, moved, 2) == 1);
+    for (uint32_t index = 0; index < 20; index += 5) CHECK(dds_writer_write(pair.writer, index, "sample"));
+    CHECK(dds_writer_write(pair.writer, 19, "end"));
+    CHECK((take_until(pair.reader, "end") == std::vector<uint32_t>{ 10, 15 }));
+}
+
+TEST(invalid_parameters_keep_the_previous_ones) {
+    FilteredPair pair("FilterInvalid", "index BETWEEN %0 AND %1", { "3", "5" });
+    REQUIRE(pair.ready());
+    const char* too_few[] = { "7" };
+    CHECK(dds_reader_set_filter_parameters(pair.reader, too_few, 1) == 0);
+    for (uint32_t index = 0; index < 10; ++index) CHECK(dds_writer_write(pair.writer, index, "sample"));
+    CHECK(dds_writer_write(pair.writer, 5, "end"));
+    CHECK((take_until(pair.reader, "end") == std::vector<uint32_t>{ 3, 4, 5 }));
+}
+
+TEST(invalid_expression_is_refused) {
+    FilteredPair pair("FilterBadExpression", "index BETWEEN", {});
+    CHECK(pair.participant != nullptr);
+    CHECK(pair.reader == nullptr);
+}
+
+TEST(unfiltered_reader_has_no_parameters) {
+    icd_test::Endpoints endpoints("FilterUnfiltered");
+    REQUIRE(endpoints.reader);
+    const char* parameters[] = { "1" };
+    CHECK(dds_reader_set_filter_parameters(endpoints.reader, parameters, 1) == 0);
+    CHECK(dds_reader_set_filter_parameters(nullptr, parameters, 1) == 0);
+}
+
+TEST(single_topic_filter) {
+    std::string name = icd_test::topic("FilterSingleTopic");
+    dds_qos_t qos = icd_test::reliable_qos();
+    const char* parameters[] = { "100" };
+    REQUIRE(dds_init_filtered(name.c_str(), icd_test::domain(), &qos, "index >= %0", parameters, 1) == 1);
+    // The dds_init writer matches the dds_init reader of the same participant
+    REQUIRE(icd_test::wait_until([] {
+        dds_stats_t stats;
+        return dds_get_stats(&stats) && stats.writer.matched_readers >= 1;
+    }));
+    std::set<uint32_t> received;
+    auto receive_until = [&](uint32_t index) {
+        return icd_test::wait_until([&] {
+            uint32_t taken;
+            char buffer[64];
+            while (dds_take(&taken, buffer, sizeof(buffer)) == 1) received.insert(taken);
+            return received.count(index) == 1;
+        });
+    };
+    CHECK(dds_write(1, "low"));
+    CHECK(dds_write(150, "high"));
+    CHECK(receive_until(150));
+    const char* lowered[] = { "0" };
+    CHECK(dds_set_filter_parameters(lowered, 1) == 1);
+    CHECK(dds_write(2, "low again"));
+    CHECK(receive_until(2));
+    CHECK((received == std::set<uint32_t>{ 150, 2 }));
+    dds_shutdown();
+}
+
+ICD_TEST_MAIN()
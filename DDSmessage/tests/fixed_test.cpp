@@ -0,0 +1,115 @@
+// Fixed-size endpoints (HelloWorldFixed): the capacity bound, loaned writes,
+// and data-sharing between same-host participants.
+
+#include "test_support.hpp"
+
+namespace {
+
+std::string take_message(dds_reader_t* reader, uint32_t& index) {
+    const dds_sample_t* samples;
+    dds_take_loan_t* loan;
+    if (dds_reader_take_loan(reader, 1, &samples, &loan) != 1) return "<none>";
+    index = samples[0].index;
+    std::string message(samples[0].message, samples[0].length);
+    dds_take_loan_return(loan);
+    return message;
+}
+
+struct FixedPair {
+    dds_participant_t* writer_participant;
+    dds_participant_t* reader_participant;
+    dds_writer_t* writer = nullptr;
+    dds_reader_t* reader = nullptr;
+
+    // Separate participants, so that samples go through the transport (or data-sharing)
+    explicit FixedPair(const char* base, const dds_qos_t& qos) {
+        std::string name = icd_test::topic(base);
+        writer_participant = dds_participant_create_with_transport(icd_test::domain(), DDS_TRANSPORT_SHM);
+        reader_participant = dds_participant_create_with_transport(icd_test::domain(), DDS_TRANSPORT_SHM);
+        if (writer_participant && reader_participant) {
+            writer = dds_writer_create_fixed(writer_participant, name.c_str(), &qos);
+            reader = dds_reader_create_fixed(reader_participant, name.c_str(), &qos);
+        }
+    }
+
+    FixedPair(const FixedPair&) = delete;
+    FixedPair& operator=(const FixedPair&) = delete;
+
+    ~FixedPair() {
+        dds_reader_delete(reader);
+        dds_writer_delete(writer);
+        dds_participant_delete(reader_participant);
+        dds_participant_delete(writer_participant);
+    }
+
+    bool ready() const { return writer && reader && icd_test::wait_matched(writer); }
+};
+
+void exchange(const dds_qos_t& qos, const char* base) {
+    FixedPair pair(base, qos);
+    REQUIRE(pair.ready());
+    std::string full(DDS_FIXED_MESSAGE_CAPACITY, 'f');
+    CHECK(dds_writer_write(pair.writer, 1, ""));
+    CHECK(dds_writer_write(pair.writer, 2, full.c_str()));
+    // One byte over the capacity cannot be written
+    std::string too_long(DDS_FIXED_MESSAGE_CAPACITY + 1, 'x');
+    CHECK(dds_writer_write(pair.writer, 3, too_long.c_str()) == 0);
+    CHECK(icd_test::wait_unread(pair.reader, 2));
+
+    uint32_t index = 0;
+    CHECK(take_message(pair.reader, index) == "" && index == 1);
+    CHECK(take_message(pair.reader, index) == full && index == 2);
+    CHECK(take_message(pair.reader, index) == "<none>");
+}
+
+} // namespace
+
+TEST(fixed_samples_hold_up_to_capacity) {
+    exchange(icd_test::reliable_qos(), "FixedCapacity");
+}
+
+TEST(fixed_samples_through_data_sharing) {
+    dds_qos_t qos = icd_test::reliable_qos();
+    qos.data_sharing = DDS_DATA_SHARING_ON;
+    exchange(qos, "FixedDataSharing");
+}
+
+TEST(loaned_write_publishes_in_place) {
+    dds_qos_t qos = icd_test::reliable_qos();
+    qos.data_sharing = DDS_DATA_SHARING_AUTO;
+    FixedPair pair("FixedLoan", qos);
+    REQUIRE(pair.ready());
+
+    dds_loan_t loan;
+    REQUIRE(dds_writer_loan(pair.writer, &loan));
+    CHECK(loan.sample && loan.message);
+    CHECK(loan.capacity == DDS_FIXED_MESSAGE_CAPACITY);
+    std::memcpy(loan.message, "loaned", 6);
+    CHECK(dds_writer_write_loan(pair.writer, &loan, 9, 6));
+    CHECK(!loan.sample);
+
+    // A discarded loan publishes nothing; an over-long one is released and fails
+    REQUIRE(dds_writer_loan(pair.writer, &loan));
+    dds_writer_discard_loan(pair.writer, &loan);
+    CHECK(!loan.sample);
+    REQUIRE(dds_writer_loan(pair.writer, &loan));
+    CHECK(dds_writer_write_loan(pair.writer, &loan, 10, DDS_FIXED_MESSAGE_CAPACITY + 1) == 0);
+    CHECK(!loan.sample);
+
+    CHECK(icd_test::wait_unread(pair.reader, 1));
+    std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    uint32_t index = 0;
+    CHECK(take_message(pair.reader, index) == "loaned" && index == 9);
+    CHECK(take_message(pair.reader, index) == "<none>");
+}
+
+TEST(regular_writers_do_not_loan) {
+    icd_test::Endpoints dds("FixedRegular");
+    REQUIRE(dds.writer);
+    dds_loan_t loan = dds_loan_t();
+    CHECK(dds_writer_loan(dds.writer, &loan) == 0);
+    CHECK(!loan.sample);
+    CHECK(dds_writer_write_loan(dds.writer, &loan, 1, 0) == 0);
+}
+
+ICD_TEST_MAIN()
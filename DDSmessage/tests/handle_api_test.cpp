@@ -0,0 +1,173 @@
+// Handle API: participants with several topics, topics shared by several
+// endpoints, deletion order, and null or closed handles.
+
+#include "test_support.hpp"
+#include "ICD.hpp"
+
+#include <atomic>
+
+namespace {
+
+bool take_text(dds_reader_t* reader, uint32_t& index, std::string& message) {
+    char buffer[256];
+    if (!dds_reader_take(reader, &index, buffer, sizeof(buffer))) return false;
+    message = buffer;
+    return true;
+}
+
+} // namespace
+
+TEST(topics_of_one_participant_are_independent) {
+    dds_participant_t* participant = dds_participant_create(icd_test::domain());
+    REQUIRE(participant);
+    dds_qos_t qos = icd_test::reliable_qos();
+    std::string name_a = icd_test::topic("HandleA"), name_b = icd_test::topic("HandleB");
+    dds_writer_t* writer_a = dds_writer_create_with_qos(participant, name_a.c_str(), &qos);
+    dds_writer_t* writer_b = dds_writer_create_with_qos(participant, name_b.c_str(), &qos);
+    dds_reader_t* reader_a = dds_reader_create_with_qos(participant, name_a.c_str(), &qos);
+    dds_reader_t* reader_b = dds_reader_create_with_qos(participant, name_b.c_str(), &qos);
+    CHECK(writer_a && writer_b && reader_a && reader_b);
+
+    if (writer_a && writer_b && reader_a && reader_b &&
+        icd_test::wait_matched(writer_a) && icd_test::wait_matched(writer_b)) {
+        CHECK(dds_writer_write(writer_a, 1, "to a"));
+        CHECK(dds_writer_write(writer_b, 2, "to b"));
+        CHECK(icd_test::wait_unread(reader_a, 1) && icd_test::wait_unread(reader_b, 1));
+
+        uint32_t index;
+        std::string message;
+        CHECK(take_text(reader_a, index, message) && index == 1 && message == "to a");
+        CHECK(take_text(reader_b, index, message) && index == 2 && message == "to b");
+        CHECK(!take_text(reader_a, index, message));
+        CHECK(!take_text(reader_b, index, message));
+    }
+
+    dds_reader_delete(reader_b);
+    dds_reader_delete(reader_a);
+    dds_writer_delete(writer_b);
+    dds_writer_delete(writer_a);
+    CHECK(dds_participant_delete(participant) == 1);
+}
+
+TEST(endpoints_share_a_topic) {
+    dds_participant_t* participant = dds_participant_create(icd_test::domain());
+    REQUIRE(participant);
+    dds_qos_t qos = icd_test::reliable_qos();
+    std::string name = icd_test::topic("HandleShared");
+    dds_writer_t* writers[2] = { dds_writer_create_with_qos(participant, name.c_str(), &qos),
+                                 dds_writer_create_with_qos(participant, name.c_str(), &qos) };
+    dds_reader_t* readers[2] = { dds_reader_create_with_qos(participant, name.c_str(), &qos),
+                                 dds_reader_create_with_qos(participant, name.c_str(), &qos) };
+    CHECK(writers[0] && writers[1] && readers[0] && readers[1]);
+
+    if (writers[0] && writers[1] && readers[0] && readers[1] &&
+        icd_test::wait_matched(writers[0], 2) && icd_test::wait_matched(writers[1], 2)) {
+        CHECK(dds_writer_write(writers[0], 10, "first writer"));
+        CHECK(dds_writer_write(writers[1], 20, "second writer"));
+        for (dds_reader_t* reader : readers) {
+            CHECK(icd_test::wait_unread(reader, 2));
+            uint32_t sum = 0, index;
+            std::string message;
+            while (take_text(reader, index, message)) sum += index;
+            CHECK(sum == 30);
+        }
+
+        // The topic outlives the first writer; a new writer on it still reaches both readers
+        dds_writer_delete(writers[0]);
+        writers[0] = dds_writer_create_with_qos(participant, name.c_str(), &qos);
+        REQUIRE(writers[0]);
+        CHECK(icd_test::wait_matched(writers[0], 2));
+        CHECK(dds_writer_write(writers[0], 30, "replacement"));
+        CHECK(icd_test::wait_unread(readers[0], 1) && icd_test::wait_unread(readers[1], 1));
+    }
+
+    for (dds_reader_t* reader : readers) dds_reader_delete(reader);
+    for (dds_writer_t* writer : writers) dds_writer_delete(writer);
+    CHECK(dds_participant_delete(participant) == 1);
+}
+
+TEST(participant_outlives_its_endpoints) {
+    dds_participant_t* participant = dds_participant_create(icd_test::domain());
+    REQUIRE(participant);
+    std::string name = icd_test::topic("HandleOrder");
+    dds_writer_t* writer = dds_writer_create(participant, name.c_str());
+    dds_reader_t* reader = dds_reader_create(participant, name.c_str());
+    CHECK(writer && reader);
+
+    CHECK(dds_participant_delete(participant) == 0);
+    dds_writer_delete(writer);
+    CHECK(dds_participant_delete(participant) == 0);
+    dds_reader_delete(reader);
+    CHECK(dds_participant_delete(participant) == 1);
+}
+
+TEST(fixed_and_regular_endpoints_cannot_share_a_topic) {
+    dds_participant_t* participant = dds_participant_create(icd_test::domain());
+    REQUIRE(participant);
+    std::string name = icd_test::topic("HandleKinds");
+    dds_writer_t* regular = dds_writer_create(participant, name.c_str());
+    CHECK(regular);
+    dds_reader_t* fixed = dds_reader_create_fixed(participant, name.c_str(), nullptr);
+    CHECK(!fixed);
+
+    dds_reader_delete(fixed);
+    dds_writer_delete(regular);
+    CHECK(dds_participant_delete(participant) == 1);
+}
+
+TEST(struct_samples_round_trip) {
+    icd_test::Endpoints dds("HandleStruct");
+    REQUIRE(dds.ready());
+    ICD_pkg::HelloWorld sent;
+    sent.index(42);
+    sent.message("struct sample");
+    REQUIRE(dds_writer_write_struct(dds.writer, &sent));
+    REQUIRE(icd_test::wait_unread(dds.reader, 1));
+
+    ICD_pkg::HelloWorld received;
+    REQUIRE(dds_reader_take_struct(dds.reader, &received));
+    CHECK(received.index() == 42);
+    CHECK(received.message() == "struct sample");
+    CHECK(!dds_reader_take_struct(dds.reader, &received));
+}
+
+TEST(null_handles_are_rejected) {
+    char buffer[16];
+    uint32_t index;
+    ICD_pkg::HelloWorld sample;
+    dds_writer_stats_t writer_stats;
+    dds_reader_stats_t reader_stats;
+    CHECK(!dds_writer_create(nullptr, "NoParticipant"));
+    CHECK(!dds_reader_create(nullptr, "NoParticipant"));
+    CHECK(!dds_writer_create_fixed(nullptr, "NoParticipant", nullptr));
+    CHECK(dds_participant_delete(nullptr) == 0);
+    CHECK(dds_writer_write(nullptr, 1, "x") == 0);
+    CHECK(dds_writer_write_struct(nullptr, &sample) == 0);
+    CHECK(dds_reader_take(nullptr, &index, buffer, sizeof(buffer)) == 0);
+    CHECK(dds_reader_take_struct(nullptr, &sample) == 0);
+    CHECK(dds_reader_wait_for_data(nullptr, 10) == 0);
+    CHECK(dds_writer_get_stats(nullptr, &writer_stats) == 0);
+    CHECK(dds_reader_get_stats(nullptr, &reader_stats) == 0);
+    // No-ops
+    dds_writer_delete(nullptr);
+    dds_reader_delete(nullptr);
+}
+
+TEST(deleting_a_reader_wakes_its_waiters) {
+    dds_participant_t* participant = dds_participant_create(icd_test::domain());
+    REQUIRE(participant);
+    dds_reader_t* reader = dds_reader_create(participant, icd_test::topic("HandleWake").c_str());
+    REQUIRE(reader);
+
+    std::atomic<int> result(-1);
+    std::thread waiter([&] { result = dds_reader_wait_for_data(reader, -1); });
+    // Let the waiter block before the reader goes away
+    std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    dds_reader_delete(reader);
+    CHECK(icd_test::wait_until([&] { return result.load() != -1; }));
+    waiter.join();
+    CHECK(result.load() == 0);
+    CHECK(dds_participant_delete(participant) == 1);
+}
+
+ICD_TEST_MAIN()
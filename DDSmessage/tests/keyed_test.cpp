@@ -0,0 +1,116 @@
+// Keyed endpoints (HelloWorldKeyed): per-index instances, dds_reader_lookup_instance
+// and dds_reader_read_instance, which reads the current value without taking it.
+
+#include "test_support.hpp"
+
+namespace {
+
+// KEEP_LAST 1: the reader holds the current value of each index
+dds_qos_t latest_value_qos(int32_t max_instances = DDS_QOS_DEFAULT) {
+    dds_qos_t qos = icd_test::reliable_qos();
+    qos.history_kind = DDS_HISTORY_KEEP_LAST;
+    qos.history_depth = 1;
+    qos.max_instances = max_instances;
+    return qos;
+}
+
+struct KeyedPair {
+    dds_participant_t* participant;
+    dds_writer_t* writer = nullptr;
+    dds_reader_t* reader = nullptr;
+
+    explicit KeyedPair(const char* base, const dds_qos_t& qos) {
+        std::string name = icd_test::topic(base);
+        participant = dds_participant_create(icd_test::domain());
+        if (participant) {
+            writer = dds_writer_create_keyed(participant, name.c_str(), &qos);
+            reader = dds_reader_create_keyed(participant, name.c_str(), &qos);
+        }
+    }
+
+    KeyedPair(const KeyedPair&) = delete;
+    KeyedPair& operator=(const KeyedPair&) = delete;
+
+    ~KeyedPair() {
+        dds_reader_delete(reader);
+        dds_writer_delete(writer);
+        dds_participant_delete(participant);
+    }
+
+    bool ready() const { return writer && reader && icd_test::wait_matched(writer); }
+};
+
+std::string read_instance(dds_reader_t* reader, uint32_t index) {
+    char buffer[256];
+    uint32_t length = 0;
+    if (!dds_reader_read_instance(reader, index, buffer, sizeof(buffer), &length)) return "<none>";
+    return std::string(buffer, length);
+}
+
+} // namespace
+
+TEST(read_instance_returns_the_latest_value_of_each_index) {
+    KeyedPair pair("KeyedLatest", latest_value_qos());
+    REQUIRE(pair.ready());
+    CHECK(dds_writer_write(pair.writer, 1, "first"));
+    CHECK(dds_writer_write(pair.writer, 2, "other"));
+    CHECK(dds_writer_write(pair.writer, 1, "second"));
+    REQUIRE(icd_test::wait_until([&] { return read_instance(pair.reader, 1) == "second"; }));
+    CHECK(read_instance(pair.reader, 2) == "other");
+    CHECK(dds_reader_lookup_instance(pair.reader, 1) == 1);
+    CHECK(dds_reader_lookup_instance(pair.reader, 3) == 0);
+    CHECK(read_instance(pair.reader, 3) == "<none>");
+}
+
+TEST(read_instance_leaves_the_sample_in_the_reader) {
+    KeyedPair pair("KeyedRead", latest_value_qos());
+    REQUIRE(pair.ready());
+    CHECK(dds_writer_write(pair.writer, 5, "kept"));
+    REQUIRE(icd_test::wait_until([&] { return dds_reader_lookup_instance(pair.reader, 5) == 1; }));
+    CHECK(read_instance(pair.reader, 5) == "kept");
+    CHECK(read_instance(pair.reader, 5) == "kept");
+
+    uint32_t index = 0;
+    char buffer[64];
+    CHECK(dds_reader_take(pair.reader, &index, buffer, sizeof(buffer)) == 1);
+    CHECK(index == 5);
+    CHECK(std::string(buffer) == "kept");
+}
+
+TEST(read_instance_reports_the_full_length_when_truncating) {
+    KeyedPair pair("KeyedTruncate", latest_value_qos());
+    REQUIRE(pair.ready());
+    std::string message(100, 'k');
+    CHECK(dds_writer_write(pair.writer, 9, message.c_str()));
+    REQUIRE(icd_test::wait_until([&] { return dds_reader_lookup_instance(pair.reader, 9) == 1; }));
+
+    char buffer[10];
+    uint32_t length = 0;
+    CHECK(dds_reader_read_instance(pair.reader, 9, buffer, sizeof(buffer), &length) == 1);
+    CHECK(length == message.size());
+    CHECK(std::strlen(buffer) == sizeof(buffer) - 1);
+}
+
+TEST(max_instances_above_the_default_sample_limit_is_accepted) {
+    // Fast DDS needs max_samples >= max_instances * max_samples_per_instance; the overlay
+    // sizes both defaults from max_instances and the depth
+    KeyedPair pair("KeyedMaxInstances", latest_value_qos(20000));
+    REQUIRE(pair.ready());
+    for (uint32_t index = 0; index < 50; ++index) {
+        CHECK(dds_writer_write(pair.writer, index, "value"));
+    }
+    CHECK(icd_test::wait_until([&] { return dds_reader_lookup_instance(pair.reader, 49) == 1; }));
+}
+
+TEST(instance_calls_on_unkeyed_readers_return_zero) {
+    icd_test::Endpoints endpoints("KeyedUnkeyed");
+    REQUIRE(endpoints.ready());
+    REQUIRE(endpoints.publish({ "plain" }, 3));
+    char buffer[16];
+    uint32_t length = 0;
+    CHECK(dds_reader_lookup_instance(endpoints.reader, 3) == 0);
+    CHECK(dds_reader_read_instance(endpoints.reader, 3, buffer, sizeof(buffer), &length) == 0);
+    CHECK(dds_reader_lookup_instance(nullptr, 3) == 0);
+}
+
+ICD_TEST_MAIN()
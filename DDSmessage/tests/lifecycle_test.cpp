@@ -0,0 +1,135 @@
+// Single-topic lifecycle: dds_init / dds_shutdown cycles racing with writes,
+// takes and waits on other threads, and shutdown while the calling thread
+// still holds a dds_take_loan loan.
+
+#include "test_support.hpp"
+
+#include <atomic>
+
+namespace {
+
+// Takes a loan of up to max_samples, waiting for data for up to five seconds
+int take_loan_waiting(uint32_t max_samples, const dds_sample_t** samples, dds_take_loan_t** loan) {
+    int count = 0;
+    icd_test::wait_until([&] {
+        if (dds_wait_for_data(50)) count = dds_take_loan(max_samples, samples, loan);
+        return count > 0;
+    });
+    return count;
+}
+
+void shutdown_with_own_loan(bool keep_participant) {
+    dds_set_keep_participant(keep_participant ? 1 : 0);
+    std::string name = icd_test::topic("LoanShutdown");
+    dds_qos_t qos = icd_test::reliable_qos();
+    REQUIRE(dds_init_with_qos(name.c_str(), icd_test::domain(), &qos));
+    REQUIRE(dds_write(5, "held across shutdown"));
+
+    const dds_sample_t* samples;
+    dds_take_loan_t* loan;
+    REQUIRE(take_loan_waiting(1, &samples, &loan) == 1);
+
+    // Used to spin forever: the loan pinned the reader dds_shutdown waits for
+    dds_shutdown();
+    CHECK(samples[0].index == 5);
+    CHECK(std::string(samples[0].message, samples[0].length) == "held across shutdown");
+    const dds_sample_t* none;
+    dds_take_loan_t* no_loan;
+    CHECK(dds_take_loan(1, &none, &no_loan) == 0);
+
+    // Re-init while the old reader is still alive, then let it go
+    REQUIRE(dds_init_with_qos(name.c_str(), icd_test::domain(), &qos));
+    CHECK(dds_write(6, "after re-init"));
+    const dds_sample_t* fresh;
+    dds_take_loan_t* fresh_loan = nullptr;
+    CHECK(take_loan_waiting(1, &fresh, &fresh_loan) == 1);
+    if (fresh_loan) {
+        CHECK(fresh[0].index == 6);
+        dds_take_loan_return(fresh_loan);
+    }
+    CHECK(samples[0].index == 5);
+    dds_take_loan_return(loan);
+    dds_shutdown();
+    dds_set_keep_participant(0);
+}
+
+} // namespace
+
+TEST(shutdown_while_holding_a_loan_returns) {
+    shutdown_with_own_loan(false);
+}
+
+TEST(shutdown_while_holding_a_loan_returns_with_kept_participant) {
+    shutdown_with_own_loan(true);
+}
+
+TEST(io_threads_survive_init_and_shutdown_cycles) {
+    std::string name = icd_test::topic("LifecycleRace");
+    dds_qos_t qos = icd_test::reliable_qos();
+    // Bounded, so that a writer never blocks for long on a full history
+    qos.history_kind = DDS_HISTORY_KEEP_LAST;
+    qos.history_depth = 64;
+
+    std::atomic<bool> stop(false);
+    std::atomic<uint64_t> written(0), taken(0);
+    std::vector<std::thread> threads;
+
+    threads.emplace_back([&] {
+        for (uint32_t i = 0; !stop; ++i) written += dds_write(i, "single");
+    });
+    threads.emplace_back([&] {
+        uint32_t indices[4] = { 0, 1, 2, 3 }, offsets[5] = { 0, 1, 2, 3, 4 };
+        while (!stop) written += dds_write_batch(4, indices, "abcd", offsets);
+    });
+    threads.emplace_back([&] {
+        uint32_t index;
+        char buffer[32];
+        while (!stop) {
+            if (dds_wait_for_data(1)) taken += dds_take(&index, buffer, sizeof(buffer));
+        }
+    });
+    threads.emplace_back([&] {
+        const dds_sample_t* samples;
+        dds_take_loan_t* loan;
+        while (!stop) {
+            int count = dds_take_loan(16, &samples, &loan);
+            if (count > 0) {
+                // Hold the loan for a while, across shutdowns now and then
+                std::this_thread::sleep_for(std::chrono::microseconds(200));
+                taken += count;
+                dds_take_loan_return(loan);
+            }
+        }
+    });
+    threads.emplace_back([&] {
+        uint32_t indices[16], offsets[17];
+        char buffer[256];
+        while (!stop) {
+            int count = dds_take_batch(16, indices, buffer, sizeof(buffer), offsets);
+            if (count > 0) taken += count;
+        }
+    });
+
+    int cycles = 0;
+    for (int i = 0; i < 20; ++i) {
+        dds_set_keep_participant(i % 2);
+        if (dds_init_with_qos(name.c_str(), icd_test::domain(), &qos)) ++cycles;
+        std::this_thread::sleep_for(std::chrono::milliseconds(20));
+        dds_shutdown();
+    }
+    stop = true;
+    for (std::thread& thread : threads) thread.join();
+    dds_set_keep_participant(0);
+
+    CHECK(cycles == 20);
+    CHECK(written.load() > 0);
+    CHECK(taken.load() > 0);
+    // Every entry point reports "not initialized" after the last shutdown
+    uint32_t index;
+    char buffer[8];
+    CHECK(dds_write(0, "late") == 0);
+    CHECK(dds_take(&index, buffer, sizeof(buffer)) == 0);
+    CHECK(dds_wait_for_data(0) == 0);
+}
+
+ICD_TEST_MAIN()
@@ -0,0 +1,96 @@
+// Loaned takes: messages of any size read in place, loans held side by side,
+// and the copying takes built on them.
+
+#include "test_support.hpp"
+
+TEST(loan_returns_full_messages_in_order) {
+    icd_test::Endpoints dds("LoanTake");
+    REQUIRE(dds.ready());
+    std::string large(200000, 'm');
+    REQUIRE(dds.publish({ "short", large, "" }));
+
+    const dds_sample_t* samples;
+    dds_take_loan_t* loan;
+    REQUIRE(dds_reader_take_loan(dds.reader, 8, &samples, &loan) == 3);
+    CHECK(samples[0].index == 0 && samples[0].length == 5);
+    CHECK(std::string(samples[0].message, samples[0].length) == "short");
+    CHECK(samples[1].length == large.size());
+    CHECK(std::string(samples[1].message, samples[1].length) == large);
+    CHECK(samples[2].index == 2 && samples[2].length == 0);
+    dds_take_loan_return(loan);
+
+    CHECK(dds_reader_take_loan(dds.reader, 8, &samples, &loan) == 0);
+}
+
+TEST(loan_takes_at_most_max_samples) {
+    icd_test::Endpoints dds("LoanMax");
+    REQUIRE(dds.ready());
+    REQUIRE(dds.publish({ "a", "b", "c", "d", "e" }));
+
+    const dds_sample_t* first;
+    const dds_sample_t* second;
+    dds_take_loan_t* first_loan;
+    dds_take_loan_t* second_loan;
+    REQUIRE(dds_reader_take_loan(dds.reader, 2, &first, &first_loan) == 2);
+    // Two loans held at once; the first stays readable while the second is taken
+    REQUIRE(dds_reader_take_loan(dds.reader, 10, &second, &second_loan) == 3);
+    CHECK(std::string(first[0].message, first[0].length) == "a");
+    CHECK(std::string(first[1].message, first[1].length) == "b");
+    CHECK(second[0].index == 2 && second[2].index == 4);
+    // Returned out of order
+    dds_take_loan_return(first_loan);
+    dds_take_loan_return(second_loan);
+
+    CHECK(dds_reader_take_loan(dds.reader, 0, &first, &first_loan) == 0);
+}
+
+TEST(copying_take_truncates_and_terminates) {
+    icd_test::Endpoints dds("LoanTruncate");
+    REQUIRE(dds.ready());
+    REQUIRE(dds.publish({ "0123456789" }));
+
+    char buffer[5];
+    std::memset(buffer, 'x', sizeof(buffer));
+    uint32_t index = 99;
+    REQUIRE(dds_reader_take(dds.reader, &index, buffer, sizeof(buffer)) == 1);
+    CHECK(index == 0);
+    CHECK(std::string(buffer) == "0123");
+}
+
+TEST(copying_take_counts_the_bytes_copied) {
+    icd_test::Endpoints dds("LoanTakeBytes");
+    REQUIRE(dds.ready());
+    REQUIRE(dds.publish({ "hello", "0123456789" }));
+
+    dds_stats_enable(1);
+    char buffer[5];
+    uint32_t index;
+    CHECK(dds_reader_take(dds.reader, &index, buffer, sizeof(buffer)) == 1);
+    CHECK(dds_reader_take(dds.reader, &index, buffer, sizeof(buffer)) == 1);
+    CHECK(dds_reader_take(dds.reader, &index, buffer, sizeof(buffer)) == 0);
+    dds_reader_stats_t stats;
+    // Both messages truncated to 4 bytes; the empty take counts no sample
+    CHECK(dds_reader_get_stats(dds.reader, &stats) && stats.samples == 2 && stats.bytes == 8);
+    dds_stats_enable(0);
+}
+
+TEST(take_message_returns_full_message) {
+    std::string name = icd_test::topic("LoanTakeMessage");
+    dds_qos_t qos = icd_test::reliable_qos();
+    REQUIRE(dds_init_with_qos(name.c_str(), icd_test::domain(), &qos));
+    std::string large(5000, 't');
+    CHECK(dds_write(3, large.c_str()));
+    CHECK(dds_write(4, "next"));
+
+    const char* message = nullptr;
+    uint32_t index = 0;
+    icd_test::wait_until([&] { return (message = dds_take_message(&index)) != nullptr; });
+    CHECK(message && index == 3 && std::string(message) == large);
+    icd_test::wait_until([&] { return (message = dds_take_message(&index)) != nullptr; });
+    CHECK(message && index == 4 && std::string(message) == "next");
+    CHECK(dds_take_message(&index) == nullptr);
+    dds_shutdown();
+    CHECK(dds_take_message(&index) == nullptr);
+}
+
+ICD_TEST_MAIN()
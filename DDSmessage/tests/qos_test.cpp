@@ -0,0 +1,143 @@
+// dds_qos_t overlay: history, durability and reliability as seen on the wire,
+// and the resource limits grown for deep KEEP_LAST histories.
+
+#include "test_support.hpp"
+
+namespace {
+
+dds_qos_t make_qos(int32_t reliability, int32_t durability, int32_t history_kind, int32_t history_depth) {
+    dds_qos_t qos;
+    std::memset(&qos, 0, sizeof(qos));
+    qos.reliability = reliability;
+    qos.durability = durability;
+    qos.history_kind = history_kind;
+    qos.history_depth = history_depth;
+    return qos;
+}
+
+std::vector<uint32_t> take_indices(dds_reader_t* reader) {
+    std::vector<uint32_t> indices;
+    uint32_t index;
+    char buffer[64];
+    while (dds_reader_take(reader, &index, buffer, sizeof(buffer))) indices.push_back(index);
+    return indices;
+}
+
+struct Participant {
+    dds_participant_t* handle = dds_participant_create(icd_test::domain());
+    ~Participant() { dds_participant_delete(handle); }
+};
+
+} // namespace
+
+TEST(keep_last_reader_keeps_only_the_newest_samples) {
+    dds_qos_t writer_qos = icd_test::reliable_qos();
+    dds_qos_t reader_qos = make_qos(DDS_RELIABILITY_RELIABLE, 0, DDS_HISTORY_KEEP_LAST, 2);
+    Participant participant;
+    REQUIRE(participant.handle);
+    std::string name = icd_test::topic("QosKeepLast");
+    dds_writer_t* writer = dds_writer_create_with_qos(participant.handle, name.c_str(), &writer_qos);
+    dds_reader_t* reader = dds_reader_create_with_qos(participant.handle, name.c_str(), &reader_qos);
+    CHECK(writer && reader);
+    if (writer && reader && icd_test::wait_matched(writer)) {
+        for (uint32_t i = 0; i < 5; ++i) CHECK(dds_writer_write(writer, i, "sample"));
+        // Once all five are delivered, the reader history holds only the last two
+        CHECK(icd_test::wait_unread(reader, 2));
+        std::this_thread::sleep_for(std::chrono::milliseconds(200));
+        CHECK(take_indices(reader) == std::vector<uint32_t>({ 3, 4 }));
+    }
+    dds_reader_delete(reader);
+    dds_writer_delete(writer);
+}
+
+TEST(transient_local_history_reaches_late_readers) {
+    dds_qos_t qos = make_qos(DDS_RELIABILITY_RELIABLE, DDS_DURABILITY_TRANSIENT_LOCAL, DDS_HISTORY_KEEP_LAST, 3);
+    dds_qos_t volatile_qos = make_qos(DDS_RELIABILITY_RELIABLE, DDS_DURABILITY_VOLATILE, DDS_HISTORY_KEEP_LAST, 3);
+    Participant participant;
+    REQUIRE(participant.handle);
+    std::string name = icd_test::topic("QosDurability");
+    dds_writer_t* writer = dds_writer_create_with_qos(participant.handle, name.c_str(), &qos);
+    REQUIRE(writer);
+    for (uint32_t i = 0; i < 5; ++i) CHECK(dds_writer_write(writer, i, "before any reader"));
+
+    dds_reader_t* late = dds_reader_create_with_qos(participant.handle, name.c_str(), &qos);
+    dds_reader_t* late_volatile = dds_reader_create_with_qos(participant.handle, name.c_str(), &volatile_qos);
+    CHECK(late && late_volatile);
+    if (late && late_volatile && icd_test::wait_matched(writer, 2)) {
+        // The writer keeps its last three samples for late joiners; volatile readers get none
+        CHECK(icd_test::wait_unread(late, 3));
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        std::vector<uint32_t> indices = take_indices(late);
+        CHECK(indices == std::vector<uint32_t>({ 2, 3, 4 }));
+        CHECK(take_indices(late_volatile).empty());
+    }
+    dds_reader_delete(late_volatile);
+    dds_reader_delete(late);
+    dds_writer_delete(writer);
+}
+
+TEST(best_effort_writer_does_not_match_reliable_reader) {
+    dds_qos_t best_effort = make_qos(DDS_RELIABILITY_BEST_EFFORT, 0, 0, 0);
+    dds_qos_t reliable = make_qos(DDS_RELIABILITY_RELIABLE, 0, 0, 0);
+    Participant participant;
+    REQUIRE(participant.handle);
+    std::string name = icd_test::topic("QosMismatch");
+    dds_writer_t* writer = dds_writer_create_with_qos(participant.handle, name.c_str(), &best_effort);
+    dds_reader_t* reliable_reader = dds_reader_create_with_qos(participant.handle, name.c_str(), &reliable);
+    dds_reader_t* best_effort_reader = dds_reader_create_with_qos(participant.handle, name.c_str(), &best_effort);
+    CHECK(writer && reliable_reader && best_effort_reader);
+    if (writer && reliable_reader && best_effort_reader) {
+        // Only the best-effort reader matches
+        CHECK(icd_test::wait_matched(writer, 1));
+        std::this_thread::sleep_for(std::chrono::milliseconds(300));
+        dds_writer_stats_t stats;
+        CHECK(dds_writer_get_stats(writer, &stats) && stats.matched_readers == 1);
+        dds_reader_stats_t reader_stats;
+        CHECK(dds_reader_get_stats(reliable_reader, &reader_stats) && reader_stats.matched_writers == 0);
+    }
+    dds_reader_delete(best_effort_reader);
+    dds_reader_delete(reliable_reader);
+    dds_writer_delete(writer);
+}
+
+TEST(deep_history_grows_default_resource_limits) {
+    // Far above the Fast DDS default max_samples_per_instance; creation fails without the overlay
+    dds_qos_t qos = make_qos(DDS_RELIABILITY_RELIABLE, 0, DDS_HISTORY_KEEP_LAST, 20000);
+    Participant participant;
+    REQUIRE(participant.handle);
+    std::string name = icd_test::topic("QosDeep");
+    dds_writer_t* writer = dds_writer_create_with_qos(participant.handle, name.c_str(), &qos);
+    dds_reader_t* reader = dds_reader_create_with_qos(participant.handle, name.c_str(), &qos);
+    CHECK(writer);
+    CHECK(reader);
+
+    // An explicit limit below the depth is the caller's choice and is rejected
+    dds_qos_t conflicting = qos;
+    conflicting.max_samples_per_instance = 10;
+    dds_reader_t* rejected = dds_reader_create_with_qos(participant.handle, name.c_str(), &conflicting);
+    CHECK(!rejected);
+
+    dds_reader_delete(rejected);
+    dds_reader_delete(reader);
+    dds_writer_delete(writer);
+}
+
+TEST(zeroed_qos_matches_default_endpoints) {
+    dds_qos_t zeroed;
+    std::memset(&zeroed, 0, sizeof(zeroed));
+    Participant participant;
+    REQUIRE(participant.handle);
+    std::string name = icd_test::topic("QosDefault");
+    dds_writer_t* writer = dds_writer_create_with_qos(participant.handle, name.c_str(), &zeroed);
+    dds_reader_t* reader = dds_reader_create(participant.handle, name.c_str());
+    CHECK(writer && reader);
+    if (writer && reader) {
+        CHECK(icd_test::wait_matched(writer));
+        CHECK(dds_writer_write(writer, 1, "defaults"));
+        CHECK(icd_test::wait_unread(reader, 1));
+    }
+    dds_reader_delete(reader);
+    dds_writer_delete(writer);
+}
+
+ICD_TEST_MAIN()
@@ -0,0 +1,166 @@
+// Minimal test harness for the facade tests: TEST cases registered at static
+// initialization, CHECK (record and continue) and REQUIRE (record and return).
+// Each test file ends with ICD_TEST_MAIN(). The tests talk to real Fast DDS
+// entities on the domain in ICD_TEST_DOMAIN (default 77), so run them on a
+// host where that domain is not otherwise in use.
+
+#pragma once
+
+#include "dds_facade.hpp"
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <functional>
+#include <string>
+#include <thread>
+#include <vector>
+
+namespace icd_test {
+
+struct Case {
+    const char* name;
+    void (*run)();
+};
+
+inline std::vector<Case>& registry() {
+    static std::vector<Case> cases;
+    return cases;
+}
+
+inline int& failures() {
+    static int count = 0;
+    return count;
+}
+
+struct Registrar {
+    Registrar(const char* name, void (*run)()) { registry().push_back(Case{ name, run }); }
+};
+
+inline void fail(const char* file, int line, const char* expression) {
+    std::fprintf(stderr, "%s:%d: check failed: %s\n", file, line, expression);
+    ++failures();
+}
+
+inline int run_all() {
+    int failed_cases = 0;
+    for (const Case& test : registry()) {
+        int before = failures();
+        test.run();
+        bool ok = failures() == before;
+        if (!ok) ++failed_cases;
+        std::printf("%s %s\n", ok ? "[ ok ]" : "[FAIL]", test.name);
+    }
+    std::printf("%d of %d test(s) failed\n", failed_cases, static_cast<int>(registry().size()));
+    return failed_cases ? 1 : 0;
+}
+
+inline uint32_t domain() {
+    const char* value = std::getenv("ICD_TEST_DOMAIN");
+    return value ? static_cast<uint32_t>(std::atoi(value)) : 77;
+}
+
+// A topic name no other test (or concurrent run) uses
+inline std::string topic(const char* base) {
+    static int sequence = 0;
+    long long now = static_cast<long long>(std::chrono::steady_clock::now().time_since_epoch().count());
+    return std::string(base) + "_" + std::to_string(now % 1000000007) + "_" + std::to_string(++sequence);
+}
+
+// Reliable, keep-all endpoints, so that no sample is dropped under test
+inline dds_qos_t reliable_qos() {
+    dds_qos_t qos;
+    std::memset(&qos, 0, sizeof(qos));
+    qos.reliability = DDS_RELIABILITY_RELIABLE;
+    qos.history_kind = DDS_HISTORY_KEEP_ALL;
+    return qos;
+}
+
+inline bool wait_until(const std::function<bool()>& condition, int timeout_ms = 5000) {
+    std::chrono::steady_clock::time_point deadline =
+        std::chrono::steady_clock::now() + std::chrono::milliseconds(timeout_ms);
+    while (!condition()) {
+        if (std::chrono::steady_clock::now() > deadline) return false;
+        std::this_thread::sleep_for(std::chrono::milliseconds(5));
+    }
+    return true;
+}
+
+// Until the writer has matched the given number of readers
+inline bool wait_matched(dds_writer_t* writer, int readers = 1) {
+    return wait_until([&] {
+        dds_writer_stats_t stats;
+        return dds_writer_get_stats(writer, &stats) && stats.matched_readers >= readers;
+    });
+}
+
+// Until the reader has at least count unread samples
+inline bool wait_unread(dds_reader_t* reader, uint64_t count) {
+    return wait_until([&] {
+        dds_reader_stats_t stats;
+        return dds_reader_get_stats(reader, &stats) && stats.unread_samples >= count;
+    });
+}
+
+// A participant with a writer and a reader on a fresh topic of their own
+struct Endpoints {
+    dds_participant_t* participant;
+    dds_writer_t* writer;
+    dds_reader_t* reader;
+
+    explicit Endpoints(const char* base, const dds_qos_t* qos_override = nullptr) : writer(nullptr), reader(nullptr) {
+        std::string name = topic(base);
+        dds_qos_t qos = qos_override ? *qos_override : reliable_qos();
+        participant = dds_participant_create(domain());
+        if (participant) {
+            writer = dds_writer_create_with_qos(participant, name.c_str(), &qos);
+            reader = dds_reader_create_with_qos(participant, name.c_str(), &qos);
+        }
+    }
+
+    Endpoints(const Endpoints&) = delete;
+    Endpoints& operator=(const Endpoints&) = delete;
+
+    ~Endpoints() {
+        dds_reader_delete(reader);
+        dds_writer_delete(writer);
+        dds_participant_delete(participant);
+    }
+
+    bool ready() const { return writer && reader && wait_matched(writer); }
+
+    // Writes the messages and waits until the reader holds all of them
+    bool publish(const std::vector<std::string>& messages, uint32_t first_index = 0) {
+        for (size_t i = 0; i < messages.size(); ++i) {
+            if (!dds_writer_write(writer, first_index + static_cast<uint32_t>(i), messages[i].c_str())) return false;
+        }
+        return wait_unread(reader, messages.size());
+    }
+};
+
+} // namespace icd_test
+
+#define ICD_TEST_CONCAT2(a, b) a##b
+#define ICD_TEST_CONCAT(a, b) ICD_TEST_CONCAT2(a, b)
+
+#define TEST(name)                                                                          \
+    static void name();                                                                     \
+    static icd_test::Registrar ICD_TEST_CONCAT(name, _registrar)(#name, &name);             \
+    static void name()
+
+#define CHECK(expression)                                                                   \
+    do {                                                                                    \
+        if (!(expression)) icd_test::fail(__FILE__, __LINE__, #expression);                 \
+    } while (0)
+
+#define REQUIRE(expression)                                                                 \
+    do {                                                                                    \
+        if (!(expression)) {                                                                \
+            icd_test::fail(__FILE__, __LINE__, #expression);                                \
+            return;                                                                         \
+        }                                                                                   \
+    } while (0)
+
+#define ICD_TEST_MAIN()                                                                     \
+    int main() { return icd_test::run_all(); }
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Run the facade benchmark suites of every binding and merge their JSON.
+
+Each suite (C facade, Python wrapper, Node addon) measures round-trip latency
+and burst throughput against an echo process on the same host, over the same
+sweep of transports, QoS profiles and message sizes. Their results are merged
+into one document with host metadata; --baseline compares it against an
+earlier run and exits with status 1 if any case regressed by more than
+--threshold.
+
+    python benchmarks/run_suite.py --bindings c,python --sizes 64,4096 --output results.json
+    python benchmarks/run_suite.py --baseline main.json --threshold 0.15
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PYTHON_DIR = os.path.join(ROOT, "swig", "ICDWrapperPython")
+NODE_DIR = os.path.join(ROOT, "nodejs")
+BINDINGS = ("c", "python", "node")
+
+# (metric path, True if higher is better)
+METRICS = ((("msgs_per_s",), True), (("latency_us", "p50"), False), (("latency_us", "p99"), False))
+
+
+def suite_command(binding, args, output):
+    """Command line and working directory of one binding's suite."""
+    sweep = ["--sizes", args.sizes, "--transports", args.transports, "--qos", args.qos,
+             "--pings", str(args.pings), "--burst", str(args.burst), "--output", output]
+    if binding == "c":
+        return [args.facade_bench] + sweep, ROOT
+    if binding == "python":
+        return [sys.executable, os.path.join(PYTHON_DIR, "bench_suite.py")] + sweep, PYTHON_DIR
+    return ["node", os.path.join(NODE_DIR, "examples", "bench-suite.js")] + sweep, NODE_DIR
+
+
+def run_binding(binding, args):
+    """Results of one suite, or None if it failed to run."""
+    handle, output = tempfile.mkstemp(prefix="bench_%s_" % binding, suffix=".json")
+    os.close(handle)
+    try:
+        command, cwd = suite_command(binding, args, output)
+        print("== %s: %s" % (binding, " ".join(command)), file=sys.stderr)
+        try:
+            status = subprocess.call(command, cwd=cwd)
+        except OSError as error:
+            print("%s suite not runnable: %s" % (binding, error), file=sys.stderr)
+            return None
+        if status != 0:
+            print("%s suite exited with status %d" % (binding, status), file=sys.stderr)
+            return None
+        with open(output) as f:
+            return json.load(f)["results"]
+    finally:
+        os.remove(output)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def case_key(result):
+    return (result["binding"], result["transport"], result["qos"], result["size"])
+
+
+def metric(result, path):
+    for name in path:
+        result = result[name]
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Print the relative change of every metric; returns the regressed cases."""
+    previous = {case_key(result): result for result in baseline["results"]}
+    regressions = []
+    print("%-32s %-14s %14s %14s %8s" % ("case", "metric", "baseline", "current", "change"))
+    for result in results:
+        old = previous.get(case_key(result))
+        if old is None:
+            continue
+        name = "/".join(str(part) for part in case_key(result))
+        for path, higher_is_better in METRICS:
+            before, after = metric(old, path), metric(result, path)
+            if before <= 0:
+                continue
+            change = (after - before) / before
+            regressed = change < -threshold if higher_is_better else change > threshold
+            if regressed:
+                regressions.append((name, ".".join(path)))
+            print("%-32s %-14s %14.1f %14.1f %+7.1f%%%s" % (
+                name, ".".join(path), before, after, change * 100, "  REGRESSION" if regressed else ""))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--bindings", default=",".join(BINDINGS), help="comma-separated subset of c,python,node")
+    parser.add_argument("--sizes", default="64,1024,16384", help="message sizes in bytes")
+    parser.add_argument("--transports", default="udp,shm")
+    parser.add_argument("--qos", default="reliable,best_effort")
+    parser.add_argument("--pings", type=int, default=1000, help="round trips per case")
+    parser.add_argument("--burst", type=int, default=5000, help="samples per throughput burst")
+    parser.add_argument("--facade-bench", default=os.path.join(ROOT, "DDSmessage", "build", "benchmarks", "facade_bench"),
+                        help="facade_bench executable (built with -DICD_BUILD_BENCHMARKS=ON)")
+    parser.add_argument("--output", default="bench-results.json", help="merged JSON document")
+    parser.add_argument("--baseline", help="earlier merged document to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change counted as a regression")
+    args = parser.parse_args()
+
+    bindings = [name for name in args.bindings.split(",") if name]
+    unknown = set(bindings) - set(BINDINGS)
+    if unknown:
+        parser.error("unknown bindings: %s" % ", ".join(sorted(unknown)))
+
+    results = []
+    failed = []
+    for binding in bindings:
+        binding_results = run_binding(binding, args)
+        if binding_results is None:
+            failed.append(binding)
+        else:
+            results.extend(binding_results)
+
+    document = {
+        "schema": 1,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "host": {"name": platform.node(), "system": platform.system(), "machine": platform.machine(),
+                 "cpus": os.cpu_count(), "python": platform.python_version()},
+        "commit": git_commit(),
+        "sweep": {"sizes": [int(size) for size in args.sizes.split(",") if size],
+                  "transports": args.transports.split(","), "qos": args.qos.split(","),
+                  "pings": args.pings, "burst": args.burst},
+        "failed": failed,
+        "results": results,
+    }
+    with open(args.output, "w") as out:
+        json.dump(document, out, indent=2)
+    print("%d results written to %s" % (len(results), args.output), file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("%d regressions above %.0f%%" % (len(regressions), args.threshold * 100), file=sys.stderr)
+            return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+// Message rate of the string API versus the Buffer API of the addon.
+//
+// A writer and a reader share one participant. Each round publishes a burst of
+// samples and drains it again, either with write()/take() (a JS string and a
+// result object per sample) or with writeBuffer()/takeBatchInto() (raw bytes,
+// preallocated receive buffers). Reports samples/s for both.
+//
+// Usage: node examples/bench-buffers.js [seconds] [messageSize] [burst]
+
+const { Participant, allocateBatch } = require('../index');
+
+const seconds = Number(process.argv[2] || 2);
+const messageSize = Number(process.argv[3] || 256);
+const burst = Number(process.argv[4] || 256);
+
+function run(label, publish, drain) {
+  let samples = 0;
+  const start = process.hrtime.bigint();
+  const deadline = start + BigInt(Math.round(seconds * 1e9));
+  while (process.hrtime.bigint() < deadline) {
+    for (let i = 0; i < burst; i++) publish(i);
+    let taken = 0;
+    while (taken < burst) {
+      const n = drain();
+      if (n === 0) break; // lost samples; count what arrived
+      taken += n;
+    }
+    samples += taken;
+  }
+  const elapsed = Number(process.hrtime.bigint() - start) / 1e9;
+  console.log(`${label.padEnd(8)} ${(samples / elapsed).toFixed(0).padStart(12)} samples/s`);
+}
+
+const participant = new Participant(0);
+const qos = { reliability: 'reliable', historyKind: 'keep_last', historyDepth: burst };
+const topic = `BufferBench_${Date.now()}`;
+const writer = participant.createWriter(topic, qos);
+const reader = participant.createReader(topic, qos);
+
+try {
+  const text = 'x'.repeat(messageSize);
+  const payload = Buffer.from(text);
+  const batch = allocateBatch(burst, burst * messageSize);
+
+  console.log(`message size ${messageSize} bytes, burst ${burst}`);
+  run('string', (i) => writer.write(i, text), () => (reader.take() ? 1 : 0));
+  run('buffer', (i) => writer.writeBuffer(i, payload),
+      () => reader.takeBatchInto(batch.indices, batch.messages, batch.offsets));
+} finally {
+  participant.close();
+}
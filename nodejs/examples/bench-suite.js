@@ -0,0 +1,216 @@
+// Round-trip latency and throughput of the Node addon, swept over transports,
+// QoS and message sizes, reported as JSON.
+//
+// Same measurements and output schema as DDSmessage/benchmarks/facade_bench
+// and swig/ICDWrapperPython/bench_suite.py (see benchmarks/README.md): for
+// each combination an echo process (this script with --echo) writes every
+// sample back, then --pings round trips with one sample in flight give
+// p50/p99/p999 latency and a burst of --burst samples timed until the last
+// echo is back gives msgs/s and MB/s. waitForData() blocks the event loop,
+// which is what a benchmark wants.
+//
+// Usage: node examples/bench-suite.js [--sizes 64,1024,16384] [--transports udp,shm]
+//          [--qos reliable,best_effort] [--pings 1000] [--burst 5000] [--output file.json]
+
+const { spawn } = require('child_process');
+const fs = require('fs');
+const { Participant, allocateBatch } = require('../index');
+
+const STOP_INDEX = 0xFFFFFFFF;
+const BATCH = 256;
+
+// Both profiles keep a whole burst, so only best-effort delivery can drop samples
+function makeQos(name, burst) {
+  if (name === 'reliable') {
+    return { reliability: 'reliable', historyKind: 'keep_all', maxSamples: burst + BATCH, maxSamplesPerInstance: burst + BATCH };
+  }
+  if (name === 'best_effort') {
+    return { reliability: 'best_effort', historyKind: 'keep_last', historyDepth: burst + BATCH };
+  }
+  throw new Error(`Unknown QoS '${name}' (expected reliable or best_effort)`);
+}
+
+function parseArgs(argv) {
+  const options = {
+    sizes: [64, 1024, 16384], transports: ['udp', 'shm'], qos: ['reliable', 'best_effort'],
+    pings: 1000, burst: 5000, output: null
+  };
+  const list = (text) => text.split(',').filter((item) => item);
+  for (let i = 0; i + 1 < argv.length; i += 2) {
+    const value = argv[i + 1];
+    switch (argv[i]) {
+      case '--sizes': options.sizes = list(value).map(Number); break;
+      case '--transports': options.transports = list(value); break;
+      case '--qos': options.qos = list(value); break;
+      case '--pings': options.pings = Number(value); break;
+      case '--burst': options.burst = Number(value); break;
+      case '--output': options.output = value; break;
+      default: throw new Error(`Unknown option ${argv[i]}`);
+    }
+  }
+  options.qos.forEach((name) => makeQos(name, options.burst));
+  return options;
+}
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+// Echo process: write every ping sample back on pong until the stop index
+function runEcho(transport, qosName, burst, size, ping, pong) {
+  const participant = new Participant(0, transport);
+  try {
+    const qos = makeQos(qosName, burst);
+    const writer = participant.createWriter(pong, qos);
+    const reader = participant.createReader(ping, qos);
+    const batch = allocateBatch(BATCH, BATCH * size);
+    // Exits on the stop sample, or once the parent has gone quiet (a lost best-effort stop)
+    for (let idle = 0; idle < 20;) {
+      if (!reader.waitForData(500)) {
+        idle++;
+        continue;
+      }
+      idle = 0;
+      const n = reader.takeBatchInto(batch.indices, batch.messages, batch.offsets);
+      if (n === 0) continue;
+      writer.writeBatchBuffers(batch.indices.subarray(0, n), batch.messages, batch.offsets.subarray(0, n + 1));
+      if (batch.indices.subarray(0, n).includes(STOP_INDEX)) return;
+    }
+  } finally {
+    participant.close();
+  }
+}
+
+function takeCount(reader, batch) {
+  return reader.takeBatchInto(batch.indices, batch.messages, batch.offsets);
+}
+
+// Receive until an echo of index arrives; false on timeout
+function awaitEcho(reader, batch, index, timeoutMs) {
+  while (reader.waitForData(timeoutMs)) {
+    const n = takeCount(reader, batch);
+    if (batch.indices.subarray(0, n).includes(index)) return true;
+  }
+  return false;
+}
+
+// Nearest-rank percentile of sorted values
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.max(0, Math.ceil(p * sorted.length) - 1))];
+}
+
+function elapsedUs(start) {
+  return Number(process.hrtime.bigint() - start) / 1000;
+}
+
+async function runCase(transport, qosName, size, options) {
+  const suffix = `${transport}_${qosName}_${size}_${process.pid}`;
+  const ping = `NodeBenchPing_${suffix}`;
+  const pong = `NodeBenchPong_${suffix}`;
+  const echo = spawn(process.execPath, [__filename, '--echo', transport, qosName, String(options.burst), String(size), ping, pong],
+                     { stdio: 'inherit' });
+  const exited = new Promise((resolve) => echo.on('exit', resolve));
+
+  const participant = new Participant(0, transport);
+  const qos = makeQos(qosName, options.burst);
+  const writer = participant.createWriter(ping, qos);
+  const reader = participant.createReader(pong, qos);
+  const batch = allocateBatch(BATCH, BATCH * size);
+  const message = Buffer.alloc(size, 'x');
+  try {
+    // Discovery: probe until the echo process answers
+    let matched = false;
+    for (let attempt = 0; attempt < 50 && !matched; attempt++) {
+      writer.writeBuffer(0, message);
+      matched = awaitEcho(reader, batch, 0, 100);
+    }
+    if (!matched) {
+      console.error(`${transport}/${qosName}/${size}: echo process never matched`);
+      return null;
+    }
+    while (takeCount(reader, batch) > 0) { /* drain probes */ }
+
+    const rtts = [];
+    for (let i = 1; i <= options.pings; i++) {
+      const start = process.hrtime.bigint();
+      writer.writeBuffer(i, message);
+      if (awaitEcho(reader, batch, i, 1000)) rtts.push(elapsedUs(start));
+    }
+    rtts.sort((a, b) => a - b);
+
+    const indices = new Uint32Array(options.burst);
+    const offsets = new Uint32Array(options.burst + 1);
+    for (let i = 0; i < options.burst; i++) {
+      indices[i] = 1000000 + i;
+      offsets[i + 1] = (i + 1) * size;
+    }
+    const packed = Buffer.alloc(options.burst * size, 'x');
+    let received = 0;
+    const start = process.hrtime.bigint();
+    let lastUs = 0;
+    writer.writeBatchBuffers(indices, packed, offsets);
+    while (received < options.burst && reader.waitForData(2000)) {
+      received += takeCount(reader, batch);
+      lastUs = elapsedUs(start);
+    }
+    const elapsed = Math.max(lastUs, 1) / 1e6;
+
+    const result = {
+      binding: 'node', transport, qos: qosName, size,
+      pings: options.pings, lost_pings: options.pings - rtts.length,
+      latency_us: {
+        p50: percentile(rtts, 0.50), p99: percentile(rtts, 0.99), p999: percentile(rtts, 0.999),
+        mean: rtts.length ? rtts.reduce((a, b) => a + b, 0) / rtts.length : 0
+      },
+      burst: options.burst, received,
+      msgs_per_s: received / elapsed, mb_per_s: received * size / elapsed / 1e6
+    };
+    console.error(`${transport.padEnd(6)} ${qosName.padEnd(12)} ${String(size).padStart(8)}  ` +
+                  `p50 ${result.latency_us.p50.toFixed(1).padStart(9)} us  p99 ${result.latency_us.p99.toFixed(1).padStart(9)} us  ` +
+                  `${result.msgs_per_s.toFixed(0).padStart(12)} msgs/s`);
+    return result;
+  } finally {
+    // The stop sample may be lost under best effort, so repeat it
+    let done = false;
+    exited.then(() => { done = true; });
+    for (let attempt = 0; attempt < 20 && !done; attempt++) {
+      writer.write(STOP_INDEX, '');
+      await sleep(100);
+    }
+    if (!done) echo.kill();
+    await exited;
+    participant.close();
+  }
+}
+
+async function main() {
+  if (process.argv[2] === '--echo') {
+    const [transport, qosName, burst, size, ping, pong] = process.argv.slice(3, 9);
+    runEcho(transport, qosName, Number(burst), Number(size), ping, pong);
+    return;
+  }
+
+  const options = parseArgs(process.argv.slice(2));
+  const results = [];
+  for (const transport of options.transports) {
+    for (const qosName of options.qos) {
+      for (const size of options.sizes) {
+        const result = await runCase(transport, qosName, size, options);
+        if (result) results.push(result);
+      }
+    }
+  }
+
+  const document = JSON.stringify({ schema: 1, binding: 'node', results }, null, 2);
+  if (options.output) {
+    fs.writeFileSync(options.output, document + '\n');
+  } else {
+    console.log(document);
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
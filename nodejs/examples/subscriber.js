@@ -1,12 +1,13 @@
 const DDSMessaging = require('../index');
 
 class Subscriber {
-  constructor(topicName = 'HelloWorldTopic', domainId = null) {
+  constructor(topicName = 'HelloWorldTopic', domainId = null, poll = false) {
     this.dds = new DDSMessaging();
     this.topicName = topicName;
     this.domainId = domainId;
+    this.poll = poll;
     this.messagesReceived = 0;
-    this.intervalId = null;
+    this.subscription = null;
     this.running = false;
   }
 
@@ -39,10 +40,14 @@ class Subscriber {
     
     this.running = true;
     
-    // Start polling for messages every 500ms
-    this.intervalId = setInterval(() => {
-      this.checkForMessages();
-    }, 500);
+    if (this.poll) {
+      // Pull mode: the wait runs on a worker thread, so timers and I/O keep running
+      this.receiveLoop();
+    } else {
+      // Samples are pushed from the DDS listener thread as they arrive; no polling
+      this.subscription = this.dds.subscribe();
+      this.subscription.on('sample', (sample) => this.printMessage(sample));
+    }
 
     // Handle graceful shutdown
     process.on('SIGINT', () => {
@@ -53,58 +58,29 @@ class Subscriber {
     return true;
   }
 
-  checkForMessages() {
-    if (!this.running) return;
-
-    try {
-      // Try to take a message using the struct method
-      const result = this.dds.takeStruct();
-      
-      if (result) {
-        this.messagesReceived++;
-        console.log(`📨 Received message ${this.messagesReceived}:`);
-        console.log(`   Index: ${result.index}`);
-        console.log(`   Message: "${result.message}"`);
-        console.log(`   Time: ${new Date().toISOString()}`);
-        console.log('   ---');
-      }
-      
-      // Also try the legacy take method as backup
-      const legacyResult = this.dds.take();
-      if (legacyResult && (!result || legacyResult.index !== result.index)) {
-        this.messagesReceived++;
-        console.log(`📨 Received legacy message ${this.messagesReceived}:`);
-        console.log(`   Index: ${legacyResult.index}`);
-        console.log(`   Message: "${legacyResult.message}"`);
-        console.log(`   Time: ${new Date().toISOString()}`);
-        console.log('   ---');
-      }
-
-      // Also try takeMessage method
-      const messageResult = this.dds.takeMessage();
-      if (messageResult && (!result || messageResult.index !== result.index)) {
-        this.messagesReceived++;
-        console.log(`📨 Received direct message ${this.messagesReceived}:`);
-        console.log(`   Index: ${messageResult.index}`);
-        console.log(`   Message: "${messageResult.message}"`);
-        console.log(`   Time: ${new Date().toISOString()}`);
-        console.log('   ---');
+  async receiveLoop() {
+    while (this.running) {
+      if (!(await this.dds.waitForDataAsync(1000))) continue;
+      let sample;
+      while (this.running && (sample = this.dds.takeMessage())) {
+        this.printMessage(sample);
       }
-      
-    } catch (error) {
-      console.error('Error checking for messages:', error.message);
     }
   }
 
+  printMessage(sample) {
+    this.messagesReceived++;
+    console.log(`📨 Received message ${this.messagesReceived}:`);
+    console.log(`   Index: ${sample.index}`);
+    console.log(`   Message: "${sample.message}"`);
+    console.log(`   Time: ${new Date().toISOString()}`);
+    console.log('   ---');
+  }
+
   stop() {
     console.log('\nShutting down subscriber...');
     this.running = false;
     
-    if (this.intervalId) {
-      clearInterval(this.intervalId);
-      this.intervalId = null;
-    }
-    
     console.log(`Total messages received: ${this.messagesReceived}`);
     this.dds.shutdown();
     console.log('Subscriber shutdown complete');
@@ -114,7 +90,9 @@ class Subscriber {
 
 // Main execution
 async function main() {
-  const args = process.argv.slice(2);
+  // --poll receives with waitForDataAsync instead of a subscription
+  const poll = process.argv.includes('--poll');
+  const args = process.argv.slice(2).filter((arg) => arg !== '--poll');
   const topicName = args[0] || 'HelloWorldTopic';
   const domainId = args[1] ? parseInt(args[1], 10) : null;
   
@@ -128,14 +106,12 @@ async function main() {
     console.log(`Environment DDS_DOMAIN_ID: ${process.env.DDS_DOMAIN_ID}`);
   }
   
-  const subscriber = new Subscriber(topicName, domainId);
+  const subscriber = new Subscriber(topicName, domainId, poll);
   
   try {
+    // The open subscription (or the pending wait) keeps the process alive
     await subscriber.start();
     
-    // Keep the process alive
-    setInterval(() => {}, 1000);
-    
   } catch (error) {
     console.error('Subscriber error:', error);
     process.exit(1);
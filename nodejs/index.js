@@ -1,5 +1,227 @@
+const { EventEmitter } = require('events');
 const ddsAddon = require('./build/Release/dds_addon');
 
+/**
+ * Pack HelloWorld objects into the (indices, messages, offsets) batch layout
+ * @private
+ * @param {Array<Object>} samples - Objects with index and message properties
+ * @returns {Object} - { indices: Uint32Array, messages: Buffer, offsets: Uint32Array }
+ */
+function packBatch(samples) {
+  const indices = new Uint32Array(samples.length);
+  const offsets = new Uint32Array(samples.length + 1);
+  const chunks = new Array(samples.length);
+  let position = 0;
+  for (let i = 0; i < samples.length; i++) {
+    const { index, message } = samples[i];
+    if (typeof index !== 'number' || typeof message !== 'string') {
+      throw new Error('HelloWorld object must have index (number) and message (string) properties');
+    }
+    indices[i] = index;
+    chunks[i] = Buffer.from(message, 'utf8');
+    position += chunks[i].length;
+    offsets[i + 1] = position;
+  }
+  return { indices, messages: Buffer.concat(chunks, position), offsets };
+}
+
+/**
+ * Allocate reusable receive buffers for takeBatchInto(). Taking into the same
+ * buffers on every call avoids any per-sample allocation: message i of a call
+ * returning n is messages.subarray(offsets[i], offsets[i + 1]), i < n.
+ * @param {number} [maxSamples] - Samples per call
+ * @param {number} [bufferLength] - Message bytes per call
+ * @returns {Object} - { indices: Uint32Array, messages: Buffer, offsets: Uint32Array }
+ */
+function allocateBatch(maxSamples = 256, bufferLength = 65536) {
+  return {
+    indices: new Uint32Array(maxSamples),
+    messages: Buffer.allocUnsafe(bufferLength),
+    offsets: new Uint32Array(maxSamples + 1)
+  };
+}
+
+/**
+ * QoS enum values, matching the DDS_* constants of dds_facade.hpp
+ * (0 keeps the Fast DDS default of each endpoint)
+ */
+const QoS = Object.freeze({
+  DEFAULT: 0,
+  BEST_EFFORT: 1,
+  RELIABLE: 2,
+  VOLATILE: 1,
+  TRANSIENT_LOCAL: 2,
+  KEEP_LAST: 1,
+  KEEP_ALL: 2,
+  SYNCHRONOUS: 1,
+  ASYNCHRONOUS: 2,
+  LENGTH_UNLIMITED: -1,
+  DATA_SHARING_AUTO: 1,
+  DATA_SHARING_ON: 2,
+  DATA_SHARING_OFF: 3
+});
+
+/**
+ * Participant transports, matching the DDS_TRANSPORT_* constants of dds_facade.hpp
+ */
+const TRANSPORTS = Object.freeze({
+  default: 0,
+  udp: 1,
+  shm: 2,
+  large_data: 3
+});
+
+/**
+ * Message capacity in bytes of fixed-size writers and readers
+ */
+const FIXED_MESSAGE_CAPACITY = 4096;
+
+// Longest native wait behind the waitForDataAsync methods: a libuv worker thread is
+// held at most this long, and it bounds how long Reader#close() defers
+const WAIT_SLICE_MS = 100;
+
+const QOS_ENUM_FIELDS = {
+  reliability: { best_effort: QoS.BEST_EFFORT, reliable: QoS.RELIABLE },
+  durability: { volatile: QoS.VOLATILE, transient_local: QoS.TRANSIENT_LOCAL },
+  historyKind: { keep_last: QoS.KEEP_LAST, keep_all: QoS.KEEP_ALL },
+  publishMode: { synchronous: QoS.SYNCHRONOUS, asynchronous: QoS.ASYNCHRONOUS },
+  dataSharing: { auto: QoS.DATA_SHARING_AUTO, on: QoS.DATA_SHARING_ON, off: QoS.DATA_SHARING_OFF }
+};
+
+const QOS_NUMBER_FIELDS = ['historyDepth', 'maxSamples', 'maxInstances', 'maxSamplesPerInstance'];
+
+/**
+ * Named QoS presets accepted wherever a QoS object is
+ */
+const QOS_PROFILES = Object.freeze({
+  default: {},
+  reliable: { reliability: 'reliable', historyKind: 'keep_last', historyDepth: 100 },
+  best_effort: { reliability: 'best_effort', historyKind: 'keep_last', historyDepth: 1 },
+  keep_all: { reliability: 'reliable', historyKind: 'keep_all' },
+  transient_local: { reliability: 'reliable', durability: 'transient_local', historyKind: 'keep_last', historyDepth: 100 },
+  async_reliable: { reliability: 'reliable', historyKind: 'keep_last', historyDepth: 1000, publishMode: 'asynchronous' }
+});
+
+/**
+ * Resolve a profile name or QoS object into the numeric form the addon expects
+ * @private
+ * @param {string|Object|undefined} qos - Profile name from QOS_PROFILES, or an object
+ *   with reliability, durability, historyKind, historyDepth, maxSamples, maxInstances,
+ *   maxSamplesPerInstance and publishMode (enum fields take QoS values or names)
+ * @returns {Object|null} - Numeric QoS object, or null for defaults
+ */
+function resolveQos(qos) {
+  if (qos === undefined || qos === null) return null;
+  if (typeof qos === 'string') {
+    if (!Object.prototype.hasOwnProperty.call(QOS_PROFILES, qos)) {
+      throw new Error(`Unknown QoS profile '${qos}' (expected one of ${Object.keys(QOS_PROFILES).join(', ')})`);
+    }
+    qos = QOS_PROFILES[qos];
+  }
+  if (typeof qos !== 'object') {
+    throw new Error('QoS must be a profile name or an object');
+  }
+
+  const resolved = {};
+  for (const [field, value] of Object.entries(qos)) {
+    if (QOS_ENUM_FIELDS[field]) {
+      const number = typeof value === 'string' ? QOS_ENUM_FIELDS[field][value] : value;
+      if (typeof number !== 'number') {
+        throw new Error(`Invalid value '${value}' for QoS ${field}`);
+      }
+      resolved[field] = number;
+    } else if (QOS_NUMBER_FIELDS.includes(field)) {
+      if (!Number.isInteger(value)) {
+        throw new Error(`QoS ${field} must be an integer`);
+      }
+      resolved[field] = value;
+    } else {
+      throw new Error(`Unknown QoS field '${field}'`);
+    }
+  }
+  return resolved;
+}
+
+/**
+ * Push-based receive: the addon is woken from the DDS listener thread and
+ * delivers samples in batches on the event loop, so nothing polls.
+ *
+ * Events: 'data' (Array of { index, message }), 'sample' ({ index, message },
+ * only emitted while someone listens for it) and 'close'. Samples delivered
+ * while nobody listens to 'data'/'sample' or iterates are dropped.
+ * Also async-iterable over batches: for await (const batch of subscription).
+ */
+class Subscription extends EventEmitter {
+  /**
+   * @private
+   * @param {Reader|null} reader - Reader to subscribe on, or null for the DDSMessaging topic
+   * @param {number} maxBatch - Maximum samples per 'data' event
+   */
+  constructor(reader, maxBatch) {
+    super();
+    this.reader = reader;
+    this.closed = false;
+    const onBatch = (batch) => {
+      this.emit('data', batch);
+      if (this.listenerCount('sample') > 0) {
+        for (const sample of batch) this.emit('sample', sample);
+      }
+    };
+    this.handle = reader
+      ? ddsAddon.readerSubscribe(reader.handle, onBatch, maxBatch)
+      : ddsAddon.subscribe(onBatch, maxBatch);
+  }
+
+  /**
+   * Stop delivery; lets the process exit once nothing else is pending
+   */
+  close() {
+    if (this.closed) return;
+    this.closed = true;
+    ddsAddon.unsubscribe(this.handle);
+    this.handle = null;
+    this.emit('close');
+  }
+
+  [Symbol.asyncIterator]() {
+    const queue = [];
+    let wake = null;
+    const notify = () => {
+      if (wake) {
+        wake();
+        wake = null;
+      }
+    };
+    const onData = (batch) => {
+      queue.push(batch);
+      notify();
+    };
+    this.on('data', onData);
+    this.on('close', notify);
+    const subscription = this;
+    return (async function* batches() {
+      try {
+        for (;;) {
+          if (queue.length > 0) {
+            yield queue.shift();
+          } else if (subscription.closed) {
+            return;
+          } else {
+            await new Promise((resolve) => { wake = resolve; });
+          }
+        }
+      } finally {
+        subscription.off('data', onData);
+        subscription.off('close', notify);
+      }
+    })();
+  }
+}
+
+// The dds_init reader has one data callback for the whole process, so its
+// subscription is shared by every DDSMessaging instance
+let defaultSubscription = null;
+
 class DDSMessaging {
   constructor() {
     this.initialized = false;
@@ -26,14 +248,18 @@ class DDSMessaging {
    * Initialize DDS with a topic name and specific domain ID
    * @param {string} topicName - The name of the DDS topic
    * @param {number} domainId - The DDS domain ID (0-232)
+   * @param {string|Object} [qos] - QoS profile name or object applied to the writer and reader
    * @returns {boolean} - Success status
    */
-  initWithDomain(topicName, domainId) {
+  initWithDomain(topicName, domainId, qos) {
     if (typeof domainId !== 'number' || domainId < 0 || domainId > 232) {
       throw new Error('Domain ID must be a number between 0 and 232');
     }
     
-    const result = ddsAddon.initWithDomain(topicName, domainId);
+    const resolvedQos = resolveQos(qos);
+    const result = resolvedQos
+      ? ddsAddon.initWithQos(topicName, domainId, resolvedQos)
+      : ddsAddon.initWithDomain(topicName, domainId);
     this.initialized = (result === 1);
     if (this.initialized) {
       this.currentTopicName = topicName;
@@ -42,6 +268,69 @@ class DDSMessaging {
     return this.initialized;
   }
 
+  /**
+   * Initialize DDS on a libuv worker thread, without blocking the event loop
+   * @param {string} topicName - The name of the DDS topic
+   * @param {number} [domainId] - The DDS domain ID (0-232); DDS_DOMAIN_ID or 0 if omitted
+   * @param {string|Object} [qos] - QoS profile name or object applied to the writer and reader
+   * @returns {Promise<boolean>} - Success status
+   */
+  async initAsync(topicName, domainId, qos) {
+    if (domainId === undefined || domainId === null) {
+      domainId = this._getDomainIdFromEnv();
+    }
+    if (typeof domainId !== 'number' || domainId < 0 || domainId > 232) {
+      throw new Error('Domain ID must be a number between 0 and 232');
+    }
+
+    const result = await ddsAddon.initAsync(topicName, domainId, resolveQos(qos));
+    this.initialized = (result === 1);
+    if (this.initialized) {
+      this.currentTopicName = topicName;
+      this.currentDomainId = domainId;
+    }
+    return this.initialized;
+  }
+
+  /**
+   * Initialize DDS with a content-filtered reader: only samples matching
+   * filterExpression are delivered (see Participant#createFilteredReader)
+   * @param {string} topicName - The name of the DDS topic
+   * @param {number} domainId - The DDS domain ID (0-232)
+   * @param {string} filterExpression - DDS-SQL condition, e.g. 'index BETWEEN %0 AND %1'
+   * @param {Array<string>} [parameters] - Values of %0..%n; quote strings ("'alarm/%'")
+   * @param {string|Object} [qos] - QoS profile name or object applied to the writer and reader
+   * @returns {boolean} - Success status
+   */
+  initFiltered(topicName, domainId, filterExpression, parameters = [], qos) {
+    if (typeof domainId !== 'number' || domainId < 0 || domainId > 232) {
+      throw new Error('Domain ID must be a number between 0 and 232');
+    }
+    if (typeof filterExpression !== 'string') {
+      throw new Error('Filter expression must be a string');
+    }
+
+    const result = ddsAddon.initFiltered(topicName, domainId, resolveQos(qos), filterExpression, parameters.map(String));
+    this.initialized = (result === 1);
+    if (this.initialized) {
+      this.currentTopicName = topicName;
+      this.currentDomainId = domainId;
+    }
+    return this.initialized;
+  }
+
+  /**
+   * Replace the filter parameters of the initFiltered() reader; the expression is kept
+   * @param {Array<string>} parameters - New values of %0..%n
+   * @returns {boolean} - False if they were rejected (the previous ones stay in effect)
+   */
+  setFilterParameters(parameters) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    return ddsAddon.setFilterParameters(parameters.map(String)) === 1;
+  }
+
   /**
    * Get the current domain ID from environment variable or return default
    * @private
@@ -64,6 +353,24 @@ class DDSMessaging {
     };
   }
 
+  /**
+   * Statistics of the writer and reader (collected while enableStats(true) is in effect)
+   * @returns {Object|null} - { writer, reader } as returned by Writer#stats and Reader#stats,
+   *   or null if not initialized
+   */
+  getStats() {
+    return ddsAddon.getStats();
+  }
+
+  /**
+   * Startup timings of the last init call, in ns since it started (0 until the event)
+   * @returns {Object|null} - { initNs, writerMatchedNs, readerMatchedNs, firstSampleNs,
+   *   participantReused }, or null if not initialized
+   */
+  getStartupStats() {
+    return ddsAddon.getStartupStats();
+  }
+
   /**
    * Write a message with index (legacy method)
    * @param {number} index - Message index
@@ -77,6 +384,20 @@ class DDSMessaging {
     return ddsAddon.write(index, message) === 1;
   }
 
+  /**
+   * Write a message on a libuv worker thread (a reliable write that blocks on a
+   * full history does not stall the event loop)
+   * @param {number} index - Message index
+   * @param {string} message - Message content
+   * @returns {Promise<boolean>} - Success status
+   */
+  async writeAsync(index, message) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    return (await ddsAddon.writeAsync(index, message)) === 1;
+  }
+
   /**
    * Write a HelloWorld struct
    * @param {Object} helloWorld - Object with index and message properties
@@ -92,6 +413,76 @@ class DDSMessaging {
     return ddsAddon.writeStruct(helloWorld) === 1;
   }
 
+  /**
+   * Write a batch of HelloWorld samples in one native call
+   * @param {Array<Object>} samples - Objects with index and message properties
+   * @returns {number} - Number of samples written
+   */
+  writeBatch(samples) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    const { indices, messages, offsets } = packBatch(samples);
+    return ddsAddon.writeBatch(indices, messages, offsets);
+  }
+
+  /**
+   * Write a pre-packed batch: message i is messages[offsets[i], offsets[i + 1])
+   * @param {Uint32Array} indices - Sample indices
+   * @param {Buffer} messages - Packed UTF-8 message bytes
+   * @param {Uint32Array} offsets - indices.length + 1 offsets into messages
+   * @returns {number} - Number of samples written
+   */
+  writeBatchBuffers(indices, messages, offsets) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    return ddsAddon.writeBatch(indices, messages, offsets);
+  }
+
+  /**
+   * Write a message held in a Buffer (raw bytes, no string conversion)
+   * @param {number} index - Message index
+   * @param {Buffer} message - Message bytes
+   * @returns {boolean} - Success status
+   */
+  writeBuffer(index, message) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    return ddsAddon.writeBuffer(index, message) === 1;
+  }
+
+  /**
+   * Take one message into a caller-owned Buffer
+   * @param {Buffer} buffer - Receives the message bytes
+   * @param {Uint32Array} out - out[0] receives the index, out[1] the message length
+   * @returns {number} - Bytes copied into buffer, or -1 if nothing was taken: out[1] is 0
+   *   if no data was available, or the length needed if the next message does not fit in
+   *   buffer (it stays in the reader for the next take)
+   */
+  takeInto(buffer, out) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    return ddsAddon.takeInto(buffer, out);
+  }
+
+  /**
+   * Take up to indices.length samples into preallocated buffers (see allocateBatch)
+   * @param {Uint32Array} indices - Receives sample indices
+   * @param {Buffer} messages - Receives the packed message bytes
+   * @param {Uint32Array} offsets - Receives indices.length + 1 offsets into messages
+   * @returns {number} - Number of samples taken, or -1 if the next message alone does
+   *   not fit in messages (offsets[1] then holds its length; nothing is lost)
+   */
+  takeBatchInto(indices, messages, offsets) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    return ddsAddon.takeBatchInto(indices, messages, offsets);
+  }
+
   /**
    * Take a message (legacy method)
    * @returns {Object|null} - Object with success, index, and message properties
@@ -128,10 +519,66 @@ class DDSMessaging {
     return result.message ? { index: result.index, message: result.message } : null;
   }
 
+  /**
+   * Block until data is available or the timeout expires.
+   * Note: this blocks the calling (event loop) thread; use waitForDataAsync there.
+   * @param {number} timeoutMs - Maximum wait in milliseconds (negative waits forever)
+   * @returns {boolean} - True if data is available
+   */
+  waitForData(timeoutMs = 0) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    return ddsAddon.waitForData(timeoutMs) === 1;
+  }
+
+  /**
+   * Wait for data on a libuv worker thread, leaving the event loop free. The wait
+   * runs in slices of at most WAIT_SLICE_MS, so no worker thread is held for
+   * longer; shutdown() settles a pending wait with false.
+   * @param {number} timeoutMs - Maximum wait in milliseconds (negative waits forever)
+   * @returns {Promise<boolean>} - True if data is available
+   */
+  async waitForDataAsync(timeoutMs = -1) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    const deadline = timeoutMs < 0 ? Infinity : Date.now() + timeoutMs;
+    for (;;) {
+      const slice = Math.max(0, Math.min(WAIT_SLICE_MS, deadline - Date.now()));
+      if (await ddsAddon.waitForDataAsync(slice) === 1) return true;
+      if (!this.initialized || Date.now() >= deadline) return false;
+    }
+  }
+
+  /**
+   * Receive without polling: samples are pushed as they arrive (see Subscription).
+   * The subscription survives re-initialization; close it (or shutdown()) to stop.
+   * Only one subscription on the DDSMessaging topic can be open at a time, across
+   * all DDSMessaging instances of the process.
+   * @param {Object} [options] - { maxBatch: samples per 'data' event (default 256) }
+   * @returns {Subscription}
+   */
+  subscribe(options = {}) {
+    if (!this.initialized) {
+      throw new Error('DDS not initialized. Call init() first.');
+    }
+    if (defaultSubscription && !defaultSubscription.closed) {
+      throw new Error('Already subscribed; close the existing subscription first');
+    }
+    this.subscription = new Subscription(null, options.maxBatch || 256);
+    defaultSubscription = this.subscription;
+    return this.subscription;
+  }
+
   /**
    * Shutdown DDS
    */
   shutdown() {
+    if (this.subscription) {
+      this.subscription.close();
+      this.subscription = null;
+    }
     if (this.initialized) {
       ddsAddon.shutdown();
       this.initialized = false;
@@ -139,4 +586,450 @@ class DDSMessaging {
   }
 }
 
+/**
+ * DomainParticipant shared by any number of topic writers and readers.
+ * Unlike DDSMessaging.init(), adding topics does not rebuild the participant.
+ */
+class Participant {
+  /**
+   * @param {number} domainId - The DDS domain ID (0-232)
+   * @param {string} [transport] - One of TRANSPORTS ('shm' keeps traffic on the host in shared memory)
+   */
+  constructor(domainId = 0, transport = 'default', handle = undefined) {
+    Participant._checkArgs(domainId, transport);
+    this.handle = handle === undefined ? ddsAddon.participantCreate(domainId, TRANSPORTS[transport]) : handle;
+    if (!this.handle) {
+      throw new Error(`Failed to create DDS participant on domain ${domainId}`);
+    }
+    this.domainId = domainId;
+    this.transport = transport;
+    this.endpoints = new Set();
+  }
+
+  /**
+   * Create a participant on a libuv worker thread (discovery setup can take a
+   * while and would otherwise block the event loop)
+   * @param {number} domainId - The DDS domain ID (0-232)
+   * @param {string} [transport] - One of TRANSPORTS
+   * @returns {Promise<Participant>}
+   */
+  static async create(domainId = 0, transport = 'default') {
+    Participant._checkArgs(domainId, transport);
+    const handle = await ddsAddon.participantCreateAsync(domainId, TRANSPORTS[transport]);
+    return new Participant(domainId, transport, handle);
+  }
+
+  /**
+   * @private
+   */
+  static _checkArgs(domainId, transport) {
+    if (typeof domainId !== 'number' || domainId < 0 || domainId > 232) {
+      throw new Error('Domain ID must be a number between 0 and 232');
+    }
+    if (!Object.prototype.hasOwnProperty.call(TRANSPORTS, transport)) {
+      throw new Error(`Unknown transport '${transport}' (expected one of ${Object.keys(TRANSPORTS).join(', ')})`);
+    }
+  }
+
+  /**
+   * Create a writer on a topic of this participant
+   * @param {string} topicName - The name of the DDS topic
+   * @param {string|Object} [qos] - QoS profile name or object
+   * @returns {Writer}
+   */
+  createWriter(topicName, qos) {
+    return new Writer(this, topicName, qos);
+  }
+
+  /**
+   * Create a reader on a topic of this participant
+   * @param {string} topicName - The name of the DDS topic
+   * @param {string|Object} [qos] - QoS profile name or object
+   * @returns {Reader}
+   */
+  createReader(topicName, qos) {
+    return new Reader(this, topicName, qos);
+  }
+
+  /**
+   * Create a writer of fixed-size samples (messages up to FIXED_MESSAGE_CAPACITY bytes),
+   * eligible for data-sharing delivery between processes on this host
+   * @param {string} topicName - The name of the DDS topic
+   * @param {string|Object} [qos] - QoS profile name or object
+   * @returns {Writer}
+   */
+  createFixedWriter(topicName, qos) {
+    return new Writer(this, topicName, qos, true);
+  }
+
+  /**
+   * Create a reader of fixed-size samples
+   * @param {string} topicName - The name of the DDS topic
+   * @param {string|Object} [qos] - QoS profile name or object
+   * @returns {Reader}
+   */
+  createFixedReader(topicName, qos) {
+    return new Reader(this, topicName, qos, true);
+  }
+
+  /**
+   * Create a reader that only receives samples matching filterExpression. Writers
+   * evaluate the filter before sending where they can, so rejected samples never
+   * reach this process.
+   * @param {string} topicName - The name of the DDS topic
+   * @param {string} filterExpression - DDS-SQL condition over index and message,
+   *   e.g. 'index BETWEEN %0 AND %1' or 'message LIKE %0'
+   * @param {Array<string>} [parameters] - Values of %0..%n; quote strings ("'alarm/%'")
+   * @param {string|Object} [qos] - QoS profile name or object
+   * @returns {Reader}
+   */
+  createFilteredReader(topicName, filterExpression, parameters = [], qos) {
+    return new Reader(this, topicName, qos, false, { expression: filterExpression, parameters });
+  }
+
+  /**
+   * Close all writers/readers created from this participant, then the participant
+   * @returns {Promise|undefined} - Settles once deferred closes (pending writeAsync and
+   *   waitForDataAsync calls) are done
+   */
+  close() {
+    if (!this.handle) return undefined;
+    const deferred = [];
+    for (const endpoint of this.endpoints) {
+      const closing = endpoint.close();
+      if (closing) deferred.push(closing);
+    }
+    const handle = this.handle;
+    this.handle = null;
+    if (deferred.length > 0) {
+      return Promise.all(deferred).then(() => { ddsAddon.participantDelete(handle); });
+    }
+    ddsAddon.participantDelete(handle);
+    return undefined;
+  }
+}
+
+/**
+ * HelloWorld writer on one topic of a Participant
+ */
+class Writer {
+  constructor(participant, topicName, qos, fixed = false) {
+    if (!participant.handle) {
+      throw new Error('Participant is closed');
+    }
+    this.participant = participant;
+    this.topicName = topicName;
+    this.fixed = fixed;
+    const create = fixed ? ddsAddon.writerCreateFixed : ddsAddon.writerCreate;
+    this.handle = create(participant.handle, topicName, resolveQos(qos));
+    if (!this.handle) {
+      throw new Error(`Failed to create DDS writer on topic ${topicName}`);
+    }
+    this.pending = new Set();
+    participant.endpoints.add(this);
+  }
+
+  /**
+   * Write a message on a libuv worker thread (a reliable write that blocks on a
+   * full history does not stall the event loop)
+   * @param {number} index - Message index
+   * @param {string} message - Message content
+   * @returns {Promise<boolean>} - Success status
+   */
+  writeAsync(index, message) {
+    if (!this.handle) {
+      return Promise.reject(new Error('Writer is closed'));
+    }
+    const write = ddsAddon.writerWriteAsync(this.handle, index, message).then((result) => result === 1);
+    this.pending.add(write);
+    const settle = () => { this.pending.delete(write); };
+    write.then(settle, settle);
+    return write;
+  }
+
+  /**
+   * Write a message with index
+   * @param {number} index - Message index
+   * @param {string} message - Message content
+   * @returns {boolean} - Success status
+   */
+  write(index, message) {
+    return ddsAddon.writerWrite(this.handle, index, message) === 1;
+  }
+
+  /**
+   * Write a batch of HelloWorld samples in one native call
+   * @param {Array<Object>} samples - Objects with index and message properties
+   * @returns {number} - Number of samples written
+   */
+  writeBatch(samples) {
+    const { indices, messages, offsets } = packBatch(samples);
+    return ddsAddon.writerWriteBatch(this.handle, indices, messages, offsets);
+  }
+
+  /**
+   * Write a pre-packed batch, e.g. as filled by Reader#takeBatchInto
+   * @param {Uint32Array} indices - Sample indices
+   * @param {Buffer} messages - Packed UTF-8 message bytes
+   * @param {Uint32Array} offsets - indices.length + 1 offsets into messages
+   * @returns {number} - Number of samples written
+   */
+  writeBatchBuffers(indices, messages, offsets) {
+    return ddsAddon.writerWriteBatch(this.handle, indices, messages, offsets);
+  }
+
+  /**
+   * Write a message held in a Buffer (raw bytes, no string conversion)
+   * @param {number} index - Message index
+   * @param {Buffer} message - Message bytes
+   * @returns {boolean} - Success status
+   */
+  writeBuffer(index, message) {
+    return ddsAddon.writerWriteBuffer(this.handle, index, message) === 1;
+  }
+
+  /**
+   * Counters and write latency (collected while enableStats(true) is in effect)
+   * @returns {Object|null} - { samples, bytes, failures, writeLatency, matchedReaders,
+   *   matchedReadersTotal }, null once closed. writeLatency is { count, totalNs, maxNs,
+   *   p50Ns, p99Ns, p999Ns, buckets: [[lowerNs, upperNs, count], ...] }
+   */
+  stats() {
+    return ddsAddon.writerGetStats(this.handle);
+  }
+
+  /**
+   * @returns {Promise|undefined} - With writeAsync calls in flight the native writer is
+   *   deleted once they settle, and the returned promise resolves then
+   */
+  close() {
+    if (!this.handle) return undefined;
+    const handle = this.handle;
+    this.handle = null;
+    this.participant.endpoints.delete(this);
+    if (this.pending.size > 0) {
+      return Promise.all(this.pending).then(() => { ddsAddon.writerDelete(handle); });
+    }
+    ddsAddon.writerDelete(handle);
+    return undefined;
+  }
+}
+
+/**
+ * HelloWorld reader on one topic of a Participant
+ */
+class Reader {
+  /**
+   * @param {Participant} participant
+   * @param {string} topicName - The name of the DDS topic
+   * @param {string|Object} [qos] - QoS profile name or object
+   * @param {boolean} [fixed] - Fixed-size samples
+   * @param {Object} [filter] - { expression, parameters } for a content-filtered reader
+   */
+  constructor(participant, topicName, qos, fixed = false, filter = null) {
+    if (!participant.handle) {
+      throw new Error('Participant is closed');
+    }
+    if (fixed && filter) {
+      throw new Error('Fixed-size readers cannot be content-filtered');
+    }
+    this.participant = participant;
+    this.topicName = topicName;
+    this.fixed = fixed;
+    this.filterExpression = filter ? filter.expression : null;
+    if (filter) {
+      if (typeof filter.expression !== 'string') {
+        throw new Error('Filter expression must be a string');
+      }
+      this.handle = ddsAddon.readerCreateFiltered(participant.handle, topicName, resolveQos(qos),
+        filter.expression, (filter.parameters || []).map(String));
+    } else {
+      const create = fixed ? ddsAddon.readerCreateFixed : ddsAddon.readerCreate;
+      this.handle = create(participant.handle, topicName, resolveQos(qos));
+    }
+    if (!this.handle) {
+      throw new Error(`Failed to create DDS reader on topic ${topicName}`);
+    }
+    this.pending = new Set();
+    participant.endpoints.add(this);
+  }
+
+  /**
+   * Take one sample
+   * @returns {Object|null} - Object with index and message properties
+   */
+  take() {
+    const result = ddsAddon.readerTake(this.handle);
+    return result.success === 1 ? { index: result.index, message: result.message } : null;
+  }
+
+  /**
+   * Take one message into a caller-owned Buffer
+   * @param {Buffer} buffer - Receives the message bytes
+   * @param {Uint32Array} out - out[0] receives the index, out[1] the message length
+   * @returns {number} - Bytes copied into buffer, or -1 if nothing was taken: out[1] is 0
+   *   if no data was available, or the length needed if the next message does not fit in
+   *   buffer (it stays in the reader for the next take)
+   */
+  takeInto(buffer, out) {
+    return ddsAddon.readerTakeInto(this.handle, buffer, out);
+  }
+
+  /**
+   * Take up to indices.length samples into preallocated buffers (see allocateBatch)
+   * @param {Uint32Array} indices - Receives sample indices
+   * @param {Buffer} messages - Receives the packed message bytes
+   * @param {Uint32Array} offsets - Receives indices.length + 1 offsets into messages
+   * @returns {number} - Number of samples taken, or -1 if the next message alone does
+   *   not fit in messages (offsets[1] then holds its length; nothing is lost)
+   */
+  takeBatchInto(indices, messages, offsets) {
+    return ddsAddon.readerTakeBatchInto(this.handle, indices, messages, offsets);
+  }
+
+  /**
+   * Replace the filter parameters of a content-filtered reader; the expression is kept
+   * @param {Array<string>} parameters - New values of %0..%n
+   * @returns {boolean} - False if they were rejected (the previous ones stay in effect)
+   */
+  setFilterParameters(parameters) {
+    if (this.filterExpression === null) {
+      throw new Error('Only content-filtered readers have filter parameters');
+    }
+    return ddsAddon.readerSetFilterParameters(this.handle, parameters.map(String)) === 1;
+  }
+
+  /**
+   * Block until data is available or the timeout expires (blocks the calling thread;
+   * use waitForDataAsync on the event loop)
+   * @param {number} timeoutMs - Maximum wait in milliseconds (negative waits forever)
+   * @returns {boolean} - True if data is available
+   */
+  waitForData(timeoutMs = 0) {
+    return ddsAddon.readerWaitForData(this.handle, timeoutMs) === 1;
+  }
+
+  /**
+   * Wait for data on a libuv worker thread, leaving the event loop free. The wait
+   * runs in slices of at most WAIT_SLICE_MS, so close() settles it with false
+   * within one slice.
+   * @param {number} timeoutMs - Maximum wait in milliseconds (negative waits forever)
+   * @returns {Promise<boolean>} - True if data is available
+   */
+  async waitForDataAsync(timeoutMs = -1) {
+    const deadline = timeoutMs < 0 ? Infinity : Date.now() + timeoutMs;
+    for (;;) {
+      if (!this.handle) return false;
+      const slice = Math.max(0, Math.min(WAIT_SLICE_MS, deadline - Date.now()));
+      const wait = ddsAddon.readerWaitForDataAsync(this.handle, slice);
+      this.pending.add(wait);
+      let result;
+      try {
+        result = await wait;
+      } finally {
+        this.pending.delete(wait);
+      }
+      if (result === 1) return true;
+      if (Date.now() >= deadline) return false;
+    }
+  }
+
+  /**
+   * Receive without polling: samples are pushed as they arrive (see Subscription).
+   * One subscription per reader; closing the reader closes it.
+   * @param {Object} [options] - { maxBatch: samples per 'data' event (default 256) }
+   * @returns {Subscription}
+   */
+  subscribe(options = {}) {
+    if (!this.handle) {
+      throw new Error('Reader is closed');
+    }
+    if (this.subscription && !this.subscription.closed) {
+      throw new Error('Already subscribed; close the existing subscription first');
+    }
+    this.subscription = new Subscription(this, options.maxBatch || 256);
+    return this.subscription;
+  }
+
+  /**
+   * Counters, take latency and Fast DDS statuses (see Writer#stats)
+   * @returns {Object|null} - { samples, bytes, emptyTakes, takeLatency, matchedWriters,
+   *   matchedWritersTotal, samplesLost, samplesRejected, lastRejectedReason, unreadSamples },
+   *   null once closed
+   */
+  stats() {
+    return ddsAddon.readerGetStats(this.handle);
+  }
+
+  /**
+   * @returns {Promise|undefined} - With waitForDataAsync calls in flight the native
+   *   reader is deleted once their current slice settles, and the returned promise
+   *   resolves then
+   */
+  close() {
+    if (!this.handle) return undefined;
+    if (this.subscription) {
+      this.subscription.close();
+      this.subscription = null;
+    }
+    const handle = this.handle;
+    this.handle = null;
+    this.participant.endpoints.delete(this);
+    if (this.pending.size > 0) {
+      const settled = [...this.pending].map((wait) => wait.catch(() => {}));
+      return Promise.all(settled).then(() => { ddsAddon.readerDelete(handle); });
+    }
+    ddsAddon.readerDelete(handle);
+    return undefined;
+  }
+}
+
+/**
+ * Turn statistics collection on or off for every writer and reader. Off by default;
+ * while off the write and take paths only test a flag.
+ * @param {boolean} [enabled=true]
+ */
+function enableStats(enabled = true) {
+  ddsAddon.statsEnable(Boolean(enabled));
+}
+
+/**
+ * @returns {boolean} - Whether statistics are being collected
+ */
+function statsEnabled() {
+  return ddsAddon.statsEnabled();
+}
+
+/**
+ * Keep the DDSMessaging participant (and its registered types) across shutdown() and
+ * init calls, so re-initializing on the same domain and transport only recreates the
+ * topic, writer and reader. Defaults to the DDS_KEEP_PARTICIPANT environment variable.
+ * @param {boolean} [keep=true]
+ */
+function setKeepParticipant(keep = true) {
+  ddsAddon.setKeepParticipant(Boolean(keep));
+}
+
+/**
+ * @returns {boolean} - Whether the DDSMessaging participant is kept
+ */
+function keepParticipant() {
+  return ddsAddon.keepParticipant();
+}
+
 module.exports = DDSMessaging;
+module.exports.DDSMessaging = DDSMessaging;
+module.exports.Participant = Participant;
+module.exports.Writer = Writer;
+module.exports.Reader = Reader;
+module.exports.Subscription = Subscription;
+module.exports.QoS = QoS;
+module.exports.QOS_PROFILES = QOS_PROFILES;
+module.exports.TRANSPORTS = TRANSPORTS;
+module.exports.FIXED_MESSAGE_CAPACITY = FIXED_MESSAGE_CAPACITY;
+module.exports.allocateBatch = allocateBatch;
+module.exports.enableStats = enableStats;
+module.exports.statsEnabled = statsEnabled;
+module.exports.setKeepParticipant = setKeepParticipant;
+module.exports.keepParticipant = keepParticipant;
+module.exports.MetricsExporter = require('./metrics').MetricsExporter;
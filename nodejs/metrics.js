@@ -0,0 +1,285 @@
+const fs = require('fs');
+const http = require('http');
+
+const CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8';
+
+// Upper bounds of the exported latency buckets: powers of two from 256 ns to about
+// 1.07 s, which are also bucket edges of the facade histograms, so counts are exact
+const LATENCY_BUCKETS_NS = Object.freeze(Array.from({ length: 23 }, (_, i) => 2 ** (i + 8)));
+
+// Loaded on first use: index.js re-exports this module
+function dds() {
+  return require('./index');
+}
+
+/**
+ * Format a float the way the Python exporter does, so both bindings produce the
+ * same le label values
+ * @private
+ */
+function formatFloat(value) {
+  if (Number.isInteger(value)) return `${value}.0`;
+  if (value >= 1e-4 && value < 1e16) return String(value);
+  const [mantissa, exponent] = value.toExponential().split('e');
+  const sign = exponent[0] === '-' ? '-' : '+';
+  const digits = exponent.replace(/^[+-]/, '');
+  return `${mantissa}e${sign}${digits.padStart(2, '0')}`;
+}
+
+function escapeLabel(value) {
+  return String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+}
+
+function formatLabels(labels) {
+  return labels.map(([key, value]) => `${key}="${escapeLabel(value)}"`).join(',');
+}
+
+/**
+ * One metric family: its metadata lines and samples
+ * @private
+ */
+class Family {
+  constructor(name, kind, help, unit = null) {
+    this.name = name;
+    this.kind = kind;
+    this.help = help;
+    this.unit = unit;
+    this.lines = [];
+  }
+
+  add(labels, value, suffix = '') {
+    this.lines.push(`${this.name}${suffix}{${formatLabels(labels)}} ${value}`);
+  }
+
+  addHistogram(labels, histogram, boundsNs) {
+    // A facade bucket is counted under the first bound at or above its upper edge,
+    // so an unaligned bound only under-counts, never over-counts
+    const cumulative = new Array(boundsNs.length).fill(0);
+    let total = 0;
+    for (const [, upper, count] of histogram.buckets) {
+      total += count;
+      const i = boundsNs.findIndex((bound) => upper <= bound);
+      if (i >= 0) cumulative[i] += count;
+    }
+    let running = 0;
+    boundsNs.forEach((bound, i) => {
+      running += cumulative[i];
+      this.add([...labels, ['le', formatFloat(bound / 1e9)]], running, '_bucket');
+    });
+    // The count is taken from the buckets so that +Inf and _count agree
+    this.add([...labels, ['le', '+Inf']], total, '_bucket');
+    this.add(labels, total, '_count');
+    this.add(labels, formatFloat(histogram.totalNs / 1e9), '_sum');
+  }
+
+  render(out) {
+    out.push(`# TYPE ${this.name} ${this.kind}`);
+    if (this.unit) out.push(`# UNIT ${this.name} ${this.unit}`);
+    out.push(`# HELP ${this.name} ${this.help}`);
+    out.push(...this.lines);
+  }
+}
+
+/**
+ * OpenMetrics exporter of facade writer and reader statistics. Endpoints are
+ * labelled with their topic and an endpoint name (the name given to add() or a
+ * sequence number). Closed endpoints are dropped at the next scrape. The HTTP
+ * server and the file export timer do not keep the process alive.
+ */
+class MetricsExporter {
+  /**
+   * @param {Object} [options]
+   * @param {boolean} [options.enableStats=true] - Turn statistics collection on
+   * @param {Array<number>} [options.bucketsNs] - Upper bounds of the latency buckets in ns
+   */
+  constructor(options = {}) {
+    if (options.enableStats !== false) {
+      dds().enableStats(true);
+    }
+    this.bucketsNs = (options.bucketsNs || LATENCY_BUCKETS_NS).slice().sort((a, b) => a - b);
+    this.endpoints = [];
+    this.sequence = 0;
+    this.server = null;
+    this.timer = null;
+  }
+
+  /**
+   * Register a Writer, a Reader, or a DDSMessaging instance (its writer and reader,
+   * named 'dds_init' unless a name is given)
+   * @param {Writer|Reader|DDSMessaging} endpoint
+   * @param {string} [name] - endpoint label
+   */
+  add(endpoint, name) {
+    const { Writer, Reader, DDSMessaging } = dds();
+    let role;
+    if (endpoint instanceof Writer) role = 'writer';
+    else if (endpoint instanceof Reader) role = 'reader';
+    else if (endpoint instanceof DDSMessaging) role = 'default';
+    else throw new TypeError('Expected a Writer, Reader or DDSMessaging');
+    if (name === undefined) {
+      name = role === 'default' ? 'dds_init' : String(++this.sequence);
+    }
+    this.endpoints.push({ role, endpoint, name: String(name) });
+  }
+
+  remove(endpoint) {
+    this.endpoints = this.endpoints.filter((entry) => entry.endpoint !== endpoint);
+  }
+
+  /**
+   * @returns {Array<Object>} - { role, topic, name, stats } for every open endpoint
+   */
+  collect() {
+    const snapshots = [];
+    const closed = [];
+    for (const { role, endpoint, name } of this.endpoints) {
+      const stats = role === 'default' ? endpoint.getStats() : endpoint.stats();
+      if (role === 'default') {
+        // null until init, which may still happen; keep the entry
+        if (!stats) continue;
+        const topic = endpoint.currentTopicName;
+        snapshots.push({ role: 'writer', topic, name, stats: stats.writer });
+        snapshots.push({ role: 'reader', topic, name, stats: stats.reader });
+      } else if (stats) {
+        snapshots.push({ role, topic: endpoint.topicName, name, stats });
+      } else {
+        closed.push(endpoint);
+      }
+    }
+    closed.forEach((endpoint) => this.remove(endpoint));
+    return snapshots;
+  }
+
+  /**
+   * @returns {string} - The current statistics as OpenMetrics text
+   */
+  render() {
+    const writer = [
+      new Family('dds_writer_samples', 'counter', 'Samples written.'),
+      new Family('dds_writer_bytes', 'counter', 'Message bytes written.', 'bytes'),
+      new Family('dds_writer_failures', 'counter', 'Write calls that did not write every sample given.'),
+      new Family('dds_writer_write_duration_seconds', 'histogram', 'Duration of write calls; a batch is one call.', 'seconds'),
+      new Family('dds_writer_matched_readers', 'gauge', 'Readers currently matched.'),
+      new Family('dds_writer_matches', 'counter', 'Readers ever matched.')
+    ];
+    const reader = [
+      new Family('dds_reader_samples', 'counter', 'Samples taken.'),
+      new Family('dds_reader_bytes', 'counter', 'Message bytes taken.', 'bytes'),
+      new Family('dds_reader_empty_takes', 'counter', 'Take calls that found no data.'),
+      new Family('dds_reader_take_duration_seconds', 'histogram', 'Duration of take calls; a batch is one call.', 'seconds'),
+      new Family('dds_reader_unread_samples', 'gauge', 'Samples received but not yet taken.'),
+      new Family('dds_reader_matched_writers', 'gauge', 'Writers currently matched.'),
+      new Family('dds_reader_matches', 'counter', 'Writers ever matched.'),
+      new Family('dds_reader_lost_samples', 'counter', 'Samples lost before they reached the reader.'),
+      new Family('dds_reader_rejected_samples', 'counter', 'Samples rejected for lack of resources.')
+    ];
+    for (const { role, topic, name, stats } of this.collect()) {
+      const labels = [['topic', topic], ['endpoint', name]];
+      if (role === 'writer') {
+        writer[0].add(labels, stats.samples, '_total');
+        writer[1].add(labels, stats.bytes, '_total');
+        writer[2].add(labels, stats.failures, '_total');
+        writer[3].addHistogram(labels, stats.writeLatency, this.bucketsNs);
+        writer[4].add(labels, stats.matchedReaders);
+        writer[5].add(labels, stats.matchedReadersTotal, '_total');
+      } else {
+        reader[0].add(labels, stats.samples, '_total');
+        reader[1].add(labels, stats.bytes, '_total');
+        reader[2].add(labels, stats.emptyTakes, '_total');
+        reader[3].addHistogram(labels, stats.takeLatency, this.bucketsNs);
+        reader[4].add(labels, stats.unreadSamples);
+        reader[5].add(labels, stats.matchedWriters);
+        reader[6].add(labels, stats.matchedWritersTotal, '_total');
+        reader[7].add(labels, stats.samplesLost, '_total');
+        reader[8].add(labels, stats.samplesRejected, '_total');
+      }
+    }
+
+    const out = [];
+    const enabled = new Family('dds_stats_enabled', 'gauge', 'Whether statistics are being collected (1) or not (0).');
+    enabled.lines.push(`dds_stats_enabled ${dds().statsEnabled() ? 1 : 0}`);
+    enabled.render(out);
+    for (const family of [...writer, ...reader]) {
+      if (family.lines.length) family.render(out);
+    }
+    out.push('# EOF');
+    return out.join('\n') + '\n';
+  }
+
+  /**
+   * Write the metrics to a file, replacing it atomically
+   * @param {string} path
+   */
+  writeFile(path) {
+    const temporary = `${path}.${process.pid}.tmp`;
+    fs.writeFileSync(temporary, this.render(), 'utf8');
+    fs.renameSync(temporary, path);
+  }
+
+  /**
+   * Rewrite a file every intervalMs until close()
+   * @param {string} path
+   * @param {number} [intervalMs=10000]
+   */
+  startFileExport(path, intervalMs = 10000) {
+    if (this.timer) {
+      throw new Error('File export already started');
+    }
+    this.writeFile(path);
+    this.timer = setInterval(() => this.writeFile(path), intervalMs);
+    this.timer.unref();
+  }
+
+  /**
+   * Serve /metrics over HTTP
+   * @param {number} [port=9464]
+   * @param {string} [host='127.0.0.1']
+   * @returns {Promise<Object>} - The bound { address, port }
+   */
+  listen(port = 9464, host = '127.0.0.1') {
+    if (this.server) {
+      return Promise.reject(new Error('Already listening'));
+    }
+    this.server = http.createServer((request, response) => {
+      const path = request.url.split('?')[0];
+      if (request.method !== 'GET' || (path !== '/' && path !== '/metrics')) {
+        response.writeHead(404);
+        response.end();
+        return;
+      }
+      const body = Buffer.from(this.render(), 'utf8');
+      response.writeHead(200, { 'Content-Type': CONTENT_TYPE, 'Content-Length': body.length });
+      response.end(body);
+    });
+    const server = this.server;
+    return new Promise((resolve, reject) => {
+      server.once('error', (error) => {
+        this.server = null;
+        reject(error);
+      });
+      server.listen(port, host, () => {
+        server.removeAllListeners('error');
+        server.unref();
+        const { address, port: bound } = server.address();
+        resolve({ address, port: bound });
+      });
+    });
+  }
+
+  /**
+   * Stop serving and stop the file export
+   * @returns {Promise<void>}
+   */
+  close() {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+    if (!this.server) return Promise.resolve();
+    const server = this.server;
+    this.server = null;
+    return new Promise((resolve) => server.close(() => resolve()));
+  }
+}
+
+module.exports = { MetricsExporter, LATENCY_BUCKETS_NS, CONTENT_TYPE };
@@ -139,6 +139,11 @@ target_link_libraries(ICD
         fastdds
 )
 
+# dds_set_data_notify_fd signals Windows sockets
+if(WIN32)
+    target_link_libraries(ICD PRIVATE ws2_32)
+endif()
+
 # Set include directories for users of this library
 target_include_directories(ICD 
     PUBLIC 
@@ -1,5 +1,11 @@
 #include <node_api.h>
+#include <algorithm>
+#include <cmath>
+#include <atomic>
+#include <functional>
+#include <memory>
 #include <string>
+#include <vector>
 #include <cstring>
 #include "../../DDSmessage/dds_facade.hpp"
 #include "../../DDSmessage/ICD.hpp"
@@ -24,6 +30,92 @@ uint32_t GetUint32FromValue(napi_env env, napi_value value) {
     return result;
 }
 
+// Helper function to get the bytes of a Buffer; throws and returns false for other values
+bool GetBufferFromValue(napi_env env, napi_value value, const char* name, char** data, size_t* length) {
+    void* buffer_data = nullptr;
+    if (napi_get_buffer_info(env, value, &buffer_data, length) != napi_ok) {
+        std::string error = std::string(name) + " must be a Buffer";
+        napi_throw_type_error(env, nullptr, error.c_str());
+        return false;
+    }
+    *data = static_cast<char*>(buffer_data);
+    return true;
+}
+
+// Helper function to get the elements of a Uint32Array; throws and returns false for other values
+bool GetUint32ArrayFromValue(napi_env env, napi_value value, const char* name, uint32_t** data, size_t* length) {
+    napi_typedarray_type type;
+    void* array_data = nullptr;
+    if (napi_get_typedarray_info(env, value, &type, length, &array_data, nullptr, nullptr) != napi_ok ||
+        type != napi_uint32_array) {
+        std::string error = std::string(name) + " must be a Uint32Array";
+        napi_throw_type_error(env, nullptr, error.c_str());
+        return false;
+    }
+    *data = static_cast<uint32_t*>(array_data);
+    return true;
+}
+
+// Helper function to fill a dds_qos_t from a JS object of numeric fields
+// (missing fields stay at DDS_QOS_DEFAULT). Returns nullptr for null/undefined.
+const dds_qos_t* GetQosFromValue(napi_env env, napi_value value, dds_qos_t* qos) {
+    napi_valuetype type;
+    if (napi_typeof(env, value, &type) != napi_ok || type != napi_object) {
+        return nullptr;
+    }
+    
+    struct Field { const char* name; int32_t* target; };
+    const Field fields[] = {
+        { "reliability", &qos->reliability },
+        { "durability", &qos->durability },
+        { "historyKind", &qos->history_kind },
+        { "historyDepth", &qos->history_depth },
+        { "maxSamples", &qos->max_samples },
+        { "maxInstances", &qos->max_instances },
+        { "maxSamplesPerInstance", &qos->max_samples_per_instance },
+        { "publishMode", &qos->publish_mode },
+        { "dataSharing", &qos->data_sharing },
+    };
+    std::memset(qos, 0, sizeof(*qos));
+    for (const Field& field : fields) {
+        napi_value property;
+        napi_valuetype property_type;
+        if (napi_get_named_property(env, value, field.name, &property) == napi_ok &&
+            napi_typeof(env, property, &property_type) == napi_ok && property_type == napi_number) {
+            napi_get_value_int32(env, property, field.target);
+        }
+    }
+    return qos;
+}
+
+// Content filter parameters from a JS array of strings (anything else, e.g.
+// undefined, means no parameters). Pointers stay valid while strings lives.
+struct FilterParameters {
+    std::vector<std::string> strings;
+    std::vector<const char*> pointers;
+    
+    const char* const* data() const { return pointers.empty() ? nullptr : pointers.data(); }
+    uint32_t count() const { return static_cast<uint32_t>(pointers.size()); }
+};
+
+void GetFilterParametersFromValue(napi_env env, napi_value value, FilterParameters* parameters) {
+    bool is_array = false;
+    if (napi_is_array(env, value, &is_array) != napi_ok || !is_array) {
+        return;
+    }
+    uint32_t length = 0;
+    napi_get_array_length(env, value, &length);
+    parameters->strings.reserve(length);
+    for (uint32_t i = 0; i < length; ++i) {
+        napi_value element;
+        napi_get_element(env, value, i, &element);
+        parameters->strings.push_back(GetStringFromValue(env, element));
+    }
+    for (const std::string& parameter : parameters->strings) {
+        parameters->pointers.push_back(parameter.c_str());
+    }
+}
+
 // Wrapper for dds_init
 napi_value DdsInit(napi_env env, napi_callback_info info) {
     size_t argc = 1;
@@ -64,6 +156,71 @@ napi_value DdsInitWithDomain(napi_env env, napi_callback_info info) {
     return return_value;
 }
 
+// Wrapper for dds_init_with_qos
+napi_value DdsInitWithQos(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected topic name, domain ID and QoS arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[0]);
+    uint32_t domain_id = GetUint32FromValue(env, args[1]);
+    dds_qos_t qos;
+    const dds_qos_t* qos_ptr = argc >= 3 ? GetQosFromValue(env, args[2], &qos) : nullptr;
+    
+    int result = dds_init_with_qos(topic_name.c_str(), domain_id, qos_ptr);
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_init_filtered: (topicName, domainId, qos, filterExpression, parameters)
+napi_value DdsInitFiltered(napi_env env, napi_callback_info info) {
+    size_t argc = 5;
+    napi_value args[5];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 4) {
+        napi_throw_error(env, nullptr, "Expected topic name, domain ID, QoS and filter expression arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[0]);
+    uint32_t domain_id = GetUint32FromValue(env, args[1]);
+    dds_qos_t qos;
+    const dds_qos_t* qos_ptr = GetQosFromValue(env, args[2], &qos);
+    std::string filter_expression = GetStringFromValue(env, args[3]);
+    FilterParameters parameters;
+    if (argc >= 5) GetFilterParametersFromValue(env, args[4], &parameters);
+    
+    int result = dds_init_filtered(topic_name.c_str(), domain_id, qos_ptr, filter_expression.c_str(),
+                                   parameters.data(), parameters.count());
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_set_filter_parameters: (parameters)
+napi_value DdsSetFilterParameters(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    FilterParameters parameters;
+    if (argc >= 1) GetFilterParametersFromValue(env, args[0], &parameters);
+    int result = dds_set_filter_parameters(parameters.data(), parameters.count());
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
 // Wrapper for dds_write (legacy)
 napi_value DdsWrite(napi_env env, napi_callback_info info) {
     size_t argc = 2;
@@ -116,20 +273,90 @@ napi_value DdsWriteStruct(napi_env env, napi_callback_info info) {
     return return_value;
 }
 
-// Wrapper for dds_take (legacy)
-napi_value DdsTake(napi_env env, napi_callback_info info) {
-    uint32_t index_out = 0;
-    char message_buffer[1024];
+// Validated views over (indices: Uint32Array, messages: Buffer, offsets: Uint32Array)
+struct WriteBatchArgs {
+    uint32_t count;
+    const uint32_t* indices;
+    const char* messages;
+    const uint32_t* offsets;
+};
+
+// Helper function to unpack batch write arguments; throws and returns false on bad input
+bool GetWriteBatchArgs(napi_env env, napi_value* args, WriteBatchArgs* out) {
+    napi_typedarray_type indices_type, offsets_type;
+    size_t index_count = 0, offset_count = 0;
+    void* indices_data = nullptr;
+    void* offsets_data = nullptr;
+    if (napi_get_typedarray_info(env, args[0], &indices_type, &index_count, &indices_data, nullptr, nullptr) != napi_ok ||
+        napi_get_typedarray_info(env, args[2], &offsets_type, &offset_count, &offsets_data, nullptr, nullptr) != napi_ok ||
+        indices_type != napi_uint32_array || offsets_type != napi_uint32_array) {
+        napi_throw_type_error(env, nullptr, "indices and offsets must be Uint32Array");
+        return false;
+    }
+    
+    void* messages_data = nullptr;
+    size_t messages_len = 0;
+    if (napi_get_buffer_info(env, args[1], &messages_data, &messages_len) != napi_ok) {
+        napi_throw_type_error(env, nullptr, "messages must be a Buffer");
+        return false;
+    }
+    
+    const uint32_t* offsets = static_cast<const uint32_t*>(offsets_data);
+    bool valid = offset_count == index_count + 1;
+    for (size_t i = 0; valid && i < index_count; ++i) {
+        valid = offsets[i] <= offsets[i + 1];
+    }
+    if (!valid || offsets[index_count] > messages_len) {
+        napi_throw_range_error(env, nullptr, "offsets must hold indices.length + 1 non-decreasing positions within messages");
+        return false;
+    }
+    
+    out->count = static_cast<uint32_t>(index_count);
+    out->indices = static_cast<const uint32_t*>(indices_data);
+    out->messages = static_cast<const char*>(messages_data);
+    out->offsets = offsets;
+    return true;
+}
+
+// Wrapper for dds_write_batch: (indices: Uint32Array, messages: Buffer, offsets: Uint32Array)
+napi_value DdsWriteBatch(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
     
-    int result = dds_take(&index_out, message_buffer, sizeof(message_buffer));
+    if (argc < 3) {
+        napi_throw_error(env, nullptr, "Expected indices, messages and offsets arguments");
+        return nullptr;
+    }
+    
+    WriteBatchArgs batch;
+    if (!GetWriteBatchArgs(env, args, &batch)) {
+        return nullptr;
+    }
+    
+    int result = dds_write_batch(batch.count, batch.indices, batch.messages, batch.offsets);
     
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Build the { success, index, message } result of a one-sample loaned take. The message
+// is decoded straight from the reader's pool (no intermediate buffer, no size limit)
+// and the loan is returned.
+napi_value TakeLoanResult(napi_env env, int result, const dds_sample_t* sample, dds_take_loan_t* loan) {
     napi_value return_obj;
     napi_create_object(env, &return_obj);
     
     napi_value success_val, index_val, message_val;
     napi_create_int32(env, result, &success_val);
-    napi_create_uint32(env, index_out, &index_val);
-    napi_create_string_utf8(env, message_buffer, NAPI_AUTO_LENGTH, &message_val);
+    napi_create_uint32(env, result ? sample->index : 0, &index_val);
+    if (result) {
+        napi_create_string_utf8(env, sample->message, sample->length, &message_val);
+        dds_take_loan_return(loan);
+    } else {
+        napi_create_string_utf8(env, "", 0, &message_val);
+    }
     
     napi_set_named_property(env, return_obj, "success", success_val);
     napi_set_named_property(env, return_obj, "index", index_val);
@@ -138,6 +365,14 @@ napi_value DdsTake(napi_env env, napi_callback_info info) {
     return return_obj;
 }
 
+// Wrapper for dds_take (legacy), through a loaned take so messages are never truncated
+napi_value DdsTake(napi_env env, napi_callback_info info) {
+    const dds_sample_t* sample = nullptr;
+    dds_take_loan_t* loan = nullptr;
+    int result = dds_take_loan(1, &sample, &loan);
+    return TakeLoanResult(env, result, sample, loan);
+}
+
 // Wrapper for dds_take_struct
 napi_value DdsTakeStruct(napi_env env, napi_callback_info info) {
     ICD_pkg::HelloWorld hello_world_out;
@@ -182,6 +417,166 @@ napi_value DdsTakeMessage(napi_env env, napi_callback_info info) {
     return return_obj;
 }
 
+// ---------------------------------------------------------------------------
+// Buffer paths: messages move as raw bytes between Buffers and the facade, with
+// no JS string, std::string or per-sample result object in between. Shared by
+// the single-topic and handle-based wrappers (a null writer/reader with
+// single_topic set selects the dds_init entities).
+// ---------------------------------------------------------------------------
+
+// (index, message: Buffer) -> 1 on success. Written as a batch of one, which takes
+// an explicit length, so the Buffer needs no terminator and may hold any bytes.
+napi_value WriteBufferImpl(napi_env env, napi_value* args, dds_writer_t* writer, bool single_topic) {
+    uint32_t index = GetUint32FromValue(env, args[0]);
+    char* data = nullptr;
+    size_t length = 0;
+    if (!GetBufferFromValue(env, args[1], "message", &data, &length)) {
+        return nullptr;
+    }
+    if (length > UINT32_MAX) {
+        napi_throw_range_error(env, nullptr, "message is too large");
+        return nullptr;
+    }
+    
+    const uint32_t offsets[2] = { 0, static_cast<uint32_t>(length) };
+    int result = single_topic
+        ? dds_write_batch(1, &index, data, offsets)
+        : dds_writer_write_batch(writer, 1, &index, data, offsets);
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// (buffer: Buffer, out: Uint32Array) -> bytes copied into buffer, or -1 if none were.
+// out[0] receives the index and out[1] the message length. A message longer than buffer
+// is not taken: -1 is returned with the length it needs in out[1], and the sample stays
+// in the reader for the next take. With no data, -1 is returned and out[1] is 0.
+// Taken as a batch of one, so the too-large case follows dds_take_batch.
+napi_value TakeIntoImpl(napi_env env, napi_value* args, dds_reader_t* reader, bool single_topic) {
+    char* data = nullptr;
+    size_t capacity = 0;
+    uint32_t* out = nullptr;
+    size_t out_length = 0;
+    if (!GetBufferFromValue(env, args[0], "buffer", &data, &capacity) ||
+        !GetUint32ArrayFromValue(env, args[1], "out", &out, &out_length)) {
+        return nullptr;
+    }
+    if (out_length < 2) {
+        napi_throw_range_error(env, nullptr, "out must hold at least 2 elements");
+        return nullptr;
+    }
+    
+    uint32_t index = 0;
+    uint32_t offsets[2] = { 0, 0 };
+    uint32_t buffer_len = static_cast<uint32_t>(std::min<size_t>(capacity, UINT32_MAX));
+    int result = single_topic
+        ? dds_take_batch(1, &index, data, buffer_len, offsets)
+        : dds_reader_take_batch(reader, 1, &index, data, buffer_len, offsets);
+    
+    int32_t copied = -1;
+    out[1] = 0;
+    if (result == 1) {
+        out[0] = index;
+        out[1] = offsets[1];
+        copied = static_cast<int32_t>(offsets[1]);
+    } else if (result < 0) {
+        out[1] = offsets[1];
+    }
+    
+    napi_value return_value;
+    napi_create_int32(env, copied, &return_value);
+    return return_value;
+}
+
+// (indices: Uint32Array, messages: Buffer, offsets: Uint32Array) -> number of samples.
+// Takes up to min(indices.length, offsets.length - 1) samples; sample i is
+// messages[offsets[i], offsets[i + 1]). Returns -1, with the length needed in
+// offsets[1], if the next message alone does not fit (see dds_take_batch).
+napi_value TakeBatchIntoImpl(napi_env env, napi_value* args, dds_reader_t* reader, bool single_topic) {
+    uint32_t* indices = nullptr;
+    uint32_t* offsets = nullptr;
+    char* messages = nullptr;
+    size_t index_count = 0, offset_count = 0, messages_len = 0;
+    if (!GetUint32ArrayFromValue(env, args[0], "indices", &indices, &index_count) ||
+        !GetBufferFromValue(env, args[1], "messages", &messages, &messages_len) ||
+        !GetUint32ArrayFromValue(env, args[2], "offsets", &offsets, &offset_count)) {
+        return nullptr;
+    }
+    if (offset_count < 2 || index_count == 0) {
+        napi_throw_range_error(env, nullptr, "indices must hold at least 1 element and offsets at least 2");
+        return nullptr;
+    }
+    
+    uint32_t max_samples = static_cast<uint32_t>(std::min(index_count, offset_count - 1));
+    uint32_t buffer_len = static_cast<uint32_t>(std::min<size_t>(messages_len, UINT32_MAX));
+    int result = single_topic
+        ? dds_take_batch(max_samples, indices, messages, buffer_len, offsets)
+        : dds_reader_take_batch(reader, max_samples, indices, messages, buffer_len, offsets);
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Wrapper for writing a Buffer message: (index, message: Buffer)
+napi_value DdsWriteBuffer(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected index and message arguments");
+        return nullptr;
+    }
+    return WriteBufferImpl(env, args, nullptr, true);
+}
+
+// Wrapper for taking one message into a Buffer: (buffer: Buffer, out: Uint32Array)
+napi_value DdsTakeInto(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected buffer and out arguments");
+        return nullptr;
+    }
+    return TakeIntoImpl(env, args, nullptr, true);
+}
+
+// Wrapper for dds_take_batch: (indices: Uint32Array, messages: Buffer, offsets: Uint32Array)
+napi_value DdsTakeBatchInto(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 3) {
+        napi_throw_error(env, nullptr, "Expected indices, messages and offsets arguments");
+        return nullptr;
+    }
+    return TakeBatchIntoImpl(env, args, nullptr, true);
+}
+
+// Wrapper for dds_wait_for_data (blocks the calling thread for up to timeoutMs; see
+// DdsWaitForDataAsync for the event loop)
+napi_value DdsWaitForData(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    int32_t timeout_ms = 0;
+    if (argc >= 1) {
+        napi_get_value_int32(env, args[0], &timeout_ms);
+    }
+    
+    int result = dds_wait_for_data(timeout_ms);
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
 // Wrapper for dds_shutdown
 napi_value DdsShutdown(napi_env env, napi_callback_info info) {
     dds_shutdown();
@@ -191,17 +586,903 @@ napi_value DdsShutdown(napi_env env, napi_callback_info info) {
     return return_value;
 }
 
+// ---------------------------------------------------------------------------
+// Statistics: snapshots become plain objects (counters as Numbers)
+// ---------------------------------------------------------------------------
+
+void SetNumberProperty(napi_env env, napi_value object, const char* name, double value) {
+    napi_value number;
+    napi_create_double(env, value, &number);
+    napi_set_named_property(env, object, name, number);
+}
+
+// { count, totalNs, maxNs, p50Ns, p99Ns, p999Ns, buckets: [[lowerNs, upperNs, count], ...] }
+// with only the non-empty buckets; the last bucket's upperNs is Infinity
+napi_value HistogramToObject(napi_env env, const dds_histogram_t& histogram) {
+    napi_value object;
+    napi_create_object(env, &object);
+    SetNumberProperty(env, object, "count", static_cast<double>(histogram.count));
+    SetNumberProperty(env, object, "totalNs", static_cast<double>(histogram.total_ns));
+    SetNumberProperty(env, object, "maxNs", static_cast<double>(histogram.max_ns));
+    SetNumberProperty(env, object, "p50Ns", static_cast<double>(dds_histogram_percentile(&histogram, 0.50)));
+    SetNumberProperty(env, object, "p99Ns", static_cast<double>(dds_histogram_percentile(&histogram, 0.99)));
+    SetNumberProperty(env, object, "p999Ns", static_cast<double>(dds_histogram_percentile(&histogram, 0.999)));
+
+    napi_value buckets;
+    napi_create_array(env, &buckets);
+    uint32_t used = 0;
+    for (uint32_t i = 0; i < DDS_HISTOGRAM_BUCKETS; ++i) {
+        if (!histogram.buckets[i]) continue;
+        uint64_t upper = dds_histogram_bucket_lower(i + 1);
+        double values[3] = {
+            static_cast<double>(dds_histogram_bucket_lower(i)),
+            upper == UINT64_MAX ? INFINITY : static_cast<double>(upper),
+            static_cast<double>(histogram.buckets[i])
+        };
+        napi_value bucket;
+        napi_create_array_with_length(env, 3, &bucket);
+        for (uint32_t j = 0; j < 3; ++j) {
+            napi_value value;
+            napi_create_double(env, values[j], &value);
+            napi_set_element(env, bucket, j, value);
+        }
+        napi_set_element(env, buckets, used++, bucket);
+    }
+    napi_set_named_property(env, object, "buckets", buckets);
+    return object;
+}
+
+napi_value WriterStatsToObject(napi_env env, const dds_writer_stats_t& stats) {
+    napi_value object;
+    napi_create_object(env, &object);
+    SetNumberProperty(env, object, "samples", static_cast<double>(stats.samples));
+    SetNumberProperty(env, object, "bytes", static_cast<double>(stats.bytes));
+    SetNumberProperty(env, object, "failures", static_cast<double>(stats.failures));
+    napi_set_named_property(env, object, "writeLatency", HistogramToObject(env, stats.write_latency));
+    SetNumberProperty(env, object, "matchedReaders", stats.matched_readers);
+    SetNumberProperty(env, object, "matchedReadersTotal", stats.matched_readers_total);
+    return object;
+}
+
+napi_value ReaderStatsToObject(napi_env env, const dds_reader_stats_t& stats) {
+    napi_value object;
+    napi_create_object(env, &object);
+    SetNumberProperty(env, object, "samples", static_cast<double>(stats.samples));
+    SetNumberProperty(env, object, "bytes", static_cast<double>(stats.bytes));
+    SetNumberProperty(env, object, "emptyTakes", static_cast<double>(stats.empty_takes));
+    napi_set_named_property(env, object, "takeLatency", HistogramToObject(env, stats.take_latency));
+    SetNumberProperty(env, object, "matchedWriters", stats.matched_writers);
+    SetNumberProperty(env, object, "matchedWritersTotal", stats.matched_writers_total);
+    SetNumberProperty(env, object, "samplesLost", stats.samples_lost);
+    SetNumberProperty(env, object, "samplesRejected", stats.samples_rejected);
+    SetNumberProperty(env, object, "lastRejectedReason", stats.last_rejected_reason);
+    SetNumberProperty(env, object, "unreadSamples", static_cast<double>(stats.unread_samples));
+    return object;
+}
+
+// Wrapper for dds_stats_enable: (enabled: boolean)
+napi_value StatsEnable(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    bool enabled = true;
+    if (argc >= 1) {
+        napi_get_value_bool(env, args[0], &enabled);
+    }
+    dds_stats_enable(enabled ? 1 : 0);
+    
+    napi_value return_value;
+    napi_get_undefined(env, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_stats_enabled
+napi_value StatsEnabled(napi_env env, napi_callback_info info) {
+    napi_value return_value;
+    napi_get_boolean(env, dds_stats_enabled() != 0, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_get_stats: { writer, reader }, or null if not initialized
+napi_value DdsGetStats(napi_env env, napi_callback_info info) {
+    dds_stats_t stats;
+    napi_value return_value;
+    if (!dds_get_stats(&stats)) {
+        napi_get_null(env, &return_value);
+        return return_value;
+    }
+    napi_create_object(env, &return_value);
+    napi_set_named_property(env, return_value, "writer", WriterStatsToObject(env, stats.writer));
+    napi_set_named_property(env, return_value, "reader", ReaderStatsToObject(env, stats.reader));
+    return return_value;
+}
+
+// Wrapper for dds_set_keep_participant: (keep: boolean)
+napi_value SetKeepParticipant(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    bool keep = true;
+    if (argc >= 1) {
+        napi_get_value_bool(env, args[0], &keep);
+    }
+    dds_set_keep_participant(keep ? 1 : 0);
+    
+    napi_value return_value;
+    napi_get_undefined(env, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_keep_participant
+napi_value KeepParticipant(napi_env env, napi_callback_info info) {
+    napi_value return_value;
+    napi_get_boolean(env, dds_keep_participant() != 0, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_get_startup_stats, null if not initialized
+napi_value DdsGetStartupStats(napi_env env, napi_callback_info info) {
+    dds_startup_stats_t stats;
+    napi_value return_value;
+    if (!dds_get_startup_stats(&stats)) {
+        napi_get_null(env, &return_value);
+        return return_value;
+    }
+    napi_create_object(env, &return_value);
+    SetNumberProperty(env, return_value, "initNs", static_cast<double>(stats.init_ns));
+    SetNumberProperty(env, return_value, "writerMatchedNs", static_cast<double>(stats.writer_matched_ns));
+    SetNumberProperty(env, return_value, "readerMatchedNs", static_cast<double>(stats.reader_matched_ns));
+    SetNumberProperty(env, return_value, "firstSampleNs", static_cast<double>(stats.first_sample_ns));
+    napi_value reused;
+    napi_get_boolean(env, stats.participant_reused != 0, &reused);
+    napi_set_named_property(env, return_value, "participantReused", reused);
+    return return_value;
+}
+
+// ---------------------------------------------------------------------------
+// Handle-based API: handles travel to JS as napi_external values (null once closed)
+// ---------------------------------------------------------------------------
+
+// Helper function to get a facade handle from napi_value (nullptr for null/undefined)
+template <typename T>
+T* GetHandleFromValue(napi_env env, napi_value value) {
+    napi_valuetype type;
+    if (napi_typeof(env, value, &type) != napi_ok || type != napi_external) {
+        return nullptr;
+    }
+    void* data = nullptr;
+    napi_get_value_external(env, value, &data);
+    return static_cast<T*>(data);
+}
+
+// Helper function to wrap a facade handle (null on failure)
+napi_value CreateHandleValue(napi_env env, void* handle) {
+    napi_value result;
+    if (handle) {
+        napi_create_external(env, handle, nullptr, nullptr, &result);
+    } else {
+        napi_get_null(env, &result);
+    }
+    return result;
+}
+
+// Wrapper for dds_participant_create_with_transport
+napi_value ParticipantCreate(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    uint32_t domain_id = argc >= 1 ? GetUint32FromValue(env, args[0]) : 0;
+    int32_t transport = DDS_TRANSPORT_DEFAULT;
+    if (argc >= 2) {
+        napi_get_value_int32(env, args[1], &transport);
+    }
+    return CreateHandleValue(env, dds_participant_create_with_transport(domain_id, transport));
+}
+
+// Wrapper for dds_participant_delete
+napi_value ParticipantDelete(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    int result = argc >= 1 ? dds_participant_delete(GetHandleFromValue<dds_participant_t>(env, args[0])) : 0;
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_writer_create_with_qos
+napi_value WriterCreate(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected participant and topic name arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[1]);
+    dds_qos_t qos;
+    const dds_qos_t* qos_ptr = argc >= 3 ? GetQosFromValue(env, args[2], &qos) : nullptr;
+    return CreateHandleValue(env, dds_writer_create_with_qos(GetHandleFromValue<dds_participant_t>(env, args[0]), topic_name.c_str(), qos_ptr));
+}
+
+// Wrapper for dds_writer_create_fixed
+napi_value WriterCreateFixed(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected participant and topic name arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[1]);
+    dds_qos_t qos;
+    const dds_qos_t* qos_ptr = argc >= 3 ? GetQosFromValue(env, args[2], &qos) : nullptr;
+    return CreateHandleValue(env, dds_writer_create_fixed(GetHandleFromValue<dds_participant_t>(env, args[0]), topic_name.c_str(), qos_ptr));
+}
+
+// Wrapper for dds_writer_delete
+napi_value WriterDelete(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc >= 1) {
+        dds_writer_delete(GetHandleFromValue<dds_writer_t>(env, args[0]));
+    }
+    
+    napi_value return_value;
+    napi_get_undefined(env, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_writer_write
+napi_value WriterWrite(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 3) {
+        napi_throw_error(env, nullptr, "Expected writer, index and message arguments");
+        return nullptr;
+    }
+    
+    uint32_t index = GetUint32FromValue(env, args[1]);
+    std::string message = GetStringFromValue(env, args[2]);
+    
+    int result = dds_writer_write(GetHandleFromValue<dds_writer_t>(env, args[0]), index, message.c_str());
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_writer_write_batch: (writer, indices: Uint32Array, messages: Buffer, offsets: Uint32Array)
+napi_value WriterWriteBatch(napi_env env, napi_callback_info info) {
+    size_t argc = 4;
+    napi_value args[4];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 4) {
+        napi_throw_error(env, nullptr, "Expected writer, indices, messages and offsets arguments");
+        return nullptr;
+    }
+    
+    WriteBatchArgs batch;
+    if (!GetWriteBatchArgs(env, args + 1, &batch)) {
+        return nullptr;
+    }
+    
+    int result = dds_writer_write_batch(GetHandleFromValue<dds_writer_t>(env, args[0]),
+                                        batch.count, batch.indices, batch.messages, batch.offsets);
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_reader_create_with_qos
+napi_value ReaderCreate(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected participant and topic name arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[1]);
+    dds_qos_t qos;
+    const dds_qos_t* qos_ptr = argc >= 3 ? GetQosFromValue(env, args[2], &qos) : nullptr;
+    return CreateHandleValue(env, dds_reader_create_with_qos(GetHandleFromValue<dds_participant_t>(env, args[0]), topic_name.c_str(), qos_ptr));
+}
+
+// Wrapper for dds_reader_create_fixed
+napi_value ReaderCreateFixed(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected participant and topic name arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[1]);
+    dds_qos_t qos;
+    const dds_qos_t* qos_ptr = argc >= 3 ? GetQosFromValue(env, args[2], &qos) : nullptr;
+    return CreateHandleValue(env, dds_reader_create_fixed(GetHandleFromValue<dds_participant_t>(env, args[0]), topic_name.c_str(), qos_ptr));
+}
+
+// Wrapper for dds_reader_create_filtered: (participant, topicName, qos, filterExpression, parameters)
+napi_value ReaderCreateFiltered(napi_env env, napi_callback_info info) {
+    size_t argc = 5;
+    napi_value args[5];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 4) {
+        napi_throw_error(env, nullptr, "Expected participant, topic name, QoS and filter expression arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[1]);
+    dds_qos_t qos;
+    const dds_qos_t* qos_ptr = GetQosFromValue(env, args[2], &qos);
+    std::string filter_expression = GetStringFromValue(env, args[3]);
+    FilterParameters parameters;
+    if (argc >= 5) GetFilterParametersFromValue(env, args[4], &parameters);
+    return CreateHandleValue(env, dds_reader_create_filtered(GetHandleFromValue<dds_participant_t>(env, args[0]), topic_name.c_str(),
+                                                             qos_ptr, filter_expression.c_str(), parameters.data(), parameters.count()));
+}
+
+// Wrapper for dds_reader_set_filter_parameters: (reader, parameters)
+napi_value ReaderSetFilterParameters(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 1) {
+        napi_throw_error(env, nullptr, "Expected reader and parameters arguments");
+        return nullptr;
+    }
+    
+    FilterParameters parameters;
+    if (argc >= 2) GetFilterParametersFromValue(env, args[1], &parameters);
+    int result = dds_reader_set_filter_parameters(GetHandleFromValue<dds_reader_t>(env, args[0]),
+                                                  parameters.data(), parameters.count());
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_writer_get_stats: (writer), null for a closed writer
+napi_value WriterGetStats(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    dds_writer_stats_t stats;
+    napi_value return_value;
+    if (argc < 1 || !dds_writer_get_stats(GetHandleFromValue<dds_writer_t>(env, args[0]), &stats)) {
+        napi_get_null(env, &return_value);
+        return return_value;
+    }
+    return WriterStatsToObject(env, stats);
+}
+
+// Wrapper for dds_reader_get_stats: (reader), null for a closed reader
+napi_value ReaderGetStats(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    dds_reader_stats_t stats;
+    napi_value return_value;
+    if (argc < 1 || !dds_reader_get_stats(GetHandleFromValue<dds_reader_t>(env, args[0]), &stats)) {
+        napi_get_null(env, &return_value);
+        return return_value;
+    }
+    return ReaderStatsToObject(env, stats);
+}
+
+// Wrapper for dds_reader_delete
+napi_value ReaderDelete(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc >= 1) {
+        dds_reader_delete(GetHandleFromValue<dds_reader_t>(env, args[0]));
+    }
+    
+    napi_value return_value;
+    napi_get_undefined(env, &return_value);
+    return return_value;
+}
+
+// Wrapper for dds_reader_take_loan (one sample)
+napi_value ReaderTake(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    const dds_sample_t* sample = nullptr;
+    dds_take_loan_t* loan = nullptr;
+    int result = argc >= 1 ? dds_reader_take_loan(GetHandleFromValue<dds_reader_t>(env, args[0]), 1, &sample, &loan) : 0;
+    return TakeLoanResult(env, result, sample, loan);
+}
+
+// Wrapper for writing a Buffer message: (writer, index, message: Buffer)
+napi_value WriterWriteBuffer(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 3) {
+        napi_throw_error(env, nullptr, "Expected writer, index and message arguments");
+        return nullptr;
+    }
+    return WriteBufferImpl(env, args + 1, GetHandleFromValue<dds_writer_t>(env, args[0]), false);
+}
+
+// Wrapper for taking one message into a Buffer: (reader, buffer: Buffer, out: Uint32Array)
+napi_value ReaderTakeInto(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 3) {
+        napi_throw_error(env, nullptr, "Expected reader, buffer and out arguments");
+        return nullptr;
+    }
+    return TakeIntoImpl(env, args + 1, GetHandleFromValue<dds_reader_t>(env, args[0]), false);
+}
+
+// Wrapper for dds_reader_take_batch: (reader, indices: Uint32Array, messages: Buffer, offsets: Uint32Array)
+napi_value ReaderTakeBatchInto(napi_env env, napi_callback_info info) {
+    size_t argc = 4;
+    napi_value args[4];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 4) {
+        napi_throw_error(env, nullptr, "Expected reader, indices, messages and offsets arguments");
+        return nullptr;
+    }
+    return TakeBatchIntoImpl(env, args + 1, GetHandleFromValue<dds_reader_t>(env, args[0]), false);
+}
+
+// Wrapper for dds_reader_wait_for_data (blocks the calling thread for up to timeoutMs; see
+// ReaderWaitForDataAsync for the event loop)
+napi_value ReaderWaitForData(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 1) {
+        napi_throw_error(env, nullptr, "Expected reader argument");
+        return nullptr;
+    }
+    
+    int32_t timeout_ms = 0;
+    if (argc >= 2) {
+        napi_get_value_int32(env, args[1], &timeout_ms);
+    }
+    
+    int result = dds_reader_wait_for_data(GetHandleFromValue<dds_reader_t>(env, args[0]), timeout_ms);
+    
+    napi_value return_value;
+    napi_create_int32(env, result, &return_value);
+    return return_value;
+}
+
+// ---------------------------------------------------------------------------
+// Async paths: subscriptions fed from the DDS listener thread through a
+// threadsafe function, and napi_async_work variants of the calls that may
+// block (participant creation, reliable writes, waits). Both keep the event loop free.
+// ---------------------------------------------------------------------------
+
+// One subscription. The DDS listener thread only queues a wakeup; samples are taken
+// on the JS thread and handed to the callback in batches of up to max_batch.
+struct Subscription {
+    napi_threadsafe_function tsfn = nullptr;
+    dds_reader_t* reader = nullptr;   // unused for the single-topic reader
+    bool single_topic = false;
+    uint32_t max_batch = 256;
+    std::atomic<bool> pending{false};
+    bool active = true;               // JS thread only
+};
+
+// Batches delivered per wakeup before yielding back to the event loop
+const int kBatchesPerWakeup = 16;
+
+void QueueSubscriptionWakeup(Subscription* subscription) {
+    // Coalesce: one queued call drains everything that arrived before it runs
+    if (!subscription->pending.exchange(true)) {
+        napi_call_threadsafe_function(subscription->tsfn, nullptr, napi_tsfn_nonblocking);
+    }
+}
+
+// dds_data_callback_t, runs on the DDS listener thread
+void OnSubscriptionData(void* context) {
+    QueueSubscriptionWakeup(static_cast<Subscription*>(context));
+}
+
+void CallSubscriptionJs(napi_env env, napi_value js_callback, void* context, void* /*data*/) {
+    Subscription* subscription = static_cast<Subscription*>(context);
+    if (!env || !subscription->active) return; // tearing down or unsubscribed
+    // Arrivals from here on queue another call, so none is missed
+    subscription->pending.store(false);
+    
+    napi_value undefined;
+    napi_get_undefined(env, &undefined);
+    for (int round = 0; round < kBatchesPerWakeup && subscription->active; ++round) {
+        const dds_sample_t* samples = nullptr;
+        dds_take_loan_t* loan = nullptr;
+        int count = subscription->single_topic
+            ? dds_take_loan(subscription->max_batch, &samples, &loan)
+            : dds_reader_take_loan(subscription->reader, subscription->max_batch, &samples, &loan);
+        if (count == 0) return;
+        
+        napi_value batch;
+        napi_create_array_with_length(env, count, &batch);
+        for (int i = 0; i < count; ++i) {
+            napi_value sample, index_val, message_val;
+            napi_create_object(env, &sample);
+            napi_create_uint32(env, samples[i].index, &index_val);
+            napi_create_string_utf8(env, samples[i].message, samples[i].length, &message_val);
+            napi_set_named_property(env, sample, "index", index_val);
+            napi_set_named_property(env, sample, "message", message_val);
+            napi_set_element(env, batch, i, sample);
+        }
+        dds_take_loan_return(loan);
+        
+        // A throwing callback surfaces as an uncaught exception; stop delivering this round
+        if (napi_call_function(env, undefined, js_callback, 1, &batch, nullptr) != napi_ok) return;
+    }
+    // More may be waiting: continue after other events had their turn
+    if (subscription->active) QueueSubscriptionWakeup(subscription);
+}
+
+void FinalizeSubscription(napi_env /*env*/, void* data, void* /*hint*/) {
+    delete static_cast<Subscription*>(data);
+}
+
+// The JS handle of a subscription. The Subscription itself is freed by its threadsafe
+// function once unsubscribed, so the handle points at this holder instead: it lives
+// until the handle is garbage collected and is cleared by the first unsubscribe.
+struct SubscriptionHandle {
+    Subscription* subscription;
+};
+
+void FinalizeSubscriptionHandle(napi_env /*env*/, void* data, void* /*hint*/) {
+    delete static_cast<SubscriptionHandle*>(data);
+}
+
+napi_value SubscribeImpl(napi_env env, napi_value callback, napi_value max_batch, dds_reader_t* reader, bool single_topic) {
+    napi_valuetype callback_type;
+    if (napi_typeof(env, callback, &callback_type) != napi_ok || callback_type != napi_function) {
+        napi_throw_type_error(env, nullptr, "callback must be a function");
+        return nullptr;
+    }
+    if (!single_topic && !reader) {
+        napi_throw_error(env, nullptr, "Reader is closed");
+        return nullptr;
+    }
+    
+    std::unique_ptr<Subscription> subscription(new Subscription());
+    subscription->reader = reader;
+    subscription->single_topic = single_topic;
+    napi_valuetype max_batch_type;
+    if (napi_typeof(env, max_batch, &max_batch_type) == napi_ok && max_batch_type == napi_number) {
+        subscription->max_batch = std::max<uint32_t>(1, GetUint32FromValue(env, max_batch));
+    }
+    
+    napi_value resource_name;
+    napi_create_string_utf8(env, "dds:subscription", NAPI_AUTO_LENGTH, &resource_name);
+    if (napi_create_threadsafe_function(env, callback, nullptr, resource_name, 0, 1,
+                                        subscription.get(), FinalizeSubscription, subscription.get(),
+                                        CallSubscriptionJs, &subscription->tsfn) != napi_ok) {
+        napi_throw_error(env, nullptr, "Failed to create subscription");
+        return nullptr;
+    }
+    Subscription* raw = subscription.release(); // owned by the threadsafe function from here on
+    if (single_topic) {
+        dds_set_data_callback(OnSubscriptionData, raw);
+    } else {
+        dds_reader_set_data_callback(reader, OnSubscriptionData, raw);
+    }
+    // Deliver whatever arrived before the callback was registered
+    QueueSubscriptionWakeup(raw);
+    
+    std::unique_ptr<SubscriptionHandle> holder(new SubscriptionHandle{ raw });
+    napi_value handle;
+    if (napi_create_external(env, holder.get(), FinalizeSubscriptionHandle, nullptr, &handle) != napi_ok) {
+        napi_throw_error(env, nullptr, "Failed to create subscription");
+        return nullptr;
+    }
+    holder.release();
+    return handle;
+}
+
+// Wrapper for dds_set_data_callback: (callback(batch), maxBatch) -> subscription handle
+napi_value DdsSubscribe(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 1) {
+        napi_throw_error(env, nullptr, "Expected callback argument");
+        return nullptr;
+    }
+    if (argc < 2) napi_get_undefined(env, &args[1]);
+    return SubscribeImpl(env, args[0], args[1], nullptr, true);
+}
+
+// Wrapper for dds_reader_set_data_callback: (reader, callback(batch), maxBatch) -> subscription handle
+napi_value ReaderSubscribe(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected reader and callback arguments");
+        return nullptr;
+    }
+    if (argc < 3) napi_get_undefined(env, &args[2]);
+    return SubscribeImpl(env, args[1], args[2], GetHandleFromValue<dds_reader_t>(env, args[0]), false);
+}
+
+// Stop a subscription: (subscription). Call before its reader is deleted; further
+// calls on the same handle do nothing.
+napi_value Unsubscribe(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    SubscriptionHandle* handle = argc >= 1 ? GetHandleFromValue<SubscriptionHandle>(env, args[0]) : nullptr;
+    Subscription* subscription = handle ? handle->subscription : nullptr;
+    if (subscription) {
+        // The release below lets the threadsafe function free the subscription
+        handle->subscription = nullptr;
+        subscription->active = false;
+        // Once these return the listener thread no longer touches the subscription
+        if (subscription->single_topic) {
+            dds_set_data_callback(nullptr, nullptr);
+        } else {
+            dds_reader_set_data_callback(subscription->reader, nullptr, nullptr);
+        }
+        napi_release_threadsafe_function(subscription->tsfn, napi_tsfn_release);
+    }
+    
+    napi_value return_value;
+    napi_get_undefined(env, &return_value);
+    return return_value;
+}
+
+// One call on a libuv worker thread, settling a promise on the JS thread
+struct AsyncCall {
+    napi_async_work work = nullptr;
+    napi_deferred deferred = nullptr;
+    std::function<void()> execute;              // worker thread
+    std::function<napi_value(napi_env)> result; // JS thread, after execute
+};
+
+napi_value QueueAsyncCall(napi_env env, const char* name, std::function<void()> execute,
+                          std::function<napi_value(napi_env)> result) {
+    std::unique_ptr<AsyncCall> call(new AsyncCall());
+    call->execute = std::move(execute);
+    call->result = std::move(result);
+    
+    napi_value promise, resource_name;
+    napi_create_promise(env, &call->deferred, &promise);
+    napi_create_string_utf8(env, name, NAPI_AUTO_LENGTH, &resource_name);
+    napi_create_async_work(env, nullptr, resource_name,
+        [](napi_env /*env*/, void* data) {
+            static_cast<AsyncCall*>(data)->execute();
+        },
+        [](napi_env env, napi_status /*status*/, void* data) {
+            std::unique_ptr<AsyncCall> done(static_cast<AsyncCall*>(data));
+            napi_resolve_deferred(env, done->deferred, done->result(env));
+            napi_delete_async_work(env, done->work);
+        },
+        call.get(), &call->work);
+    napi_queue_async_work(env, call->work);
+    call.release();
+    return promise;
+}
+
+napi_value Int32Result(napi_env env, int value) {
+    napi_value result;
+    napi_create_int32(env, value, &result);
+    return result;
+}
+
+// Async dds_init_with_qos: (topicName, domainId, qos) -> Promise<1|0>
+napi_value DdsInitAsync(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected topic name and domain ID arguments");
+        return nullptr;
+    }
+    
+    std::string topic_name = GetStringFromValue(env, args[0]);
+    uint32_t domain_id = GetUint32FromValue(env, args[1]);
+    std::shared_ptr<dds_qos_t> qos(new dds_qos_t());
+    bool has_qos = argc >= 3 && GetQosFromValue(env, args[2], qos.get()) != nullptr;
+    std::shared_ptr<int> result = std::make_shared<int>(0);
+    
+    return QueueAsyncCall(env, "dds:init",
+        [=]() { *result = dds_init_with_qos(topic_name.c_str(), domain_id, has_qos ? qos.get() : nullptr); },
+        [=](napi_env env) { return Int32Result(env, *result); });
+}
+
+// Async dds_write: (index, message) -> Promise<1|0>
+napi_value DdsWriteAsync(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 2) {
+        napi_throw_error(env, nullptr, "Expected index and message arguments");
+        return nullptr;
+    }
+    
+    uint32_t index = GetUint32FromValue(env, args[0]);
+    std::string message = GetStringFromValue(env, args[1]);
+    std::shared_ptr<int> result = std::make_shared<int>(0);
+    
+    return QueueAsyncCall(env, "dds:write",
+        [=]() { *result = dds_write(index, message.c_str()); },
+        [=](napi_env env) { return Int32Result(env, *result); });
+}
+
+// Async dds_participant_create_with_transport: (domainId, transport) -> Promise<handle|null>
+napi_value ParticipantCreateAsync(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 1) {
+        napi_throw_error(env, nullptr, "Expected domain ID argument");
+        return nullptr;
+    }
+    
+    uint32_t domain_id = GetUint32FromValue(env, args[0]);
+    int32_t transport = DDS_TRANSPORT_DEFAULT;
+    if (argc >= 2) napi_get_value_int32(env, args[1], &transport);
+    std::shared_ptr<dds_participant_t*> participant = std::make_shared<dds_participant_t*>(nullptr);
+    
+    return QueueAsyncCall(env, "dds:participantCreate",
+        [=]() { *participant = dds_participant_create_with_transport(domain_id, transport); },
+        [=](napi_env env) { return CreateHandleValue(env, *participant); });
+}
+
+// Async dds_writer_write: (writer, index, message) -> Promise<1|0>.
+// The writer must stay open until the promise settles.
+napi_value WriterWriteAsync(napi_env env, napi_callback_info info) {
+    size_t argc = 3;
+    napi_value args[3];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 3) {
+        napi_throw_error(env, nullptr, "Expected writer, index and message arguments");
+        return nullptr;
+    }
+    
+    dds_writer_t* writer = GetHandleFromValue<dds_writer_t>(env, args[0]);
+    uint32_t index = GetUint32FromValue(env, args[1]);
+    std::string message = GetStringFromValue(env, args[2]);
+    std::shared_ptr<int> result = std::make_shared<int>(0);
+    
+    return QueueAsyncCall(env, "dds:writerWrite",
+        [=]() { *result = dds_writer_write(writer, index, message.c_str()); },
+        [=](napi_env env) { return Int32Result(env, *result); });
+}
+
+// Async dds_wait_for_data: (timeoutMs) -> Promise<1|0>. The wait runs on a libuv
+// worker thread; dds_shutdown settles it early with 0.
+napi_value DdsWaitForDataAsync(napi_env env, napi_callback_info info) {
+    size_t argc = 1;
+    napi_value args[1];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    int32_t timeout_ms = 0;
+    if (argc >= 1) napi_get_value_int32(env, args[0], &timeout_ms);
+    std::shared_ptr<int> result = std::make_shared<int>(0);
+    
+    return QueueAsyncCall(env, "dds:waitForData",
+        [=]() { *result = dds_wait_for_data(timeout_ms); },
+        [=](napi_env env) { return Int32Result(env, *result); });
+}
+
+// Async dds_reader_wait_for_data: (reader, timeoutMs) -> Promise<1|0>.
+// The reader must stay open until the promise settles.
+napi_value ReaderWaitForDataAsync(napi_env env, napi_callback_info info) {
+    size_t argc = 2;
+    napi_value args[2];
+    napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    
+    if (argc < 1) {
+        napi_throw_error(env, nullptr, "Expected reader argument");
+        return nullptr;
+    }
+    
+    dds_reader_t* reader = GetHandleFromValue<dds_reader_t>(env, args[0]);
+    int32_t timeout_ms = 0;
+    if (argc >= 2) napi_get_value_int32(env, args[1], &timeout_ms);
+    std::shared_ptr<int> result = std::make_shared<int>(0);
+    
+    return QueueAsyncCall(env, "dds:readerWaitForData",
+        [=]() { *result = dds_reader_wait_for_data(reader, timeout_ms); },
+        [=](napi_env env) { return Int32Result(env, *result); });
+}
+
 // Initialize the addon
 napi_value Init(napi_env env, napi_value exports) {
     napi_property_descriptor desc[] = {
         { "init", nullptr, DdsInit, nullptr, nullptr, nullptr, napi_default, nullptr },
         { "initWithDomain", nullptr, DdsInitWithDomain, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "initWithQos", nullptr, DdsInitWithQos, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "initFiltered", nullptr, DdsInitFiltered, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "setFilterParameters", nullptr, DdsSetFilterParameters, nullptr, nullptr, nullptr, napi_default, nullptr },
         { "write", nullptr, DdsWrite, nullptr, nullptr, nullptr, napi_default, nullptr },
         { "writeStruct", nullptr, DdsWriteStruct, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writeBatch", nullptr, DdsWriteBatch, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writeBuffer", nullptr, DdsWriteBuffer, nullptr, nullptr, nullptr, napi_default, nullptr },
         { "take", nullptr, DdsTake, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "takeInto", nullptr, DdsTakeInto, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "takeBatchInto", nullptr, DdsTakeBatchInto, nullptr, nullptr, nullptr, napi_default, nullptr },
         { "takeStruct", nullptr, DdsTakeStruct, nullptr, nullptr, nullptr, napi_default, nullptr },
         { "takeMessage", nullptr, DdsTakeMessage, nullptr, nullptr, nullptr, napi_default, nullptr },
-        { "shutdown", nullptr, DdsShutdown, nullptr, nullptr, nullptr, napi_default, nullptr }
+        { "waitForData", nullptr, DdsWaitForData, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "waitForDataAsync", nullptr, DdsWaitForDataAsync, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "initAsync", nullptr, DdsInitAsync, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writeAsync", nullptr, DdsWriteAsync, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "subscribe", nullptr, DdsSubscribe, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "unsubscribe", nullptr, Unsubscribe, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "shutdown", nullptr, DdsShutdown, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "statsEnable", nullptr, StatsEnable, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "statsEnabled", nullptr, StatsEnabled, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "getStats", nullptr, DdsGetStats, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "setKeepParticipant", nullptr, SetKeepParticipant, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "keepParticipant", nullptr, KeepParticipant, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "getStartupStats", nullptr, DdsGetStartupStats, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "participantCreate", nullptr, ParticipantCreate, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "participantCreateAsync", nullptr, ParticipantCreateAsync, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "participantDelete", nullptr, ParticipantDelete, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerCreate", nullptr, WriterCreate, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerCreateFixed", nullptr, WriterCreateFixed, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerDelete", nullptr, WriterDelete, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerWrite", nullptr, WriterWrite, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerWriteBatch", nullptr, WriterWriteBatch, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerWriteBuffer", nullptr, WriterWriteBuffer, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerWriteAsync", nullptr, WriterWriteAsync, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "writerGetStats", nullptr, WriterGetStats, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerCreate", nullptr, ReaderCreate, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerCreateFixed", nullptr, ReaderCreateFixed, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerCreateFiltered", nullptr, ReaderCreateFiltered, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerSetFilterParameters", nullptr, ReaderSetFilterParameters, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerDelete", nullptr, ReaderDelete, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerTake", nullptr, ReaderTake, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerTakeInto", nullptr, ReaderTakeInto, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerTakeBatchInto", nullptr, ReaderTakeBatchInto, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerSubscribe", nullptr, ReaderSubscribe, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerWaitForData", nullptr, ReaderWaitForData, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerWaitForDataAsync", nullptr, ReaderWaitForDataAsync, nullptr, nullptr, nullptr, napi_default, nullptr },
+        { "readerGetStats", nullptr, ReaderGetStats, nullptr, nullptr, nullptr, napi_default, nullptr }
     };
     
     napi_define_properties(env, exports, sizeof(desc) / sizeof(desc[0]), desc);
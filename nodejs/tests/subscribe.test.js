@@ -0,0 +1,60 @@
+// Subscriptions push batches from the listener thread; unsubscribing must be safe
+// to repeat, since the native subscription is freed by the first call.
+const test = require('node:test');
+const assert = require('node:assert');
+const { skip, domain, topic, waitUntil, waitMatched } = require('./support');
+
+test('Subscription', { skip }, async (t) => {
+  const { Participant } = require('..');
+  const participant = new Participant(domain);
+  t.after(() => participant.close());
+  const name = topic('Subscribe');
+  const writer = participant.createWriter(name, 'keep_all');
+  const reader = participant.createReader(name, 'keep_all');
+  assert.ok(await waitMatched(writer));
+
+  await t.test('delivers written samples', async () => {
+    const received = [];
+    const subscription = reader.subscribe();
+    subscription.on('sample', (sample) => received.push(sample));
+    assert.ok(writer.write(1, 'pushed'));
+    assert.ok(await waitUntil(() => received.length === 1));
+    assert.deepStrictEqual(received[0], { index: 1, message: 'pushed' });
+    subscription.close();
+  });
+
+  await t.test('a repeated unsubscribe of the same handle does nothing', async () => {
+    const addon = require('../build/Release/dds_addon.node');
+    const handle = addon.readerSubscribe(reader.handle, () => {}, 16);
+    addon.unsubscribe(handle);
+    // Let the threadsafe function finalize, freeing the native subscription
+    await new Promise((resolve) => setImmediate(resolve));
+    addon.unsubscribe(handle);
+    addon.unsubscribe(handle);
+    // The reader accepts a new subscription afterwards
+    const subscription = reader.subscribe();
+    subscription.close();
+    subscription.close();
+  });
+});
+
+test('DDSMessaging.subscribe', { skip }, async (t) => {
+  const DDSMessaging = require('..');
+  const first = new DDSMessaging();
+  const second = new DDSMessaging();
+  const name = topic('SubscribeDefault');
+  assert.ok(first.initWithDomain(name, domain, 'keep_all'));
+  assert.ok(second.initWithDomain(name, domain, 'keep_all'));
+  t.after(() => {
+    first.shutdown();
+    second.shutdown();
+  });
+
+  await t.test('one subscription at a time across instances', () => {
+    // Both instances share the process-wide dds_init reader and its callback
+    const subscription = first.subscribe();
+    assert.throws(() => second.subscribe(), /Already subscribed/);
+    subscription.close();
+    second.subscribe().close();
+  });
+});
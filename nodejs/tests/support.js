@@ -0,0 +1,36 @@
+// Shared helpers of the addon tests. They need the built addon (npm run build)
+// and create real DDS entities on the domain in ICD_TEST_DOMAIN (default 77).
+const path = require('path');
+const fs = require('fs');
+
+const built = fs.existsSync(path.join(__dirname, '..', 'build', 'Release', 'dds_addon.node'));
+const skip = built ? false : 'addon not built (npm run build)';
+
+const domain = Number(process.env.ICD_TEST_DOMAIN || 77);
+
+let sequence = 0;
+// A topic name no other test (or concurrent run) uses
+function topic(base) {
+  return `${base}_${process.pid}_${Date.now()}_${++sequence}`;
+}
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+async function waitUntil(condition, timeoutMs = 5000) {
+  const deadline = Date.now() + timeoutMs;
+  while (!condition()) {
+    if (Date.now() > deadline) return false;
+    await sleep(5);
+  }
+  return true;
+}
+
+// Until the writer has matched the given number of readers
+function waitMatched(writer, readers = 1) {
+  return waitUntil(() => writer.stats().matchedReaders >= readers);
+}
+
+
+module.exports = { skip, domain, topic, sleep, waitUntil, waitMatched };
@@ -0,0 +1,38 @@
+// takeInto copies one message into a caller-owned Buffer. A message that does not
+// fit is not taken: -1 comes back with the length it needs, and the next take with a
+// large enough Buffer returns it whole.
+const test = require('node:test');
+const assert = require('node:assert');
+const { skip, domain, topic, waitUntil, waitMatched } = require('./support');
+
+test('Reader.takeInto', { skip }, async (t) => {
+  const { Participant } = require('..');
+  const participant = new Participant(domain);
+  t.after(() => participant.close());
+  const name = topic('TakeInto');
+  const writer = participant.createWriter(name, 'keep_all');
+  const reader = participant.createReader(name, 'keep_all');
+  assert.ok(await waitMatched(writer));
+  const out = new Uint32Array(2);
+
+  await t.test('returns -1 with an empty out when there is no data', () => {
+    out[1] = 99;
+    assert.strictEqual(reader.takeInto(Buffer.alloc(16), out), -1);
+    assert.strictEqual(out[1], 0);
+  });
+
+  await t.test('a too small buffer keeps the message for the next take', async () => {
+    const message = 'a message longer than eight bytes';
+    assert.ok(writer.writeBuffer(3, Buffer.from(message)));
+    const small = Buffer.alloc(8);
+    assert.ok(await waitUntil(() => reader.takeInto(small, out) === -1 && out[1] > 0));
+    assert.strictEqual(out[1], message.length);
+
+    const large = Buffer.alloc(out[1]);
+    assert.strictEqual(reader.takeInto(large, out), message.length);
+    assert.strictEqual(out[0], 3);
+    assert.strictEqual(large.toString(), message);
+    assert.strictEqual(reader.takeInto(large, out), -1);
+    assert.strictEqual(out[1], 0);
+  });
+});
@@ -0,0 +1,85 @@
+// waitForDataAsync waits on a worker thread: the event loop keeps running, data
+// settles the promise with true, and shutdown / close settle it with false.
+const test = require('node:test');
+const assert = require('node:assert');
+const { skip, domain, topic, sleep, waitMatched } = require('./support');
+
+test('DDSMessaging.waitForDataAsync', { skip }, async (t) => {
+  const DDSMessaging = require('..');
+  const dds = new DDSMessaging();
+  assert.ok(dds.initWithDomain(topic('WaitAsync'), domain, 'keep_all'));
+  t.after(() => dds.shutdown());
+
+  await t.test('leaves the event loop free while waiting', async () => {
+    let ticks = 0;
+    const timer = setInterval(() => { ticks += 1; }, 10);
+    const available = await dds.waitForDataAsync(200);
+    clearInterval(timer);
+    assert.strictEqual(available, false);
+    assert.ok(ticks >= 5, `only ${ticks} timer ticks during the wait`);
+  });
+
+  await t.test('settles with true once data arrives', async () => {
+    const waiting = dds.waitForDataAsync(5000);
+    await sleep(20);
+    assert.ok(dds.write(1, 'wake'));
+    assert.strictEqual(await waiting, true);
+    assert.deepStrictEqual(dds.takeMessage(), { index: 1, message: 'wake' });
+  });
+
+  await t.test('shutdown settles a pending wait with false', async () => {
+    const waiting = dds.waitForDataAsync(-1);
+    await sleep(20);
+    dds.shutdown();
+    assert.strictEqual(await waiting, false);
+  });
+});
+
+test('Reader.waitForDataAsync', { skip }, async (t) => {
+  const { Participant } = require('..');
+  const participant = new Participant(domain);
+  t.after(() => participant.close());
+  const name = topic('ReaderWaitAsync');
+  const writer = participant.createWriter(name, 'keep_all');
+  const reader = participant.createReader(name, 'keep_all');
+  assert.ok(await waitMatched(writer));
+
+  await t.test('times out with false', async () => {
+    const started = Date.now();
+    assert.strictEqual(await reader.waitForDataAsync(250), false);
+    assert.ok(Date.now() - started >= 240);
+  });
+
+  await t.test('settles with true once data arrives', async () => {
+    const waiting = reader.waitForDataAsync(-1);
+    await sleep(150);
+    assert.ok(writer.write(7, 'wake'));
+    assert.strictEqual(await waiting, true);
+    assert.deepStrictEqual(reader.take(), { index: 7, message: 'wake' });
+  });
+
+  await t.test('close settles a pending wait with false', async () => {
+    const waiting = reader.waitForDataAsync(-1);
+    await sleep(20);
+    const closing = reader.close();
+    assert.ok(closing instanceof Promise, 'close defers the native delete');
+    assert.strictEqual(await waiting, false);
+    await closing;
+  });
+});
+
+test('DDSMessaging.waitForDataAsync does not hold the libuv pool', { skip }, async (t) => {
+  const DDSMessaging = require('..');
+  const fs = require('fs');
+  const dds = new DDSMessaging();
+  assert.ok(dds.initWithDomain(topic('WaitPool'), domain, 'keep_all'));
+  t.after(() => dds.shutdown());
+
+  // More waits than the pool has threads (UV_THREADPOOL_SIZE, 4 by default)
+  const waits = Array.from({ length: 8 }, () => dds.waitForDataAsync(-1));
+  await sleep(20);
+  // fs work still completes while all of them are pending
+  await fs.promises.stat(__filename);
+  dds.shutdown();
+  assert.deepStrictEqual(await Promise.all(waits), Array(8).fill(false));
+});
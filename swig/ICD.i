@@ -1,4 +1,15 @@
+#ifdef SWIGPYTHON
+// Python applications import ICDWrapper.py, which loads this module on first use
+%module(threads="1") icd_native
+#else
 %module ICDWrapper
+#endif
+
+#ifdef SWIGPYTHON
+// Keep the GIL for the generated type accessors (too cheap to be worth a
+// release); the facade section below turns it back on for every DDS call
+%nothread;
+#endif
 
 %{
 #include "ICD.hpp"
@@ -18,20 +29,882 @@
 %include "ICDPubSubTypes.hpp"
 %include "ICDTypeObjectSupport.hpp"
 %include "ICDCdrAux.hpp"
-%include "dds_facade.hpp"
 
-// Simple C facade functions - includes both legacy and new struct-based functions
+// Loaned takes hand out raw, unterminated message pointers; the bindings use the
+// helpers below (Python) or dds_take_message (other languages) instead
+%ignore dds_sample_s;
+%ignore dds_take_loan;
+%ignore dds_reader_take_loan;
+%ignore dds_take_loan_return;
+// Native listener callbacks are not wrapped; Python watches
+// dds_set_data_notify_fd or blocks in wait_for_data instead
+%ignore dds_set_data_callback;
+%ignore dds_reader_set_data_callback;
+// Statistics snapshots are returned as dicts by the *_get_stats_dict helpers below
+%ignore dds_histogram_s;
+%ignore dds_writer_stats_s;
+%ignore dds_reader_stats_s;
+%ignore dds_stats_s;
+%ignore dds_get_stats;
+%ignore dds_writer_get_stats;
+%ignore dds_reader_get_stats;
+%ignore dds_histogram_percentile;
+%ignore dds_startup_stats_s;
+%ignore dds_get_startup_stats;
+
+// Loan pointers are owned by the writer's pool; only the facade may set them
+%immutable dds_loan_s::sample;
+%immutable dds_loan_s::message;
+
+// Simple C facade functions - includes both legacy and new struct-based functions.
+// Each of them may block in DDS (participant creation, reliable writes, waits),
+// so the Python wrappers release the GIL around the native call.
+#ifdef SWIGPYTHON
+%thread;
+// Accept QOS_PROFILES names and dicts as well as dds_qos_t (see make_qos)
+%pythonprepend dds_init_with_qos %{
+    qos = _qos_arg(qos)
+%}
+%pythonprepend dds_init_filtered %{
+    qos = _qos_arg(qos)
+%}
+// Content filter parameters from any sequence of str (or None for none)
+%typemap(in) (const char* const* parameters, uint32_t parameter_count)
+		(std::vector<std::string> strings, std::vector<const char*> pointers) {
+	if ($input != Py_None) {
+		PyObject* seq = PySequence_Fast($input, "filter parameters must be a sequence of str");
+		if (!seq) SWIG_fail;
+		Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+		for (Py_ssize_t i = 0; i < count; ++i) {
+			PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+			const char* utf8 = PyUnicode_Check(item) ? PyUnicode_AsUTF8(item) : NULL;
+			if (!utf8) {
+				if (!PyErr_Occurred()) PyErr_SetString(PyExc_TypeError, "filter parameters must be str");
+				Py_DECREF(seq);
+				SWIG_fail;
+			}
+			strings.push_back(utf8);
+		}
+		Py_DECREF(seq);
+		for (size_t i = 0; i < strings.size(); ++i) pointers.push_back(strings[i].c_str());
+	}
+	$1 = ($1_ltype)(pointers.empty() ? NULL : &pointers[0]);
+	$2 = (uint32_t)pointers.size();
+}
+#endif
 %include "dds_facade.hpp"
 
-// Inline helper to expose take with returned string (simplifies C# usage)
+// Inline helper to expose take with returned string (simplifies C# usage).
+// Returns the full message, whatever its size.
 %inline %{
 const char* dds_take_string(unsigned int* index_out) {
-	static thread_local std::string storage;
-	char buf[1024];
-	if (dds_take(index_out, buf, (int)sizeof(buf)) == 1) {
-		storage = buf;
-		return storage.c_str();
+	uint32_t index = 0;
+	const char* message = dds_take_message(&index);
+	if (message && index_out) *index_out = index;
+	return message;
+}
+%}
+
+#ifdef SWIGPYTHON
+// The helpers below build Python objects, so they keep the GIL and release it
+// themselves around the native facade call
+%nothread;
+
+%{
+// ICDWrapper.Sample: compact (index, message) value built natively, a struct
+// sequence (tuple subclass) with attribute access and no C++ object behind it,
+// unlike the HelloWorld proxy
+static PyTypeObject dds_sample_type;
+
+static PyStructSequence_Field dds_sample_fields[] = {
+	{(char*)"index", (char*)"sample index"},
+	{(char*)"message", (char*)"message text (bytes when taken raw)"},
+	{NULL, NULL}
+};
+
+static PyStructSequence_Desc dds_sample_desc = {
+	(char*)"ICDWrapper.Sample",
+	(char*)"Sample(index, message): immutable HelloWorld value; unpacks like an (index, message) tuple",
+	dds_sample_fields,
+	2
+};
+
+// Steals message; NULL with the error set on failure
+static PyObject* dds_make_sample(uint32_t index, PyObject* message, bool as_sample) {
+	if (!as_sample) return Py_BuildValue("(kN)", (unsigned long)index, message);
+	PyObject* index_obj = PyLong_FromUnsignedLong(index);
+	PyObject* sample = index_obj ? PyStructSequence_New(&dds_sample_type) : NULL;
+	if (!sample) {
+		Py_XDECREF(index_obj);
+		Py_DECREF(message);
+		return NULL;
+	}
+	PyStructSequence_SET_ITEM(sample, 0, index_obj);
+	PyStructSequence_SET_ITEM(sample, 1, message);
+	return sample;
+}
+
+// Shared by the single-topic and handle-based batch helpers below; a null
+// reader/writer selects the single-topic facade entities.
+// Samples are loaned, so each message is decoded (or copied into bytes when
+// raw) straight from the reader's pool: one copy and no size limit. Items are
+// (index, message) tuples, or Sample values when as_sample is set.
+static PyObject* dds_take_batch_py(dds_reader_t* reader, unsigned int max_samples, bool raw, bool as_sample = false) {
+	const dds_sample_t* samples = NULL;
+	dds_take_loan_t* loan = NULL;
+	int count;
+	Py_BEGIN_ALLOW_THREADS
+	count = reader
+		? dds_reader_take_loan(reader, max_samples, &samples, &loan)
+		: dds_take_loan(max_samples, &samples, &loan);
+	Py_END_ALLOW_THREADS
+
+	PyObject* result = PyList_New(count);
+	for (int i = 0; result && i < count; ++i) {
+		PyObject* message = raw
+			? PyBytes_FromStringAndSize(samples[i].message, (Py_ssize_t)samples[i].length)
+			: PyUnicode_DecodeUTF8(samples[i].message, (Py_ssize_t)samples[i].length, "surrogateescape");
+		PyObject* item = message ? dds_make_sample(samples[i].index, message, as_sample) : NULL;
+		if (!item) { Py_CLEAR(result); break; }
+		PyList_SET_ITEM(result, i, item);
+	}
+	if (count > 0) dds_take_loan_return(loan);
+	return result;
+}
+
+static int dds_get_uint32_buffer(PyObject* obj, Py_buffer* view, const char* name, int flags = 0) {
+	if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | flags) != 0) return 0;
+	if (view->itemsize != 4 || !view->format || (strcmp(view->format, "I") != 0 && strcmp(view->format, "L") != 0)) {
+		PyErr_Format(PyExc_TypeError, "%s must be a contiguous uint32 buffer (e.g. array('I'))", name);
+		PyBuffer_Release(view);
+		return 0;
+	}
+	return 1;
+}
+
+// Columnar take into caller-owned writable buffers (numpy arrays, array('I'),
+// bytearray, ...): no Python object is created per sample.
+static PyObject* dds_take_batch_into_py(dds_reader_t* reader, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	Py_buffer idx, msg, off;
+	if (!dds_get_uint32_buffer(indices, &idx, "indices", PyBUF_WRITABLE)) return NULL;
+	if (!dds_get_uint32_buffer(offsets, &off, "offsets", PyBUF_WRITABLE)) { PyBuffer_Release(&idx); return NULL; }
+	if (PyObject_GetBuffer(messages, &msg, PyBUF_SIMPLE | PyBUF_WRITABLE) != 0) { PyBuffer_Release(&idx); PyBuffer_Release(&off); return NULL; }
+
+	PyObject* result = NULL;
+	Py_ssize_t index_count = idx.len / 4;
+	Py_ssize_t offset_count = off.len / 4;
+	if (index_count < 1 || offset_count < 2) {
+		PyErr_SetString(PyExc_ValueError, "indices must hold at least 1 entry and offsets at least 2");
+	} else {
+		uint32_t max_samples = (uint32_t)(index_count < offset_count - 1 ? index_count : offset_count - 1);
+		uint32_t buffer_len = (uint32_t)(msg.len < (Py_ssize_t)UINT32_MAX ? msg.len : (Py_ssize_t)UINT32_MAX);
+		int count;
+		Py_BEGIN_ALLOW_THREADS
+		count = reader
+			? dds_reader_take_batch(reader, max_samples, (uint32_t*)idx.buf, (char*)msg.buf, buffer_len, (uint32_t*)off.buf)
+			: dds_take_batch(max_samples, (uint32_t*)idx.buf, (char*)msg.buf, buffer_len, (uint32_t*)off.buf);
+		Py_END_ALLOW_THREADS
+		result = PyLong_FromLong(count);
+	}
+	PyBuffer_Release(&idx);
+	PyBuffer_Release(&off);
+	PyBuffer_Release(&msg);
+	return result;
+}
+
+static PyObject* dds_write_batch_py(dds_writer_t* writer, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	Py_buffer idx, msg, off;
+	if (!dds_get_uint32_buffer(indices, &idx, "indices")) return NULL;
+	if (!dds_get_uint32_buffer(offsets, &off, "offsets")) { PyBuffer_Release(&idx); return NULL; }
+	if (PyObject_GetBuffer(messages, &msg, PyBUF_SIMPLE) != 0) { PyBuffer_Release(&idx); PyBuffer_Release(&off); return NULL; }
+
+	PyObject* result = NULL;
+	uint32_t count = (uint32_t)(idx.len / 4);
+	const uint32_t* offs = (const uint32_t*)off.buf;
+	bool valid = (uint32_t)(off.len / 4) == count + 1;
+	for (uint32_t i = 0; valid && i < count; ++i) valid = offs[i] <= offs[i + 1];
+	if (!valid || offs[count] > (uint64_t)msg.len) {
+		PyErr_SetString(PyExc_ValueError, "offsets must hold len(indices) + 1 non-decreasing positions within messages");
+	} else {
+		int written;
+		Py_BEGIN_ALLOW_THREADS
+		written = writer
+			? dds_writer_write_batch(writer, count, (const uint32_t*)idx.buf, (const char*)msg.buf, offs)
+			: dds_write_batch(count, (const uint32_t*)idx.buf, (const char*)msg.buf, offs);
+		Py_END_ALLOW_THREADS
+		result = PyLong_FromLong(written);
+	}
+	PyBuffer_Release(&idx);
+	PyBuffer_Release(&off);
+	PyBuffer_Release(&msg);
+	return result;
+}
+%}
+
+// One native call drains up to max_samples samples and returns them as a list
+// of (index, message) tuples; message is a str, or bytes when raw is true.
+// Messages are returned in full, whatever their size.
+%inline %{
+PyObject* dds_take_batch_list(unsigned int max_samples, bool raw = false) {
+	return dds_take_batch_py(NULL, max_samples, raw);
+}
+
+PyObject* dds_reader_take_batch_list(dds_reader_t* reader, unsigned int max_samples, bool raw = false) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	return dds_take_batch_py(reader, max_samples, raw);
+}
+%}
+
+// Same as dds_take_batch_list, but each item is a Sample with index and
+// message attributes instead of a plain tuple
+%inline %{
+PyObject* dds_take_samples(unsigned int max_samples = 256, bool raw = false) {
+	return dds_take_batch_py(NULL, max_samples, raw, true);
+}
+
+PyObject* dds_reader_take_samples(dds_reader_t* reader, unsigned int max_samples = 256, bool raw = false) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	return dds_take_batch_py(reader, max_samples, raw, true);
+}
+%}
+
+%init %{
+	if (PyStructSequence_InitType2(&dds_sample_type, &dds_sample_desc) != 0) {
+#if PY_VERSION_HEX >= 0x03000000
+		return NULL;
+#else
+		return;
+#endif
+	}
+	Py_INCREF((PyObject*)&dds_sample_type);
+	PyDict_SetItemString(d, "Sample", (PyObject*)&dds_sample_type);
+%}
+
+// Batched take straight into writable buffers: up to min(len(indices),
+// len(offsets) - 1) samples, message i in messages[offsets[i]:offsets[i + 1]].
+// As with dds_take_batch, the batch stops before a message that does not fit in
+// the remaining space. Returns the sample count, or -1 if the next message alone
+// does not fit, with its length in offsets[1]. See icd_columns.py.
+%inline %{
+PyObject* dds_take_batch_into(PyObject* indices, PyObject* messages, PyObject* offsets) {
+	return dds_take_batch_into_py(NULL, indices, messages, offsets);
+}
+
+PyObject* dds_reader_take_batch_into(dds_reader_t* reader, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	return dds_take_batch_into_py(reader, indices, messages, offsets);
+}
+%}
+
+// Batched publish from buffer-protocol objects, e.g. array('I') for indices and
+// offsets plus a bytes blob of packed UTF-8 messages. The GIL is released for
+// the native loop.
+%inline %{
+PyObject* dds_write_batch_buffers(PyObject* indices, PyObject* messages, PyObject* offsets) {
+	return dds_write_batch_py(NULL, indices, messages, offsets);
+}
+
+PyObject* dds_writer_write_batch_buffers(dds_writer_t* writer, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	if (!writer) {
+		PyErr_SetString(PyExc_ValueError, "writer is closed");
+		return NULL;
+	}
+	return dds_write_batch_py(writer, indices, messages, offsets);
+}
+%}
+
+// Writable memoryview over the message bytes of a loaned sample (dds_writer_loan).
+// The view aliases writer-owned memory: release it before the loan is written
+// or discarded.
+%inline %{
+PyObject* dds_loan_buffer(dds_loan_t* loan) {
+	if (!loan || !loan->sample) {
+		PyErr_SetString(PyExc_ValueError, "no sample is loaned");
+		return NULL;
 	}
-	return (const char*)0;
+	return PyMemoryView_FromMemory(loan->message, (Py_ssize_t)loan->capacity, PyBUF_WRITE);
 }
-%}
\ No newline at end of file
+%}
+
+// Newest message of the instance for index on a keyed reader, without taking
+// it: str (bytes when raw), or None if the reader holds no data for index.
+// Small messages are read into a stack buffer; longer ones are re-read at
+// their full length.
+%inline %{
+PyObject* dds_reader_read_instance_message(dds_reader_t* reader, uint32_t index, bool raw = false) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	char stack_buffer[1024];
+	char* buffer = stack_buffer;
+	uint32_t buffer_len = sizeof(stack_buffer);
+	uint32_t length = 0;
+	int found;
+	for (;;) {
+		Py_BEGIN_ALLOW_THREADS
+		found = dds_reader_read_instance(reader, index, buffer, buffer_len, &length);
+		Py_END_ALLOW_THREADS
+		// The value may have been replaced by a longer one in between: retry until it fits
+		if (!found || length < buffer_len) break;
+		if (buffer != stack_buffer) PyMem_Free(buffer);
+		buffer_len = length + 1;
+		buffer = (char*)PyMem_Malloc(buffer_len);
+		if (!buffer) return PyErr_NoMemory();
+	}
+	PyObject* result;
+	if (!found) {
+		Py_INCREF(Py_None);
+		result = Py_None;
+	} else {
+		result = raw
+			? PyBytes_FromStringAndSize(buffer, (Py_ssize_t)length)
+			: PyUnicode_DecodeUTF8(buffer, (Py_ssize_t)length, "surrogateescape");
+	}
+	if (buffer != stack_buffer) PyMem_Free(buffer);
+	return result;
+}
+%}
+
+// Statistics snapshots (dds_stats_enable) as dicts. Latency histograms become
+// {"count", "total_ns", "max_ns", "p50_ns", "p99_ns", "p999_ns", "buckets"}, where
+// buckets lists (lower_ns, upper_ns, count) for the non-empty buckets only.
+%{
+static PyObject* dds_histogram_dict(const dds_histogram_t& histogram) {
+	PyObject* buckets = PyList_New(0);
+	if (!buckets) return NULL;
+	for (uint32_t i = 0; i < DDS_HISTOGRAM_BUCKETS; ++i) {
+		if (!histogram.buckets[i]) continue;
+		PyObject* bucket = Py_BuildValue("(KKK)", (unsigned long long)dds_histogram_bucket_lower(i),
+			(unsigned long long)dds_histogram_bucket_lower(i + 1), (unsigned long long)histogram.buckets[i]);
+		if (!bucket || PyList_Append(buckets, bucket) < 0) {
+			Py_XDECREF(bucket);
+			Py_DECREF(buckets);
+			return NULL;
+		}
+		Py_DECREF(bucket);
+	}
+	return Py_BuildValue("{s:K,s:K,s:K,s:K,s:K,s:K,s:N}",
+		"count", (unsigned long long)histogram.count,
+		"total_ns", (unsigned long long)histogram.total_ns,
+		"max_ns", (unsigned long long)histogram.max_ns,
+		"p50_ns", (unsigned long long)dds_histogram_percentile(&histogram, 0.50),
+		"p99_ns", (unsigned long long)dds_histogram_percentile(&histogram, 0.99),
+		"p999_ns", (unsigned long long)dds_histogram_percentile(&histogram, 0.999),
+		"buckets", buckets);
+}
+
+static PyObject* dds_writer_stats_dict(const dds_writer_stats_t& stats) {
+	PyObject* latency = dds_histogram_dict(stats.write_latency);
+	if (!latency) return NULL;
+	return Py_BuildValue("{s:K,s:K,s:K,s:N,s:i,s:i}",
+		"samples", (unsigned long long)stats.samples,
+		"bytes", (unsigned long long)stats.bytes,
+		"failures", (unsigned long long)stats.failures,
+		"write_latency", latency,
+		"matched_readers", (int)stats.matched_readers,
+		"matched_readers_total", (int)stats.matched_readers_total);
+}
+
+static PyObject* dds_reader_stats_dict(const dds_reader_stats_t& stats) {
+	PyObject* latency = dds_histogram_dict(stats.take_latency);
+	if (!latency) return NULL;
+	return Py_BuildValue("{s:K,s:K,s:K,s:N,s:i,s:i,s:i,s:I,s:i,s:K}",
+		"samples", (unsigned long long)stats.samples,
+		"bytes", (unsigned long long)stats.bytes,
+		"empty_takes", (unsigned long long)stats.empty_takes,
+		"take_latency", latency,
+		"matched_writers", (int)stats.matched_writers,
+		"matched_writers_total", (int)stats.matched_writers_total,
+		"samples_lost", (int)stats.samples_lost,
+		"samples_rejected", (unsigned int)stats.samples_rejected,
+		"last_rejected_reason", (int)stats.last_rejected_reason,
+		"unread_samples", (unsigned long long)stats.unread_samples);
+}
+%}
+
+%inline %{
+// {"writer": {...}, "reader": {...}} for the dds_init endpoints, or None if not initialized
+PyObject* dds_get_stats_dict() {
+	dds_stats_t stats;
+	int ok;
+	Py_BEGIN_ALLOW_THREADS
+	ok = dds_get_stats(&stats);
+	Py_END_ALLOW_THREADS
+	if (!ok) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+	PyObject* writer = dds_writer_stats_dict(stats.writer);
+	if (!writer) return NULL;
+	PyObject* reader = dds_reader_stats_dict(stats.reader);
+	if (!reader) {
+		Py_DECREF(writer);
+		return NULL;
+	}
+	return Py_BuildValue("{s:N,s:N}", "writer", writer, "reader", reader);
+}
+
+PyObject* dds_writer_get_stats_dict(dds_writer_t* writer) {
+	if (!writer) {
+		PyErr_SetString(PyExc_ValueError, "writer is closed");
+		return NULL;
+	}
+	dds_writer_stats_t stats;
+	Py_BEGIN_ALLOW_THREADS
+	dds_writer_get_stats(writer, &stats);
+	Py_END_ALLOW_THREADS
+	return dds_writer_stats_dict(stats);
+}
+
+PyObject* dds_reader_get_stats_dict(dds_reader_t* reader) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	dds_reader_stats_t stats;
+	Py_BEGIN_ALLOW_THREADS
+	dds_reader_get_stats(reader, &stats);
+	Py_END_ALLOW_THREADS
+	return dds_reader_stats_dict(stats);
+}
+
+// Startup timings of the last dds_init as a dict, or None if not initialized
+PyObject* dds_get_startup_stats_dict() {
+	dds_startup_stats_t stats;
+	int ok;
+	Py_BEGIN_ALLOW_THREADS
+	ok = dds_get_startup_stats(&stats);
+	Py_END_ALLOW_THREADS
+	if (!ok) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+	return Py_BuildValue("{s:K,s:K,s:K,s:K,s:O}",
+		"init_ns", (unsigned long long)stats.init_ns,
+		"writer_matched_ns", (unsigned long long)stats.writer_matched_ns,
+		"reader_matched_ns", (unsigned long long)stats.reader_matched_ns,
+		"first_sample_ns", (unsigned long long)stats.first_sample_ns,
+		"participant_reused", stats.participant_reused ? Py_True : Py_False);
+}
+%}
+
+%pythoncode %{
+Sample = _icd_native.Sample
+
+
+def _pack_batch(samples):
+    from array import array
+    indices = array('I')
+    offsets = array('I', [0])
+    chunks = []
+    position = 0
+    for index, message in samples:
+        data = message.encode('utf-8') if isinstance(message, str) else bytes(message)
+        indices.append(index)
+        chunks.append(data)
+        position += len(data)
+        offsets.append(position)
+    return indices, b''.join(chunks), offsets
+
+
+def dds_write_batch_list(samples):
+    """Publish an iterable of (index, message) pairs in one native call.
+
+    Returns the number of samples written.
+    """
+    return dds_write_batch_buffers(*_pack_batch(samples))
+
+
+_QOS_ENUM_FIELDS = {
+    'reliability': {'best_effort': DDS_RELIABILITY_BEST_EFFORT, 'reliable': DDS_RELIABILITY_RELIABLE},
+    'durability': {'volatile': DDS_DURABILITY_VOLATILE, 'transient_local': DDS_DURABILITY_TRANSIENT_LOCAL},
+    'history_kind': {'keep_last': DDS_HISTORY_KEEP_LAST, 'keep_all': DDS_HISTORY_KEEP_ALL},
+    'publish_mode': {'synchronous': DDS_PUBLISH_SYNCHRONOUS, 'asynchronous': DDS_PUBLISH_ASYNCHRONOUS},
+    'data_sharing': {'auto': DDS_DATA_SHARING_AUTO, 'on': DDS_DATA_SHARING_ON, 'off': DDS_DATA_SHARING_OFF},
+}
+
+_QOS_NUMBER_FIELDS = ('history_depth', 'max_samples', 'max_instances', 'max_samples_per_instance')
+
+# Named presets accepted by make_qos and the qos= arguments below
+QOS_PROFILES = {
+    'default': {},
+    'reliable': dict(reliability='reliable', history_kind='keep_last', history_depth=100),
+    'best_effort': dict(reliability='best_effort', history_kind='keep_last', history_depth=1),
+    'keep_all': dict(reliability='reliable', history_kind='keep_all'),
+    'transient_local': dict(reliability='reliable', durability='transient_local',
+                            history_kind='keep_last', history_depth=100),
+    'async_reliable': dict(reliability='reliable', history_kind='keep_last', history_depth=1000,
+                           publish_mode='asynchronous'),
+}
+
+
+def make_qos(profile=None, **fields):
+    """Build a dds_qos_t from a QOS_PROFILES name and/or field overrides.
+
+    Enum fields take the DDS_* constants or their lower-case names, e.g.
+    make_qos('reliable', history_depth=1000) or make_qos(reliability='best_effort').
+    A dds_qos_t is returned unchanged; None gives all defaults.
+    """
+    if isinstance(profile, dds_qos_t):
+        if fields:
+            raise TypeError("cannot combine a dds_qos_t with field overrides")
+        return profile
+    if profile is None:
+        settings = {}
+    elif isinstance(profile, dict):
+        settings = dict(profile)
+    elif profile in QOS_PROFILES:
+        settings = dict(QOS_PROFILES[profile])
+    else:
+        raise ValueError("unknown QoS profile %r (expected one of %s)" % (profile, ", ".join(QOS_PROFILES)))
+    settings.update(fields)
+
+    qos = dds_qos_t()
+    for field, value in settings.items():
+        if field in _QOS_ENUM_FIELDS:
+            names = _QOS_ENUM_FIELDS[field]
+            if isinstance(value, str):
+                if value not in names:
+                    raise ValueError("invalid value %r for QoS %s (expected one of %s)" % (value, field, ", ".join(names)))
+                value = names[value]
+        elif field not in _QOS_NUMBER_FIELDS:
+            raise TypeError("unknown QoS field %r" % field)
+        setattr(qos, field, value)
+    return qos
+
+
+def _qos_arg(qos):
+    return None if qos is None else make_qos(qos)
+
+
+TRANSPORTS = {
+    'default': DDS_TRANSPORT_DEFAULT,
+    'udp': DDS_TRANSPORT_UDP,
+    'shm': DDS_TRANSPORT_SHM,
+    'large_data': DDS_TRANSPORT_LARGE_DATA,
+}
+
+
+class Participant(object):
+    """DomainParticipant shared by any number of topic writers and readers.
+
+    Unlike dds_init, creating writers/readers on new topics does not tear
+    down the participant, so no new discovery round is needed. transport is
+    a TRANSPORTS name or DDS_TRANSPORT_* value ('shm' keeps traffic on the
+    host in shared memory).
+    """
+
+    def __init__(self, domain_id=0, transport='default'):
+        import weakref
+        transport_id = TRANSPORTS.get(transport, transport)
+        if transport_id not in TRANSPORTS.values():
+            raise ValueError("unknown transport %r (expected one of %s)" % (transport, ", ".join(TRANSPORTS)))
+        self._handle = dds_participant_create_with_transport(domain_id, transport_id)
+        if self._handle is None:
+            raise RuntimeError("failed to create DDS participant on domain %d" % domain_id)
+        self.domain_id = domain_id
+        self.transport = transport
+        self._endpoints = weakref.WeakSet()
+
+    def create_writer(self, topic_name, qos=None):
+        """qos: QOS_PROFILES name, dict of fields or dds_qos_t (None for defaults)."""
+        return Writer(self, topic_name, qos)
+
+    def create_reader(self, topic_name, qos=None):
+        """qos: QOS_PROFILES name, dict of fields or dds_qos_t (None for defaults)."""
+        return Reader(self, topic_name, qos)
+
+    def create_fixed_writer(self, topic_name, qos=None):
+        """Writer of fixed-size samples (messages up to DDS_FIXED_MESSAGE_CAPACITY bytes),
+        eligible for data-sharing delivery between processes on this host."""
+        return Writer(self, topic_name, qos, fixed=True)
+
+    def create_fixed_reader(self, topic_name, qos=None):
+        """Reader counterpart of create_fixed_writer."""
+        return Reader(self, topic_name, qos, fixed=True)
+
+    def create_keyed_writer(self, topic_name, qos=None):
+        """Writer of keyed samples: each index is its own instance, so history and
+        resource limits apply per index."""
+        return Writer(self, topic_name, qos, keyed=True)
+
+    def create_keyed_reader(self, topic_name, qos=None):
+        """Reader counterpart of create_keyed_writer; see Reader.read_instance and LatestValueCache."""
+        return Reader(self, topic_name, qos, keyed=True)
+
+    def create_filtered_reader(self, topic_name, filter_expression, parameters=(), qos=None):
+        """Reader that only receives samples matching filter_expression, a DDS-SQL
+        condition such as "index BETWEEN %0 AND %1" with parameters ("100", "199");
+        see Reader.set_filter_parameters."""
+        return Reader(self, topic_name, qos, filter_expression=filter_expression, parameters=parameters)
+
+    def close(self):
+        """Close all writers/readers created from this participant, then the participant."""
+        if self._handle is None:
+            return
+        for endpoint in list(self._endpoints):
+            endpoint.close()
+        dds_participant_delete(self._handle)
+        self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class Loan(object):
+    """Sample loaned from a fixed-size Writer's pool.
+
+    Fill buffer (a writable memoryview of DDS_FIXED_MESSAGE_CAPACITY bytes)
+    in place, then write(index, length) publishes it without copying. Leaving
+    the with-block without writing discards the loan. buffer is released on
+    write/discard; do not keep slices of it past that point.
+    """
+
+    def __init__(self, writer):
+        self._writer = writer
+        self._loan = dds_loan_t()
+        if dds_writer_loan(writer._handle, self._loan) != 1:
+            raise RuntimeError("failed to loan a sample on topic %r" % writer.topic_name)
+        self.buffer = dds_loan_buffer(self._loan)
+        writer._loans.add(self)
+
+    @property
+    def capacity(self):
+        return self._loan.capacity
+
+    def write(self, index, length):
+        """Publish buffer[:length]; the loan is released either way."""
+        self._release()
+        return dds_writer_write_loan(self._writer._handle, self._loan, index, length) == 1
+
+    def discard(self):
+        if self.buffer is not None:
+            self._release()
+            dds_writer_discard_loan(self._writer._handle, self._loan)
+
+    def _release(self):
+        if self.buffer is None:
+            raise ValueError("loan already written or discarded")
+        self.buffer.release()
+        self.buffer = None
+        self._writer._loans.discard(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.discard()
+
+
+class Writer(object):
+    """HelloWorld writer on one topic of a Participant."""
+
+    def __init__(self, participant, topic_name, qos=None, fixed=False, keyed=False):
+        import weakref
+        if fixed and keyed:
+            raise ValueError("a writer is either fixed-size or keyed")
+        self.participant = participant
+        self.topic_name = topic_name
+        self.fixed = fixed
+        self.keyed = keyed
+        create = dds_writer_create_fixed if fixed else dds_writer_create_keyed if keyed else dds_writer_create_with_qos
+        self._handle = create(participant._handle, topic_name, _qos_arg(qos))
+        if self._handle is None:
+            raise RuntimeError("failed to create DDS writer on topic %r" % topic_name)
+        self._loans = weakref.WeakSet()
+        participant._endpoints.add(self)
+
+    def loan(self):
+        """Loan a sample to fill in place (fixed-size writers only); see Loan."""
+        if not self.fixed:
+            raise TypeError("only fixed-size writers can loan samples")
+        return Loan(self)
+
+    def write_loaned(self, index, data):
+        """Publish a bytes-like message through a loan: one copy, straight into the pool."""
+        with self.loan() as loan:
+            length = len(data)
+            if length > loan.capacity:
+                raise ValueError("message of %d bytes exceeds the %d byte capacity" % (length, loan.capacity))
+            loan.buffer[:length] = data
+            return loan.write(index, length)
+
+    def write(self, index, message):
+        return dds_writer_write(self._handle, index, message) == 1
+
+    def write_struct(self, hello_world):
+        return dds_writer_write_struct(self._handle, hello_world) == 1
+
+    def write_batch(self, samples):
+        """Publish an iterable of (index, message) pairs; returns the number written."""
+        return dds_writer_write_batch_buffers(self._handle, *_pack_batch(samples))
+
+    def write_batch_buffers(self, indices, messages, offsets):
+        return dds_writer_write_batch_buffers(self._handle, indices, messages, offsets)
+
+    def stats(self):
+        """Counters, write latency histogram and matched readers as a dict (see dds_stats_enable)."""
+        return dds_writer_get_stats_dict(self._handle)
+
+    def close(self):
+        if self._handle is not None:
+            for loan in list(self._loans):
+                loan.discard()
+            dds_writer_delete(self._handle)
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class Reader(object):
+    """HelloWorld reader on one topic of a Participant."""
+
+    def __init__(self, participant, topic_name, qos=None, fixed=False, keyed=False, filter_expression=None, parameters=()):
+        if fixed + keyed + (filter_expression is not None) > 1:
+            raise ValueError("a reader is either fixed-size, keyed or content-filtered")
+        self.participant = participant
+        self.topic_name = topic_name
+        self.fixed = fixed
+        self.keyed = keyed
+        self.filter_expression = filter_expression
+        if filter_expression is not None:
+            self._handle = dds_reader_create_filtered(participant._handle, topic_name, _qos_arg(qos),
+                                                      filter_expression, parameters)
+        else:
+            create = dds_reader_create_fixed if fixed else dds_reader_create_keyed if keyed else dds_reader_create_with_qos
+            self._handle = create(participant._handle, topic_name, _qos_arg(qos))
+        if self._handle is None:
+            raise RuntimeError("failed to create DDS reader on topic %r" % topic_name)
+        participant._endpoints.add(self)
+
+    def take(self):
+        """Return one (index, message) tuple, or None if no data is available."""
+        batch = dds_reader_take_batch_list(self._handle, 1)
+        return batch[0] if batch else None
+
+    def take_struct(self, hello_world_out):
+        return dds_reader_take_struct(self._handle, hello_world_out) == 1
+
+    def take_bytes(self):
+        """Return one (index, bytes) tuple, or None if no data is available."""
+        batch = dds_reader_take_batch_list(self._handle, 1, True)
+        return batch[0] if batch else None
+
+    def take_batch(self, max_samples=256, raw=False):
+        """Return up to max_samples (index, message) tuples, messages in full; bytes when raw."""
+        return dds_reader_take_batch_list(self._handle, max_samples, raw)
+
+    def take_samples(self, max_samples=256, raw=False):
+        """Return up to max_samples Sample values (sample.index, sample.message)."""
+        return dds_reader_take_samples(self._handle, max_samples, raw)
+
+    def take_batch_into(self, indices, messages, offsets):
+        """Take into writable uint32 indices/offsets and a bytes buffer; returns the count.
+
+        Returns -1 if the next message alone does not fit in messages; offsets[1]
+        then holds its length.
+        """
+        return dds_reader_take_batch_into(self._handle, indices, messages, offsets)
+
+    def set_filter_parameters(self, parameters):
+        """Replace the filter parameters of a content-filtered reader; the expression is kept.
+
+        Raises ValueError if they are rejected (the previous ones stay in effect).
+        """
+        if self.filter_expression is None:
+            raise TypeError("only content-filtered readers have filter parameters")
+        if dds_reader_set_filter_parameters(self._handle, parameters) != 1:
+            raise ValueError("invalid filter parameters %r for %r" % (list(parameters), self.filter_expression))
+
+    def lookup_instance(self, index):
+        """True if this keyed reader currently holds the instance for index."""
+        return dds_reader_lookup_instance(self._handle, index) == 1
+
+    def read_instance(self, index, raw=False):
+        """Newest message for index without taking it (keyed readers only); None if absent."""
+        if not self.keyed:
+            raise TypeError("only keyed readers have instances")
+        return dds_reader_read_instance_message(self._handle, index, raw)
+
+    def wait_for_data(self, timeout_ms=-1):
+        """Block (GIL released) until data is available; False on timeout or close."""
+        return dds_reader_wait_for_data(self._handle, timeout_ms) == 1
+
+    def stats(self):
+        """Counters, take latency histogram, matched writers, lost/rejected and unread samples as a dict."""
+        return dds_reader_get_stats_dict(self._handle)
+
+    def set_data_notify_fd(self, fd):
+        dds_reader_set_data_notify_fd(self._handle, fd)
+
+    def close(self):
+        if self._handle is not None:
+            dds_reader_delete(self._handle)
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class LatestValueCache(object):
+    """Current message per index of a keyed Reader, looked up by key.
+
+    The reader's own cache holds the values, so nothing is taken or copied
+    into Python ahead of time: get() reads the newest sample of one instance
+    in place (Reader.read_instance), which Fast DDS finds by key. Create the
+    reader with history_depth 1 so that it keeps only the current value of
+    each index, and bound it with max_instances; once that many indices are
+    held, samples of new indices are rejected (counted in samples_rejected
+    of the reader's stats()) rather than evicting old ones.
+
+        reader = participant.create_keyed_reader("Status", {"history_depth": 1, "max_instances": 10000})
+        cache = LatestValueCache(reader)
+        cache.get(42)
+    """
+
+    def __init__(self, reader, raw=False):
+        if not getattr(reader, 'keyed', False):
+            raise TypeError("LatestValueCache needs a keyed Reader (Participant.create_keyed_reader)")
+        self.reader = reader
+        self.raw = raw
+
+    def get(self, index, default=None):
+        value = self.reader.read_instance(index, self.raw)
+        return default if value is None else value
+
+    def __getitem__(self, index):
+        value = self.reader.read_instance(index, self.raw)
+        if value is None:
+            raise KeyError(index)
+        return value
+
+    def __contains__(self, index):
+        return self.reader.read_instance(index, True) is not None
+%}
+#endif
@@ -9,9 +9,10 @@
 
 #define SWIG_VERSION 0x040301
 #define SWIGPYTHON
+#define SWIG_PYTHON_THREADS
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
 
-#define SWIG_name    "_ICDWrapper"
+#define SWIG_name    "_icd_native"
 /* -----------------------------------------------------------------------------
  *  This section contains generic SWIG labels for method/variable
  *  declarations/attributes, and other compiler dependent labels.
@@ -3208,28 +3209,46 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 /* -------- TYPES TABLE (BEGIN) -------- */
 
 #define SWIGTYPE_p_ICD_pkg__HelloWorld swig_types[0]
-#define SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType swig_types[1]
-#define SWIGTYPE_p_char swig_types[2]
-#define SWIGTYPE_p_eprosima__fastcdr__Cdr swig_types[3]
-#define SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t swig_types[4]
-#define SWIGTYPE_p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair swig_types[5]
-#define SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t swig_types[6]
-#define SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t swig_types[7]
-#define SWIGTYPE_p_int swig_types[8]
-#define SWIGTYPE_p_long_long swig_types[9]
-#define SWIGTYPE_p_short swig_types[10]
-#define SWIGTYPE_p_signed_char swig_types[11]
-#define SWIGTYPE_p_std__invalid_argument swig_types[12]
-#define SWIGTYPE_p_std__string swig_types[13]
-#define SWIGTYPE_p_swig__SwigPyIterator swig_types[14]
-#define SWIGTYPE_p_type swig_types[15]
-#define SWIGTYPE_p_unsigned_char swig_types[16]
-#define SWIGTYPE_p_unsigned_int swig_types[17]
-#define SWIGTYPE_p_unsigned_long_long swig_types[18]
-#define SWIGTYPE_p_unsigned_short swig_types[19]
-#define SWIGTYPE_p_void swig_types[20]
-static swig_type_info *swig_types[22];
-static swig_module_info swig_module = {swig_types, 21, 0, 0, 0, 0};
+#define SWIGTYPE_p_ICD_pkg__HelloWorldFixed swig_types[1]
+#define SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType swig_types[2]
+#define SWIGTYPE_p_ICD_pkg__HelloWorldKeyed swig_types[3]
+#define SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType swig_types[4]
+#define SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType swig_types[5]
+#define SWIGTYPE_p_char swig_types[6]
+#define SWIGTYPE_p_dds_histogram_s swig_types[7]
+#define SWIGTYPE_p_dds_loan_s swig_types[8]
+#define SWIGTYPE_p_dds_participant_s swig_types[9]
+#define SWIGTYPE_p_dds_qos_s swig_types[10]
+#define SWIGTYPE_p_dds_reader_s swig_types[11]
+#define SWIGTYPE_p_dds_reader_stats_s swig_types[12]
+#define SWIGTYPE_p_dds_sample_s swig_types[13]
+#define SWIGTYPE_p_dds_startup_stats_s swig_types[14]
+#define SWIGTYPE_p_dds_stats_s swig_types[15]
+#define SWIGTYPE_p_dds_take_loan_s swig_types[16]
+#define SWIGTYPE_p_dds_writer_s swig_types[17]
+#define SWIGTYPE_p_dds_writer_stats_s swig_types[18]
+#define SWIGTYPE_p_eprosima__fastcdr__Cdr swig_types[19]
+#define SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t swig_types[20]
+#define SWIGTYPE_p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair swig_types[21]
+#define SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t swig_types[22]
+#define SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t swig_types[23]
+#define SWIGTYPE_p_int swig_types[24]
+#define SWIGTYPE_p_long_long swig_types[25]
+#define SWIGTYPE_p_p_char swig_types[26]
+#define SWIGTYPE_p_short swig_types[27]
+#define SWIGTYPE_p_signed_char swig_types[28]
+#define SWIGTYPE_p_std__arrayT_char_4096_t swig_types[29]
+#define SWIGTYPE_p_std__invalid_argument swig_types[30]
+#define SWIGTYPE_p_std__string swig_types[31]
+#define SWIGTYPE_p_swig__SwigPyIterator swig_types[32]
+#define SWIGTYPE_p_type swig_types[33]
+#define SWIGTYPE_p_unsigned_char swig_types[34]
+#define SWIGTYPE_p_unsigned_int swig_types[35]
+#define SWIGTYPE_p_unsigned_long_long swig_types[36]
+#define SWIGTYPE_p_unsigned_short swig_types[37]
+#define SWIGTYPE_p_void swig_types[38]
+static swig_type_info *swig_types[40];
+static swig_module_info swig_module = {swig_types, 39, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -3241,13 +3260,13 @@ static swig_module_info swig_module = {swig_types, 21, 0, 0, 0, 0};
 #define SWIG_TypeQuery SWIG_Python_TypeQuery
 
 /*-----------------------------------------------
-              @(target):= _ICDWrapper.so
+              @(target):= _icd_native.so
   ------------------------------------------------*/
 #if PY_VERSION_HEX >= 0x03000000
-#  define SWIG_init    PyInit__ICDWrapper
+#  define SWIG_init    PyInit__icd_native
 
 #else
-#  define SWIG_init    init_ICDWrapper
+#  define SWIG_init    init_icd_native
 
 #endif
 
@@ -4097,9 +4116,6 @@ SWIG_AsVal_bool (PyObject *obj, bool *val)
 }
 
 
-
-
-
 SWIGINTERNINLINE PyObject*
   SWIG_From_int  (int value)
 {
@@ -4123,6 +4139,9 @@ SWIG_AsVal_int (PyObject * obj, int *val)
 }
 
 
+
+
+
 SWIGINTERNINLINE PyObject * 
 SWIG_FromCharPtr(const char *cptr)
 { 
@@ -4130,14 +4149,365 @@ SWIG_FromCharPtr(const char *cptr)
 }
 
 
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERNINLINE PyObject* 
+SWIG_From_unsigned_SS_long_SS_long  (unsigned long long value)
+{
+  return (value > LONG_MAX) ?
+    PyLong_FromUnsignedLongLong(value) : PyInt_FromLong(static_cast< long >(value));
+}
+#endif
+
+
 const char* dds_take_string(unsigned int* index_out) {
-	static thread_local std::string storage;
-	char buf[1024];
-	if (dds_take(index_out, buf, (int)sizeof(buf)) == 1) {
-		storage = buf;
-		return storage.c_str();
+	uint32_t index = 0;
+	const char* message = dds_take_message(&index);
+	if (message && index_out) *index_out = index;
+	return message;
+}
+
+
+// ICDWrapper.Sample: compact (index, message) value built natively, a struct
+// sequence (tuple subclass) with attribute access and no C++ object behind it,
+// unlike the HelloWorld proxy
+static PyTypeObject dds_sample_type;
+
+static PyStructSequence_Field dds_sample_fields[] = {
+	{(char*)"index", (char*)"sample index"},
+	{(char*)"message", (char*)"message text (bytes when taken raw)"},
+	{NULL, NULL}
+};
+
+static PyStructSequence_Desc dds_sample_desc = {
+	(char*)"ICDWrapper.Sample",
+	(char*)"Sample(index, message): immutable HelloWorld value; unpacks like an (index, message) tuple",
+	dds_sample_fields,
+	2
+};
+
+// Steals message; NULL with the error set on failure
+static PyObject* dds_make_sample(uint32_t index, PyObject* message, bool as_sample) {
+	if (!as_sample) return Py_BuildValue("(kN)", (unsigned long)index, message);
+	PyObject* index_obj = PyLong_FromUnsignedLong(index);
+	PyObject* sample = index_obj ? PyStructSequence_New(&dds_sample_type) : NULL;
+	if (!sample) {
+		Py_XDECREF(index_obj);
+		Py_DECREF(message);
+		return NULL;
+	}
+	PyStructSequence_SET_ITEM(sample, 0, index_obj);
+	PyStructSequence_SET_ITEM(sample, 1, message);
+	return sample;
+}
+
+// Shared by the single-topic and handle-based batch helpers below; a null
+// reader/writer selects the single-topic facade entities.
+// Samples are loaned, so each message is decoded (or copied into bytes when
+// raw) straight from the reader's pool: one copy and no size limit. Items are
+// (index, message) tuples, or Sample values when as_sample is set.
+static PyObject* dds_take_batch_py(dds_reader_t* reader, unsigned int max_samples, bool raw, bool as_sample = false) {
+	const dds_sample_t* samples = NULL;
+	dds_take_loan_t* loan = NULL;
+	int count;
+	Py_BEGIN_ALLOW_THREADS
+	count = reader
+		? dds_reader_take_loan(reader, max_samples, &samples, &loan)
+		: dds_take_loan(max_samples, &samples, &loan);
+	Py_END_ALLOW_THREADS
+
+	PyObject* result = PyList_New(count);
+	for (int i = 0; result && i < count; ++i) {
+		PyObject* message = raw
+			? PyBytes_FromStringAndSize(samples[i].message, (Py_ssize_t)samples[i].length)
+			: PyUnicode_DecodeUTF8(samples[i].message, (Py_ssize_t)samples[i].length, "surrogateescape");
+		PyObject* item = message ? dds_make_sample(samples[i].index, message, as_sample) : NULL;
+		if (!item) { Py_CLEAR(result); break; }
+		PyList_SET_ITEM(result, i, item);
+	}
+	if (count > 0) dds_take_loan_return(loan);
+	return result;
+}
+
+static int dds_get_uint32_buffer(PyObject* obj, Py_buffer* view, const char* name, int flags = 0) {
+	if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | flags) != 0) return 0;
+	if (view->itemsize != 4 || !view->format || (strcmp(view->format, "I") != 0 && strcmp(view->format, "L") != 0)) {
+		PyErr_Format(PyExc_TypeError, "%s must be a contiguous uint32 buffer (e.g. array('I'))", name);
+		PyBuffer_Release(view);
+		return 0;
+	}
+	return 1;
+}
+
+// Columnar take into caller-owned writable buffers (numpy arrays, array('I'),
+// bytearray, ...): no Python object is created per sample.
+static PyObject* dds_take_batch_into_py(dds_reader_t* reader, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	Py_buffer idx, msg, off;
+	if (!dds_get_uint32_buffer(indices, &idx, "indices", PyBUF_WRITABLE)) return NULL;
+	if (!dds_get_uint32_buffer(offsets, &off, "offsets", PyBUF_WRITABLE)) { PyBuffer_Release(&idx); return NULL; }
+	if (PyObject_GetBuffer(messages, &msg, PyBUF_SIMPLE | PyBUF_WRITABLE) != 0) { PyBuffer_Release(&idx); PyBuffer_Release(&off); return NULL; }
+
+	PyObject* result = NULL;
+	Py_ssize_t index_count = idx.len / 4;
+	Py_ssize_t offset_count = off.len / 4;
+	if (index_count < 1 || offset_count < 2) {
+		PyErr_SetString(PyExc_ValueError, "indices must hold at least 1 entry and offsets at least 2");
+	} else {
+		uint32_t max_samples = (uint32_t)(index_count < offset_count - 1 ? index_count : offset_count - 1);
+		uint32_t buffer_len = (uint32_t)(msg.len < (Py_ssize_t)UINT32_MAX ? msg.len : (Py_ssize_t)UINT32_MAX);
+		int count;
+		Py_BEGIN_ALLOW_THREADS
+		count = reader
+			? dds_reader_take_batch(reader, max_samples, (uint32_t*)idx.buf, (char*)msg.buf, buffer_len, (uint32_t*)off.buf)
+			: dds_take_batch(max_samples, (uint32_t*)idx.buf, (char*)msg.buf, buffer_len, (uint32_t*)off.buf);
+		Py_END_ALLOW_THREADS
+		result = PyLong_FromLong(count);
+	}
+	PyBuffer_Release(&idx);
+	PyBuffer_Release(&off);
+	PyBuffer_Release(&msg);
+	return result;
+}
+
+static PyObject* dds_write_batch_py(dds_writer_t* writer, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	Py_buffer idx, msg, off;
+	if (!dds_get_uint32_buffer(indices, &idx, "indices")) return NULL;
+	if (!dds_get_uint32_buffer(offsets, &off, "offsets")) { PyBuffer_Release(&idx); return NULL; }
+	if (PyObject_GetBuffer(messages, &msg, PyBUF_SIMPLE) != 0) { PyBuffer_Release(&idx); PyBuffer_Release(&off); return NULL; }
+
+	PyObject* result = NULL;
+	uint32_t count = (uint32_t)(idx.len / 4);
+	const uint32_t* offs = (const uint32_t*)off.buf;
+	bool valid = (uint32_t)(off.len / 4) == count + 1;
+	for (uint32_t i = 0; valid && i < count; ++i) valid = offs[i] <= offs[i + 1];
+	if (!valid || offs[count] > (uint64_t)msg.len) {
+		PyErr_SetString(PyExc_ValueError, "offsets must hold len(indices) + 1 non-decreasing positions within messages");
+	} else {
+		int written;
+		Py_BEGIN_ALLOW_THREADS
+		written = writer
+			? dds_writer_write_batch(writer, count, (const uint32_t*)idx.buf, (const char*)msg.buf, offs)
+			: dds_write_batch(count, (const uint32_t*)idx.buf, (const char*)msg.buf, offs);
+		Py_END_ALLOW_THREADS
+		result = PyLong_FromLong(written);
+	}
+	PyBuffer_Release(&idx);
+	PyBuffer_Release(&off);
+	PyBuffer_Release(&msg);
+	return result;
+}
+
+
+PyObject* dds_take_batch_list(unsigned int max_samples, bool raw = false) {
+	return dds_take_batch_py(NULL, max_samples, raw);
+}
+
+PyObject* dds_reader_take_batch_list(dds_reader_t* reader, unsigned int max_samples, bool raw = false) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	return dds_take_batch_py(reader, max_samples, raw);
+}
+
+
+PyObject* dds_take_samples(unsigned int max_samples = 256, bool raw = false) {
+	return dds_take_batch_py(NULL, max_samples, raw, true);
+}
+
+PyObject* dds_reader_take_samples(dds_reader_t* reader, unsigned int max_samples = 256, bool raw = false) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	return dds_take_batch_py(reader, max_samples, raw, true);
+}
+
+
+PyObject* dds_take_batch_into(PyObject* indices, PyObject* messages, PyObject* offsets) {
+	return dds_take_batch_into_py(NULL, indices, messages, offsets);
+}
+
+PyObject* dds_reader_take_batch_into(dds_reader_t* reader, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	return dds_take_batch_into_py(reader, indices, messages, offsets);
+}
+
+
+PyObject* dds_write_batch_buffers(PyObject* indices, PyObject* messages, PyObject* offsets) {
+	return dds_write_batch_py(NULL, indices, messages, offsets);
+}
+
+PyObject* dds_writer_write_batch_buffers(dds_writer_t* writer, PyObject* indices, PyObject* messages, PyObject* offsets) {
+	if (!writer) {
+		PyErr_SetString(PyExc_ValueError, "writer is closed");
+		return NULL;
+	}
+	return dds_write_batch_py(writer, indices, messages, offsets);
+}
+
+
+PyObject* dds_loan_buffer(dds_loan_t* loan) {
+	if (!loan || !loan->sample) {
+		PyErr_SetString(PyExc_ValueError, "no sample is loaned");
+		return NULL;
+	}
+	return PyMemoryView_FromMemory(loan->message, (Py_ssize_t)loan->capacity, PyBUF_WRITE);
+}
+
+
+PyObject* dds_reader_read_instance_message(dds_reader_t* reader, uint32_t index, bool raw = false) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	char stack_buffer[1024];
+	char* buffer = stack_buffer;
+	uint32_t buffer_len = sizeof(stack_buffer);
+	uint32_t length = 0;
+	int found;
+	for (;;) {
+		Py_BEGIN_ALLOW_THREADS
+		found = dds_reader_read_instance(reader, index, buffer, buffer_len, &length);
+		Py_END_ALLOW_THREADS
+		// The value may have been replaced by a longer one in between: retry until it fits
+		if (!found || length < buffer_len) break;
+		if (buffer != stack_buffer) PyMem_Free(buffer);
+		buffer_len = length + 1;
+		buffer = (char*)PyMem_Malloc(buffer_len);
+		if (!buffer) return PyErr_NoMemory();
+	}
+	PyObject* result;
+	if (!found) {
+		Py_INCREF(Py_None);
+		result = Py_None;
+	} else {
+		result = raw
+			? PyBytes_FromStringAndSize(buffer, (Py_ssize_t)length)
+			: PyUnicode_DecodeUTF8(buffer, (Py_ssize_t)length, "surrogateescape");
 	}
-	return (const char*)0;
+	if (buffer != stack_buffer) PyMem_Free(buffer);
+	return result;
+}
+
+
+static PyObject* dds_histogram_dict(const dds_histogram_t& histogram) {
+	PyObject* buckets = PyList_New(0);
+	if (!buckets) return NULL;
+	for (uint32_t i = 0; i < DDS_HISTOGRAM_BUCKETS; ++i) {
+		if (!histogram.buckets[i]) continue;
+		PyObject* bucket = Py_BuildValue("(KKK)", (unsigned long long)dds_histogram_bucket_lower(i),
+			(unsigned long long)dds_histogram_bucket_lower(i + 1), (unsigned long long)histogram.buckets[i]);
+		if (!bucket || PyList_Append(buckets, bucket) < 0) {
+			Py_XDECREF(bucket);
+			Py_DECREF(buckets);
+			return NULL;
+		}
+		Py_DECREF(bucket);
+	}
+	return Py_BuildValue("{s:K,s:K,s:K,s:K,s:K,s:K,s:N}",
+		"count", (unsigned long long)histogram.count,
+		"total_ns", (unsigned long long)histogram.total_ns,
+		"max_ns", (unsigned long long)histogram.max_ns,
+		"p50_ns", (unsigned long long)dds_histogram_percentile(&histogram, 0.50),
+		"p99_ns", (unsigned long long)dds_histogram_percentile(&histogram, 0.99),
+		"p999_ns", (unsigned long long)dds_histogram_percentile(&histogram, 0.999),
+		"buckets", buckets);
+}
+
+static PyObject* dds_writer_stats_dict(const dds_writer_stats_t& stats) {
+	PyObject* latency = dds_histogram_dict(stats.write_latency);
+	if (!latency) return NULL;
+	return Py_BuildValue("{s:K,s:K,s:K,s:N,s:i,s:i}",
+		"samples", (unsigned long long)stats.samples,
+		"bytes", (unsigned long long)stats.bytes,
+		"failures", (unsigned long long)stats.failures,
+		"write_latency", latency,
+		"matched_readers", (int)stats.matched_readers,
+		"matched_readers_total", (int)stats.matched_readers_total);
+}
+
+static PyObject* dds_reader_stats_dict(const dds_reader_stats_t& stats) {
+	PyObject* latency = dds_histogram_dict(stats.take_latency);
+	if (!latency) return NULL;
+	return Py_BuildValue("{s:K,s:K,s:K,s:N,s:i,s:i,s:i,s:I,s:i,s:K}",
+		"samples", (unsigned long long)stats.samples,
+		"bytes", (unsigned long long)stats.bytes,
+		"empty_takes", (unsigned long long)stats.empty_takes,
+		"take_latency", latency,
+		"matched_writers", (int)stats.matched_writers,
+		"matched_writers_total", (int)stats.matched_writers_total,
+		"samples_lost", (int)stats.samples_lost,
+		"samples_rejected", (unsigned int)stats.samples_rejected,
+		"last_rejected_reason", (int)stats.last_rejected_reason,
+		"unread_samples", (unsigned long long)stats.unread_samples);
+}
+
+
+// {"writer": {...}, "reader": {...}} for the dds_init endpoints, or None if not initialized
+PyObject* dds_get_stats_dict() {
+	dds_stats_t stats;
+	int ok;
+	Py_BEGIN_ALLOW_THREADS
+	ok = dds_get_stats(&stats);
+	Py_END_ALLOW_THREADS
+	if (!ok) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+	PyObject* writer = dds_writer_stats_dict(stats.writer);
+	if (!writer) return NULL;
+	PyObject* reader = dds_reader_stats_dict(stats.reader);
+	if (!reader) {
+		Py_DECREF(writer);
+		return NULL;
+	}
+	return Py_BuildValue("{s:N,s:N}", "writer", writer, "reader", reader);
+}
+
+PyObject* dds_writer_get_stats_dict(dds_writer_t* writer) {
+	if (!writer) {
+		PyErr_SetString(PyExc_ValueError, "writer is closed");
+		return NULL;
+	}
+	dds_writer_stats_t stats;
+	Py_BEGIN_ALLOW_THREADS
+	dds_writer_get_stats(writer, &stats);
+	Py_END_ALLOW_THREADS
+	return dds_writer_stats_dict(stats);
+}
+
+PyObject* dds_reader_get_stats_dict(dds_reader_t* reader) {
+	if (!reader) {
+		PyErr_SetString(PyExc_ValueError, "reader is closed");
+		return NULL;
+	}
+	dds_reader_stats_t stats;
+	Py_BEGIN_ALLOW_THREADS
+	dds_reader_get_stats(reader, &stats);
+	Py_END_ALLOW_THREADS
+	return dds_reader_stats_dict(stats);
+}
+
+// Startup timings of the last dds_init as a dict, or None if not initialized
+PyObject* dds_get_startup_stats_dict() {
+	dds_startup_stats_t stats;
+	int ok;
+	Py_BEGIN_ALLOW_THREADS
+	ok = dds_get_startup_stats(&stats);
+	Py_END_ALLOW_THREADS
+	if (!ok) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+	return Py_BuildValue("{s:K,s:K,s:K,s:K,s:O}",
+		"init_ns", (unsigned long long)stats.init_ns,
+		"writer_matched_ns", (unsigned long long)stats.writer_matched_ns,
+		"reader_matched_ns", (unsigned long long)stats.reader_matched_ns,
+		"first_sample_ns", (unsigned long long)stats.first_sample_ns,
+		"participant_reused", stats.participant_reused ? Py_True : Py_False);
 }
 
 #ifdef __cplusplus
@@ -5513,23 +5883,37 @@ SWIGINTERN PyObject *HelloWorld_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObjec
   return SWIG_Python_InitShadowInstance(args);
 }
 
-SWIGINTERN PyObject *_wrap_new_HelloWorldPubSubType(PyObject *self, PyObject *args) {
+SWIGINTERN int Swig_var_FIXED_MESSAGE_CAPACITY_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable FIXED_MESSAGE_CAPACITY is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_FIXED_MESSAGE_CAPACITY_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg::FIXED_MESSAGE_CAPACITY));
+  return pyobj;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_HelloWorldFixed__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *result = 0 ;
+  ICD_pkg::HelloWorldFixed *result = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "new_HelloWorldPubSubType", 0, 0, 0)) SWIG_fail;
-  result = (ICD_pkg::HelloWorldPubSubType *)new ICD_pkg::HelloWorldPubSubType();
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, SWIG_POINTER_NEW |  0 );
+  if ((nobjs < 0) || (nobjs > 0)) SWIG_fail;
+  result = (ICD_pkg::HelloWorldFixed *)new ICD_pkg::HelloWorldFixed();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_HelloWorldPubSubType(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_HelloWorldFixed(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
@@ -5537,11 +5921,11 @@ SWIGINTERN PyObject *_wrap_delete_HelloWorldPubSubType(PyObject *self, PyObject
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, SWIG_POINTER_DISOWN |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_HelloWorldPubSubType" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_HelloWorldFixed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
   delete arg1;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -5550,482 +5934,454 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_serialize(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_HelloWorldFixed__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  void *arg2 = (void *) (void *)0 ;
-  eprosima::fastdds::rtps::SerializedPayload_t *arg3 = 0 ;
-  eprosima::fastdds::dds::DataRepresentationId_t arg4 ;
+  ICD_pkg::HelloWorldFixed *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int res2 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 ;
-  int res4 = 0 ;
-  PyObject *swig_obj[4] ;
-  bool result;
+  ICD_pkg::HelloWorldFixed *result = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_serialize", 4, 4, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_ICD_pkg__HelloWorldFixed,  0  | 0);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_serialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
-  }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_serialize" "', argument " "2"" of type '" "void const *const""'"); 
-  }
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_HelloWorldFixed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
   }
-  if (!argp3) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_HelloWorldFixed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
   }
-  arg3 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp3);
-  {
-    res4 = SWIG_ConvertPtr(swig_obj[3], &argp4, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
-    if (!SWIG_IsOK(res4)) {
-      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "HelloWorldPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
-    }  
-    if (!argp4) {
-      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  result = (ICD_pkg::HelloWorldFixed *)new ICD_pkg::HelloWorldFixed((ICD_pkg::HelloWorldFixed const &)*arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_HelloWorldFixed__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixed *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::unique_ptr< ICD_pkg::HelloWorldFixed > rvrdeleter1 ;
+  ICD_pkg::HelloWorldFixed *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_RELEASE |  0 );
+  if (!SWIG_IsOK(res1)) {
+    if (res1 == SWIG_ERROR_RELEASE_NOT_OWNED) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_HelloWorldFixed" "', cannot release ownership as memory is not owned for argument " "1"" of type '" "ICD_pkg::HelloWorldFixed &&""'");
     } else {
-      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp4);
-      arg4 = *temp;
-      if (SWIG_IsNewObj(res4)) delete temp;
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_HelloWorldFixed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed &&""'"); 
     }
   }
-  result = (bool)(arg1)->serialize((void const *)arg2,*arg3,SWIG_STD_MOVE(arg4));
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_HelloWorldFixed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed &&""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  rvrdeleter1.reset(arg1);
+  result = (ICD_pkg::HelloWorldFixed *)new ICD_pkg::HelloWorldFixed((ICD_pkg::HelloWorldFixed &&)*arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_deserialize(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_HelloWorldFixed(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[2] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "new_HelloWorldFixed", 0, 1, argv))) SWIG_fail;
+  --argc;
+  if (argc == 0) {
+    return _wrap_new_HelloWorldFixed__SWIG_0(self, argc, argv);
+  }
+  if (argc == 1) {
+    int _v = 0;
+    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_NO_NULL | 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_new_HelloWorldFixed__SWIG_1(self, argc, argv);
+    }
+  }
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_NO_NULL);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_new_HelloWorldFixed__SWIG_2(self, argc, argv);
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'new_HelloWorldFixed'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldFixed::HelloWorldFixed()\n"
+    "    ICD_pkg::HelloWorldFixed::HelloWorldFixed(ICD_pkg::HelloWorldFixed const &)\n"
+    "    ICD_pkg::HelloWorldFixed::HelloWorldFixed(ICD_pkg::HelloWorldFixed &&)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixed___eq__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
-  void *arg3 = (void *) 0 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  ICD_pkg::HelloWorldFixed *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int res3 ;
-  PyObject *swig_obj[3] ;
+  PyObject *swig_obj[2] ;
   bool result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_deserialize", 3, 3, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldFixed___eq__", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_deserialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed___eq__" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed const *""'"); 
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorldFixed,  0  | 0);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixed___eq__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
-  }
-  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2],SWIG_as_voidptrptr(&arg3), 0, 0);
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_deserialize" "', argument " "3"" of type '" "void *""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixed___eq__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
   }
-  result = (bool)(arg1)->deserialize(*arg2,arg3);
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp2);
+  result = (bool)((ICD_pkg::HelloWorldFixed const *)arg1)->operator ==((ICD_pkg::HelloWorldFixed const &)*arg2);
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_calculate_serialized_size(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed___ne__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  void *arg2 = (void *) (void *)0 ;
-  eprosima::fastdds::dds::DataRepresentationId_t arg3 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  ICD_pkg::HelloWorldFixed *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int res2 ;
-  void *argp3 ;
-  int res3 = 0 ;
-  PyObject *swig_obj[3] ;
-  uint32_t result;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  bool result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_calculate_serialized_size", 3, 3, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldFixed___ne__", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed___ne__" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed const *""'"); 
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorldFixed,  0  | 0);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "2"" of type '" "void const *const""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixed___ne__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
   }
-  {
-    res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
-    if (!SWIG_IsOK(res3)) {
-      SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
-    }  
-    if (!argp3) {
-      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
-    } else {
-      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp3);
-      arg3 = *temp;
-      if (SWIG_IsNewObj(res3)) delete temp;
-    }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixed___ne__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
   }
-  result = (uint32_t)(arg1)->calculate_serialized_size((void const *)arg2,SWIG_STD_MOVE(arg3));
-  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp2);
+  result = (bool)((ICD_pkg::HelloWorldFixed const *)arg1)->operator !=((ICD_pkg::HelloWorldFixed const &)*arg2);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_index__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
-  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
-  bool arg4 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  uint32_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  bool val4 ;
-  int ecode4 = 0 ;
-  bool result;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
   
   (void)self;
-  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
-  }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
-  }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
-  }
-  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
-  }
-  if (!argp3) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_index" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
   }
-  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
-  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "HelloWorldFixed_index" "', argument " "2"" of type '" "uint32_t""'");
   } 
-  arg4 = static_cast< bool >(val4);
-  result = (bool)(arg1)->compute_key(*arg2,*arg3,arg4);
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
-  PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
-  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  bool result;
-  
-  (void)self;
-  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
-  }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
-  }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
-  }
-  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
-  }
-  if (!argp3) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
-  }
-  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
-  result = (bool)(arg1)->compute_key(*arg2,*arg3);
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  arg2 = static_cast< uint32_t >(val2);
+  (arg1)->index(arg2);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_index__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  void *arg2 = (void *) (void *)0 ;
-  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
-  bool arg4 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int res2 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  bool val4 ;
-  int ecode4 = 0 ;
-  bool result;
+  uint32_t result;
   
   (void)self;
-  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
-  }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
-  }
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
-  }
-  if (!argp3) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_index" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed const *""'"); 
   }
-  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
-  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
-  } 
-  arg4 = static_cast< bool >(val4);
-  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3,arg4);
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  result = (uint32_t)((ICD_pkg::HelloWorldFixed const *)arg1)->index();
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_index__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  void *arg2 = (void *) (void *)0 ;
-  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int res2 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  bool result;
+  uint32_t *result = 0 ;
   
   (void)self;
-  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
-  }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
-  }
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_index" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
   }
-  if (!argp3) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
-  }
-  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
-  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3);
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  result = (uint32_t *) &(arg1)->index();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_unsigned_int, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_index(PyObject *self, PyObject *args) {
   Py_ssize_t argc;
-  PyObject *argv[5] = {
+  PyObject *argv[3] = {
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_compute_key", 0, 4, argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldFixed_index", 0, 2, argv))) SWIG_fail;
   --argc;
-  if (argc == 3) {
+  if (argc == 1) {
     int _v = 0;
     void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
-        _v = SWIG_CheckState(res);
-        if (_v) {
-          return _wrap_HelloWorldPubSubType_compute_key__SWIG_1(self, argc, argv);
-        }
-      }
+      return _wrap_HelloWorldFixed_index__SWIG_1(self, argc, argv);
     }
   }
-  if (argc == 3) {
+  if (argc == 1) {
     int _v = 0;
     void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *ptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
-        _v = SWIG_CheckState(res);
-        if (_v) {
-          return _wrap_HelloWorldPubSubType_compute_key__SWIG_3(self, argc, argv);
-        }
-      }
+      return _wrap_HelloWorldFixed_index__SWIG_2(self, argc, argv);
     }
   }
-  if (argc == 4) {
+  if (argc == 2) {
     int _v = 0;
     void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
         _v = SWIG_CheckState(res);
-        if (_v) {
-          {
-            int res = SWIG_AsVal_bool(argv[3], NULL);
-            _v = SWIG_CheckState(res);
-          }
-          if (_v) {
-            return _wrap_HelloWorldPubSubType_compute_key__SWIG_0(self, argc, argv);
-          }
-        }
       }
-    }
-  }
-  if (argc == 4) {
-    int _v = 0;
-    void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      void *ptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
-      _v = SWIG_CheckState(res);
       if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
-        _v = SWIG_CheckState(res);
-        if (_v) {
-          {
-            int res = SWIG_AsVal_bool(argv[3], NULL);
-            _v = SWIG_CheckState(res);
-          }
-          if (_v) {
-            return _wrap_HelloWorldPubSubType_compute_key__SWIG_2(self, argc, argv);
-          }
-        }
+        return _wrap_HelloWorldFixed_index__SWIG_0(self, argc, argv);
       }
     }
   }
   
 fail:
-  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldPubSubType_compute_key'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldFixed_index'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    ICD_pkg::HelloWorldPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
-    "    ICD_pkg::HelloWorldPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &)\n"
-    "    ICD_pkg::HelloWorldPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
-    "    ICD_pkg::HelloWorldPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &)\n");
+    "    ICD_pkg::HelloWorldFixed::index(uint32_t)\n"
+    "    ICD_pkg::HelloWorldFixed::index() const\n"
+    "    ICD_pkg::HelloWorldFixed::index()\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_create_data(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_length__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  uint32_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  void *result = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_create_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_length" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  result = (void *)(arg1)->create_data();
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "HelloWorldFixed_length" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  (arg1)->length(arg2);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_delete_data(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_length__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
-  void *arg2 = (void *) 0 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int res2 ;
-  PyObject *swig_obj[2] ;
+  uint32_t result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_delete_data", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_delete_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_length" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed const *""'"); 
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  result = (uint32_t)((ICD_pkg::HelloWorldFixed const *)arg1)->length();
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_length__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  uint32_t *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_length" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  result = (uint32_t *) &(arg1)->length();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_unsigned_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_length(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldFixed_length", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldFixed_length__SWIG_1(self, argc, argv);
+    }
+  }
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldFixed_length__SWIG_2(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_HelloWorldFixed_length__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldFixed_length'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldFixed::length(uint32_t)\n"
+    "    ICD_pkg::HelloWorldFixed::length() const\n"
+    "    ICD_pkg::HelloWorldFixed::length()\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_message__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  std::array< char,4096 > *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_std__arrayT_char_4096_t,  0  | 0);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_delete_data" "', argument " "2"" of type '" "void *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixed_message" "', argument " "2"" of type '" "std::array< char,4096 > const &""'"); 
   }
-  (arg1)->delete_data(arg2);
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixed_message" "', argument " "2"" of type '" "std::array< char,4096 > const &""'"); 
+  }
+  arg2 = reinterpret_cast< std::array< char,4096 > * >(argp2);
+  (arg1)->message((std::array< char,4096 > const &)*arg2);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6033,22 +6389,37 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_register_type_object_representation(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_message__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  std::array< char,4096 > *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  std::unique_ptr< std::array< char,4096 > > rvrdeleter2 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_register_type_object_representation" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
-  (arg1)->register_type_object_representation();
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_std__arrayT_char_4096_t, SWIG_POINTER_RELEASE |  0 );
+  if (!SWIG_IsOK(res2)) {
+    if (res2 == SWIG_ERROR_RELEASE_NOT_OWNED) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixed_message" "', cannot release ownership as memory is not owned for argument " "2"" of type '" "std::array< char,4096 > &&""'");
+    } else {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixed_message" "', argument " "2"" of type '" "std::array< char,4096 > &&""'"); 
+    }
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixed_message" "', argument " "2"" of type '" "std::array< char,4096 > &&""'"); 
+  }
+  arg2 = reinterpret_cast< std::array< char,4096 > * >(argp2);
+  rvrdeleter2.reset(arg2);
+  (arg1)->message((std::array< char,4096 > &&)*arg2);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6056,20 +6427,143 @@ fail:
 }
 
 
-SWIGINTERN PyObject *HelloWorldPubSubType_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_message__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::array< char,4096 > *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed const *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  result = (std::array< char,4096 > *) &((ICD_pkg::HelloWorldFixed const *)arg1)->message();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__arrayT_char_4096_t, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_message__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixed *arg1 = (ICD_pkg::HelloWorldFixed *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::array< char,4096 > *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp1);
+  result = (std::array< char,4096 > *) &(arg1)->message();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__arrayT_char_4096_t, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixed_message(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldFixed_message", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldFixed_message__SWIG_3(self, argc, argv);
+    }
+  }
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldFixed_message__SWIG_2(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_std__arrayT_char_4096_t, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_HelloWorldFixed_message__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_std__arrayT_char_4096_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_HelloWorldFixed_message__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldFixed_message'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldFixed::message(std::array< char,4096 > const &)\n"
+    "    ICD_pkg::HelloWorldFixed::message(std::array< char,4096 > &&)\n"
+    "    ICD_pkg::HelloWorldFixed::message() const\n"
+    "    ICD_pkg::HelloWorldFixed::message()\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *HelloWorldFixed_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj = NULL;
   if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, SWIG_NewClientData(obj));
+  SWIG_TypeNewClientData(SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
 
-SWIGINTERN PyObject *HelloWorldPubSubType_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *HelloWorldFixed_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   return SWIG_Python_InitShadowInstance(args);
 }
 
-SWIGINTERN PyObject *_wrap_register_HelloWorld_type_identifier(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_HelloWorldKeyed__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
   PyObject *resultobj = 0;
-  eprosima::fastdds::dds::xtypes::TypeIdentifierPair *arg1 = 0 ;
+  ICD_pkg::HelloWorldKeyed *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 0) || (nobjs > 0)) SWIG_fail;
+  result = (ICD_pkg::HelloWorldKeyed *)new ICD_pkg::HelloWorldKeyed();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_HelloWorldKeyed(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
@@ -6077,15 +6571,12 @@ SWIGINTERN PyObject *_wrap_register_HelloWorld_type_identifier(PyObject *self, P
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair,  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "register_HelloWorld_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "register_HelloWorld_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_HelloWorldKeyed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed *""'"); 
   }
-  arg1 = reinterpret_cast< eprosima::fastdds::dds::xtypes::TypeIdentifierPair * >(argp1);
-  ICD_pkg::register_HelloWorld_type_identifier(*arg1);
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  delete arg1;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6093,310 +6584,6022 @@ fail:
 }
 
 
-SWIGINTERN int Swig_var_ICD_pkg_HelloWorld_max_cdr_typesize_set(PyObject *) {
-  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorld_max_cdr_typesize is read-only.");
-  return 1;
+SWIGINTERN PyObject *_wrap_new_HelloWorldKeyed__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  ICD_pkg::HelloWorldKeyed *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_HelloWorldKeyed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_HelloWorldKeyed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  result = (ICD_pkg::HelloWorldKeyed *)new ICD_pkg::HelloWorldKeyed((ICD_pkg::HelloWorldKeyed const &)*arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorld_max_cdr_typesize_get(void) {
-  PyObject *pyobj = 0;
+SWIGINTERN PyObject *_wrap_new_HelloWorldKeyed__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::unique_ptr< ICD_pkg::HelloWorldKeyed > rvrdeleter1 ;
+  ICD_pkg::HelloWorldKeyed *result = 0 ;
   
-  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorld_max_cdr_typesize));
-  return pyobj;
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_RELEASE |  0 );
+  if (!SWIG_IsOK(res1)) {
+    if (res1 == SWIG_ERROR_RELEASE_NOT_OWNED) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_HelloWorldKeyed" "', cannot release ownership as memory is not owned for argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed &&""'");
+    } else {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_HelloWorldKeyed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed &&""'"); 
+    }
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_HelloWorldKeyed" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed &&""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  rvrdeleter1.reset(arg1);
+  result = (ICD_pkg::HelloWorldKeyed *)new ICD_pkg::HelloWorldKeyed((ICD_pkg::HelloWorldKeyed &&)*arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
 }
 
 
-SWIGINTERN int Swig_var_ICD_pkg_HelloWorld_max_key_cdr_typesize_set(PyObject *) {
-  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorld_max_key_cdr_typesize is read-only.");
-  return 1;
+SWIGINTERN PyObject *_wrap_new_HelloWorldKeyed(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[2] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "new_HelloWorldKeyed", 0, 1, argv))) SWIG_fail;
+  --argc;
+  if (argc == 0) {
+    return _wrap_new_HelloWorldKeyed__SWIG_0(self, argc, argv);
+  }
+  if (argc == 1) {
+    int _v = 0;
+    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_NO_NULL | 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_new_HelloWorldKeyed__SWIG_1(self, argc, argv);
+    }
+  }
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_NO_NULL);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_new_HelloWorldKeyed__SWIG_2(self, argc, argv);
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'new_HelloWorldKeyed'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldKeyed::HelloWorldKeyed()\n"
+    "    ICD_pkg::HelloWorldKeyed::HelloWorldKeyed(ICD_pkg::HelloWorldKeyed const &)\n"
+    "    ICD_pkg::HelloWorldKeyed::HelloWorldKeyed(ICD_pkg::HelloWorldKeyed &&)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed___eq__(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  ICD_pkg::HelloWorldKeyed *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldKeyed___eq__", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed___eq__" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed const *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyed___eq__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyed___eq__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp2);
+  result = (bool)((ICD_pkg::HelloWorldKeyed const *)arg1)->operator ==((ICD_pkg::HelloWorldKeyed const &)*arg2);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed___ne__(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  ICD_pkg::HelloWorldKeyed *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldKeyed___ne__", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed___ne__" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed const *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyed___ne__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyed___ne__" "', argument " "2"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp2);
+  result = (bool)((ICD_pkg::HelloWorldKeyed const *)arg1)->operator !=((ICD_pkg::HelloWorldKeyed const &)*arg2);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_index__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  uint32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed_index" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "HelloWorldKeyed_index" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  (arg1)->index(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_index__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  uint32_t result;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed_index" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed const *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  result = (uint32_t)((ICD_pkg::HelloWorldKeyed const *)arg1)->index();
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_index__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  uint32_t *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed_index" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  result = (uint32_t *) &(arg1)->index();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_unsigned_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_index(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldKeyed_index", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldKeyed_index__SWIG_1(self, argc, argv);
+    }
+  }
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldKeyed_index__SWIG_2(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_HelloWorldKeyed_index__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldKeyed_index'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldKeyed::index(uint32_t)\n"
+    "    ICD_pkg::HelloWorldKeyed::index() const\n"
+    "    ICD_pkg::HelloWorldKeyed::index()\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_message__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  std::string *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 = SWIG_OLDOBJ ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  {
+    std::string *ptr = (std::string *)0;
+    res2 = SWIG_AsPtr_std_string(swig_obj[1], &ptr);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyed_message" "', argument " "2"" of type '" "std::string const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyed_message" "', argument " "2"" of type '" "std::string const &""'"); 
+    }
+    arg2 = ptr;
+  }
+  (arg1)->message((std::string const &)*arg2);
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res2)) delete arg2;
+  return resultobj;
+fail:
+  if (SWIG_IsNewObj(res2)) delete arg2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_message__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  std::string *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  std::unique_ptr< std::string > rvrdeleter2 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_std__string, SWIG_POINTER_RELEASE |  0 );
+  if (!SWIG_IsOK(res2)) {
+    if (res2 == SWIG_ERROR_RELEASE_NOT_OWNED) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyed_message" "', cannot release ownership as memory is not owned for argument " "2"" of type '" "std::string &&""'");
+    } else {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyed_message" "', argument " "2"" of type '" "std::string &&""'"); 
+    }
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyed_message" "', argument " "2"" of type '" "std::string &&""'"); 
+  }
+  arg2 = reinterpret_cast< std::string * >(argp2);
+  rvrdeleter2.reset(arg2);
+  (arg1)->message((std::string &&)*arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_message__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::string *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed const *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  result = (std::string *) &((ICD_pkg::HelloWorldKeyed const *)arg1)->message();
+  resultobj = SWIG_From_std_string(static_cast< std::string >(*result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_message__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyed *arg1 = (ICD_pkg::HelloWorldKeyed *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::string *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyed_message" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyed *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp1);
+  result = (std::string *) &(arg1)->message();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__string, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyed_message(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldKeyed_message", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldKeyed_message__SWIG_3(self, argc, argv);
+    }
+  }
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_HelloWorldKeyed_message__SWIG_2(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_std__string, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_HelloWorldKeyed_message__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)(0));
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_HelloWorldKeyed_message__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldKeyed_message'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldKeyed::message(std::string const &)\n"
+    "    ICD_pkg::HelloWorldKeyed::message(std::string &&)\n"
+    "    ICD_pkg::HelloWorldKeyed::message() const\n"
+    "    ICD_pkg::HelloWorldKeyed::message()\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *HelloWorldKeyed_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *HelloWorldKeyed_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_new_HelloWorldPubSubType(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "new_HelloWorldPubSubType", 0, 0, 0)) SWIG_fail;
+  result = (ICD_pkg::HelloWorldPubSubType *)new ICD_pkg::HelloWorldPubSubType();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_HelloWorldPubSubType(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_HelloWorldPubSubType" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  delete arg1;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_serialize(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg3 = 0 ;
+  eprosima::fastdds::dds::DataRepresentationId_t arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_serialize", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_serialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_serialize" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp3);
+  {
+    res4 = SWIG_ConvertPtr(swig_obj[3], &argp4, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "HelloWorldPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
+    }  
+    if (!argp4) {
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
+    } else {
+      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp4);
+      arg4 = *temp;
+      if (SWIG_IsNewObj(res4)) delete temp;
+    }
+  }
+  result = (bool)(arg1)->serialize((void const *)arg2,*arg3,SWIG_STD_MOVE(arg4));
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_deserialize(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  void *arg3 = (void *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res3 ;
+  PyObject *swig_obj[3] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_deserialize", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_deserialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2],SWIG_as_voidptrptr(&arg3), 0, 0);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_deserialize" "', argument " "3"" of type '" "void *""'"); 
+  }
+  result = (bool)(arg1)->deserialize(*arg2,arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_calculate_serialized_size(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::dds::DataRepresentationId_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  uint32_t result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_calculate_serialized_size", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  {
+    res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
+    if (!SWIG_IsOK(res3)) {
+      SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
+    }  
+    if (!argp3) {
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
+    } else {
+      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp3);
+      arg3 = *temp;
+      if (SWIG_IsNewObj(res3)) delete temp;
+    }
+  }
+  result = (uint32_t)(arg1)->calculate_serialized_size((void const *)arg2,SWIG_STD_MOVE(arg3));
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  bool arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  result = (bool)(arg1)->compute_key(*arg2,*arg3,arg4);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  result = (bool)(arg1)->compute_key(*arg2,*arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  bool arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3,arg4);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_compute_key(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_compute_key", 0, 4, argv))) SWIG_fail;
+  --argc;
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_HelloWorldPubSubType_compute_key__SWIG_1(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *ptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_HelloWorldPubSubType_compute_key__SWIG_3(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_HelloWorldPubSubType_compute_key__SWIG_0(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *ptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_HelloWorldPubSubType_compute_key__SWIG_2(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldPubSubType_compute_key'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
+    "    ICD_pkg::HelloWorldPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &)\n"
+    "    ICD_pkg::HelloWorldPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
+    "    ICD_pkg::HelloWorldPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_create_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  void *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_create_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  result = (void *)(arg1)->create_data();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_delete_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *arg2 = (void *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldPubSubType_delete_data", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_delete_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldPubSubType_delete_data" "', argument " "2"" of type '" "void *""'"); 
+  }
+  (arg1)->delete_data(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldPubSubType_register_type_object_representation(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldPubSubType *arg1 = (ICD_pkg::HelloWorldPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldPubSubType_register_type_object_representation" "', argument " "1"" of type '" "ICD_pkg::HelloWorldPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldPubSubType * >(argp1);
+  (arg1)->register_type_object_representation();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *HelloWorldPubSubType_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_ICD_pkg__HelloWorldPubSubType, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *HelloWorldPubSubType_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_new_HelloWorldFixedPubSubType(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "new_HelloWorldFixedPubSubType", 0, 0, 0)) SWIG_fail;
+  result = (ICD_pkg::HelloWorldFixedPubSubType *)new ICD_pkg::HelloWorldFixedPubSubType();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_HelloWorldFixedPubSubType(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_HelloWorldFixedPubSubType" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  delete arg1;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_serialize(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg3 = 0 ;
+  eprosima::fastdds::dds::DataRepresentationId_t arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldFixedPubSubType_serialize", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_serialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_serialize" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldFixedPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp3);
+  {
+    res4 = SWIG_ConvertPtr(swig_obj[3], &argp4, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "HelloWorldFixedPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
+    }  
+    if (!argp4) {
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
+    } else {
+      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp4);
+      arg4 = *temp;
+      if (SWIG_IsNewObj(res4)) delete temp;
+    }
+  }
+  result = (bool)(arg1)->serialize((void const *)arg2,*arg3,SWIG_STD_MOVE(arg4));
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_deserialize(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  void *arg3 = (void *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res3 ;
+  PyObject *swig_obj[3] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldFixedPubSubType_deserialize", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_deserialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2],SWIG_as_voidptrptr(&arg3), 0, 0);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldFixedPubSubType_deserialize" "', argument " "3"" of type '" "void *""'"); 
+  }
+  result = (bool)(arg1)->deserialize(*arg2,arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_calculate_serialized_size(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::dds::DataRepresentationId_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  uint32_t result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldFixedPubSubType_calculate_serialized_size", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_calculate_serialized_size" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_calculate_serialized_size" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  {
+    res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
+    if (!SWIG_IsOK(res3)) {
+      SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldFixedPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
+    }  
+    if (!argp3) {
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
+    } else {
+      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp3);
+      arg3 = *temp;
+      if (SWIG_IsNewObj(res3)) delete temp;
+    }
+  }
+  result = (uint32_t)(arg1)->calculate_serialized_size((void const *)arg2,SWIG_STD_MOVE(arg3));
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_compute_key__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  bool arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  result = (bool)(arg1)->compute_key(*arg2,*arg3,arg4);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_compute_key__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  result = (bool)(arg1)->compute_key(*arg2,*arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_compute_key__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  bool arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3,arg4);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_compute_key__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldFixedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_compute_key(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldFixedPubSubType_compute_key", 0, 4, argv))) SWIG_fail;
+  --argc;
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_HelloWorldFixedPubSubType_compute_key__SWIG_1(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *ptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_HelloWorldFixedPubSubType_compute_key__SWIG_3(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_HelloWorldFixedPubSubType_compute_key__SWIG_0(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *ptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_HelloWorldFixedPubSubType_compute_key__SWIG_2(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldFixedPubSubType_compute_key'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldFixedPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
+    "    ICD_pkg::HelloWorldFixedPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &)\n"
+    "    ICD_pkg::HelloWorldFixedPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
+    "    ICD_pkg::HelloWorldFixedPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_create_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  void *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_create_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  result = (void *)(arg1)->create_data();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_delete_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *arg2 = (void *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldFixedPubSubType_delete_data", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_delete_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldFixedPubSubType_delete_data" "', argument " "2"" of type '" "void *""'"); 
+  }
+  (arg1)->delete_data(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldFixedPubSubType_register_type_object_representation(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldFixedPubSubType *arg1 = (ICD_pkg::HelloWorldFixedPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldFixedPubSubType_register_type_object_representation" "', argument " "1"" of type '" "ICD_pkg::HelloWorldFixedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldFixedPubSubType * >(argp1);
+  (arg1)->register_type_object_representation();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *HelloWorldFixedPubSubType_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_ICD_pkg__HelloWorldFixedPubSubType, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *HelloWorldFixedPubSubType_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_new_HelloWorldKeyedPubSubType(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "new_HelloWorldKeyedPubSubType", 0, 0, 0)) SWIG_fail;
+  result = (ICD_pkg::HelloWorldKeyedPubSubType *)new ICD_pkg::HelloWorldKeyedPubSubType();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_HelloWorldKeyedPubSubType(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_HelloWorldKeyedPubSubType" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  delete arg1;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_serialize(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg3 = 0 ;
+  eprosima::fastdds::dds::DataRepresentationId_t arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldKeyedPubSubType_serialize", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_serialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_serialize" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldKeyedPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_serialize" "', argument " "3"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp3);
+  {
+    res4 = SWIG_ConvertPtr(swig_obj[3], &argp4, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "HelloWorldKeyedPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
+    }  
+    if (!argp4) {
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_serialize" "', argument " "4"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
+    } else {
+      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp4);
+      arg4 = *temp;
+      if (SWIG_IsNewObj(res4)) delete temp;
+    }
+  }
+  result = (bool)(arg1)->serialize((void const *)arg2,*arg3,SWIG_STD_MOVE(arg4));
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_deserialize(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  void *arg3 = (void *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res3 ;
+  PyObject *swig_obj[3] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldKeyedPubSubType_deserialize", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_deserialize" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_deserialize" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2],SWIG_as_voidptrptr(&arg3), 0, 0);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldKeyedPubSubType_deserialize" "', argument " "3"" of type '" "void *""'"); 
+  }
+  result = (bool)(arg1)->deserialize(*arg2,arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_calculate_serialized_size(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::dds::DataRepresentationId_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  uint32_t result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldKeyedPubSubType_calculate_serialized_size", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_calculate_serialized_size" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_calculate_serialized_size" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  {
+    res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__dds__DataRepresentationId_t,  0  | 0);
+    if (!SWIG_IsOK(res3)) {
+      SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldKeyedPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'"); 
+    }  
+    if (!argp3) {
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_calculate_serialized_size" "', argument " "3"" of type '" "eprosima::fastdds::dds::DataRepresentationId_t""'");
+    } else {
+      eprosima::fastdds::dds::DataRepresentationId_t * temp = reinterpret_cast< eprosima::fastdds::dds::DataRepresentationId_t * >(argp3);
+      arg3 = *temp;
+      if (SWIG_IsNewObj(res3)) delete temp;
+    }
+  }
+  result = (uint32_t)(arg1)->calculate_serialized_size((void const *)arg2,SWIG_STD_MOVE(arg3));
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  bool arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  result = (bool)(arg1)->compute_key(*arg2,*arg3,arg4);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  eprosima::fastdds::rtps::SerializedPayload_t *arg2 = 0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "2"" of type '" "eprosima::fastdds::rtps::SerializedPayload_t &""'"); 
+  }
+  arg2 = reinterpret_cast< eprosima::fastdds::rtps::SerializedPayload_t * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  result = (bool)(arg1)->compute_key(*arg2,*arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  bool arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3,arg4);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *arg2 = (void *) (void *)0 ;
+  eprosima::fastdds::rtps::InstanceHandle_t *arg3 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "2"" of type '" "void const *const""'"); 
+  }
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t,  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "HelloWorldKeyedPubSubType_compute_key" "', argument " "3"" of type '" "eprosima::fastdds::rtps::InstanceHandle_t &""'"); 
+  }
+  arg3 = reinterpret_cast< eprosima::fastdds::rtps::InstanceHandle_t * >(argp3);
+  result = (bool)(arg1)->compute_key((void const *)arg2,*arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_compute_key(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "HelloWorldKeyedPubSubType_compute_key", 0, 4, argv))) SWIG_fail;
+  --argc;
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_1(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *ptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_3(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__SerializedPayload_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_0(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *ptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &ptr, 0, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_eprosima__fastdds__rtps__InstanceHandle_t, SWIG_POINTER_NO_NULL);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_HelloWorldKeyedPubSubType_compute_key__SWIG_2(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'HelloWorldKeyedPubSubType_compute_key'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    ICD_pkg::HelloWorldKeyedPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
+    "    ICD_pkg::HelloWorldKeyedPubSubType::compute_key(eprosima::fastdds::rtps::SerializedPayload_t &,eprosima::fastdds::rtps::InstanceHandle_t &)\n"
+    "    ICD_pkg::HelloWorldKeyedPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &,bool)\n"
+    "    ICD_pkg::HelloWorldKeyedPubSubType::compute_key(void const *const,eprosima::fastdds::rtps::InstanceHandle_t &)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_create_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  void *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_create_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  result = (void *)(arg1)->create_data();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_delete_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *arg2 = (void *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "HelloWorldKeyedPubSubType_delete_data", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_delete_data" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "HelloWorldKeyedPubSubType_delete_data" "', argument " "2"" of type '" "void *""'"); 
+  }
+  (arg1)->delete_data(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_HelloWorldKeyedPubSubType_register_type_object_representation(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorldKeyedPubSubType *arg1 = (ICD_pkg::HelloWorldKeyedPubSubType *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "HelloWorldKeyedPubSubType_register_type_object_representation" "', argument " "1"" of type '" "ICD_pkg::HelloWorldKeyedPubSubType *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorldKeyedPubSubType * >(argp1);
+  (arg1)->register_type_object_representation();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *HelloWorldKeyedPubSubType_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_ICD_pkg__HelloWorldKeyedPubSubType, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *HelloWorldKeyedPubSubType_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_register_HelloWorld_type_identifier(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  eprosima::fastdds::dds::xtypes::TypeIdentifierPair *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair,  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "register_HelloWorld_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "register_HelloWorld_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
+  }
+  arg1 = reinterpret_cast< eprosima::fastdds::dds::xtypes::TypeIdentifierPair * >(argp1);
+  ICD_pkg::register_HelloWorld_type_identifier(*arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_register_HelloWorldFixed_type_identifier(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  eprosima::fastdds::dds::xtypes::TypeIdentifierPair *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair,  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "register_HelloWorldFixed_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "register_HelloWorldFixed_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
+  }
+  arg1 = reinterpret_cast< eprosima::fastdds::dds::xtypes::TypeIdentifierPair * >(argp1);
+  ICD_pkg::register_HelloWorldFixed_type_identifier(*arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_register_HelloWorldKeyed_type_identifier(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  eprosima::fastdds::dds::xtypes::TypeIdentifierPair *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair,  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "register_HelloWorldKeyed_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "register_HelloWorldKeyed_type_identifier" "', argument " "1"" of type '" "eprosima::fastdds::dds::xtypes::TypeIdentifierPair &""'"); 
+  }
+  arg1 = reinterpret_cast< eprosima::fastdds::dds::xtypes::TypeIdentifierPair * >(argp1);
+  ICD_pkg::register_HelloWorldKeyed_type_identifier(*arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN int Swig_var_ICD_pkg_HelloWorldKeyed_max_cdr_typesize_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorldKeyed_max_cdr_typesize is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorldKeyed_max_cdr_typesize_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorldKeyed_max_cdr_typesize));
+  return pyobj;
+}
+
+
+SWIGINTERN int Swig_var_ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize));
+  return pyobj;
+}
+
+
+SWIGINTERN int Swig_var_ICD_pkg_HelloWorldFixed_max_cdr_typesize_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorldFixed_max_cdr_typesize is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorldFixed_max_cdr_typesize_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorldFixed_max_cdr_typesize));
+  return pyobj;
+}
+
+
+SWIGINTERN int Swig_var_ICD_pkg_HelloWorldFixed_max_key_cdr_typesize_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorldFixed_max_key_cdr_typesize is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorldFixed_max_key_cdr_typesize_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorldFixed_max_key_cdr_typesize));
+  return pyobj;
+}
+
+
+SWIGINTERN int Swig_var_ICD_pkg_HelloWorld_max_cdr_typesize_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorld_max_cdr_typesize is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorld_max_cdr_typesize_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorld_max_cdr_typesize));
+  return pyobj;
+}
+
+
+SWIGINTERN int Swig_var_ICD_pkg_HelloWorld_max_key_cdr_typesize_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable ICD_pkg_HelloWorld_max_key_cdr_typesize is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorld_max_key_cdr_typesize_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorld_max_key_cdr_typesize));
+  return pyobj;
+}
+
+
+SWIGINTERN PyObject *_wrap_serialize_key__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  eprosima::fastcdr::Cdr *arg1 = 0 ;
+  ICD_pkg::HelloWorld *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastcdr__Cdr,  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
+  }
+  arg1 = reinterpret_cast< eprosima::fastcdr::Cdr * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorld,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorld const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorld const &""'"); 
+  }
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp2);
+  eprosima::fastcdr::serialize_key(*arg1,(ICD_pkg::HelloWorld const &)*arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_serialize_key__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  eprosima::fastcdr::Cdr *arg1 = 0 ;
+  ICD_pkg::HelloWorldFixed *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastcdr__Cdr,  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
+  }
+  arg1 = reinterpret_cast< eprosima::fastcdr::Cdr * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorldFixed,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorldFixed const &""'"); 
+  }
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorldFixed * >(argp2);
+  eprosima::fastcdr::serialize_key(*arg1,(ICD_pkg::HelloWorldFixed const &)*arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_serialize_key__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  eprosima::fastcdr::Cdr *arg1 = 0 ;
+  ICD_pkg::HelloWorldKeyed *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastcdr__Cdr,  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
+  }
+  arg1 = reinterpret_cast< eprosima::fastcdr::Cdr * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorldKeyed const &""'"); 
+  }
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorldKeyed * >(argp2);
+  eprosima::fastcdr::serialize_key(*arg1,(ICD_pkg::HelloWorldKeyed const &)*arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_serialize_key(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "serialize_key", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_eprosima__fastcdr__Cdr, SWIG_POINTER_NO_NULL);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_ICD_pkg__HelloWorld, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_serialize_key__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_eprosima__fastcdr__Cdr, SWIG_POINTER_NO_NULL);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_ICD_pkg__HelloWorldFixed, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_serialize_key__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_eprosima__fastcdr__Cdr, SWIG_POINTER_NO_NULL);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_ICD_pkg__HelloWorldKeyed, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_serialize_key__SWIG_2(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'serialize_key'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    eprosima::fastcdr::serialize_key(eprosima::fastcdr::Cdr &,ICD_pkg::HelloWorld const &)\n"
+    "    eprosima::fastcdr::serialize_key(eprosima::fastcdr::Cdr &,ICD_pkg::HelloWorldFixed const &)\n"
+    "    eprosima::fastcdr::serialize_key(eprosima::fastcdr::Cdr &,ICD_pkg::HelloWorldKeyed const &)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_reliability_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_reliability_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_reliability_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_reliability_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->reliability = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_reliability_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_reliability_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->reliability);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_durability_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_durability_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_durability_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_durability_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->durability = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_durability_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_durability_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->durability);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_history_kind_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_history_kind_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_history_kind_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_history_kind_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->history_kind = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_history_kind_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_history_kind_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->history_kind);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_history_depth_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_history_depth_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_history_depth_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_history_depth_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->history_depth = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_history_depth_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_history_depth_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->history_depth);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_max_samples_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_max_samples_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_max_samples_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_max_samples_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->max_samples = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_max_samples_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_max_samples_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->max_samples);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_max_instances_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_max_instances_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_max_instances_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_max_instances_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->max_instances = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_max_instances_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_max_instances_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->max_instances);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_max_samples_per_instance_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_max_samples_per_instance_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_max_samples_per_instance_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_max_samples_per_instance_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->max_samples_per_instance = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_max_samples_per_instance_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_max_samples_per_instance_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->max_samples_per_instance);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_publish_mode_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_publish_mode_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_publish_mode_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_publish_mode_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->publish_mode = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_publish_mode_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_publish_mode_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->publish_mode);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_data_sharing_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_qos_t_data_sharing_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_data_sharing_set" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_qos_t_data_sharing_set" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->data_sharing = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_qos_t_data_sharing_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_qos_t_data_sharing_get" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int32_t) ((arg1)->data_sharing);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_dds_qos_t(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "new_dds_qos_t", 0, 0, 0)) SWIG_fail;
+  result = (dds_qos_s *)new dds_qos_s();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_qos_s, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_dds_qos_t(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_qos_s *arg1 = (dds_qos_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_qos_s, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_dds_qos_t" "', argument " "1"" of type '" "dds_qos_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_qos_s * >(argp1);
+  delete arg1;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *dds_qos_t_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_dds_qos_s, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *dds_qos_t_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_dds_init(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_init" "', argument " "1"" of type '" "char const *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_init((char const *)arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_init_with_domain(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  uint32_t arg2 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_init_with_domain", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_init_with_domain" "', argument " "1"" of type '" "char const *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_init_with_domain" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_init_with_domain((char const *)arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_init_with_qos(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  uint32_t arg2 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_init_with_qos", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_init_with_qos" "', argument " "1"" of type '" "char const *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_init_with_qos" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_init_with_qos" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_init_with_qos((char const *)arg1,arg2,(dds_qos_s const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_init_filtered(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  uint32_t arg2 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  char *arg4 = (char *) 0 ;
+  char **arg5 = (char **) 0 ;
+  uint32_t arg6 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  std::vector< std::string > strings5 ;
+  std::vector< char const * > pointers5 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_init_filtered", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_init_filtered" "', argument " "1"" of type '" "char const *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_init_filtered" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_init_filtered" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(swig_obj[3], &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "dds_init_filtered" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  {
+    if (swig_obj[4] != Py_None) {
+      PyObject* seq = PySequence_Fast(swig_obj[4], "filter parameters must be a sequence of str");
+      if (!seq) SWIG_fail;
+      Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+      for (Py_ssize_t i = 0; i < count; ++i) {
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        const char* utf8 = PyUnicode_Check(item) ? PyUnicode_AsUTF8(item) : NULL;
+        if (!utf8) {
+          if (!PyErr_Occurred()) PyErr_SetString(PyExc_TypeError, "filter parameters must be str");
+          Py_DECREF(seq);
+          SWIG_fail;
+        }
+        strings5.push_back(utf8);
+      }
+      Py_DECREF(seq);
+      for (size_t i = 0; i < strings5.size(); ++i) pointers5.push_back(strings5[i].c_str());
+    }
+    arg5 = (char **)(pointers5.empty() ? NULL : &pointers5[0]);
+    arg6 = (uint32_t)pointers5.size();
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_init_filtered((char const *)arg1,arg2,(dds_qos_s const *)arg3,(char const *)arg4,(char const *const *)arg5,arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_set_filter_parameters(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  char **arg1 = (char **) 0 ;
+  uint32_t arg2 ;
+  std::vector< std::string > strings1 ;
+  std::vector< char const * > pointers1 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    if (swig_obj[0] != Py_None) {
+      PyObject* seq = PySequence_Fast(swig_obj[0], "filter parameters must be a sequence of str");
+      if (!seq) SWIG_fail;
+      Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+      for (Py_ssize_t i = 0; i < count; ++i) {
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        const char* utf8 = PyUnicode_Check(item) ? PyUnicode_AsUTF8(item) : NULL;
+        if (!utf8) {
+          if (!PyErr_Occurred()) PyErr_SetString(PyExc_TypeError, "filter parameters must be str");
+          Py_DECREF(seq);
+          SWIG_fail;
+        }
+        strings1.push_back(utf8);
+      }
+      Py_DECREF(seq);
+      for (size_t i = 0; i < strings1.size(); ++i) pointers1.push_back(strings1[i].c_str());
+    }
+    arg1 = (char **)(pointers1.empty() ? NULL : &pointers1[0]);
+    arg2 = (uint32_t)pointers1.size();
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_set_filter_parameters((char const *const *)arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_write(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t arg1 ;
+  char *arg2 = (char *) 0 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_write", 2, 2, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_write" "', argument " "1"" of type '" "uint32_t""'");
+  } 
+  arg1 = static_cast< uint32_t >(val1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_write" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_write(arg1,(char const *)arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_write_struct(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorld *arg1 = (ICD_pkg::HelloWorld *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorld, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_write_struct" "', argument " "1"" of type '" "ICD_pkg::HelloWorld const *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_write_struct((ICD_pkg::HelloWorld const *)arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_write_batch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t arg1 ;
+  uint32_t *arg2 = (uint32_t *) 0 ;
+  char *arg3 = (char *) 0 ;
+  uint32_t *arg4 = (uint32_t *) 0 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_write_batch", 4, 4, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_write_batch" "', argument " "1"" of type '" "uint32_t""'");
+  } 
+  arg1 = static_cast< uint32_t >(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_write_batch" "', argument " "2"" of type '" "uint32_t const *""'"); 
+  }
+  arg2 = reinterpret_cast< uint32_t * >(argp2);
+  res3 = SWIG_AsCharPtrAndSize(swig_obj[2], &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_write_batch" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = reinterpret_cast< char * >(buf3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "dds_write_batch" "', argument " "4"" of type '" "uint32_t const *""'"); 
+  }
+  arg4 = reinterpret_cast< uint32_t * >(argp4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_write_batch(arg1,(unsigned int const *)arg2,(char const *)arg3,(unsigned int const *)arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return resultobj;
+fail:
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t *arg1 = (uint32_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_take", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take" "', argument " "1"" of type '" "uint32_t *""'"); 
+  }
+  arg1 = reinterpret_cast< uint32_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_take" "', argument " "2"" of type '" "char *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "dds_take" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_take(arg1,arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_struct(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ICD_pkg::HelloWorld *arg1 = (ICD_pkg::HelloWorld *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorld, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take_struct" "', argument " "1"" of type '" "ICD_pkg::HelloWorld *""'"); 
+  }
+  arg1 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_take_struct(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_batch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t arg1 ;
+  uint32_t *arg2 = (uint32_t *) 0 ;
+  char *arg3 = (char *) 0 ;
+  uint32_t arg4 ;
+  uint32_t *arg5 = (uint32_t *) 0 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  unsigned int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_take_batch", 5, 5, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_take_batch" "', argument " "1"" of type '" "uint32_t""'");
+  } 
+  arg1 = static_cast< uint32_t >(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_take_batch" "', argument " "2"" of type '" "uint32_t *""'"); 
+  }
+  arg2 = reinterpret_cast< uint32_t * >(argp2);
+  res3 = SWIG_AsCharPtrAndSize(swig_obj[2], &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_take_batch" "', argument " "3"" of type '" "char *""'");
+  }
+  arg3 = reinterpret_cast< char * >(buf3);
+  ecode4 = SWIG_AsVal_unsigned_SS_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "dds_take_batch" "', argument " "4"" of type '" "uint32_t""'");
+  } 
+  arg4 = static_cast< uint32_t >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "dds_take_batch" "', argument " "5"" of type '" "uint32_t *""'"); 
+  }
+  arg5 = reinterpret_cast< uint32_t * >(argp5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_take_batch(arg1,arg2,arg3,arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return resultobj;
+fail:
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_wait_for_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int32_t arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_wait_for_data" "', argument " "1"" of type '" "int32_t""'");
+  } 
+  arg1 = static_cast< int32_t >(val1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_wait_for_data(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_set_data_notify_fd(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  intptr_t arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_set_data_notify_fd" "', argument " "1"" of type '" "intptr_t""'");
+  } 
+  arg1 = static_cast< intptr_t >(val1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_set_data_notify_fd(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_message(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t *arg1 = (uint32_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  char *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take_message" "', argument " "1"" of type '" "uint32_t *""'"); 
+  }
+  arg1 = reinterpret_cast< uint32_t * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (char *)dds_take_message(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_FromCharPtr((const char *)result);
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_shutdown(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_shutdown", 0, 0, 0)) SWIG_fail;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_shutdown();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_set_keep_participant(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_set_keep_participant" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = static_cast< int >(val1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_set_keep_participant(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_keep_participant(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_keep_participant", 0, 0, 0)) SWIG_fail;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_keep_participant();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_participant_create(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t arg1 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  dds_participant_t *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_participant_create" "', argument " "1"" of type '" "uint32_t""'");
+  } 
+  arg1 = static_cast< uint32_t >(val1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_participant_t *)dds_participant_create(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_participant_create_with_transport(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t arg1 ;
+  int32_t arg2 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  dds_participant_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_participant_create_with_transport", 2, 2, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_participant_create_with_transport" "', argument " "1"" of type '" "uint32_t""'");
+  } 
+  arg1 = static_cast< uint32_t >(val1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_participant_create_with_transport" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_participant_t *)dds_participant_create_with_transport(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_participant_delete(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_participant_delete" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_participant_delete(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_create(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject *swig_obj[2] ;
+  dds_writer_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_create", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_create" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_create" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_writer_t *)dds_writer_create(arg1,(char const *)arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_create_with_qos(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  dds_writer_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_create_with_qos", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_create_with_qos" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_create_with_qos" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_writer_create_with_qos" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_writer_t *)dds_writer_create_with_qos(arg1,(char const *)arg2,(dds_qos_s const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_delete(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_delete" "', argument " "1"" of type '" "dds_writer_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_writer_delete(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_write(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  uint32_t arg2 ;
+  char *arg3 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_write", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_write" "', argument " "1"" of type '" "dds_writer_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_writer_write" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  res3 = SWIG_AsCharPtrAndSize(swig_obj[2], &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_writer_write" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = reinterpret_cast< char * >(buf3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_writer_write(arg1,arg2,(char const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return resultobj;
+fail:
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_write_struct(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  ICD_pkg::HelloWorld *arg2 = (ICD_pkg::HelloWorld *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_write_struct", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_write_struct" "', argument " "1"" of type '" "dds_writer_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_ICD_pkg__HelloWorld, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_write_struct" "', argument " "2"" of type '" "ICD_pkg::HelloWorld const *""'"); 
+  }
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_writer_write_struct(arg1,(ICD_pkg::HelloWorld const *)arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_write_batch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  uint32_t arg2 ;
+  uint32_t *arg3 = (uint32_t *) 0 ;
+  char *arg4 = (char *) 0 ;
+  uint32_t *arg5 = (uint32_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_write_batch", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_write_batch" "', argument " "1"" of type '" "dds_writer_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_writer_write_batch" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_writer_write_batch" "', argument " "3"" of type '" "uint32_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< uint32_t * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(swig_obj[3], &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "dds_writer_write_batch" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "dds_writer_write_batch" "', argument " "5"" of type '" "uint32_t const *""'"); 
+  }
+  arg5 = reinterpret_cast< uint32_t * >(argp5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_writer_write_batch(arg1,arg2,(unsigned int const *)arg3,(char const *)arg4,(unsigned int const *)arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return resultobj;
+fail:
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_create(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject *swig_obj[2] ;
+  dds_reader_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_create", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_create" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_reader_create" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_reader_t *)dds_reader_create(arg1,(char const *)arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_create_with_qos(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  dds_reader_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_create_with_qos", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_create_with_qos" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_reader_create_with_qos" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_reader_create_with_qos" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_reader_t *)dds_reader_create_with_qos(arg1,(char const *)arg2,(dds_qos_s const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_delete(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_delete" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_reader_delete(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  uint32_t *arg2 = (uint32_t *) 0 ;
+  char *arg3 = (char *) 0 ;
+  int arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_take", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_reader_take" "', argument " "2"" of type '" "uint32_t *""'"); 
+  }
+  arg2 = reinterpret_cast< uint32_t * >(argp2);
+  res3 = SWIG_AsCharPtrAndSize(swig_obj[2], &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_reader_take" "', argument " "3"" of type '" "char *""'");
+  }
+  arg3 = reinterpret_cast< char * >(buf3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "dds_reader_take" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_reader_take(arg1,arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return resultobj;
+fail:
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_struct(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  ICD_pkg::HelloWorld *arg2 = (ICD_pkg::HelloWorld *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_take_struct", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_struct" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_ICD_pkg__HelloWorld, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_reader_take_struct" "', argument " "2"" of type '" "ICD_pkg::HelloWorld *""'"); 
+  }
+  arg2 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_reader_take_struct(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_batch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  uint32_t arg2 ;
+  uint32_t *arg3 = (uint32_t *) 0 ;
+  char *arg4 = (char *) 0 ;
+  uint32_t arg5 ;
+  uint32_t *arg6 = (uint32_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  unsigned int val5 ;
+  int ecode5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  PyObject *swig_obj[6] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_take_batch", 6, 6, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_batch" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_take_batch" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_reader_take_batch" "', argument " "3"" of type '" "uint32_t *""'"); 
+  }
+  arg3 = reinterpret_cast< uint32_t * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(swig_obj[3], &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "dds_reader_take_batch" "', argument " "4"" of type '" "char *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  ecode5 = SWIG_AsVal_unsigned_SS_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "dds_reader_take_batch" "', argument " "5"" of type '" "uint32_t""'");
+  } 
+  arg5 = static_cast< uint32_t >(val5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "dds_reader_take_batch" "', argument " "6"" of type '" "uint32_t *""'"); 
+  }
+  arg6 = reinterpret_cast< uint32_t * >(argp6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_reader_take_batch(arg1,arg2,arg3,arg4,arg5,arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return resultobj;
+fail:
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_create_filtered(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  char *arg4 = (char *) 0 ;
+  char **arg5 = (char **) 0 ;
+  uint32_t arg6 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  std::vector< std::string > strings5 ;
+  std::vector< char const * > pointers5 ;
+  PyObject *swig_obj[5] ;
+  dds_reader_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_create_filtered", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_create_filtered" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_reader_create_filtered" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_reader_create_filtered" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(swig_obj[3], &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "dds_reader_create_filtered" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  {
+    if (swig_obj[4] != Py_None) {
+      PyObject* seq = PySequence_Fast(swig_obj[4], "filter parameters must be a sequence of str");
+      if (!seq) SWIG_fail;
+      Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+      for (Py_ssize_t i = 0; i < count; ++i) {
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        const char* utf8 = PyUnicode_Check(item) ? PyUnicode_AsUTF8(item) : NULL;
+        if (!utf8) {
+          if (!PyErr_Occurred()) PyErr_SetString(PyExc_TypeError, "filter parameters must be str");
+          Py_DECREF(seq);
+          SWIG_fail;
+        }
+        strings5.push_back(utf8);
+      }
+      Py_DECREF(seq);
+      for (size_t i = 0; i < strings5.size(); ++i) pointers5.push_back(strings5[i].c_str());
+    }
+    arg5 = (char **)(pointers5.empty() ? NULL : &pointers5[0]);
+    arg6 = (uint32_t)pointers5.size();
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_reader_t *)dds_reader_create_filtered(arg1,(char const *)arg2,(dds_qos_s const *)arg3,(char const *)arg4,(char const *const *)arg5,arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_set_filter_parameters(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  char **arg2 = (char **) 0 ;
+  uint32_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::vector< std::string > strings2 ;
+  std::vector< char const * > pointers2 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_set_filter_parameters", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_set_filter_parameters" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  {
+    if (swig_obj[1] != Py_None) {
+      PyObject* seq = PySequence_Fast(swig_obj[1], "filter parameters must be a sequence of str");
+      if (!seq) SWIG_fail;
+      Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+      for (Py_ssize_t i = 0; i < count; ++i) {
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        const char* utf8 = PyUnicode_Check(item) ? PyUnicode_AsUTF8(item) : NULL;
+        if (!utf8) {
+          if (!PyErr_Occurred()) PyErr_SetString(PyExc_TypeError, "filter parameters must be str");
+          Py_DECREF(seq);
+          SWIG_fail;
+        }
+        strings2.push_back(utf8);
+      }
+      Py_DECREF(seq);
+      for (size_t i = 0; i < strings2.size(); ++i) pointers2.push_back(strings2[i].c_str());
+    }
+    arg2 = (char **)(pointers2.empty() ? NULL : &pointers2[0]);
+    arg3 = (uint32_t)pointers2.size();
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_reader_set_filter_parameters(arg1,(char const *const *)arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_wait_for_data(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  int32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_wait_for_data", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_wait_for_data" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_wait_for_data" "', argument " "2"" of type '" "int32_t""'");
+  } 
+  arg2 = static_cast< int32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_reader_wait_for_data(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_set_data_notify_fd(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  intptr_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_set_data_notify_fd", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_set_data_notify_fd" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_set_data_notify_fd" "', argument " "2"" of type '" "intptr_t""'");
+  } 
+  arg2 = static_cast< intptr_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_reader_set_data_notify_fd(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_create_fixed(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  dds_writer_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_create_fixed", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_create_fixed" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_create_fixed" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_writer_create_fixed" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_writer_t *)dds_writer_create_fixed(arg1,(char const *)arg2,(dds_qos_s const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_create_fixed(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  dds_reader_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_create_fixed", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_create_fixed" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_reader_create_fixed" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_reader_create_fixed" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_reader_t *)dds_reader_create_fixed(arg1,(char const *)arg2,(dds_qos_s const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_loan_t_sample_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_loan_s *arg1 = (dds_loan_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  ICD_pkg::HelloWorldFixed *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_loan_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_loan_t_sample_get" "', argument " "1"" of type '" "dds_loan_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_loan_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (ICD_pkg::HelloWorldFixed *) ((arg1)->sample);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ICD_pkg__HelloWorldFixed, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_loan_t_message_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_loan_s *arg1 = (dds_loan_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  char *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_loan_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_loan_t_message_get" "', argument " "1"" of type '" "dds_loan_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_loan_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (char *) ((arg1)->message);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_FromCharPtr((const char *)result);
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_loan_t_capacity_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_loan_s *arg1 = (dds_loan_s *) 0 ;
+  uint32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_loan_t_capacity_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_loan_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_loan_t_capacity_set" "', argument " "1"" of type '" "dds_loan_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_loan_s * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_loan_t_capacity_set" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->capacity = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_loan_t_capacity_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_loan_s *arg1 = (dds_loan_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  uint32_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_loan_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_loan_t_capacity_get" "', argument " "1"" of type '" "dds_loan_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_loan_s * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint32_t) ((arg1)->capacity);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_dds_loan_t(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_loan_s *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "new_dds_loan_t", 0, 0, 0)) SWIG_fail;
+  result = (dds_loan_s *)new dds_loan_s();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_loan_s, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_dds_loan_t(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_loan_s *arg1 = (dds_loan_s *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_loan_s, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_dds_loan_t" "', argument " "1"" of type '" "dds_loan_s *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_loan_s * >(argp1);
+  delete arg1;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *dds_loan_t_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_dds_loan_s, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *dds_loan_t_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_dds_writer_loan(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  dds_loan_t *arg2 = (dds_loan_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_loan", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_loan" "', argument " "1"" of type '" "dds_writer_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_dds_loan_s, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_loan" "', argument " "2"" of type '" "dds_loan_t *""'"); 
+  }
+  arg2 = reinterpret_cast< dds_loan_t * >(argp2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_writer_loan(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_write_loan(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  dds_loan_t *arg2 = (dds_loan_t *) 0 ;
+  uint32_t arg3 ;
+  uint32_t arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  unsigned int val3 ;
+  int ecode3 = 0 ;
+  unsigned int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_write_loan", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_write_loan" "', argument " "1"" of type '" "dds_writer_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_dds_loan_s, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_write_loan" "', argument " "2"" of type '" "dds_loan_t *""'"); 
+  }
+  arg2 = reinterpret_cast< dds_loan_t * >(argp2);
+  ecode3 = SWIG_AsVal_unsigned_SS_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "dds_writer_write_loan" "', argument " "3"" of type '" "uint32_t""'");
+  } 
+  arg3 = static_cast< uint32_t >(val3);
+  ecode4 = SWIG_AsVal_unsigned_SS_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "dds_writer_write_loan" "', argument " "4"" of type '" "uint32_t""'");
+  } 
+  arg4 = static_cast< uint32_t >(val4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_writer_write_loan(arg1,arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_discard_loan(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  dds_loan_t *arg2 = (dds_loan_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_discard_loan", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_discard_loan" "', argument " "1"" of type '" "dds_writer_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_dds_loan_s, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_discard_loan" "', argument " "2"" of type '" "dds_loan_t *""'"); 
+  }
+  arg2 = reinterpret_cast< dds_loan_t * >(argp2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_writer_discard_loan(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_writer_create_keyed(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  dds_writer_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_create_keyed", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_create_keyed" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_writer_create_keyed" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_writer_create_keyed" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_writer_t *)dds_writer_create_keyed(arg1,(char const *)arg2,(dds_qos_s const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_writer_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_create_keyed(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_participant_t *arg1 = (dds_participant_t *) 0 ;
+  char *arg2 = (char *) 0 ;
+  dds_qos_t *arg3 = (dds_qos_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  dds_reader_t *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_create_keyed", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_participant_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_create_keyed" "', argument " "1"" of type '" "dds_participant_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_participant_t * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_reader_create_keyed" "', argument " "2"" of type '" "char const *""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_dds_qos_s, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_reader_create_keyed" "', argument " "3"" of type '" "dds_qos_t const *""'"); 
+  }
+  arg3 = reinterpret_cast< dds_qos_t * >(argp3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (dds_reader_t *)dds_reader_create_keyed(arg1,(char const *)arg2,(dds_qos_s const *)arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_lookup_instance(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  uint32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_lookup_instance", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_lookup_instance" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_lookup_instance" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_reader_lookup_instance(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_read_instance(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  uint32_t arg2 ;
+  char *arg3 = (char *) 0 ;
+  uint32_t arg4 ;
+  uint32_t *arg5 = (uint32_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  unsigned int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_read_instance", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_read_instance" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_read_instance" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  res3 = SWIG_AsCharPtrAndSize(swig_obj[2], &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "dds_reader_read_instance" "', argument " "3"" of type '" "char *""'");
+  }
+  arg3 = reinterpret_cast< char * >(buf3);
+  ecode4 = SWIG_AsVal_unsigned_SS_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "dds_reader_read_instance" "', argument " "4"" of type '" "uint32_t""'");
+  } 
+  arg4 = static_cast< uint32_t >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "dds_reader_read_instance" "', argument " "5"" of type '" "uint32_t *""'"); 
+  }
+  arg5 = reinterpret_cast< uint32_t * >(argp5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_reader_read_instance(arg1,arg2,arg3,arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return resultobj;
+fail:
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_stats_enable(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_stats_enable" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = static_cast< int >(val1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    dds_stats_enable(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_stats_enabled(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_stats_enabled", 0, 0, 0)) SWIG_fail;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)dds_stats_enabled();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_histogram_bucket_lower(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  uint32_t arg1 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  uint64_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_histogram_bucket_lower" "', argument " "1"" of type '" "uint32_t""'");
+  } 
+  arg1 = static_cast< uint32_t >(val1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint64_t)dds_histogram_bucket_lower(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_unsigned_SS_long_SS_long(static_cast< unsigned long long >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_string(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  unsigned int *arg1 = (unsigned int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  char *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take_string" "', argument " "1"" of type '" "unsigned int *""'"); 
+  }
+  arg1 = reinterpret_cast< unsigned int * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (char *)dds_take_string(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_FromCharPtr((const char *)result);
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_batch_list__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  unsigned int arg1 ;
+  bool arg2 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_take_batch_list" "', argument " "1"" of type '" "unsigned int""'");
+  } 
+  arg1 = static_cast< unsigned int >(val1);
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_take_batch_list" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  result = (PyObject *)dds_take_batch_list(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_batch_list__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  unsigned int arg1 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_take_batch_list" "', argument " "1"" of type '" "unsigned int""'");
+  } 
+  arg1 = static_cast< unsigned int >(val1);
+  result = (PyObject *)dds_take_batch_list(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_batch_list(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "dds_take_batch_list", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    {
+      int res = SWIG_AsVal_unsigned_SS_int(argv[0], NULL);
+      _v = SWIG_CheckState(res);
+    }
+    if (_v) {
+      return _wrap_dds_take_batch_list__SWIG_1(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    {
+      int res = SWIG_AsVal_unsigned_SS_int(argv[0], NULL);
+      _v = SWIG_CheckState(res);
+    }
+    if (_v) {
+      {
+        int res = SWIG_AsVal_bool(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_dds_take_batch_list__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'dds_take_batch_list'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    dds_take_batch_list(unsigned int,bool)\n"
+    "    dds_take_batch_list(unsigned int)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_batch_list__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  unsigned int arg2 ;
+  bool arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_batch_list" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_take_batch_list" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "dds_reader_take_batch_list" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  result = (PyObject *)dds_reader_take_batch_list(arg1,arg2,arg3);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_batch_list__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_batch_list" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_take_batch_list" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  result = (PyObject *)dds_reader_take_batch_list(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_batch_list(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "dds_reader_take_batch_list", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_dds_reader_s, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_dds_reader_take_batch_list__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_dds_reader_s, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          return _wrap_dds_reader_take_batch_list__SWIG_0(self, argc, argv);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'dds_reader_take_batch_list'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    dds_reader_take_batch_list(dds_reader_t *,unsigned int,bool)\n"
+    "    dds_reader_take_batch_list(dds_reader_t *,unsigned int)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_samples__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  unsigned int arg1 ;
+  bool arg2 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_take_samples" "', argument " "1"" of type '" "unsigned int""'");
+  } 
+  arg1 = static_cast< unsigned int >(val1);
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_take_samples" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  result = (PyObject *)dds_take_samples(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_samples__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  unsigned int arg1 ;
+  unsigned int val1 ;
+  int ecode1 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_take_samples" "', argument " "1"" of type '" "unsigned int""'");
+  } 
+  arg1 = static_cast< unsigned int >(val1);
+  result = (PyObject *)dds_take_samples(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_samples__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
+  PyObject *resultobj = 0;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 0) || (nobjs > 0)) SWIG_fail;
+  result = (PyObject *)dds_take_samples();
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_samples(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "dds_take_samples", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 0) {
+    return _wrap_dds_take_samples__SWIG_2(self, argc, argv);
+  }
+  if (argc == 1) {
+    int _v = 0;
+    {
+      int res = SWIG_AsVal_unsigned_SS_int(argv[0], NULL);
+      _v = SWIG_CheckState(res);
+    }
+    if (_v) {
+      return _wrap_dds_take_samples__SWIG_1(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    {
+      int res = SWIG_AsVal_unsigned_SS_int(argv[0], NULL);
+      _v = SWIG_CheckState(res);
+    }
+    if (_v) {
+      {
+        int res = SWIG_AsVal_bool(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_dds_take_samples__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'dds_take_samples'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    dds_take_samples(unsigned int,bool)\n"
+    "    dds_take_samples(unsigned int)\n"
+    "    dds_take_samples()\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_samples__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  unsigned int arg2 ;
+  bool arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_samples" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_take_samples" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "dds_reader_take_samples" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  result = (PyObject *)dds_reader_take_samples(arg1,arg2,arg3);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_samples__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_samples" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_take_samples" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  result = (PyObject *)dds_reader_take_samples(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_samples__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_samples" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  result = (PyObject *)dds_reader_take_samples(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_samples(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "dds_reader_take_samples", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_dds_reader_s, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_dds_reader_take_samples__SWIG_2(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_dds_reader_s, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_dds_reader_take_samples__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_dds_reader_s, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          return _wrap_dds_reader_take_samples__SWIG_0(self, argc, argv);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'dds_reader_take_samples'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    dds_reader_take_samples(dds_reader_t *,unsigned int,bool)\n"
+    "    dds_reader_take_samples(dds_reader_t *,unsigned int)\n"
+    "    dds_reader_take_samples(dds_reader_t *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_take_batch_into(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  PyObject *arg1 = (PyObject *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  PyObject *swig_obj[3] ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_take_batch_into", 3, 3, swig_obj)) SWIG_fail;
+  arg1 = swig_obj[0];
+  arg2 = swig_obj[1];
+  arg3 = swig_obj[2];
+  result = (PyObject *)dds_take_batch_into(arg1,arg2,arg3);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_dds_reader_take_batch_into(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  PyObject *arg4 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[4] ;
+  PyObject *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_reader_take_batch_into", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_take_batch_into" "', argument " "1"" of type '" "dds_reader_t *""'"); 
+  }
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  arg2 = swig_obj[1];
+  arg3 = swig_obj[2];
+  arg4 = swig_obj[3];
+  result = (PyObject *)dds_reader_take_batch_into(arg1,arg2,arg3,arg4);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *Swig_var_ICD_pkg_HelloWorld_max_key_cdr_typesize_get(void) {
-  PyObject *pyobj = 0;
+SWIGINTERN PyObject *_wrap_dds_write_batch_buffers(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  PyObject *arg1 = (PyObject *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  PyObject *swig_obj[3] ;
+  PyObject *result = 0 ;
   
-  pyobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(ICD_pkg_HelloWorld_max_key_cdr_typesize));
-  return pyobj;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "dds_write_batch_buffers", 3, 3, swig_obj)) SWIG_fail;
+  arg1 = swig_obj[0];
+  arg2 = swig_obj[1];
+  arg3 = swig_obj[2];
+  result = (PyObject *)dds_write_batch_buffers(arg1,arg2,arg3);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_serialize_key(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_writer_write_batch_buffers(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  eprosima::fastcdr::Cdr *arg1 = 0 ;
-  ICD_pkg::HelloWorld *arg2 = 0 ;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  PyObject *arg4 = (PyObject *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject *swig_obj[2] ;
+  PyObject *swig_obj[4] ;
+  PyObject *result = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "serialize_key", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_eprosima__fastcdr__Cdr,  0 );
+  if (!SWIG_Python_UnpackTuple(args, "dds_writer_write_batch_buffers", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "1"" of type '" "eprosima::fastcdr::Cdr &""'"); 
-  }
-  arg1 = reinterpret_cast< eprosima::fastcdr::Cdr * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_ICD_pkg__HelloWorld,  0  | 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorld const &""'"); 
-  }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "serialize_key" "', argument " "2"" of type '" "ICD_pkg::HelloWorld const &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_write_batch_buffers" "', argument " "1"" of type '" "dds_writer_t *""'"); 
   }
-  arg2 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp2);
-  eprosima::fastcdr::serialize_key(*arg1,(ICD_pkg::HelloWorld const &)*arg2);
-  resultobj = SWIG_Py_Void();
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  arg2 = swig_obj[1];
+  arg3 = swig_obj[2];
+  arg4 = swig_obj[3];
+  result = (PyObject *)dds_writer_write_batch_buffers(arg1,arg2,arg3,arg4);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_init(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_loan_buffer(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  char *arg1 = (char *) 0 ;
-  int res1 ;
-  char *buf1 = 0 ;
-  int alloc1 = 0 ;
+  dds_loan_t *arg1 = (dds_loan_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  int result;
+  PyObject *result = 0 ;
   
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_loan_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_init" "', argument " "1"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_loan_buffer" "', argument " "1"" of type '" "dds_loan_t *""'"); 
   }
-  arg1 = reinterpret_cast< char * >(buf1);
-  result = (int)dds_init((char const *)arg1);
-  resultobj = SWIG_From_int(static_cast< int >(result));
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  arg1 = reinterpret_cast< dds_loan_t * >(argp1);
+  result = (PyObject *)dds_loan_buffer(arg1);
+  resultobj = result;
   return resultobj;
 fail:
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_init_with_domain(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_reader_read_instance_message__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  char *arg1 = (char *) 0 ;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
   uint32_t arg2 ;
-  int res1 ;
-  char *buf1 = 0 ;
-  int alloc1 = 0 ;
+  bool arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
   unsigned int val2 ;
   int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  int result;
+  bool val3 ;
+  int ecode3 = 0 ;
+  PyObject *result = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "dds_init_with_domain", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_init_with_domain" "', argument " "1"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_read_instance_message" "', argument " "1"" of type '" "dds_reader_t *""'"); 
   }
-  arg1 = reinterpret_cast< char * >(buf1);
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
   ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_init_with_domain" "', argument " "2"" of type '" "uint32_t""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_read_instance_message" "', argument " "2"" of type '" "uint32_t""'");
   } 
   arg2 = static_cast< uint32_t >(val2);
-  result = (int)dds_init_with_domain((char const *)arg1,arg2);
-  resultobj = SWIG_From_int(static_cast< int >(result));
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "dds_reader_read_instance_message" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  result = (PyObject *)dds_reader_read_instance_message(arg1,arg2,arg3);
+  resultobj = result;
   return resultobj;
 fail:
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_write(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_reader_read_instance_message__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  uint32_t arg1 ;
-  char *arg2 = (char *) 0 ;
-  unsigned int val1 ;
-  int ecode1 = 0 ;
-  int res2 ;
-  char *buf2 = 0 ;
-  int alloc2 = 0 ;
-  PyObject *swig_obj[2] ;
-  int result;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
+  uint32_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *result = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "dds_write", 2, 2, swig_obj)) SWIG_fail;
-  ecode1 = SWIG_AsVal_unsigned_SS_int(swig_obj[0], &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "dds_write" "', argument " "1"" of type '" "uint32_t""'");
-  } 
-  arg1 = static_cast< uint32_t >(val1);
-  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_write" "', argument " "2"" of type '" "char const *""'");
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_read_instance_message" "', argument " "1"" of type '" "dds_reader_t *""'"); 
   }
-  arg2 = reinterpret_cast< char * >(buf2);
-  result = (int)dds_write(arg1,(char const *)arg2);
-  resultobj = SWIG_From_int(static_cast< int >(result));
-  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "dds_reader_read_instance_message" "', argument " "2"" of type '" "uint32_t""'");
+  } 
+  arg2 = static_cast< uint32_t >(val2);
+  result = (PyObject *)dds_reader_read_instance_message(arg1,arg2);
+  resultobj = result;
   return resultobj;
 fail:
-  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_write_struct(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  ICD_pkg::HelloWorld *arg1 = (ICD_pkg::HelloWorld *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  int result;
+SWIGINTERN PyObject *_wrap_dds_reader_read_instance_message(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
   
-  (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorld, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_write_struct" "', argument " "1"" of type '" "ICD_pkg::HelloWorld const *""'"); 
+  if (!(argc = SWIG_Python_UnpackTuple(args, "dds_reader_read_instance_message", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_dds_reader_s, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_dds_reader_read_instance_message__SWIG_1(self, argc, argv);
+      }
+    }
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp1);
-  result = (int)dds_write_struct((ICD_pkg::HelloWorld const *)arg1);
-  resultobj = SWIG_From_int(static_cast< int >(result));
-  return resultobj;
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_dds_reader_s, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          return _wrap_dds_reader_read_instance_message__SWIG_0(self, argc, argv);
+        }
+      }
+    }
+  }
+  
 fail:
-  return NULL;
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'dds_reader_read_instance_message'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    dds_reader_read_instance_message(dds_reader_t *,uint32_t,bool)\n"
+    "    dds_reader_read_instance_message(dds_reader_t *,uint32_t)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_take(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_get_stats_dict(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  uint32_t *arg1 = (uint32_t *) 0 ;
-  char *arg2 = (char *) 0 ;
-  int arg3 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  int res2 ;
-  char *buf2 = 0 ;
-  int alloc2 = 0 ;
-  int val3 ;
-  int ecode3 = 0 ;
-  PyObject *swig_obj[3] ;
-  int result;
+  PyObject *result = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "dds_take", 3, 3, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_unsigned_int, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take" "', argument " "1"" of type '" "uint32_t *""'"); 
-  }
-  arg1 = reinterpret_cast< uint32_t * >(argp1);
-  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "dds_take" "', argument " "2"" of type '" "char *""'");
-  }
-  arg2 = reinterpret_cast< char * >(buf2);
-  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "dds_take" "', argument " "3"" of type '" "int""'");
-  } 
-  arg3 = static_cast< int >(val3);
-  result = (int)dds_take(arg1,arg2,arg3);
-  resultobj = SWIG_From_int(static_cast< int >(result));
-  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  if (!SWIG_Python_UnpackTuple(args, "dds_get_stats_dict", 0, 0, 0)) SWIG_fail;
+  result = (PyObject *)dds_get_stats_dict();
+  resultobj = result;
   return resultobj;
 fail:
-  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_take_struct(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_writer_get_stats_dict(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  ICD_pkg::HelloWorld *arg1 = (ICD_pkg::HelloWorld *) 0 ;
+  dds_writer_t *arg1 = (dds_writer_t *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  int result;
+  PyObject *result = 0 ;
   
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ICD_pkg__HelloWorld, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_writer_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take_struct" "', argument " "1"" of type '" "ICD_pkg::HelloWorld *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_writer_get_stats_dict" "', argument " "1"" of type '" "dds_writer_t *""'"); 
   }
-  arg1 = reinterpret_cast< ICD_pkg::HelloWorld * >(argp1);
-  result = (int)dds_take_struct(arg1);
-  resultobj = SWIG_From_int(static_cast< int >(result));
+  arg1 = reinterpret_cast< dds_writer_t * >(argp1);
+  result = (PyObject *)dds_writer_get_stats_dict(arg1);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_take_message(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_reader_get_stats_dict(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  uint32_t *arg1 = (uint32_t *) 0 ;
+  dds_reader_t *arg1 = (dds_reader_t *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  char *result = 0 ;
+  PyObject *result = 0 ;
   
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_dds_reader_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take_message" "', argument " "1"" of type '" "uint32_t *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_reader_get_stats_dict" "', argument " "1"" of type '" "dds_reader_t *""'"); 
   }
-  arg1 = reinterpret_cast< uint32_t * >(argp1);
-  result = (char *)dds_take_message(arg1);
-  resultobj = SWIG_FromCharPtr((const char *)result);
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_dds_shutdown(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  
-  (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "dds_shutdown", 0, 0, 0)) SWIG_fail;
-  dds_shutdown();
-  resultobj = SWIG_Py_Void();
+  arg1 = reinterpret_cast< dds_reader_t * >(argp1);
+  result = (PyObject *)dds_reader_get_stats_dict(arg1);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_dds_take_string(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_dds_get_startup_stats_dict(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  unsigned int *arg1 = (unsigned int *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  char *result = 0 ;
+  PyObject *result = 0 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_unsigned_int, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "dds_take_string" "', argument " "1"" of type '" "unsigned int *""'"); 
-  }
-  arg1 = reinterpret_cast< unsigned int * >(argp1);
-  result = (char *)dds_take_string(arg1);
-  resultobj = SWIG_FromCharPtr((const char *)result);
+  if (!SWIG_Python_UnpackTuple(args, "dds_get_startup_stats_dict", 0, 0, 0)) SWIG_fail;
+  result = (PyObject *)dds_get_startup_stats_dict();
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
@@ -6430,6 +12633,23 @@ static PyMethodDef SwigMethods[] = {
 	 { "HelloWorld_message", _wrap_HelloWorld_message, METH_VARARGS, NULL},
 	 { "HelloWorld_swigregister", HelloWorld_swigregister, METH_O, NULL},
 	 { "HelloWorld_swiginit", HelloWorld_swiginit, METH_VARARGS, NULL},
+	 { "delete_HelloWorldFixed", _wrap_delete_HelloWorldFixed, METH_O, NULL},
+	 { "new_HelloWorldFixed", _wrap_new_HelloWorldFixed, METH_VARARGS, NULL},
+	 { "HelloWorldFixed___eq__", _wrap_HelloWorldFixed___eq__, METH_VARARGS, NULL},
+	 { "HelloWorldFixed___ne__", _wrap_HelloWorldFixed___ne__, METH_VARARGS, NULL},
+	 { "HelloWorldFixed_index", _wrap_HelloWorldFixed_index, METH_VARARGS, NULL},
+	 { "HelloWorldFixed_length", _wrap_HelloWorldFixed_length, METH_VARARGS, NULL},
+	 { "HelloWorldFixed_message", _wrap_HelloWorldFixed_message, METH_VARARGS, NULL},
+	 { "HelloWorldFixed_swigregister", HelloWorldFixed_swigregister, METH_O, NULL},
+	 { "HelloWorldFixed_swiginit", HelloWorldFixed_swiginit, METH_VARARGS, NULL},
+	 { "delete_HelloWorldKeyed", _wrap_delete_HelloWorldKeyed, METH_O, NULL},
+	 { "new_HelloWorldKeyed", _wrap_new_HelloWorldKeyed, METH_VARARGS, NULL},
+	 { "HelloWorldKeyed___eq__", _wrap_HelloWorldKeyed___eq__, METH_VARARGS, NULL},
+	 { "HelloWorldKeyed___ne__", _wrap_HelloWorldKeyed___ne__, METH_VARARGS, NULL},
+	 { "HelloWorldKeyed_index", _wrap_HelloWorldKeyed_index, METH_VARARGS, NULL},
+	 { "HelloWorldKeyed_message", _wrap_HelloWorldKeyed_message, METH_VARARGS, NULL},
+	 { "HelloWorldKeyed_swigregister", HelloWorldKeyed_swigregister, METH_O, NULL},
+	 { "HelloWorldKeyed_swiginit", HelloWorldKeyed_swiginit, METH_VARARGS, NULL},
 	 { "new_HelloWorldPubSubType", _wrap_new_HelloWorldPubSubType, METH_NOARGS, NULL},
 	 { "delete_HelloWorldPubSubType", _wrap_delete_HelloWorldPubSubType, METH_O, NULL},
 	 { "HelloWorldPubSubType_serialize", _wrap_HelloWorldPubSubType_serialize, METH_VARARGS, NULL},
@@ -6441,17 +12661,125 @@ static PyMethodDef SwigMethods[] = {
 	 { "HelloWorldPubSubType_register_type_object_representation", _wrap_HelloWorldPubSubType_register_type_object_representation, METH_O, NULL},
 	 { "HelloWorldPubSubType_swigregister", HelloWorldPubSubType_swigregister, METH_O, NULL},
 	 { "HelloWorldPubSubType_swiginit", HelloWorldPubSubType_swiginit, METH_VARARGS, NULL},
+	 { "new_HelloWorldFixedPubSubType", _wrap_new_HelloWorldFixedPubSubType, METH_NOARGS, NULL},
+	 { "delete_HelloWorldFixedPubSubType", _wrap_delete_HelloWorldFixedPubSubType, METH_O, NULL},
+	 { "HelloWorldFixedPubSubType_serialize", _wrap_HelloWorldFixedPubSubType_serialize, METH_VARARGS, NULL},
+	 { "HelloWorldFixedPubSubType_deserialize", _wrap_HelloWorldFixedPubSubType_deserialize, METH_VARARGS, NULL},
+	 { "HelloWorldFixedPubSubType_calculate_serialized_size", _wrap_HelloWorldFixedPubSubType_calculate_serialized_size, METH_VARARGS, NULL},
+	 { "HelloWorldFixedPubSubType_compute_key", _wrap_HelloWorldFixedPubSubType_compute_key, METH_VARARGS, NULL},
+	 { "HelloWorldFixedPubSubType_create_data", _wrap_HelloWorldFixedPubSubType_create_data, METH_O, NULL},
+	 { "HelloWorldFixedPubSubType_delete_data", _wrap_HelloWorldFixedPubSubType_delete_data, METH_VARARGS, NULL},
+	 { "HelloWorldFixedPubSubType_register_type_object_representation", _wrap_HelloWorldFixedPubSubType_register_type_object_representation, METH_O, NULL},
+	 { "HelloWorldFixedPubSubType_swigregister", HelloWorldFixedPubSubType_swigregister, METH_O, NULL},
+	 { "HelloWorldFixedPubSubType_swiginit", HelloWorldFixedPubSubType_swiginit, METH_VARARGS, NULL},
+	 { "new_HelloWorldKeyedPubSubType", _wrap_new_HelloWorldKeyedPubSubType, METH_NOARGS, NULL},
+	 { "delete_HelloWorldKeyedPubSubType", _wrap_delete_HelloWorldKeyedPubSubType, METH_O, NULL},
+	 { "HelloWorldKeyedPubSubType_serialize", _wrap_HelloWorldKeyedPubSubType_serialize, METH_VARARGS, NULL},
+	 { "HelloWorldKeyedPubSubType_deserialize", _wrap_HelloWorldKeyedPubSubType_deserialize, METH_VARARGS, NULL},
+	 { "HelloWorldKeyedPubSubType_calculate_serialized_size", _wrap_HelloWorldKeyedPubSubType_calculate_serialized_size, METH_VARARGS, NULL},
+	 { "HelloWorldKeyedPubSubType_compute_key", _wrap_HelloWorldKeyedPubSubType_compute_key, METH_VARARGS, NULL},
+	 { "HelloWorldKeyedPubSubType_create_data", _wrap_HelloWorldKeyedPubSubType_create_data, METH_O, NULL},
+	 { "HelloWorldKeyedPubSubType_delete_data", _wrap_HelloWorldKeyedPubSubType_delete_data, METH_VARARGS, NULL},
+	 { "HelloWorldKeyedPubSubType_register_type_object_representation", _wrap_HelloWorldKeyedPubSubType_register_type_object_representation, METH_O, NULL},
+	 { "HelloWorldKeyedPubSubType_swigregister", HelloWorldKeyedPubSubType_swigregister, METH_O, NULL},
+	 { "HelloWorldKeyedPubSubType_swiginit", HelloWorldKeyedPubSubType_swiginit, METH_VARARGS, NULL},
 	 { "register_HelloWorld_type_identifier", _wrap_register_HelloWorld_type_identifier, METH_O, NULL},
+	 { "register_HelloWorldFixed_type_identifier", _wrap_register_HelloWorldFixed_type_identifier, METH_O, NULL},
+	 { "register_HelloWorldKeyed_type_identifier", _wrap_register_HelloWorldKeyed_type_identifier, METH_O, NULL},
 	 { "serialize_key", _wrap_serialize_key, METH_VARARGS, NULL},
+	 { "dds_qos_t_reliability_set", _wrap_dds_qos_t_reliability_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_reliability_get", _wrap_dds_qos_t_reliability_get, METH_O, NULL},
+	 { "dds_qos_t_durability_set", _wrap_dds_qos_t_durability_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_durability_get", _wrap_dds_qos_t_durability_get, METH_O, NULL},
+	 { "dds_qos_t_history_kind_set", _wrap_dds_qos_t_history_kind_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_history_kind_get", _wrap_dds_qos_t_history_kind_get, METH_O, NULL},
+	 { "dds_qos_t_history_depth_set", _wrap_dds_qos_t_history_depth_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_history_depth_get", _wrap_dds_qos_t_history_depth_get, METH_O, NULL},
+	 { "dds_qos_t_max_samples_set", _wrap_dds_qos_t_max_samples_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_max_samples_get", _wrap_dds_qos_t_max_samples_get, METH_O, NULL},
+	 { "dds_qos_t_max_instances_set", _wrap_dds_qos_t_max_instances_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_max_instances_get", _wrap_dds_qos_t_max_instances_get, METH_O, NULL},
+	 { "dds_qos_t_max_samples_per_instance_set", _wrap_dds_qos_t_max_samples_per_instance_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_max_samples_per_instance_get", _wrap_dds_qos_t_max_samples_per_instance_get, METH_O, NULL},
+	 { "dds_qos_t_publish_mode_set", _wrap_dds_qos_t_publish_mode_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_publish_mode_get", _wrap_dds_qos_t_publish_mode_get, METH_O, NULL},
+	 { "dds_qos_t_data_sharing_set", _wrap_dds_qos_t_data_sharing_set, METH_VARARGS, NULL},
+	 { "dds_qos_t_data_sharing_get", _wrap_dds_qos_t_data_sharing_get, METH_O, NULL},
+	 { "new_dds_qos_t", _wrap_new_dds_qos_t, METH_NOARGS, NULL},
+	 { "delete_dds_qos_t", _wrap_delete_dds_qos_t, METH_O, NULL},
+	 { "dds_qos_t_swigregister", dds_qos_t_swigregister, METH_O, NULL},
+	 { "dds_qos_t_swiginit", dds_qos_t_swiginit, METH_VARARGS, NULL},
 	 { "dds_init", _wrap_dds_init, METH_O, NULL},
 	 { "dds_init_with_domain", _wrap_dds_init_with_domain, METH_VARARGS, NULL},
+	 { "dds_init_with_qos", _wrap_dds_init_with_qos, METH_VARARGS, NULL},
+	 { "dds_init_filtered", _wrap_dds_init_filtered, METH_VARARGS, NULL},
+	 { "dds_set_filter_parameters", _wrap_dds_set_filter_parameters, METH_O, NULL},
 	 { "dds_write", _wrap_dds_write, METH_VARARGS, NULL},
 	 { "dds_write_struct", _wrap_dds_write_struct, METH_O, NULL},
+	 { "dds_write_batch", _wrap_dds_write_batch, METH_VARARGS, NULL},
 	 { "dds_take", _wrap_dds_take, METH_VARARGS, NULL},
 	 { "dds_take_struct", _wrap_dds_take_struct, METH_O, NULL},
+	 { "dds_take_batch", _wrap_dds_take_batch, METH_VARARGS, NULL},
+	 { "dds_wait_for_data", _wrap_dds_wait_for_data, METH_O, NULL},
+	 { "dds_set_data_notify_fd", _wrap_dds_set_data_notify_fd, METH_O, NULL},
 	 { "dds_take_message", _wrap_dds_take_message, METH_O, NULL},
 	 { "dds_shutdown", _wrap_dds_shutdown, METH_NOARGS, NULL},
+	 { "dds_set_keep_participant", _wrap_dds_set_keep_participant, METH_O, NULL},
+	 { "dds_keep_participant", _wrap_dds_keep_participant, METH_NOARGS, NULL},
+	 { "dds_participant_create", _wrap_dds_participant_create, METH_O, NULL},
+	 { "dds_participant_create_with_transport", _wrap_dds_participant_create_with_transport, METH_VARARGS, NULL},
+	 { "dds_participant_delete", _wrap_dds_participant_delete, METH_O, NULL},
+	 { "dds_writer_create", _wrap_dds_writer_create, METH_VARARGS, NULL},
+	 { "dds_writer_create_with_qos", _wrap_dds_writer_create_with_qos, METH_VARARGS, NULL},
+	 { "dds_writer_delete", _wrap_dds_writer_delete, METH_O, NULL},
+	 { "dds_writer_write", _wrap_dds_writer_write, METH_VARARGS, NULL},
+	 { "dds_writer_write_struct", _wrap_dds_writer_write_struct, METH_VARARGS, NULL},
+	 { "dds_writer_write_batch", _wrap_dds_writer_write_batch, METH_VARARGS, NULL},
+	 { "dds_reader_create", _wrap_dds_reader_create, METH_VARARGS, NULL},
+	 { "dds_reader_create_with_qos", _wrap_dds_reader_create_with_qos, METH_VARARGS, NULL},
+	 { "dds_reader_delete", _wrap_dds_reader_delete, METH_O, NULL},
+	 { "dds_reader_take", _wrap_dds_reader_take, METH_VARARGS, NULL},
+	 { "dds_reader_take_struct", _wrap_dds_reader_take_struct, METH_VARARGS, NULL},
+	 { "dds_reader_take_batch", _wrap_dds_reader_take_batch, METH_VARARGS, NULL},
+	 { "dds_reader_create_filtered", _wrap_dds_reader_create_filtered, METH_VARARGS, NULL},
+	 { "dds_reader_set_filter_parameters", _wrap_dds_reader_set_filter_parameters, METH_VARARGS, NULL},
+	 { "dds_reader_wait_for_data", _wrap_dds_reader_wait_for_data, METH_VARARGS, NULL},
+	 { "dds_reader_set_data_notify_fd", _wrap_dds_reader_set_data_notify_fd, METH_VARARGS, NULL},
+	 { "dds_writer_create_fixed", _wrap_dds_writer_create_fixed, METH_VARARGS, NULL},
+	 { "dds_reader_create_fixed", _wrap_dds_reader_create_fixed, METH_VARARGS, NULL},
+	 { "dds_loan_t_sample_get", _wrap_dds_loan_t_sample_get, METH_O, NULL},
+	 { "dds_loan_t_message_get", _wrap_dds_loan_t_message_get, METH_O, NULL},
+	 { "dds_loan_t_capacity_set", _wrap_dds_loan_t_capacity_set, METH_VARARGS, NULL},
+	 { "dds_loan_t_capacity_get", _wrap_dds_loan_t_capacity_get, METH_O, NULL},
+	 { "new_dds_loan_t", _wrap_new_dds_loan_t, METH_NOARGS, NULL},
+	 { "delete_dds_loan_t", _wrap_delete_dds_loan_t, METH_O, NULL},
+	 { "dds_loan_t_swigregister", dds_loan_t_swigregister, METH_O, NULL},
+	 { "dds_loan_t_swiginit", dds_loan_t_swiginit, METH_VARARGS, NULL},
+	 { "dds_writer_loan", _wrap_dds_writer_loan, METH_VARARGS, NULL},
+	 { "dds_writer_write_loan", _wrap_dds_writer_write_loan, METH_VARARGS, NULL},
+	 { "dds_writer_discard_loan", _wrap_dds_writer_discard_loan, METH_VARARGS, NULL},
+	 { "dds_writer_create_keyed", _wrap_dds_writer_create_keyed, METH_VARARGS, NULL},
+	 { "dds_reader_create_keyed", _wrap_dds_reader_create_keyed, METH_VARARGS, NULL},
+	 { "dds_reader_lookup_instance", _wrap_dds_reader_lookup_instance, METH_VARARGS, NULL},
+	 { "dds_reader_read_instance", _wrap_dds_reader_read_instance, METH_VARARGS, NULL},
+	 { "dds_stats_enable", _wrap_dds_stats_enable, METH_O, NULL},
+	 { "dds_stats_enabled", _wrap_dds_stats_enabled, METH_NOARGS, NULL},
+	 { "dds_histogram_bucket_lower", _wrap_dds_histogram_bucket_lower, METH_O, NULL},
 	 { "dds_take_string", _wrap_dds_take_string, METH_O, NULL},
+	 { "dds_take_batch_list", _wrap_dds_take_batch_list, METH_VARARGS, NULL},
+	 { "dds_reader_take_batch_list", _wrap_dds_reader_take_batch_list, METH_VARARGS, NULL},
+	 { "dds_take_samples", _wrap_dds_take_samples, METH_VARARGS, NULL},
+	 { "dds_reader_take_samples", _wrap_dds_reader_take_samples, METH_VARARGS, NULL},
+	 { "dds_take_batch_into", _wrap_dds_take_batch_into, METH_VARARGS, NULL},
+	 { "dds_reader_take_batch_into", _wrap_dds_reader_take_batch_into, METH_VARARGS, NULL},
+	 { "dds_write_batch_buffers", _wrap_dds_write_batch_buffers, METH_VARARGS, NULL},
+	 { "dds_writer_write_batch_buffers", _wrap_dds_writer_write_batch_buffers, METH_VARARGS, NULL},
+	 { "dds_loan_buffer", _wrap_dds_loan_buffer, METH_O, NULL},
+	 { "dds_reader_read_instance_message", _wrap_dds_reader_read_instance_message, METH_VARARGS, NULL},
+	 { "dds_get_stats_dict", _wrap_dds_get_stats_dict, METH_NOARGS, NULL},
+	 { "dds_writer_get_stats_dict", _wrap_dds_writer_get_stats_dict, METH_O, NULL},
+	 { "dds_reader_get_stats_dict", _wrap_dds_reader_get_stats_dict, METH_O, NULL},
+	 { "dds_get_startup_stats_dict", _wrap_dds_get_startup_stats_dict, METH_NOARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -6459,8 +12787,24 @@ static PyMethodDef SwigMethods[] = {
 /* -------- TYPE CONVERSION AND EQUIVALENCE RULES (BEGIN) -------- */
 
 static swig_type_info _swigt__p_ICD_pkg__HelloWorld = {"_p_ICD_pkg__HelloWorld", "ICD_pkg::HelloWorld *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_ICD_pkg__HelloWorldFixed = {"_p_ICD_pkg__HelloWorldFixed", "ICD_pkg::HelloWorldFixed *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_ICD_pkg__HelloWorldFixedPubSubType = {"_p_ICD_pkg__HelloWorldFixedPubSubType", "ICD_pkg::HelloWorldFixedPubSubType *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_ICD_pkg__HelloWorldKeyed = {"_p_ICD_pkg__HelloWorldKeyed", "ICD_pkg::HelloWorldKeyed *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_ICD_pkg__HelloWorldKeyedPubSubType = {"_p_ICD_pkg__HelloWorldKeyedPubSubType", "ICD_pkg::HelloWorldKeyedPubSubType *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_ICD_pkg__HelloWorldPubSubType = {"_p_ICD_pkg__HelloWorldPubSubType", "ICD_pkg::HelloWorldPubSubType *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_histogram_s = {"_p_dds_histogram_s", "dds_histogram_t *|dds_histogram_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_loan_s = {"_p_dds_loan_s", "dds_loan_t *|dds_loan_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_participant_s = {"_p_dds_participant_s", "dds_participant_t *|dds_participant_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_qos_s = {"_p_dds_qos_s", "dds_qos_t *|dds_qos_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_reader_s = {"_p_dds_reader_s", "dds_reader_t *|dds_reader_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_reader_stats_s = {"_p_dds_reader_stats_s", "dds_reader_stats_t *|dds_reader_stats_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_sample_s = {"_p_dds_sample_s", "dds_sample_t *|dds_sample_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_startup_stats_s = {"_p_dds_startup_stats_s", "dds_startup_stats_t *|dds_startup_stats_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_stats_s = {"_p_dds_stats_s", "dds_stats_t *|dds_stats_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_take_loan_s = {"_p_dds_take_loan_s", "dds_take_loan_t *|dds_take_loan_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_writer_s = {"_p_dds_writer_s", "dds_writer_t *|dds_writer_s *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_dds_writer_stats_s = {"_p_dds_writer_stats_s", "dds_writer_stats_t *|dds_writer_stats_s *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_eprosima__fastcdr__Cdr = {"_p_eprosima__fastcdr__Cdr", "eprosima::fastcdr::Cdr *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_eprosima__fastdds__dds__DataRepresentationId_t = {"_p_eprosima__fastdds__dds__DataRepresentationId_t", "eprosima::fastdds::dds::DataRepresentationId_t *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair = {"_p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair", "eprosima::fastdds::dds::xtypes::TypeIdentifierPair *", 0, 0, (void*)0, 0};
@@ -6468,8 +12812,10 @@ static swig_type_info _swigt__p_eprosima__fastdds__rtps__InstanceHandle_t = {"_p
 static swig_type_info _swigt__p_eprosima__fastdds__rtps__SerializedPayload_t = {"_p_eprosima__fastdds__rtps__SerializedPayload_t", "eprosima::fastdds::rtps::SerializedPayload_t *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_int = {"_p_int", "int32_t *|int_fast16_t *|int_fast32_t *|int_least32_t *|intptr_t *|int *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_long_long = {"_p_long_long", "int64_t *|int_fast64_t *|int_least64_t *|intmax_t *|long long *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_p_char = {"_p_p_char", "char **", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_short = {"_p_short", "int16_t *|int_least16_t *|short *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_signed_char = {"_p_signed_char", "int8_t *|int_fast8_t *|int_least8_t *|signed char *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_std__arrayT_char_4096_t = {"_p_std__arrayT_char_4096_t", "std::array< char,4096 > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__invalid_argument = {"_p_std__invalid_argument", "std::invalid_argument *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__string = {"_p_std__string", "std::string *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_swig__SwigPyIterator = {"_p_swig__SwigPyIterator", "swig::SwigPyIterator *", 0, 0, (void*)0, 0};
@@ -6482,8 +12828,24 @@ static swig_type_info _swigt__p_void = {"_p_void", "void *", 0, 0, (void*)0, 0};
 
 static swig_type_info *swig_type_initial[] = {
   &_swigt__p_ICD_pkg__HelloWorld,
+  &_swigt__p_ICD_pkg__HelloWorldFixed,
+  &_swigt__p_ICD_pkg__HelloWorldFixedPubSubType,
+  &_swigt__p_ICD_pkg__HelloWorldKeyed,
+  &_swigt__p_ICD_pkg__HelloWorldKeyedPubSubType,
   &_swigt__p_ICD_pkg__HelloWorldPubSubType,
   &_swigt__p_char,
+  &_swigt__p_dds_histogram_s,
+  &_swigt__p_dds_loan_s,
+  &_swigt__p_dds_participant_s,
+  &_swigt__p_dds_qos_s,
+  &_swigt__p_dds_reader_s,
+  &_swigt__p_dds_reader_stats_s,
+  &_swigt__p_dds_sample_s,
+  &_swigt__p_dds_startup_stats_s,
+  &_swigt__p_dds_stats_s,
+  &_swigt__p_dds_take_loan_s,
+  &_swigt__p_dds_writer_s,
+  &_swigt__p_dds_writer_stats_s,
   &_swigt__p_eprosima__fastcdr__Cdr,
   &_swigt__p_eprosima__fastdds__dds__DataRepresentationId_t,
   &_swigt__p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair,
@@ -6491,8 +12853,10 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_eprosima__fastdds__rtps__SerializedPayload_t,
   &_swigt__p_int,
   &_swigt__p_long_long,
+  &_swigt__p_p_char,
   &_swigt__p_short,
   &_swigt__p_signed_char,
+  &_swigt__p_std__arrayT_char_4096_t,
   &_swigt__p_std__invalid_argument,
   &_swigt__p_std__string,
   &_swigt__p_swig__SwigPyIterator,
@@ -6505,8 +12869,24 @@ static swig_type_info *swig_type_initial[] = {
 };
 
 static swig_cast_info _swigc__p_ICD_pkg__HelloWorld[] = {  {&_swigt__p_ICD_pkg__HelloWorld, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_ICD_pkg__HelloWorldFixed[] = {  {&_swigt__p_ICD_pkg__HelloWorldFixed, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_ICD_pkg__HelloWorldFixedPubSubType[] = {  {&_swigt__p_ICD_pkg__HelloWorldFixedPubSubType, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_ICD_pkg__HelloWorldKeyed[] = {  {&_swigt__p_ICD_pkg__HelloWorldKeyed, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_ICD_pkg__HelloWorldKeyedPubSubType[] = {  {&_swigt__p_ICD_pkg__HelloWorldKeyedPubSubType, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_ICD_pkg__HelloWorldPubSubType[] = {  {&_swigt__p_ICD_pkg__HelloWorldPubSubType, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_histogram_s[] = {  {&_swigt__p_dds_histogram_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_loan_s[] = {  {&_swigt__p_dds_loan_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_participant_s[] = {  {&_swigt__p_dds_participant_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_qos_s[] = {  {&_swigt__p_dds_qos_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_reader_s[] = {  {&_swigt__p_dds_reader_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_reader_stats_s[] = {  {&_swigt__p_dds_reader_stats_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_sample_s[] = {  {&_swigt__p_dds_sample_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_startup_stats_s[] = {  {&_swigt__p_dds_startup_stats_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_stats_s[] = {  {&_swigt__p_dds_stats_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_take_loan_s[] = {  {&_swigt__p_dds_take_loan_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_writer_s[] = {  {&_swigt__p_dds_writer_s, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_dds_writer_stats_s[] = {  {&_swigt__p_dds_writer_stats_s, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_eprosima__fastcdr__Cdr[] = {  {&_swigt__p_eprosima__fastcdr__Cdr, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_eprosima__fastdds__dds__DataRepresentationId_t[] = {  {&_swigt__p_eprosima__fastdds__dds__DataRepresentationId_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair[] = {  {&_swigt__p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair, 0, 0, 0},{0, 0, 0, 0}};
@@ -6514,8 +12894,10 @@ static swig_cast_info _swigc__p_eprosima__fastdds__rtps__InstanceHandle_t[] = {
 static swig_cast_info _swigc__p_eprosima__fastdds__rtps__SerializedPayload_t[] = {  {&_swigt__p_eprosima__fastdds__rtps__SerializedPayload_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_int[] = {  {&_swigt__p_int, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_long_long[] = {  {&_swigt__p_long_long, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_p_char[] = {  {&_swigt__p_p_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_short[] = {  {&_swigt__p_short, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_signed_char[] = {  {&_swigt__p_signed_char, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_std__arrayT_char_4096_t[] = {  {&_swigt__p_std__arrayT_char_4096_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__invalid_argument[] = {  {&_swigt__p_std__invalid_argument, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__string[] = {  {&_swigt__p_std__string, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_swig__SwigPyIterator[] = {  {&_swigt__p_swig__SwigPyIterator, 0, 0, 0},{0, 0, 0, 0}};
@@ -6528,8 +12910,24 @@ static swig_cast_info _swigc__p_void[] = {  {&_swigt__p_void, 0, 0, 0},{0, 0, 0,
 
 static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_ICD_pkg__HelloWorld,
+  _swigc__p_ICD_pkg__HelloWorldFixed,
+  _swigc__p_ICD_pkg__HelloWorldFixedPubSubType,
+  _swigc__p_ICD_pkg__HelloWorldKeyed,
+  _swigc__p_ICD_pkg__HelloWorldKeyedPubSubType,
   _swigc__p_ICD_pkg__HelloWorldPubSubType,
   _swigc__p_char,
+  _swigc__p_dds_histogram_s,
+  _swigc__p_dds_loan_s,
+  _swigc__p_dds_participant_s,
+  _swigc__p_dds_qos_s,
+  _swigc__p_dds_reader_s,
+  _swigc__p_dds_reader_stats_s,
+  _swigc__p_dds_sample_s,
+  _swigc__p_dds_startup_stats_s,
+  _swigc__p_dds_stats_s,
+  _swigc__p_dds_take_loan_s,
+  _swigc__p_dds_writer_s,
+  _swigc__p_dds_writer_stats_s,
   _swigc__p_eprosima__fastcdr__Cdr,
   _swigc__p_eprosima__fastdds__dds__DataRepresentationId_t,
   _swigc__p_eprosima__fastdds__dds__xtypes__TypeIdentifierPair,
@@ -6537,8 +12935,10 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_eprosima__fastdds__rtps__SerializedPayload_t,
   _swigc__p_int,
   _swigc__p_long_long,
+  _swigc__p_p_char,
   _swigc__p_short,
   _swigc__p_signed_char,
+  _swigc__p_std__arrayT_char_4096_t,
   _swigc__p_std__invalid_argument,
   _swigc__p_std__string,
   _swigc__p_swig__SwigPyIterator,
@@ -7024,6 +13424,44 @@ SWIG_init(void) {
 #endif
   }
   PyDict_SetItemString(md, "cvar", globals);
+  SWIG_Python_SetConstant(d, "DDS_QOS_DEFAULT",SWIG_From_int(static_cast< int >(0)));
+  SWIG_Python_SetConstant(d, "DDS_RELIABILITY_BEST_EFFORT",SWIG_From_int(static_cast< int >(1)));
+  SWIG_Python_SetConstant(d, "DDS_RELIABILITY_RELIABLE",SWIG_From_int(static_cast< int >(2)));
+  SWIG_Python_SetConstant(d, "DDS_DURABILITY_VOLATILE",SWIG_From_int(static_cast< int >(1)));
+  SWIG_Python_SetConstant(d, "DDS_DURABILITY_TRANSIENT_LOCAL",SWIG_From_int(static_cast< int >(2)));
+  SWIG_Python_SetConstant(d, "DDS_HISTORY_KEEP_LAST",SWIG_From_int(static_cast< int >(1)));
+  SWIG_Python_SetConstant(d, "DDS_HISTORY_KEEP_ALL",SWIG_From_int(static_cast< int >(2)));
+  SWIG_Python_SetConstant(d, "DDS_PUBLISH_SYNCHRONOUS",SWIG_From_int(static_cast< int >(1)));
+  SWIG_Python_SetConstant(d, "DDS_PUBLISH_ASYNCHRONOUS",SWIG_From_int(static_cast< int >(2)));
+  SWIG_Python_SetConstant(d, "DDS_LENGTH_UNLIMITED",SWIG_From_int(static_cast< int >((-1))));
+  SWIG_Python_SetConstant(d, "DDS_DATA_SHARING_AUTO",SWIG_From_int(static_cast< int >(1)));
+  SWIG_Python_SetConstant(d, "DDS_DATA_SHARING_ON",SWIG_From_int(static_cast< int >(2)));
+  SWIG_Python_SetConstant(d, "DDS_DATA_SHARING_OFF",SWIG_From_int(static_cast< int >(3)));
+  SWIG_Python_SetConstant(d, "DDS_TRANSPORT_DEFAULT",SWIG_From_int(static_cast< int >(0)));
+  SWIG_Python_SetConstant(d, "DDS_TRANSPORT_UDP",SWIG_From_int(static_cast< int >(1)));
+  SWIG_Python_SetConstant(d, "DDS_TRANSPORT_SHM",SWIG_From_int(static_cast< int >(2)));
+  SWIG_Python_SetConstant(d, "DDS_TRANSPORT_LARGE_DATA",SWIG_From_int(static_cast< int >(3)));
+  SWIG_Python_SetConstant(d, "DDS_FIXED_MESSAGE_CAPACITY",SWIG_From_int(static_cast< int >(4096)));
+  SWIG_Python_SetConstant(d, "DDS_HISTOGRAM_BUCKETS",SWIG_From_int(static_cast< int >(256)));
+  
+  if (PyStructSequence_InitType2(&dds_sample_type, &dds_sample_desc) != 0) {
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF((PyObject*)&dds_sample_type);
+  PyDict_SetItemString(d, "Sample", (PyObject*)&dds_sample_type);
+  
+  
+  /* Initialize threading */
+  SWIG_PYTHON_INITIALIZE_THREADS;
+  SWIG_addvarlink(globals, "FIXED_MESSAGE_CAPACITY", Swig_var_FIXED_MESSAGE_CAPACITY_get, Swig_var_FIXED_MESSAGE_CAPACITY_set);
+  SWIG_addvarlink(globals, "ICD_pkg_HelloWorldKeyed_max_cdr_typesize", Swig_var_ICD_pkg_HelloWorldKeyed_max_cdr_typesize_get, Swig_var_ICD_pkg_HelloWorldKeyed_max_cdr_typesize_set);
+  SWIG_addvarlink(globals, "ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize", Swig_var_ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize_get, Swig_var_ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize_set);
+  SWIG_addvarlink(globals, "ICD_pkg_HelloWorldFixed_max_cdr_typesize", Swig_var_ICD_pkg_HelloWorldFixed_max_cdr_typesize_get, Swig_var_ICD_pkg_HelloWorldFixed_max_cdr_typesize_set);
+  SWIG_addvarlink(globals, "ICD_pkg_HelloWorldFixed_max_key_cdr_typesize", Swig_var_ICD_pkg_HelloWorldFixed_max_key_cdr_typesize_get, Swig_var_ICD_pkg_HelloWorldFixed_max_key_cdr_typesize_set);
   SWIG_addvarlink(globals, "ICD_pkg_HelloWorld_max_cdr_typesize", Swig_var_ICD_pkg_HelloWorld_max_cdr_typesize_get, Swig_var_ICD_pkg_HelloWorld_max_cdr_typesize_set);
   SWIG_addvarlink(globals, "ICD_pkg_HelloWorld_max_key_cdr_typesize", Swig_var_ICD_pkg_HelloWorld_max_key_cdr_typesize_get, Swig_var_ICD_pkg_HelloWorld_max_key_cdr_typesize_set);
 #if PY_VERSION_HEX >= 0x03000000
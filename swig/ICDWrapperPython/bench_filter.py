@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Content-filtered readers versus filtering in Python.
+
+A subscriber interested in a fraction of a topic's indices either takes
+every sample and discards the rest itself, or subscribes through a
+content filter ("index BETWEEN %0 AND %1") so non-matching samples never
+reach it. For each, a burst of --samples samples with indices spread over
+0..--keys-1 is published and drained; reported are the samples delivered to
+the subscriber, the samples it kept, and the CPU time of the whole process
+(publisher included) per published sample.
+
+    python bench_filter.py --samples 100000 --keys 1000 --selectivity 0.01
+"""
+
+import argparse
+import time
+
+import ICDWrapper
+
+
+def run(participant, topic, qos, message, args, low, high, filtered):
+    """Publish one burst and drain it; returns (delivered, kept, cpu seconds)."""
+    if filtered:
+        reader = participant.create_filtered_reader(topic, "index BETWEEN %0 AND %1", (str(low), str(high)), qos)
+    else:
+        reader = participant.create_reader(topic, qos)
+    writer = participant.create_writer(topic, qos)
+    # Same participant, so matching is local; give it a moment all the same
+    time.sleep(0.2)
+
+    delivered = kept = 0
+    start = time.process_time()
+    for first in range(0, args.samples, args.batch):
+        count = min(args.batch, args.samples - first)
+        writer.write_batch((i % args.keys, message) for i in range(first, first + count))
+        while True:
+            samples = reader.take_batch(args.batch)
+            if not samples:
+                break
+            delivered += len(samples)
+            kept += sum(1 for index, _ in samples if low <= index <= high)
+    cpu = time.process_time() - start
+
+    writer.close()
+    reader.close()
+    return delivered, kept, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=100000, help="samples published per run")
+    parser.add_argument("--keys", type=int, default=1000, help="distinct indices published")
+    parser.add_argument("--selectivity", type=float, default=0.01, help="fraction of the indices the subscriber wants")
+    parser.add_argument("--size", type=int, default=64, help="message size in bytes")
+    parser.add_argument("--batch", type=int, default=1000, help="samples per write_batch / take_batch")
+    parser.add_argument("--domain", type=int, default=0)
+    args = parser.parse_args()
+
+    low = 0
+    high = max(0, int(args.keys * args.selectivity) - 1)
+    message = "x" * args.size
+    # KEEP_ALL reliable, so every matching sample is delivered in both runs
+    qos = dict(reliability='reliable', history_kind='keep_all')
+
+    print(f"{args.samples} samples over {args.keys} indices, subscriber wants {low}..{high}")
+    print(f"{'':10} {'delivered':>10} {'kept':>10} {'cpu us/sample':>14}")
+    with ICDWrapper.Participant(args.domain) as participant:
+        stamp = int(time.time() * 1000)
+        for filtered in (False, True):
+            topic = f"FilterBench_{stamp}_{int(filtered)}"
+            delivered, kept, cpu = run(participant, topic, qos, message, args, low, high, filtered)
+            label = "filtered" if filtered else "python"
+            print(f"{label:10} {delivered:>10} {kept:>10} {cpu * 1e6 / args.samples:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
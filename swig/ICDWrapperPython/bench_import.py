@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Import time of the Python binding, measured with python -X importtime.
+
+Each scenario runs --runs times in a fresh interpreter. Its total is the sum
+of the cumulative times of the top-level imports in the -X importtime report,
+counted from the start of the statement, so the imports done by interpreter
+startup are left out. The icd_native import done inside ICDWrapper.load() is
+one of those top-level imports. Reports the median and minimum per scenario,
+and the --top slowest modules of the --detail scenario by median self time:
+
+  import      import ICDWrapper (the lazy front only)
+  load        import ICDWrapper, then ICDWrapper.load() (the native binding)
+  native      import icd_native (loads everything eagerly)
+  asyncio     import icd_asyncio
+  metrics     import icd_metrics
+  record      import icd_record
+
+    python bench_import.py --runs 20 --detail load --output import.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import": "import ICDWrapper",
+    "load": "import ICDWrapper; ICDWrapper.load()",
+    "native": "import icd_native",
+    "asyncio": "import icd_asyncio",
+    "metrics": "import icd_metrics",
+    "record": "import icd_record",
+}
+
+# "import time:      self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+# Written to stderr where the statement starts
+_MARK = "bench_import: start"
+
+
+def run_once(statement):
+    """(total_us, {module: self_us}) of statement in a fresh interpreter."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    # sys is loaded at startup, so importing it adds no report line
+    code = "import sys\nsys.stderr.write(%r)\nsys.stderr.flush()\n%s" % (_MARK + "\n", statement)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [here, env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, env=env, cwd=here)
+    if result.returncode != 0:
+        raise RuntimeError("%s failed:\n%s" % (statement, result.stderr.strip()))
+
+    total = 0
+    modules = {}
+    lines = result.stderr.splitlines()
+    if _MARK in lines:
+        lines = lines[lines.index(_MARK) + 1:]
+    for line in lines:
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = modules.get(name, 0) + int(self_us)
+        # Top-level entries are indented by one space; their cumulative times add up
+        if len(indent) == 1:
+            total += int(cumulative_us)
+    return total, modules
+
+
+def run_scenario(statement, runs):
+    totals = []
+    modules = {}
+    for _ in range(runs):
+        total, self_times = run_once(statement)
+        totals.append(total)
+        for name, us in self_times.items():
+            modules.setdefault(name, []).append(us)
+    return totals, {name: statistics.median(times) for name, times in modules.items()}
+
+
+def main():
+    def csv(text):
+        return [item for item in text.split(",") if item]
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", type=csv, default=list(SCENARIOS),
+                        help="comma-separated, from: %s" % ", ".join(SCENARIOS))
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per scenario")
+    parser.add_argument("--detail", default="load", help="scenario whose slowest modules are listed")
+    parser.add_argument("--top", type=int, default=10, help="modules listed for --detail")
+    parser.add_argument("--output", help="also write the results as JSON")
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error("unknown scenario(s): %s" % ", ".join(unknown))
+
+    results = {}
+    print("%-10s %12s %12s" % ("scenario", "median ms", "min ms"))
+    for name in args.scenarios:
+        try:
+            totals, modules = run_scenario(SCENARIOS[name], args.runs)
+        except RuntimeError as error:
+            print("%-10s failed: %s" % (name, str(error).splitlines()[-1]))
+            results[name] = {"statement": SCENARIOS[name], "error": str(error)}
+            continue
+        results[name] = {
+            "statement": SCENARIOS[name],
+            "median_us": statistics.median(totals),
+            "min_us": min(totals),
+            "runs": totals,
+            "modules_self_us": modules,
+        }
+        print("%-10s %12.2f %12.2f" % (name, statistics.median(totals) / 1e3, min(totals) / 1e3))
+
+    detail = results.get(args.detail, {}).get("modules_self_us")
+    if detail:
+        print("\nslowest modules of %r (median self time)" % args.detail)
+        for module, us in sorted(detail.items(), key=lambda item: -item[1])[:args.top]:
+            print("  %-30s %10.2f ms" % (module, us / 1e3))
+
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs, "scenarios": results}, out, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Publish cost of copied versus loaned writes on a fixed-size writer.
+
+For each message size three paths publish the same payload for --seconds:
+
+  * write:        Writer.write(index, str) - encode, copy into a local sample,
+                  copy again when the sample is serialized
+  * write_loaned: Writer.write_loaned(index, bytes) - one copy straight into a
+                  sample loaned from the writer's pool
+  * in_place:     Writer.loan(), fill the memoryview, Loan.write() - the
+                  payload is produced directly in the loaned sample
+
+A fixed-size reader on the same participant keeps the writer matched and is
+drained in a background thread. --data-sharing on measures delivery
+without serialization.
+
+    python bench_loan.py --seconds 1 --size 64 --size 4096
+"""
+
+import argparse
+import threading
+import time
+
+import ICDWrapper
+
+
+def drain(reader, stop):
+    while not stop.is_set():
+        if reader.wait_for_data(50):
+            while reader.take_batch(1024):
+                pass
+
+
+def run(publish, seconds):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(256):
+            publish(count)
+            count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, action="append",
+                        help="message size in bytes (repeatable, default: 64 1024 4096)")
+    parser.add_argument("--seconds", type=float, default=1.0, help="duration per path and size")
+    parser.add_argument("--data-sharing", choices=("auto", "on", "off"), default="auto")
+    parser.add_argument("--transport", choices=sorted(ICDWrapper.TRANSPORTS), default="default")
+    parser.add_argument("--domain", type=int, default=0)
+    args = parser.parse_args()
+
+    capacity = ICDWrapper.DDS_FIXED_MESSAGE_CAPACITY
+    sizes = args.size or [64, 1024, capacity]
+    qos = dict(ICDWrapper.QOS_PROFILES["best_effort"], data_sharing=args.data_sharing)
+
+    print(f"{'size':>6} {'write/s':>12} {'loaned/s':>12} {'in_place/s':>12}")
+    with ICDWrapper.Participant(args.domain, args.transport) as participant:
+        topic = f"LoanBench_{int(time.time() * 1000)}"
+        writer = participant.create_fixed_writer(topic, qos)
+        reader = participant.create_fixed_reader(topic, qos)
+        stop = threading.Event()
+        consumer = threading.Thread(target=drain, args=(reader, stop))
+        consumer.start()
+        try:
+            for size in sizes:
+                if size > capacity:
+                    print(f"{size:>6} exceeds the {capacity} byte fixed capacity, skipped")
+                    continue
+                text = "x" * size
+                payload = text.encode()
+
+                def in_place(index):
+                    with writer.loan() as loan:
+                        loan.buffer[:size] = payload
+                        loan.write(index, size)
+
+                copied = run(lambda index: writer.write(index, text), args.seconds)
+                loaned = run(lambda index: writer.write_loaned(index, payload), args.seconds)
+                filled = run(in_place, args.seconds)
+                print(f"{size:>6} {copied:>12.0f} {loaned:>12.0f} {filled:>12.0f}")
+        finally:
+            stop.set()
+            consumer.join()
+            writer.close()
+            reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Throughput and latency of the facade per QoS profile.
+
+For every profile in ICDWrapper.QOS_PROFILES (or those given with --profile)
+a writer and a reader are created on a fresh topic with that QoS, then:
+
+  * throughput: one thread publishes batches for --seconds while another
+    drains the reader; reports sent/s, received/s and the loss ratio
+  * latency: --pings single samples carrying their send time, each waited
+    for with wait_for_data; reports the median and p99 round trip
+
+    python bench_qos.py --seconds 2 --profile best_effort --profile reliable
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+import ICDWrapper
+
+
+def wait_for_match(writer, reader, timeout=5.0):
+    """Publish probes until the reader sees one (discovery has completed)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        writer.write(0, "probe")
+        if reader.wait_for_data(100):
+            while reader.take_batch(1024):
+                pass
+            return True
+    return False
+
+
+def throughput(writer, reader, seconds, batch_size, message):
+    stop = threading.Event()
+    received = [0]
+
+    def drain():
+        while not stop.is_set():
+            if reader.wait_for_data(50):
+                received[0] += len(reader.take_batch(1024))
+        # Pick up what is still in flight
+        time.sleep(0.2)
+        while True:
+            batch = reader.take_batch(1024)
+            if not batch:
+                break
+            received[0] += len(batch)
+
+    consumer = threading.Thread(target=drain)
+    consumer.start()
+    samples = [(i, message) for i in range(batch_size)]
+    sent = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        sent += writer.write_batch(samples)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    consumer.join()
+    return sent / elapsed, received[0] / elapsed, 1.0 - received[0] / sent if sent else 0.0
+
+
+def latency(writer, reader, pings):
+    samples = []
+    for i in range(pings):
+        sent = time.perf_counter_ns()
+        writer.write(i, str(sent))
+        while True:
+            if not reader.wait_for_data(1000):
+                break  # lost (best effort) or timed out
+            batch = reader.take_batch(16)
+            if any(index == i for index, _ in batch):
+                samples.append((time.perf_counter_ns() - sent) / 1000.0)
+                break
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--profile", action="append", choices=sorted(ICDWrapper.QOS_PROFILES),
+                        help="profile to measure (repeatable, default: all)")
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of the throughput run")
+    parser.add_argument("--batch", type=int, default=64, help="samples per write_batch call")
+    parser.add_argument("--message-size", type=int, default=64, help="message length in bytes")
+    parser.add_argument("--pings", type=int, default=1000, help="samples in the latency run")
+    parser.add_argument("--domain", type=int, default=0)
+    args = parser.parse_args()
+
+    message = "x" * args.message_size
+    print(f"{'profile':<16} {'sent/s':>12} {'recv/s':>12} {'loss':>7} {'p50 us':>9} {'p99 us':>9}")
+    with ICDWrapper.Participant(args.domain) as participant:
+        for profile in args.profile or list(ICDWrapper.QOS_PROFILES):
+            topic = f"QosBench_{profile}_{int(time.time() * 1000)}"
+            writer = participant.create_writer(topic, profile)
+            reader = participant.create_reader(topic, profile)
+            try:
+                if not wait_for_match(writer, reader):
+                    print(f"{profile:<16} reader never matched")
+                    continue
+                sent, received, loss = throughput(writer, reader, args.seconds, args.batch, message)
+                rtts = sorted(latency(writer, reader, args.pings))
+                p50 = statistics.median(rtts) if rtts else float("nan")
+                p99 = rtts[min(len(rtts) - 1, int(len(rtts) * 0.99))] if rtts else float("nan")
+                print(f"{profile:<16} {sent:>12.0f} {received:>12.0f} {loss:>6.1%} {p50:>9.1f} {p99:>9.1f}")
+            finally:
+                writer.close()
+                reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Per-sample cost of HelloWorld proxies versus compact Sample values.
+
+Two measurements, each reported in samples/s:
+
+  * local:   build a sample and read both fields back, no DDS involved.
+             HelloWorld() plus index()/message() setter and getter calls
+             versus Sample((index, message)) plus .index/.message
+  * receive: drain a published burst from a reader, one
+             Reader.take_struct(HelloWorld()) per sample versus
+             Reader.take_samples(), reading both fields of every sample
+
+    python bench_samples.py --seconds 1 --size 64 --burst 256
+"""
+
+import argparse
+import time
+
+import ICDWrapper
+
+
+def rate(step, seconds):
+    """Calls of step() per second; step returns the number of samples it handled."""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        count += step()
+    return count / (time.perf_counter() - start)
+
+
+def local_proxy(message, loops):
+    def step():
+        for i in range(loops):
+            sample = ICDWrapper.HelloWorld()
+            sample.index(i)
+            sample.message(message)
+            sample.index()
+            sample.message()
+        return loops
+    return step
+
+
+def local_compact(message, loops):
+    Sample = ICDWrapper.Sample
+
+    def step():
+        for i in range(loops):
+            sample = Sample((i, message))
+            sample.index
+            sample.message
+        return loops
+    return step
+
+
+def publish(writer, message, burst):
+    for i in range(burst):
+        writer.write(i, message)
+
+
+def receive_proxy(writer, reader, message, burst):
+    def step():
+        publish(writer, message, burst)
+        taken = 0
+        while True:
+            sample = ICDWrapper.HelloWorld()
+            if not reader.take_struct(sample):
+                return taken
+            sample.index()
+            sample.message()
+            taken += 1
+    return step
+
+
+def receive_compact(writer, reader, message, burst):
+    def step():
+        publish(writer, message, burst)
+        taken = 0
+        while True:
+            samples = reader.take_samples(burst)
+            if not samples:
+                return taken
+            for sample in samples:
+                sample.index
+                sample.message
+            taken += len(samples)
+    return step
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="duration per measurement")
+    parser.add_argument("--size", type=int, default=64, help="message size in bytes")
+    parser.add_argument("--burst", type=int, default=256, help="samples published per receive round")
+    parser.add_argument("--domain", type=int, default=0)
+    args = parser.parse_args()
+
+    message = "x" * args.size
+    print(f"message size {args.size} bytes, burst {args.burst}")
+    print(f"{'':8} {'proxy/s':>12} {'compact/s':>12}")
+    proxy = rate(local_proxy(message, 1000), args.seconds)
+    compact = rate(local_compact(message, 1000), args.seconds)
+    print(f"{'local':8} {proxy:>12.0f} {compact:>12.0f}")
+
+    # The send side is the same for both: samples are published with Writer.write
+    qos = dict(reliability='reliable', history_kind='keep_last', history_depth=args.burst)
+    with ICDWrapper.Participant(args.domain) as participant:
+        topic = f"SampleBench_{int(time.time() * 1000)}"
+        writer = participant.create_writer(topic, qos)
+        reader = participant.create_reader(topic, qos)
+        proxy = rate(receive_proxy(writer, reader, message, args.burst), args.seconds)
+        compact = rate(receive_compact(writer, reader, message, args.burst), args.seconds)
+        print(f"{'receive':8} {proxy:>12.0f} {compact:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Round-trip latency and throughput of the Python wrapper, swept over
+transports, QoS and message sizes, reported as JSON.
+
+Same measurements and output schema as DDSmessage/benchmarks/facade_bench
+and nodejs/examples/bench-suite.js (see benchmarks/README.md): for each
+combination an echo process (this script with --echo) writes every sample
+back, then --pings round trips with one sample in flight give p50/p99/p999
+latency and a burst of --burst samples timed until the last echo is back
+gives msgs/s and MB/s.
+
+    python bench_suite.py --sizes 64,1024 --transports shm --output python.json
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+import ICDWrapper
+
+STOP_INDEX = 0xFFFFFFFF
+BATCH = 256
+
+
+def make_qos(name, burst):
+    """Both profiles keep a whole burst, so only best-effort delivery can drop samples."""
+    if name == "reliable":
+        return dict(reliability="reliable", history_kind="keep_all",
+                    max_samples=burst + BATCH, max_samples_per_instance=burst + BATCH)
+    if name == "best_effort":
+        return dict(reliability="best_effort", history_kind="keep_last", history_depth=burst + BATCH)
+    raise ValueError("unknown QoS %r (expected reliable or best_effort)" % name)
+
+
+def run_echo(transport, qos_name, burst, ping, pong):
+    """Echo process: write every ping sample back on pong until the stop index."""
+    with ICDWrapper.Participant(0, transport) as participant:
+        qos = make_qos(qos_name, burst)
+        writer = participant.create_writer(pong, qos)
+        reader = participant.create_reader(ping, qos)
+        idle = 0
+        # Exits on the stop sample, or once the parent has gone quiet (a lost best-effort stop)
+        while idle < 20:
+            if not reader.wait_for_data(500):
+                idle += 1
+                continue
+            idle = 0
+            samples = reader.take_batch(BATCH, raw=True)
+            writer.write_batch(samples)
+            if any(index == STOP_INDEX for index, _ in samples):
+                return
+
+
+def await_echo(reader, index, timeout_ms):
+    while reader.wait_for_data(timeout_ms):
+        if any(i == index for i, _ in reader.take_batch(BATCH, raw=True)):
+            return True
+    return False
+
+
+def wait_for_match(writer, reader, message):
+    """Probe until the echo process answers (discovery has completed)."""
+    for _ in range(50):
+        writer.write_batch([(0, message)])
+        if await_echo(reader, 0, 100):
+            return True
+    return False
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, math.ceil(p * len(values)) - 1))]
+
+
+def run_case(transport, qos_name, size, args):
+    suffix = "%s_%s_%d_%d" % (transport, qos_name, size, os.getpid())
+    ping, pong = "PyBenchPing_" + suffix, "PyBenchPong_" + suffix
+    echo = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--echo",
+                             transport, qos_name, str(args.burst), ping, pong])
+    message = b"x" * size
+    try:
+        with ICDWrapper.Participant(0, transport) as participant:
+            qos = make_qos(qos_name, args.burst)
+            writer = participant.create_writer(ping, qos)
+            reader = participant.create_reader(pong, qos)
+            try:
+                if not wait_for_match(writer, reader, message):
+                    print("%s/%s/%d: echo process never matched" % (transport, qos_name, size), file=sys.stderr)
+                    return None
+                while reader.take_batch(BATCH, raw=True):
+                    pass
+
+                rtts = []
+                for i in range(1, args.pings + 1):
+                    start = time.perf_counter()
+                    writer.write_batch([(i, message)])
+                    if await_echo(reader, i, 1000):
+                        rtts.append((time.perf_counter() - start) * 1e6)
+                rtts.sort()
+
+                samples = [(1000000 + i, message) for i in range(args.burst)]
+                received = 0
+                start = last = time.perf_counter()
+                writer.write_batch(samples)
+                while received < args.burst and reader.wait_for_data(2000):
+                    received += len(reader.take_batch(BATCH, raw=True))
+                    last = time.perf_counter()
+                elapsed = max(last - start, 1e-6)
+            finally:
+                # The stop sample may be lost under best effort, so repeat it
+                for _ in range(20):
+                    writer.write_batch([(STOP_INDEX, b"")])
+                    try:
+                        echo.wait(0.1)
+                        break
+                    except subprocess.TimeoutExpired:
+                        pass
+    finally:
+        if echo.poll() is None:
+            echo.terminate()
+        echo.wait()
+
+    result = {
+        "binding": "python", "transport": transport, "qos": qos_name, "size": size,
+        "pings": args.pings, "lost_pings": args.pings - len(rtts),
+        "latency_us": {"p50": percentile(rtts, 0.50), "p99": percentile(rtts, 0.99),
+                       "p999": percentile(rtts, 0.999), "mean": sum(rtts) / len(rtts) if rtts else 0.0},
+        "burst": args.burst, "received": received,
+        "msgs_per_s": received / elapsed, "mb_per_s": received * size / elapsed / 1e6,
+    }
+    print("%-6s %-12s %8d  p50 %9.1f us  p99 %9.1f us  %12.0f msgs/s" % (
+        transport, qos_name, size, result["latency_us"]["p50"], result["latency_us"]["p99"], result["msgs_per_s"]),
+        file=sys.stderr)
+    return result
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--echo":
+        transport, qos_name, burst, ping, pong = sys.argv[2:7]
+        run_echo(transport, qos_name, int(burst), ping, pong)
+        return
+
+    def csv(cast):
+        return lambda text: [cast(item) for item in text.split(",") if item]
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=csv(int), default=[64, 1024, 16384], help="message sizes in bytes")
+    parser.add_argument("--transports", type=csv(str), default=["udp", "shm"])
+    parser.add_argument("--qos", type=csv(str), default=["reliable", "best_effort"])
+    parser.add_argument("--pings", type=int, default=1000, help="round trips per combination")
+    parser.add_argument("--burst", type=int, default=5000, help="samples per throughput burst")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    args = parser.parse_args()
+    for name in args.qos:
+        make_qos(name, args.burst)
+
+    results = []
+    for transport in args.transports:
+        for qos_name in args.qos:
+            for size in args.sizes:
+                result = run_case(transport, qos_name, size, args)
+                if result is not None:
+                    results.append(result)
+
+    document = {"schema": 1, "binding": "python", "results": results}
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(document, out, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
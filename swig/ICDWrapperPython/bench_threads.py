@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Threaded publish benchmark for the Python bindings.
+
+Runs 1, 2, 4 ... N Python threads calling dds_write in parallel and reports
+the aggregate write rate. The facade calls release the GIL, so the rate should
+grow with the thread count instead of flattening at the single-thread number.
+A second check measures how much pure-Python work another thread gets done
+while one thread is blocked in dds_wait_for_data.
+
+    python bench_threads.py --seconds 2 --max-threads 8
+"""
+
+import argparse
+import threading
+import time
+
+import ICDWrapper
+
+
+def publish_rate(threads, seconds, message):
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def worker(slot):
+        index = slot << 24
+        count = 0
+        while not stop.is_set():
+            count += ICDWrapper.dds_write(index, message)
+            index += 1
+        counts[slot] = count
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in workers:
+        t.join()
+    return sum(counts) / seconds
+
+
+def python_progress(seconds, block):
+    """Loop iterations a pure-Python thread manages in `seconds`, optionally
+    while another thread sits in dds_wait_for_data."""
+    waiter = None
+    if block:
+        # Nothing is published, so this blocks for the whole measurement
+        waiter = threading.Thread(target=ICDWrapper.dds_wait_for_data, args=(int(seconds * 1000),))
+        waiter.start()
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        count += 1
+    if waiter is not None:
+        waiter.join()
+    return count / seconds
+
+
+def drain():
+    while ICDWrapper.dds_take_batch_list(1024):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of each run")
+    parser.add_argument("--max-threads", type=int, default=8, help="largest thread count")
+    parser.add_argument("--message-size", type=int, default=64, help="message length in bytes")
+    parser.add_argument("--topic", default="PythonThreadBenchTopic")
+    args = parser.parse_args()
+
+    if not ICDWrapper.dds_init(args.topic):
+        raise SystemExit("dds_init failed")
+    message = "x" * args.message_size
+
+    try:
+        print(f"{'threads':>8} {'writes/s':>14} {'speedup':>8}")
+        baseline = None
+        threads = 1
+        while threads <= args.max_threads:
+            rate = publish_rate(threads, args.seconds, message)
+            baseline = baseline or rate
+            print(f"{threads:>8} {rate:>14.0f} {rate / baseline:>7.2f}x")
+            drain()
+            threads *= 2
+
+        free = python_progress(args.seconds, block=False)
+        blocked = python_progress(args.seconds, block=True)
+        print(f"\nPython loop alone:                {free:>14.0f}/s")
+        print(f"Python loop beside wait_for_data: {blocked:>14.0f}/s ({blocked / free:.0%})")
+    finally:
+        ICDWrapper.dds_shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,7 @@ if errorlevel 1 (
 echo Build completed successfully!
 echo Files generated:
 echo - ICD_wrap.cxx
-echo - ICDWrapper.py  
-echo - _ICDWrapper.pyd
+echo - icd_native.py
+echo - _icd_native.pyd
 
 pause
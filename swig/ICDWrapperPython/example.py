@@ -76,6 +76,10 @@ def subscriber_example():
     try:
         message_count = 0
         while message_count < 20:  # Limit for demo
+            # Block (GIL released) until data arrives instead of sleep-polling
+            if not ICDWrapper.dds_wait_for_data(100):
+                continue
+
             # Method 1: Using the convenient string-based take
             index_out = ICDWrapper.new_uintp()
             message = ICDWrapper.dds_take_string(index_out)
@@ -93,7 +97,6 @@ def subscriber_example():
                     message_count += 1
             
             ICDWrapper.delete_uintp(index_out)
-            time.sleep(0.1)
                 
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+asyncio receive path for the DDS facade.
+
+The facade signals a socket on every data arrival (dds_set_data_notify_fd),
+the event loop watches it with add_reader, and samples are drained in
+batches with dds_take_batch_list. No thread and no sleep-polling involved.
+
+    async with Subscription() as subscription:
+        async for index, message in subscription:
+            ...
+"""
+
+import asyncio
+import socket
+
+import ICDWrapper
+
+
+class Subscription:
+    """Async iterator over (index, message) samples from a facade reader.
+
+    With reader=None the single-topic facade reader is used (dds_init must
+    have been called first, and only one such Subscription can be open at a
+    time). Pass an ICDWrapper.Reader to subscribe on a handle-based reader.
+    """
+
+    def __init__(self, reader=None, max_batch=256, poll_timeout_ms=100):
+        self.reader = reader
+        self.max_batch = max_batch
+        # Only used when the loop cannot watch sockets (e.g. Windows Proactor loop)
+        self.poll_timeout_ms = poll_timeout_ms
+        self._loop = None
+        self._event = None
+        self._rsock = None
+        self._wsock = None
+        self._closed = True
+
+    def open(self):
+        """Start watching for data on the running event loop."""
+        if not self._closed:
+            return self
+        self._loop = asyncio.get_running_loop()
+        self._closed = False
+        self._rsock, self._wsock = socket.socketpair()
+        self._rsock.setblocking(False)
+        self._wsock.setblocking(False)
+        self._event = asyncio.Event()
+        try:
+            self._loop.add_reader(self._rsock.fileno(), self._on_readable)
+        except NotImplementedError:
+            # Fall back to waiting in the default executor (the wait releases the GIL)
+            self._close_sockets()
+            self._event = None
+            return self
+        self._set_notify_fd(self._wsock.fileno())
+        return self
+
+    def close(self):
+        """Stop watching and wake any pending iteration."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._event is not None:
+            self._set_notify_fd(-1)
+            self._loop.remove_reader(self._rsock.fileno())
+            self._close_sockets()
+            self._event.set()
+
+    async def __aenter__(self):
+        return self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __aiter__(self):
+        return self._samples()
+
+    async def batches(self):
+        """Yield non-empty lists of (index, message) tuples until closed."""
+        if self._closed:
+            self.open()
+        while not self._closed:
+            if self._event is not None:
+                # Clear before taking so an arrival during the take is not lost
+                self._event.clear()
+            batch = self._take_batch()
+            if batch:
+                yield batch
+            else:
+                await self._wait_for_data()
+
+    async def _samples(self):
+        async for batch in self.batches():
+            for sample in batch:
+                yield sample
+
+    async def _wait_for_data(self):
+        if self._event is not None:
+            await self._event.wait()
+        elif self.reader is None:
+            await self._loop.run_in_executor(None, ICDWrapper.dds_wait_for_data, self.poll_timeout_ms)
+        else:
+            await self._loop.run_in_executor(None, self.reader.wait_for_data, self.poll_timeout_ms)
+
+    def _take_batch(self):
+        if self.reader is None:
+            return ICDWrapper.dds_take_batch_list(self.max_batch)
+        return self.reader.take_batch(self.max_batch)
+
+    def _set_notify_fd(self, fd):
+        if self.reader is None:
+            ICDWrapper.dds_set_data_notify_fd(fd)
+        else:
+            self.reader.set_data_notify_fd(fd)
+
+    def _on_readable(self):
+        try:
+            while self._rsock.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        self._event.set()
+
+    def _close_sockets(self):
+        for sock in (self._rsock, self._wsock):
+            if sock is not None:
+                sock.close()
+        self._rsock = self._wsock = None
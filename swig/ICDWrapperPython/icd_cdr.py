@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Pure-Python CDR codec for the ICD_pkg types, for offline use (recording,
+replay, test fixtures) without a participant or the native module.
+
+Payloads are laid out exactly as HelloWorldPubSubType /
+HelloWorldFixedPubSubType serialize them (ICDCdrAux.ipp): a 4-byte
+encapsulation header followed by
+
+  HelloWorld       XCDR1: index, string            (CDR_LE/BE)
+                   XCDR2: DHEADER, index, string   (D_CDR2_LE/BE, appendable)
+  HelloWorldFixed  XCDR1/XCDR2: index, length, char[FIXED_MESSAGE_CAPACITY]
+                                                   (CDR_LE/BE, CDR2_LE/BE)
+
+where a string is a uint32 length (terminating NUL included) followed by its
+bytes and the NUL. Decoding follows the header, so both endiannesses and both
+CDR versions are accepted.
+
+    payload = encode(7, "hello", version=XCDR2)
+    decode(payload)                            # (7, 'hello')
+    stream = encode_stream((i, "m") for i in range(1000))
+    decode_stream(stream)                      # [(0, 'm'), (1, 'm'), ...]
+"""
+
+import struct
+
+XCDR1 = 1
+XCDR2 = 2
+
+# Must match FIXED_MESSAGE_CAPACITY in ICD.idl
+FIXED_MESSAGE_CAPACITY = 4096
+
+# Representation identifiers of the encapsulation header, as Fast CDR writes
+# them: its EncodingAlgorithmFlag (PLAIN_CDR, PLAIN_CDR2, DELIMIT_CDR2) with the
+# low bit set for little endian. These are the DDS-XTypes 1.3 values.
+CDR_BE, CDR_LE = 0x0000, 0x0001
+CDR2_BE, CDR2_LE = 0x0006, 0x0007
+D_CDR2_BE, D_CDR2_LE = 0x0008, 0x0009
+
+_HEADER = struct.Struct('>HH')
+_U32 = {False: struct.Struct('<I'), True: struct.Struct('>I')}
+_U32_PAIR = {False: struct.Struct('<II'), True: struct.Struct('>II')}
+_FIXED = {big: struct.Struct(('>' if big else '<') + 'II%ds' % FIXED_MESSAGE_CAPACITY)
+          for big in (False, True)}
+
+_HELLO_WORLD_IDS = {XCDR1: CDR_BE, XCDR2: D_CDR2_BE}
+_FIXED_IDS = {XCDR1: CDR_BE, XCDR2: CDR2_BE}
+
+
+def _representation(ids, version, big_endian):
+    if version not in ids:
+        raise ValueError("unknown CDR version %r (expected XCDR1 or XCDR2)" % (version,))
+    return ids[version] | (0 if big_endian else 1)
+
+
+def _as_bytes(message):
+    return message.encode('utf-8') if isinstance(message, str) else bytes(message)
+
+
+def _message(data, raw):
+    return bytes(data) if raw else str(data, 'utf-8', 'surrogateescape')
+
+
+def encode(index, message, version=XCDR1, big_endian=False):
+    """Serialized HelloWorld payload (header included) for a str or bytes message."""
+    representation = _representation(_HELLO_WORLD_IDS, version, big_endian)
+    data = _as_bytes(message)
+    body = _U32_PAIR[big_endian].pack(index, len(data) + 1) + data + b'\0'
+    if version == XCDR2:
+        body = _U32[big_endian].pack(len(body)) + body
+    return _HEADER.pack(representation, 0) + body
+
+
+def encode_fixed(index, message, version=XCDR1, big_endian=False):
+    """Serialized HelloWorldFixed payload; message must fit FIXED_MESSAGE_CAPACITY bytes."""
+    representation = _representation(_FIXED_IDS, version, big_endian)
+    data = _as_bytes(message)
+    if len(data) > FIXED_MESSAGE_CAPACITY:
+        raise ValueError("message of %d bytes exceeds the %d byte capacity" % (len(data), FIXED_MESSAGE_CAPACITY))
+    # struct pads the char array with NULs
+    return _HEADER.pack(representation, 0) + _FIXED[big_endian].pack(index, len(data), data)
+
+
+def _decode_at(view, pos, raw):
+    """Decode the HelloWorld payload starting at pos; returns (index, message, end)."""
+    representation, options = _HEADER.unpack_from(view, pos)
+    big_endian = not representation & 1
+    pos += 4
+    if representation in (D_CDR2_BE, D_CDR2_LE):
+        size, = _U32[big_endian].unpack_from(view, pos)
+        pos += 4
+        end = pos + size
+    elif representation in (CDR_BE, CDR_LE):
+        end = None
+    else:
+        raise ValueError("unsupported HelloWorld encapsulation 0x%04x" % representation)
+    index, length = _U32_PAIR[big_endian].unpack_from(view, pos)
+    pos += 8
+    if pos + length > len(view) or (end is not None and end > len(view)):
+        raise ValueError("truncated HelloWorld payload")
+    message = _message(view[pos:pos + length - 1] if length else b'', raw)
+    # An appendable XCDR2 body may carry members this type does not know: skip them
+    pos = end if end is not None else pos + length
+    # The low two option bits count the padding appended after the body
+    return index, message, pos + (options & 3)
+
+
+def _decode_one(decode_at, payload, raw):
+    try:
+        index, message, _ = decode_at(memoryview(payload), 0, raw)
+    except struct.error:
+        raise ValueError("truncated payload")
+    return index, message
+
+
+def decode(payload, raw=False):
+    """(index, message) from one HelloWorld payload; message is bytes when raw."""
+    return _decode_one(_decode_at, payload, raw)
+
+
+def _decode_fixed_at(view, pos, raw):
+    representation, options = _HEADER.unpack_from(view, pos)
+    if representation not in (CDR_BE, CDR_LE, CDR2_BE, CDR2_LE):
+        raise ValueError("unsupported HelloWorldFixed encapsulation 0x%04x" % representation)
+    layout = _FIXED[not representation & 1]
+    index, length, data = layout.unpack_from(view, pos + 4)
+    if length > FIXED_MESSAGE_CAPACITY:
+        raise ValueError("HelloWorldFixed length %d exceeds the capacity" % length)
+    return index, _message(data[:length], raw), pos + 4 + layout.size + (options & 3)
+
+
+def decode_fixed(payload, raw=False):
+    """(index, message) from one HelloWorldFixed payload; message is bytes when raw."""
+    return _decode_one(_decode_fixed_at, payload, raw)
+
+
+def encode_stream(samples, version=XCDR1, big_endian=False, fixed=False):
+    """Concatenated payloads for an iterable of (index, message) pairs."""
+    encoder = encode_fixed if fixed else encode
+    return b''.join([encoder(index, message, version, big_endian) for index, message in samples])
+
+
+def decode_stream(data, raw=False, fixed=False):
+    """List of (index, message) from payloads concatenated back to back.
+
+    Each payload delimits itself, so no framing is needed between them.
+    """
+    view = memoryview(data)
+    decode_at = _decode_fixed_at if fixed else _decode_at
+    samples = []
+    append = samples.append
+    pos = 0
+    end = len(view)
+    try:
+        while pos < end:
+            index, message, pos = decode_at(view, pos, raw)
+            append((index, message))
+    except struct.error:
+        raise ValueError("truncated payload at offset %d" % pos)
+    return samples
+
+
+def decode_batch(data, offsets, raw=False, fixed=False):
+    """List of (index, message) from payloads framed by offsets: payload i is
+    data[offsets[i]:offsets[i + 1]] (the layout of the batch take/write APIs)."""
+    view = memoryview(data)
+    decode_at = _decode_fixed_at if fixed else _decode_at
+    return [_decode_one(decode_at, view[offsets[i]:offsets[i + 1]], raw) for i in range(len(offsets) - 1)]
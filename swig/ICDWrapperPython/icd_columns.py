@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Columnar bulk receive for the DDS facade (optional extra, needs NumPy).
+
+Samples are taken straight into preallocated NumPy arrays in Arrow layout: a
+uint32 index column plus uint32 offsets into one bytes column. No Python
+object is created per sample, and ICDWrapper itself never imports NumPy.
+
+    receiver = ColumnReceiver(reader, max_samples=65536)
+    columns = receiver.take()
+    columns.indices            # uint32[n]
+    columns.message(i)         # bytes of sample i
+    columns.to_structured(32)  # [('index', '<u4'), ('message', 'S32')]
+    columns.to_arrow()         # pyarrow Table, if pyarrow is installed
+"""
+
+import ICDWrapper
+
+# Arrow binary offsets are int32, so a batch holds at most this many message bytes
+MAX_BUFFER_LEN = (1 << 31) - 1
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("icd_columns needs NumPy (pip install numpy)")
+    return numpy
+
+
+class Columns(object):
+    """One received batch: sample i has index indices[i] and message
+    data[offsets[i]:offsets[i + 1]].
+
+    Columns returned by ColumnReceiver.take() are views into the receiver's
+    buffers and are overwritten by its next take(); copy() them to keep them.
+    """
+
+    __slots__ = ('indices', 'offsets', 'data')
+
+    def __init__(self, indices, offsets, data):
+        self.indices = indices
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.indices)
+
+    def message(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes()
+
+    def lengths(self):
+        """Message lengths in bytes (uint32[n])."""
+        return _numpy().diff(self.offsets)
+
+    def copy(self):
+        return Columns(self.indices.copy(), self.offsets.copy(), self.data.copy())
+
+    def to_structured(self, width):
+        """Structured array with an 'index' field and messages padded or cut to width bytes.
+
+        Built with vectorised gathers; memory is proportional to len(self) * width.
+        """
+        np = _numpy()
+        count = len(self)
+        out = np.zeros(count, dtype=[('index', '<u4'), ('message', 'S%d' % width)])
+        out['index'] = self.indices
+        if count and width:
+            starts = self.offsets[:-1].astype(np.int64)
+            lengths = np.minimum(np.diff(self.offsets), width)
+            columns = np.arange(width)
+            mask = columns < lengths[:, None]
+            messages = np.zeros((count, width), np.uint8)
+            messages[mask] = self.data[(starts[:, None] + columns)[mask]]
+            out['message'] = messages.view('S%d' % width).reshape(count)
+        return out
+
+    def to_arrow(self):
+        """pyarrow Table with 'index' (uint32) and 'message' (binary) columns.
+
+        The message column shares this batch's data buffer.
+        """
+        import pyarrow as pa
+        count = len(self)
+        # Arrow binary offsets are int32; ColumnReceiver keeps its buffer within
+        # MAX_BUFFER_LEN, so they fit
+        offsets = pa.py_buffer(self.offsets.astype('<i4'))
+        messages = pa.BinaryArray.from_buffers(pa.binary(), count, [None, offsets, pa.py_buffer(self.data)])
+        return pa.table({'index': pa.array(self.indices, pa.uint32()), 'message': messages})
+
+
+class ColumnReceiver(object):
+    """Takes up to max_samples samples per call into reused column buffers.
+
+    With reader=None the single-topic facade reader is used (dds_init must
+    have been called); otherwise pass an ICDWrapper.Reader. buffer_len bounds
+    the message bytes per call: a batch ends before the first message that
+    does not fit in the remaining space, and the next take returns it, so size
+    it for max_samples typical messages. A single message longer than the
+    whole buffer grows it.
+    """
+
+    def __init__(self, reader=None, max_samples=65536, buffer_len=16 << 20):
+        np = _numpy()
+        self.reader = reader
+        self._indices = np.empty(max_samples, np.uint32)
+        self._offsets = np.zeros(max_samples + 1, np.uint32)
+        self._data = np.empty(buffer_len, np.uint8)
+
+    def _take_into(self):
+        if self.reader is None:
+            return ICDWrapper.dds_take_batch_into(self._indices, self._data, self._offsets)
+        return self.reader.take_batch_into(self._indices, self._data, self._offsets)
+
+    def take(self):
+        """Take what is available (up to max_samples) as Columns; empty if none."""
+        count = self._take_into()
+        while count < 0:
+            # The next message is longer than the whole buffer: nothing was taken. It
+            # can still not fit after growing, if another taker got to the reader first
+            # and the message now next is longer again
+            needed = int(self._offsets[1])
+            if needed > MAX_BUFFER_LEN:
+                raise ValueError("a %d-byte message exceeds MAX_BUFFER_LEN" % needed)
+            np = _numpy()
+            self._data = np.empty(min(max(needed, 2 * len(self._data)), MAX_BUFFER_LEN), np.uint8)
+            count = self._take_into()
+        return Columns(self._indices[:count], self._offsets[:count + 1], self._data[:self._offsets[count]])
+
+
+def take_columns(reader=None, max_samples=65536, buffer_len=16 << 20):
+    """One-shot take into freshly allocated columns (not shared with any receiver)."""
+    return ColumnReceiver(reader, max_samples, buffer_len).take()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Export facade statistics in the OpenMetrics text format.
+
+An Exporter renders the counters, Fast DDS statuses and latency histograms of
+the writers and readers registered with it (see dds_stats_enable). It serves
+them over HTTP from a background thread, writes them to a file, or does both.
+Every scrape reads fresh snapshots, and nothing is collected between scrapes.
+
+    ICDWrapper.dds_stats_enable(1)
+    exporter = icd_metrics.Exporter()
+    exporter.add(writer)
+    exporter.add(reader, name='commands')
+    exporter.add_default()                 # the dds_init writer and reader
+    exporter.serve(9464)                   # http://127.0.0.1:9464/metrics
+    exporter.start_file_export('/run/icd/metrics.prom', interval=10)
+
+A reader whose unread_samples keeps growing while take_duration stays short
+is overloaded: samples arrive faster than they are taken. A reader that logs
+many empty takes but few samples, while its writers still count samples, is
+starved: data is lost or rejected on the way (see lost_samples and
+rejected_samples), or nothing is being published.
+"""
+
+import os
+import threading
+
+import ICDWrapper
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# Upper bounds of the exported latency buckets. They are powers of two from
+# 256 ns to about 1.07 s, which are also bucket edges of the facade histograms,
+# so the cumulative counts are exact.
+LATENCY_BUCKETS_NS = tuple(1 << n for n in range(8, 31))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    return ','.join('%s="%s"' % (key, _escape(value)) for key, value in labels)
+
+
+class _Family(object):
+    """One metric family: its metadata lines and samples."""
+
+    def __init__(self, name, kind, help_text, unit=None):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.unit = unit
+        self.lines = []
+
+    def add(self, labels, value, suffix=''):
+        self.lines.append('%s%s{%s} %s' % (self.name, suffix, _labels(labels), value))
+
+    def add_histogram(self, labels, histogram, bounds_ns):
+        # A facade bucket is counted under the first bound at or above its
+        # upper edge, so an unaligned bound only under-counts, never over-counts
+        cumulative = [0] * len(bounds_ns)
+        total = 0
+        for _lower, upper, count in histogram['buckets']:
+            total += count
+            for i, bound in enumerate(bounds_ns):
+                if upper <= bound:
+                    cumulative[i] += count
+                    break
+        running = 0
+        for bound, count in zip(bounds_ns, cumulative):
+            running += count
+            self.add(labels + (('le', repr(bound / 1e9)),), running, '_bucket')
+        # The count is taken from the buckets so that +Inf and _count agree
+        self.add(labels + (('le', '+Inf'),), total, '_bucket')
+        self.add(labels, total, '_count')
+        self.add(labels, repr(histogram['total_ns'] / 1e9), '_sum')
+
+    def render(self, out):
+        out.append('# TYPE %s %s' % (self.name, self.kind))
+        if self.unit:
+            out.append('# UNIT %s %s' % (self.name, self.unit))
+        out.append('# HELP %s %s' % (self.name, self.help_text))
+        out.extend(self.lines)
+
+
+class Exporter(object):
+    """OpenMetrics exporter of facade writer and reader statistics.
+
+    Endpoints are labelled with their topic and an endpoint name, which is
+    the name given to add() or a sequence number. Closed endpoints are dropped
+    at the next scrape. With enable_stats (the default) collection is turned
+    on when the exporter is created.
+    """
+
+    def __init__(self, enable_stats=True, buckets_ns=LATENCY_BUCKETS_NS):
+        if enable_stats:
+            ICDWrapper.dds_stats_enable(1)
+        self.buckets_ns = tuple(sorted(buckets_ns))
+        self._lock = threading.Lock()
+        self._endpoints = []
+        self._default = None
+        self._sequence = 0
+        self._server = None
+        self._server_thread = None
+        self._file_thread = None
+        self._stop = threading.Event()
+
+    def add(self, endpoint, name=None):
+        """Register an ICDWrapper.Writer or ICDWrapper.Reader."""
+        if isinstance(endpoint, ICDWrapper.Writer):
+            role = 'writer'
+        elif isinstance(endpoint, ICDWrapper.Reader):
+            role = 'reader'
+        else:
+            raise TypeError('expected an ICDWrapper.Writer or ICDWrapper.Reader')
+        with self._lock:
+            if name is None:
+                self._sequence += 1
+                name = str(self._sequence)
+            self._endpoints.append((role, endpoint, endpoint.topic_name, str(name)))
+
+    def add_default(self, topic_name='HelloWorldTopic', name='dds_init'):
+        """Register the dds_init writer and reader, reported under topic_name."""
+        with self._lock:
+            self._default = (topic_name, name)
+
+    def remove(self, endpoint):
+        with self._lock:
+            self._endpoints = [entry for entry in self._endpoints if entry[1] is not endpoint]
+
+    def collect(self):
+        """[(role, topic, name, stats dict)] for every open endpoint."""
+        with self._lock:
+            endpoints = list(self._endpoints)
+            default = self._default
+        snapshots = []
+        closed = []
+        for role, endpoint, topic, name in endpoints:
+            try:
+                snapshots.append((role, topic, name, endpoint.stats()))
+            except ValueError:
+                closed.append(endpoint)
+        if default is not None:
+            stats = ICDWrapper.dds_get_stats_dict()
+            if stats is not None:
+                snapshots.append(('writer', default[0], default[1], stats['writer']))
+                snapshots.append(('reader', default[0], default[1], stats['reader']))
+        for endpoint in closed:
+            self.remove(endpoint)
+        return snapshots
+
+    def render(self):
+        """The current statistics as OpenMetrics text."""
+        writer = [
+            _Family('dds_writer_samples', 'counter', 'Samples written.'),
+            _Family('dds_writer_bytes', 'counter', 'Message bytes written.', 'bytes'),
+            _Family('dds_writer_failures', 'counter', 'Write calls that did not write every sample given.'),
+            _Family('dds_writer_write_duration_seconds', 'histogram', 'Duration of write calls; a batch is one call.', 'seconds'),
+            _Family('dds_writer_matched_readers', 'gauge', 'Readers currently matched.'),
+            _Family('dds_writer_matches', 'counter', 'Readers ever matched.'),
+        ]
+        reader = [
+            _Family('dds_reader_samples', 'counter', 'Samples taken.'),
+            _Family('dds_reader_bytes', 'counter', 'Message bytes taken.', 'bytes'),
+            _Family('dds_reader_empty_takes', 'counter', 'Take calls that found no data.'),
+            _Family('dds_reader_take_duration_seconds', 'histogram', 'Duration of take calls; a batch is one call.', 'seconds'),
+            _Family('dds_reader_unread_samples', 'gauge', 'Samples received but not yet taken.'),
+            _Family('dds_reader_matched_writers', 'gauge', 'Writers currently matched.'),
+            _Family('dds_reader_matches', 'counter', 'Writers ever matched.'),
+            _Family('dds_reader_lost_samples', 'counter', 'Samples lost before they reached the reader.'),
+            _Family('dds_reader_rejected_samples', 'counter', 'Samples rejected for lack of resources.'),
+        ]
+        for role, topic, name, stats in self.collect():
+            labels = (('topic', topic), ('endpoint', name))
+            if role == 'writer':
+                writer[0].add(labels, stats['samples'], '_total')
+                writer[1].add(labels, stats['bytes'], '_total')
+                writer[2].add(labels, stats['failures'], '_total')
+                writer[3].add_histogram(labels, stats['write_latency'], self.buckets_ns)
+                writer[4].add(labels, stats['matched_readers'])
+                writer[5].add(labels, stats['matched_readers_total'], '_total')
+            else:
+                reader[0].add(labels, stats['samples'], '_total')
+                reader[1].add(labels, stats['bytes'], '_total')
+                reader[2].add(labels, stats['empty_takes'], '_total')
+                reader[3].add_histogram(labels, stats['take_latency'], self.buckets_ns)
+                reader[4].add(labels, stats['unread_samples'])
+                reader[5].add(labels, stats['matched_writers'])
+                reader[6].add(labels, stats['matched_writers_total'], '_total')
+                reader[7].add(labels, stats['samples_lost'], '_total')
+                reader[8].add(labels, stats['samples_rejected'], '_total')
+
+        out = []
+        enabled = _Family('dds_stats_enabled', 'gauge', 'Whether statistics are being collected (1) or not (0).')
+        enabled.lines.append('dds_stats_enabled %d' % ICDWrapper.dds_stats_enabled())
+        enabled.render(out)
+        for family in writer + reader:
+            if family.lines:
+                family.render(out)
+        out.append('# EOF')
+        return '\n'.join(out) + '\n'
+
+    def write_file(self, path):
+        """Write the metrics to path, replacing it atomically."""
+        temporary = '%s.%d.tmp' % (path, os.getpid())
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(temporary, path)
+
+    def start_file_export(self, path, interval=10.0):
+        """Rewrite path every interval seconds from a daemon thread until close()."""
+        if self._file_thread is not None:
+            raise RuntimeError('file export already started')
+
+        def run():
+            while True:
+                self.write_file(path)
+                if self._stop.wait(interval):
+                    break
+
+        self._file_thread = threading.Thread(target=run, name='icd-metrics-file', daemon=True)
+        self._file_thread.start()
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        """Serve /metrics from a daemon thread; returns the bound (host, port)."""
+        if self._server is not None:
+            raise RuntimeError('already serving')
+        # Imported here: http.server pulls in the email package, which file-only
+        # exporters need not load
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = HTTPServer((host, port), Handler)
+        self._server_thread = threading.Thread(target=self._server.serve_forever, name='icd-metrics-http', daemon=True)
+        self._server_thread.start()
+        return self._server.server_address[:2]
+
+    def close(self):
+        """Stop serving and stop the file export."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server_thread.join()
+            self._server = None
+        if self._file_thread is not None:
+            self._file_thread.join()
+            self._file_thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,962 @@
+# This file was automatically generated by SWIG (https://www.swig.org).
+# Version 4.3.1
+#
+# Do not make changes to this file unless you know what you are doing - modify
+# the SWIG interface file instead.
+
+from sys import version_info as _swig_python_version_info
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _icd_native
+else:
+    import _icd_native
+
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "this":
+            set(self, name, value)
+        elif name == "thisown":
+            self.this.own(value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+class SwigPyIterator(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+
+    def __init__(self, *args, **kwargs):
+        raise AttributeError("No constructor defined - class is abstract")
+    __repr__ = _swig_repr
+    __swig_destroy__ = _icd_native.delete_SwigPyIterator
+
+    def value(self):
+        return _icd_native.SwigPyIterator_value(self)
+
+    def incr(self, n=1):
+        return _icd_native.SwigPyIterator_incr(self, n)
+
+    def decr(self, n=1):
+        return _icd_native.SwigPyIterator_decr(self, n)
+
+    def distance(self, x):
+        return _icd_native.SwigPyIterator_distance(self, x)
+
+    def equal(self, x):
+        return _icd_native.SwigPyIterator_equal(self, x)
+
+    def copy(self):
+        return _icd_native.SwigPyIterator_copy(self)
+
+    def next(self):
+        return _icd_native.SwigPyIterator_next(self)
+
+    def __next__(self):
+        return _icd_native.SwigPyIterator___next__(self)
+
+    def previous(self):
+        return _icd_native.SwigPyIterator_previous(self)
+
+    def advance(self, n):
+        return _icd_native.SwigPyIterator_advance(self, n)
+
+    def __eq__(self, x):
+        return _icd_native.SwigPyIterator___eq__(self, x)
+
+    def __ne__(self, x):
+        return _icd_native.SwigPyIterator___ne__(self, x)
+
+    def __iadd__(self, n):
+        return _icd_native.SwigPyIterator___iadd__(self, n)
+
+    def __isub__(self, n):
+        return _icd_native.SwigPyIterator___isub__(self, n)
+
+    def __add__(self, n):
+        return _icd_native.SwigPyIterator___add__(self, n)
+
+    def __sub__(self, *args):
+        return _icd_native.SwigPyIterator___sub__(self, *args)
+    def __iter__(self):
+        return self
+
+# Register SwigPyIterator in _icd_native:
+_icd_native.SwigPyIterator_swigregister(SwigPyIterator)
+class HelloWorld(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    __swig_destroy__ = _icd_native.delete_HelloWorld
+
+    def __init__(self, *args):
+        _icd_native.HelloWorld_swiginit(self, _icd_native.new_HelloWorld(*args))
+
+    def __eq__(self, x):
+        return _icd_native.HelloWorld___eq__(self, x)
+
+    def __ne__(self, x):
+        return _icd_native.HelloWorld___ne__(self, x)
+
+    def index(self, *args):
+        return _icd_native.HelloWorld_index(self, *args)
+
+    def message(self, *args):
+        return _icd_native.HelloWorld_message(self, *args)
+
+# Register HelloWorld in _icd_native:
+_icd_native.HelloWorld_swigregister(HelloWorld)
+class HelloWorldFixed(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    __swig_destroy__ = _icd_native.delete_HelloWorldFixed
+
+    def __init__(self, *args):
+        _icd_native.HelloWorldFixed_swiginit(self, _icd_native.new_HelloWorldFixed(*args))
+
+    def __eq__(self, x):
+        return _icd_native.HelloWorldFixed___eq__(self, x)
+
+    def __ne__(self, x):
+        return _icd_native.HelloWorldFixed___ne__(self, x)
+
+    def index(self, *args):
+        return _icd_native.HelloWorldFixed_index(self, *args)
+
+    def length(self, *args):
+        return _icd_native.HelloWorldFixed_length(self, *args)
+
+    def message(self, *args):
+        return _icd_native.HelloWorldFixed_message(self, *args)
+
+# Register HelloWorldFixed in _icd_native:
+_icd_native.HelloWorldFixed_swigregister(HelloWorldFixed)
+cvar = _icd_native.cvar
+FIXED_MESSAGE_CAPACITY = cvar.FIXED_MESSAGE_CAPACITY
+
+class HelloWorldKeyed(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    __swig_destroy__ = _icd_native.delete_HelloWorldKeyed
+
+    def __init__(self, *args):
+        _icd_native.HelloWorldKeyed_swiginit(self, _icd_native.new_HelloWorldKeyed(*args))
+
+    def __eq__(self, x):
+        return _icd_native.HelloWorldKeyed___eq__(self, x)
+
+    def __ne__(self, x):
+        return _icd_native.HelloWorldKeyed___ne__(self, x)
+
+    def index(self, *args):
+        return _icd_native.HelloWorldKeyed_index(self, *args)
+
+    def message(self, *args):
+        return _icd_native.HelloWorldKeyed_message(self, *args)
+
+# Register HelloWorldKeyed in _icd_native:
+_icd_native.HelloWorldKeyed_swigregister(HelloWorldKeyed)
+class HelloWorldPubSubType(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self):
+        _icd_native.HelloWorldPubSubType_swiginit(self, _icd_native.new_HelloWorldPubSubType())
+    __swig_destroy__ = _icd_native.delete_HelloWorldPubSubType
+
+    def serialize(self, data, payload, data_representation):
+        return _icd_native.HelloWorldPubSubType_serialize(self, data, payload, data_representation)
+
+    def deserialize(self, payload, data):
+        return _icd_native.HelloWorldPubSubType_deserialize(self, payload, data)
+
+    def calculate_serialized_size(self, data, data_representation):
+        return _icd_native.HelloWorldPubSubType_calculate_serialized_size(self, data, data_representation)
+
+    def compute_key(self, *args):
+        return _icd_native.HelloWorldPubSubType_compute_key(self, *args)
+
+    def create_data(self):
+        return _icd_native.HelloWorldPubSubType_create_data(self)
+
+    def delete_data(self, data):
+        return _icd_native.HelloWorldPubSubType_delete_data(self, data)
+
+    def register_type_object_representation(self):
+        return _icd_native.HelloWorldPubSubType_register_type_object_representation(self)
+
+# Register HelloWorldPubSubType in _icd_native:
+_icd_native.HelloWorldPubSubType_swigregister(HelloWorldPubSubType)
+class HelloWorldFixedPubSubType(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self):
+        _icd_native.HelloWorldFixedPubSubType_swiginit(self, _icd_native.new_HelloWorldFixedPubSubType())
+    __swig_destroy__ = _icd_native.delete_HelloWorldFixedPubSubType
+
+    def serialize(self, data, payload, data_representation):
+        return _icd_native.HelloWorldFixedPubSubType_serialize(self, data, payload, data_representation)
+
+    def deserialize(self, payload, data):
+        return _icd_native.HelloWorldFixedPubSubType_deserialize(self, payload, data)
+
+    def calculate_serialized_size(self, data, data_representation):
+        return _icd_native.HelloWorldFixedPubSubType_calculate_serialized_size(self, data, data_representation)
+
+    def compute_key(self, *args):
+        return _icd_native.HelloWorldFixedPubSubType_compute_key(self, *args)
+
+    def create_data(self):
+        return _icd_native.HelloWorldFixedPubSubType_create_data(self)
+
+    def delete_data(self, data):
+        return _icd_native.HelloWorldFixedPubSubType_delete_data(self, data)
+
+    def register_type_object_representation(self):
+        return _icd_native.HelloWorldFixedPubSubType_register_type_object_representation(self)
+
+# Register HelloWorldFixedPubSubType in _icd_native:
+_icd_native.HelloWorldFixedPubSubType_swigregister(HelloWorldFixedPubSubType)
+class HelloWorldKeyedPubSubType(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self):
+        _icd_native.HelloWorldKeyedPubSubType_swiginit(self, _icd_native.new_HelloWorldKeyedPubSubType())
+    __swig_destroy__ = _icd_native.delete_HelloWorldKeyedPubSubType
+
+    def serialize(self, data, payload, data_representation):
+        return _icd_native.HelloWorldKeyedPubSubType_serialize(self, data, payload, data_representation)
+
+    def deserialize(self, payload, data):
+        return _icd_native.HelloWorldKeyedPubSubType_deserialize(self, payload, data)
+
+    def calculate_serialized_size(self, data, data_representation):
+        return _icd_native.HelloWorldKeyedPubSubType_calculate_serialized_size(self, data, data_representation)
+
+    def compute_key(self, *args):
+        return _icd_native.HelloWorldKeyedPubSubType_compute_key(self, *args)
+
+    def create_data(self):
+        return _icd_native.HelloWorldKeyedPubSubType_create_data(self)
+
+    def delete_data(self, data):
+        return _icd_native.HelloWorldKeyedPubSubType_delete_data(self, data)
+
+    def register_type_object_representation(self):
+        return _icd_native.HelloWorldKeyedPubSubType_register_type_object_representation(self)
+
+# Register HelloWorldKeyedPubSubType in _icd_native:
+_icd_native.HelloWorldKeyedPubSubType_swigregister(HelloWorldKeyedPubSubType)
+
+def register_HelloWorld_type_identifier(type_ids):
+    return _icd_native.register_HelloWorld_type_identifier(type_ids)
+
+def register_HelloWorldFixed_type_identifier(type_ids):
+    return _icd_native.register_HelloWorldFixed_type_identifier(type_ids)
+
+def register_HelloWorldKeyed_type_identifier(type_ids):
+    return _icd_native.register_HelloWorldKeyed_type_identifier(type_ids)
+
+def serialize_key(*args):
+    return _icd_native.serialize_key(*args)
+DDS_QOS_DEFAULT = _icd_native.DDS_QOS_DEFAULT
+DDS_RELIABILITY_BEST_EFFORT = _icd_native.DDS_RELIABILITY_BEST_EFFORT
+DDS_RELIABILITY_RELIABLE = _icd_native.DDS_RELIABILITY_RELIABLE
+DDS_DURABILITY_VOLATILE = _icd_native.DDS_DURABILITY_VOLATILE
+DDS_DURABILITY_TRANSIENT_LOCAL = _icd_native.DDS_DURABILITY_TRANSIENT_LOCAL
+DDS_HISTORY_KEEP_LAST = _icd_native.DDS_HISTORY_KEEP_LAST
+DDS_HISTORY_KEEP_ALL = _icd_native.DDS_HISTORY_KEEP_ALL
+DDS_PUBLISH_SYNCHRONOUS = _icd_native.DDS_PUBLISH_SYNCHRONOUS
+DDS_PUBLISH_ASYNCHRONOUS = _icd_native.DDS_PUBLISH_ASYNCHRONOUS
+DDS_LENGTH_UNLIMITED = _icd_native.DDS_LENGTH_UNLIMITED
+DDS_DATA_SHARING_AUTO = _icd_native.DDS_DATA_SHARING_AUTO
+DDS_DATA_SHARING_ON = _icd_native.DDS_DATA_SHARING_ON
+DDS_DATA_SHARING_OFF = _icd_native.DDS_DATA_SHARING_OFF
+DDS_TRANSPORT_DEFAULT = _icd_native.DDS_TRANSPORT_DEFAULT
+DDS_TRANSPORT_UDP = _icd_native.DDS_TRANSPORT_UDP
+DDS_TRANSPORT_SHM = _icd_native.DDS_TRANSPORT_SHM
+DDS_TRANSPORT_LARGE_DATA = _icd_native.DDS_TRANSPORT_LARGE_DATA
+DDS_FIXED_MESSAGE_CAPACITY = _icd_native.DDS_FIXED_MESSAGE_CAPACITY
+class dds_qos_t(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    reliability = property(_icd_native.dds_qos_t_reliability_get, _icd_native.dds_qos_t_reliability_set)
+    durability = property(_icd_native.dds_qos_t_durability_get, _icd_native.dds_qos_t_durability_set)
+    history_kind = property(_icd_native.dds_qos_t_history_kind_get, _icd_native.dds_qos_t_history_kind_set)
+    history_depth = property(_icd_native.dds_qos_t_history_depth_get, _icd_native.dds_qos_t_history_depth_set)
+    max_samples = property(_icd_native.dds_qos_t_max_samples_get, _icd_native.dds_qos_t_max_samples_set)
+    max_instances = property(_icd_native.dds_qos_t_max_instances_get, _icd_native.dds_qos_t_max_instances_set)
+    max_samples_per_instance = property(_icd_native.dds_qos_t_max_samples_per_instance_get, _icd_native.dds_qos_t_max_samples_per_instance_set)
+    publish_mode = property(_icd_native.dds_qos_t_publish_mode_get, _icd_native.dds_qos_t_publish_mode_set)
+    data_sharing = property(_icd_native.dds_qos_t_data_sharing_get, _icd_native.dds_qos_t_data_sharing_set)
+
+    def __init__(self):
+        _icd_native.dds_qos_t_swiginit(self, _icd_native.new_dds_qos_t())
+    __swig_destroy__ = _icd_native.delete_dds_qos_t
+
+# Register dds_qos_t in _icd_native:
+_icd_native.dds_qos_t_swigregister(dds_qos_t)
+ICD_pkg_HelloWorldKeyed_max_cdr_typesize = cvar.ICD_pkg_HelloWorldKeyed_max_cdr_typesize
+ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize = cvar.ICD_pkg_HelloWorldKeyed_max_key_cdr_typesize
+ICD_pkg_HelloWorldFixed_max_cdr_typesize = cvar.ICD_pkg_HelloWorldFixed_max_cdr_typesize
+ICD_pkg_HelloWorldFixed_max_key_cdr_typesize = cvar.ICD_pkg_HelloWorldFixed_max_key_cdr_typesize
+ICD_pkg_HelloWorld_max_cdr_typesize = cvar.ICD_pkg_HelloWorld_max_cdr_typesize
+ICD_pkg_HelloWorld_max_key_cdr_typesize = cvar.ICD_pkg_HelloWorld_max_key_cdr_typesize
+
+
+def dds_init(topic_name):
+    return _icd_native.dds_init(topic_name)
+
+def dds_init_with_domain(topic_name, domain_id):
+    return _icd_native.dds_init_with_domain(topic_name, domain_id)
+
+def dds_init_with_qos(topic_name, domain_id, qos):
+
+    qos = _qos_arg(qos)
+
+
+    return _icd_native.dds_init_with_qos(topic_name, domain_id, qos)
+
+def dds_init_filtered(topic_name, domain_id, qos, filter_expression, parameters):
+
+    qos = _qos_arg(qos)
+
+
+    return _icd_native.dds_init_filtered(topic_name, domain_id, qos, filter_expression, parameters)
+
+def dds_set_filter_parameters(parameters):
+    return _icd_native.dds_set_filter_parameters(parameters)
+
+def dds_write(index, message):
+    return _icd_native.dds_write(index, message)
+
+def dds_write_struct(hello_world):
+    return _icd_native.dds_write_struct(hello_world)
+
+def dds_write_batch(count, indices, messages, offsets):
+    return _icd_native.dds_write_batch(count, indices, messages, offsets)
+
+def dds_take(index_out, message_buffer, buffer_len):
+    return _icd_native.dds_take(index_out, message_buffer, buffer_len)
+
+def dds_take_struct(hello_world_out):
+    return _icd_native.dds_take_struct(hello_world_out)
+
+def dds_take_batch(max_samples, indices_out, message_buffer, buffer_len, offsets_out):
+    return _icd_native.dds_take_batch(max_samples, indices_out, message_buffer, buffer_len, offsets_out)
+
+def dds_wait_for_data(timeout_ms):
+    return _icd_native.dds_wait_for_data(timeout_ms)
+
+def dds_set_data_notify_fd(fd):
+    return _icd_native.dds_set_data_notify_fd(fd)
+
+def dds_take_message(index_out):
+    return _icd_native.dds_take_message(index_out)
+
+def dds_shutdown():
+    return _icd_native.dds_shutdown()
+
+def dds_set_keep_participant(keep):
+    return _icd_native.dds_set_keep_participant(keep)
+
+def dds_keep_participant():
+    return _icd_native.dds_keep_participant()
+
+def dds_participant_create(domain_id):
+    return _icd_native.dds_participant_create(domain_id)
+
+def dds_participant_create_with_transport(domain_id, transport):
+    return _icd_native.dds_participant_create_with_transport(domain_id, transport)
+
+def dds_participant_delete(participant):
+    return _icd_native.dds_participant_delete(participant)
+
+def dds_writer_create(participant, topic_name):
+    return _icd_native.dds_writer_create(participant, topic_name)
+
+def dds_writer_create_with_qos(participant, topic_name, qos):
+    return _icd_native.dds_writer_create_with_qos(participant, topic_name, qos)
+
+def dds_writer_delete(writer):
+    return _icd_native.dds_writer_delete(writer)
+
+def dds_writer_write(writer, index, message):
+    return _icd_native.dds_writer_write(writer, index, message)
+
+def dds_writer_write_struct(writer, hello_world):
+    return _icd_native.dds_writer_write_struct(writer, hello_world)
+
+def dds_writer_write_batch(writer, count, indices, messages, offsets):
+    return _icd_native.dds_writer_write_batch(writer, count, indices, messages, offsets)
+
+def dds_reader_create(participant, topic_name):
+    return _icd_native.dds_reader_create(participant, topic_name)
+
+def dds_reader_create_with_qos(participant, topic_name, qos):
+    return _icd_native.dds_reader_create_with_qos(participant, topic_name, qos)
+
+def dds_reader_delete(reader):
+    return _icd_native.dds_reader_delete(reader)
+
+def dds_reader_take(reader, index_out, message_buffer, buffer_len):
+    return _icd_native.dds_reader_take(reader, index_out, message_buffer, buffer_len)
+
+def dds_reader_take_struct(reader, hello_world_out):
+    return _icd_native.dds_reader_take_struct(reader, hello_world_out)
+
+def dds_reader_take_batch(reader, max_samples, indices_out, message_buffer, buffer_len, offsets_out):
+    return _icd_native.dds_reader_take_batch(reader, max_samples, indices_out, message_buffer, buffer_len, offsets_out)
+
+def dds_reader_create_filtered(participant, topic_name, qos, filter_expression, parameters):
+    return _icd_native.dds_reader_create_filtered(participant, topic_name, qos, filter_expression, parameters)
+
+def dds_reader_set_filter_parameters(reader, parameters):
+    return _icd_native.dds_reader_set_filter_parameters(reader, parameters)
+
+def dds_reader_wait_for_data(reader, timeout_ms):
+    return _icd_native.dds_reader_wait_for_data(reader, timeout_ms)
+
+def dds_reader_set_data_notify_fd(reader, fd):
+    return _icd_native.dds_reader_set_data_notify_fd(reader, fd)
+
+def dds_writer_create_fixed(participant, topic_name, qos):
+    return _icd_native.dds_writer_create_fixed(participant, topic_name, qos)
+
+def dds_reader_create_fixed(participant, topic_name, qos):
+    return _icd_native.dds_reader_create_fixed(participant, topic_name, qos)
+class dds_loan_t(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    sample = property(_icd_native.dds_loan_t_sample_get)
+    message = property(_icd_native.dds_loan_t_message_get)
+    capacity = property(_icd_native.dds_loan_t_capacity_get, _icd_native.dds_loan_t_capacity_set)
+
+    def __init__(self):
+        _icd_native.dds_loan_t_swiginit(self, _icd_native.new_dds_loan_t())
+    __swig_destroy__ = _icd_native.delete_dds_loan_t
+
+# Register dds_loan_t in _icd_native:
+_icd_native.dds_loan_t_swigregister(dds_loan_t)
+
+def dds_writer_loan(writer, loan_out):
+    return _icd_native.dds_writer_loan(writer, loan_out)
+
+def dds_writer_write_loan(writer, loan, index, length):
+    return _icd_native.dds_writer_write_loan(writer, loan, index, length)
+
+def dds_writer_discard_loan(writer, loan):
+    return _icd_native.dds_writer_discard_loan(writer, loan)
+
+def dds_writer_create_keyed(participant, topic_name, qos):
+    return _icd_native.dds_writer_create_keyed(participant, topic_name, qos)
+
+def dds_reader_create_keyed(participant, topic_name, qos):
+    return _icd_native.dds_reader_create_keyed(participant, topic_name, qos)
+
+def dds_reader_lookup_instance(reader, index):
+    return _icd_native.dds_reader_lookup_instance(reader, index)
+
+def dds_reader_read_instance(reader, index, message_buffer, buffer_len, length_out):
+    return _icd_native.dds_reader_read_instance(reader, index, message_buffer, buffer_len, length_out)
+DDS_HISTOGRAM_BUCKETS = _icd_native.DDS_HISTOGRAM_BUCKETS
+
+def dds_stats_enable(enabled):
+    return _icd_native.dds_stats_enable(enabled)
+
+def dds_stats_enabled():
+    return _icd_native.dds_stats_enabled()
+
+def dds_histogram_bucket_lower(bucket):
+    return _icd_native.dds_histogram_bucket_lower(bucket)
+
+def dds_take_string(index_out):
+    return _icd_native.dds_take_string(index_out)
+
+def dds_take_batch_list(max_samples, raw=False):
+    return _icd_native.dds_take_batch_list(max_samples, raw)
+
+def dds_reader_take_batch_list(reader, max_samples, raw=False):
+    return _icd_native.dds_reader_take_batch_list(reader, max_samples, raw)
+
+def dds_take_samples(max_samples=256, raw=False):
+    return _icd_native.dds_take_samples(max_samples, raw)
+
+def dds_reader_take_samples(reader, max_samples=256, raw=False):
+    return _icd_native.dds_reader_take_samples(reader, max_samples, raw)
+
+def dds_take_batch_into(indices, messages, offsets):
+    return _icd_native.dds_take_batch_into(indices, messages, offsets)
+
+def dds_reader_take_batch_into(reader, indices, messages, offsets):
+    return _icd_native.dds_reader_take_batch_into(reader, indices, messages, offsets)
+
+def dds_write_batch_buffers(indices, messages, offsets):
+    return _icd_native.dds_write_batch_buffers(indices, messages, offsets)
+
+def dds_writer_write_batch_buffers(writer, indices, messages, offsets):
+    return _icd_native.dds_writer_write_batch_buffers(writer, indices, messages, offsets)
+
+def dds_loan_buffer(loan):
+    return _icd_native.dds_loan_buffer(loan)
+
+def dds_reader_read_instance_message(reader, index, raw=False):
+    return _icd_native.dds_reader_read_instance_message(reader, index, raw)
+
+def dds_get_stats_dict():
+    return _icd_native.dds_get_stats_dict()
+
+def dds_writer_get_stats_dict(writer):
+    return _icd_native.dds_writer_get_stats_dict(writer)
+
+def dds_reader_get_stats_dict(reader):
+    return _icd_native.dds_reader_get_stats_dict(reader)
+
+def dds_get_startup_stats_dict():
+    return _icd_native.dds_get_startup_stats_dict()
+
+Sample = _icd_native.Sample
+
+
+def _pack_batch(samples):
+    from array import array
+    indices = array('I')
+    offsets = array('I', [0])
+    chunks = []
+    position = 0
+    for index, message in samples:
+        data = message.encode('utf-8') if isinstance(message, str) else bytes(message)
+        indices.append(index)
+        chunks.append(data)
+        position += len(data)
+        offsets.append(position)
+    return indices, b''.join(chunks), offsets
+
+
+def dds_write_batch_list(samples):
+    """Publish an iterable of (index, message) pairs in one native call.
+
+    Returns the number of samples written.
+    """
+    return dds_write_batch_buffers(*_pack_batch(samples))
+
+
+_QOS_ENUM_FIELDS = {
+    'reliability': {'best_effort': DDS_RELIABILITY_BEST_EFFORT, 'reliable': DDS_RELIABILITY_RELIABLE},
+    'durability': {'volatile': DDS_DURABILITY_VOLATILE, 'transient_local': DDS_DURABILITY_TRANSIENT_LOCAL},
+    'history_kind': {'keep_last': DDS_HISTORY_KEEP_LAST, 'keep_all': DDS_HISTORY_KEEP_ALL},
+    'publish_mode': {'synchronous': DDS_PUBLISH_SYNCHRONOUS, 'asynchronous': DDS_PUBLISH_ASYNCHRONOUS},
+    'data_sharing': {'auto': DDS_DATA_SHARING_AUTO, 'on': DDS_DATA_SHARING_ON, 'off': DDS_DATA_SHARING_OFF},
+}
+
+_QOS_NUMBER_FIELDS = ('history_depth', 'max_samples', 'max_instances', 'max_samples_per_instance')
+
+# Named presets accepted by make_qos and the qos= arguments below
+QOS_PROFILES = {
+    'default': {},
+    'reliable': dict(reliability='reliable', history_kind='keep_last', history_depth=100),
+    'best_effort': dict(reliability='best_effort', history_kind='keep_last', history_depth=1),
+    'keep_all': dict(reliability='reliable', history_kind='keep_all'),
+    'transient_local': dict(reliability='reliable', durability='transient_local',
+                            history_kind='keep_last', history_depth=100),
+    'async_reliable': dict(reliability='reliable', history_kind='keep_last', history_depth=1000,
+                           publish_mode='asynchronous'),
+}
+
+
+def make_qos(profile=None, **fields):
+    """Build a dds_qos_t from a QOS_PROFILES name and/or field overrides.
+
+    Enum fields take the DDS_* constants or their lower-case names, e.g.
+    make_qos('reliable', history_depth=1000) or make_qos(reliability='best_effort').
+    A dds_qos_t is returned unchanged; None gives all defaults.
+    """
+    if isinstance(profile, dds_qos_t):
+        if fields:
+            raise TypeError("cannot combine a dds_qos_t with field overrides")
+        return profile
+    if profile is None:
+        settings = {}
+    elif isinstance(profile, dict):
+        settings = dict(profile)
+    elif profile in QOS_PROFILES:
+        settings = dict(QOS_PROFILES[profile])
+    else:
+        raise ValueError("unknown QoS profile %r (expected one of %s)" % (profile, ", ".join(QOS_PROFILES)))
+    settings.update(fields)
+
+    qos = dds_qos_t()
+    for field, value in settings.items():
+        if field in _QOS_ENUM_FIELDS:
+            names = _QOS_ENUM_FIELDS[field]
+            if isinstance(value, str):
+                if value not in names:
+                    raise ValueError("invalid value %r for QoS %s (expected one of %s)" % (value, field, ", ".join(names)))
+                value = names[value]
+        elif field not in _QOS_NUMBER_FIELDS:
+            raise TypeError("unknown QoS field %r" % field)
+        setattr(qos, field, value)
+    return qos
+
+
+def _qos_arg(qos):
+    return None if qos is None else make_qos(qos)
+
+
+TRANSPORTS = {
+    'default': DDS_TRANSPORT_DEFAULT,
+    'udp': DDS_TRANSPORT_UDP,
+    'shm': DDS_TRANSPORT_SHM,
+    'large_data': DDS_TRANSPORT_LARGE_DATA,
+}
+
+
+class Participant(object):
+    """DomainParticipant shared by any number of topic writers and readers.
+
+    Unlike dds_init, creating writers/readers on new topics does not tear
+    down the participant, so no new discovery round is needed. transport is
+    a TRANSPORTS name or DDS_TRANSPORT_* value ('shm' keeps traffic on the
+    host in shared memory).
+    """
+
+    def __init__(self, domain_id=0, transport='default'):
+        import weakref
+        transport_id = TRANSPORTS.get(transport, transport)
+        if transport_id not in TRANSPORTS.values():
+            raise ValueError("unknown transport %r (expected one of %s)" % (transport, ", ".join(TRANSPORTS)))
+        self._handle = dds_participant_create_with_transport(domain_id, transport_id)
+        if self._handle is None:
+            raise RuntimeError("failed to create DDS participant on domain %d" % domain_id)
+        self.domain_id = domain_id
+        self.transport = transport
+        self._endpoints = weakref.WeakSet()
+
+    def create_writer(self, topic_name, qos=None):
+        """qos: QOS_PROFILES name, dict of fields or dds_qos_t (None for defaults)."""
+        return Writer(self, topic_name, qos)
+
+    def create_reader(self, topic_name, qos=None):
+        """qos: QOS_PROFILES name, dict of fields or dds_qos_t (None for defaults)."""
+        return Reader(self, topic_name, qos)
+
+    def create_fixed_writer(self, topic_name, qos=None):
+        """Writer of fixed-size samples (messages up to DDS_FIXED_MESSAGE_CAPACITY bytes),
+        eligible for data-sharing delivery between processes on this host."""
+        return Writer(self, topic_name, qos, fixed=True)
+
+    def create_fixed_reader(self, topic_name, qos=None):
+        """Reader counterpart of create_fixed_writer."""
+        return Reader(self, topic_name, qos, fixed=True)
+
+    def create_keyed_writer(self, topic_name, qos=None):
+        """Writer of keyed samples: each index is its own instance, so history and
+        resource limits apply per index."""
+        return Writer(self, topic_name, qos, keyed=True)
+
+    def create_keyed_reader(self, topic_name, qos=None):
+        """Reader counterpart of create_keyed_writer; see Reader.read_instance and LatestValueCache."""
+        return Reader(self, topic_name, qos, keyed=True)
+
+    def create_filtered_reader(self, topic_name, filter_expression, parameters=(), qos=None):
+        """Reader that only receives samples matching filter_expression, a DDS-SQL
+        condition such as "index BETWEEN %0 AND %1" with parameters ("100", "199");
+        see Reader.set_filter_parameters."""
+        return Reader(self, topic_name, qos, filter_expression=filter_expression, parameters=parameters)
+
+    def close(self):
+        """Close all writers/readers created from this participant, then the participant."""
+        if self._handle is None:
+            return
+        for endpoint in list(self._endpoints):
+            endpoint.close()
+        dds_participant_delete(self._handle)
+        self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class Loan(object):
+    """Sample loaned from a fixed-size Writer's pool.
+
+    Fill buffer (a writable memoryview of DDS_FIXED_MESSAGE_CAPACITY bytes)
+    in place, then write(index, length) publishes it without copying. Leaving
+    the with-block without writing discards the loan. buffer is released on
+    write/discard; do not keep slices of it past that point.
+    """
+
+    def __init__(self, writer):
+        self._writer = writer
+        self._loan = dds_loan_t()
+        if dds_writer_loan(writer._handle, self._loan) != 1:
+            raise RuntimeError("failed to loan a sample on topic %r" % writer.topic_name)
+        self.buffer = dds_loan_buffer(self._loan)
+        writer._loans.add(self)
+
+    @property
+    def capacity(self):
+        return self._loan.capacity
+
+    def write(self, index, length):
+        """Publish buffer[:length]; the loan is released either way."""
+        self._release()
+        return dds_writer_write_loan(self._writer._handle, self._loan, index, length) == 1
+
+    def discard(self):
+        if self.buffer is not None:
+            self._release()
+            dds_writer_discard_loan(self._writer._handle, self._loan)
+
+    def _release(self):
+        if self.buffer is None:
+            raise ValueError("loan already written or discarded")
+        self.buffer.release()
+        self.buffer = None
+        self._writer._loans.discard(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.discard()
+
+
+class Writer(object):
+    """HelloWorld writer on one topic of a Participant."""
+
+    def __init__(self, participant, topic_name, qos=None, fixed=False, keyed=False):
+        import weakref
+        if fixed and keyed:
+            raise ValueError("a writer is either fixed-size or keyed")
+        self.participant = participant
+        self.topic_name = topic_name
+        self.fixed = fixed
+        self.keyed = keyed
+        create = dds_writer_create_fixed if fixed else dds_writer_create_keyed if keyed else dds_writer_create_with_qos
+        self._handle = create(participant._handle, topic_name, _qos_arg(qos))
+        if self._handle is None:
+            raise RuntimeError("failed to create DDS writer on topic %r" % topic_name)
+        self._loans = weakref.WeakSet()
+        participant._endpoints.add(self)
+
+    def loan(self):
+        """Loan a sample to fill in place (fixed-size writers only); see Loan."""
+        if not self.fixed:
+            raise TypeError("only fixed-size writers can loan samples")
+        return Loan(self)
+
+    def write_loaned(self, index, data):
+        """Publish a bytes-like message through a loan: one copy, straight into the pool."""
+        with self.loan() as loan:
+            length = len(data)
+            if length > loan.capacity:
+                raise ValueError("message of %d bytes exceeds the %d byte capacity" % (length, loan.capacity))
+            loan.buffer[:length] = data
+            return loan.write(index, length)
+
+    def write(self, index, message):
+        return dds_writer_write(self._handle, index, message) == 1
+
+    def write_struct(self, hello_world):
+        return dds_writer_write_struct(self._handle, hello_world) == 1
+
+    def write_batch(self, samples):
+        """Publish an iterable of (index, message) pairs; returns the number written."""
+        return dds_writer_write_batch_buffers(self._handle, *_pack_batch(samples))
+
+    def write_batch_buffers(self, indices, messages, offsets):
+        return dds_writer_write_batch_buffers(self._handle, indices, messages, offsets)
+
+    def stats(self):
+        """Counters, write latency histogram and matched readers as a dict (see dds_stats_enable)."""
+        return dds_writer_get_stats_dict(self._handle)
+
+    def close(self):
+        if self._handle is not None:
+            for loan in list(self._loans):
+                loan.discard()
+            dds_writer_delete(self._handle)
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class Reader(object):
+    """HelloWorld reader on one topic of a Participant."""
+
+    def __init__(self, participant, topic_name, qos=None, fixed=False, keyed=False, filter_expression=None, parameters=()):
+        if fixed + keyed + (filter_expression is not None) > 1:
+            raise ValueError("a reader is either fixed-size, keyed or content-filtered")
+        self.participant = participant
+        self.topic_name = topic_name
+        self.fixed = fixed
+        self.keyed = keyed
+        self.filter_expression = filter_expression
+        if filter_expression is not None:
+            self._handle = dds_reader_create_filtered(participant._handle, topic_name, _qos_arg(qos),
+                                                      filter_expression, parameters)
+        else:
+            create = dds_reader_create_fixed if fixed else dds_reader_create_keyed if keyed else dds_reader_create_with_qos
+            self._handle = create(participant._handle, topic_name, _qos_arg(qos))
+        if self._handle is None:
+            raise RuntimeError("failed to create DDS reader on topic %r" % topic_name)
+        participant._endpoints.add(self)
+
+    def take(self):
+        """Return one (index, message) tuple, or None if no data is available."""
+        batch = dds_reader_take_batch_list(self._handle, 1)
+        return batch[0] if batch else None
+
+    def take_struct(self, hello_world_out):
+        return dds_reader_take_struct(self._handle, hello_world_out) == 1
+
+    def take_bytes(self):
+        """Return one (index, bytes) tuple, or None if no data is available."""
+        batch = dds_reader_take_batch_list(self._handle, 1, True)
+        return batch[0] if batch else None
+
+    def take_batch(self, max_samples=256, raw=False):
+        """Return up to max_samples (index, message) tuples, messages in full; bytes when raw."""
+        return dds_reader_take_batch_list(self._handle, max_samples, raw)
+
+    def take_samples(self, max_samples=256, raw=False):
+        """Return up to max_samples Sample values (sample.index, sample.message)."""
+        return dds_reader_take_samples(self._handle, max_samples, raw)
+
+    def take_batch_into(self, indices, messages, offsets):
+        """Take into writable uint32 indices/offsets and a bytes buffer; returns the count.
+
+        Returns -1 if the next message alone does not fit in messages; offsets[1]
+        then holds its length.
+        """
+        return dds_reader_take_batch_into(self._handle, indices, messages, offsets)
+
+    def set_filter_parameters(self, parameters):
+        """Replace the filter parameters of a content-filtered reader; the expression is kept.
+
+        Raises ValueError if they are rejected (the previous ones stay in effect).
+        """
+        if self.filter_expression is None:
+            raise TypeError("only content-filtered readers have filter parameters")
+        if dds_reader_set_filter_parameters(self._handle, parameters) != 1:
+            raise ValueError("invalid filter parameters %r for %r" % (list(parameters), self.filter_expression))
+
+    def lookup_instance(self, index):
+        """True if this keyed reader currently holds the instance for index."""
+        return dds_reader_lookup_instance(self._handle, index) == 1
+
+    def read_instance(self, index, raw=False):
+        """Newest message for index without taking it (keyed readers only); None if absent."""
+        if not self.keyed:
+            raise TypeError("only keyed readers have instances")
+        return dds_reader_read_instance_message(self._handle, index, raw)
+
+    def wait_for_data(self, timeout_ms=-1):
+        """Block (GIL released) until data is available; False on timeout or close."""
+        return dds_reader_wait_for_data(self._handle, timeout_ms) == 1
+
+    def stats(self):
+        """Counters, take latency histogram, matched writers, lost/rejected and unread samples as a dict."""
+        return dds_reader_get_stats_dict(self._handle)
+
+    def set_data_notify_fd(self, fd):
+        dds_reader_set_data_notify_fd(self._handle, fd)
+
+    def close(self):
+        if self._handle is not None:
+            dds_reader_delete(self._handle)
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class LatestValueCache(object):
+    """Current message per index of a keyed Reader, looked up by key.
+
+    The reader's own cache holds the values, so nothing is taken or copied
+    into Python ahead of time: get() reads the newest sample of one instance
+    in place (Reader.read_instance), which Fast DDS finds by key. Create the
+    reader with history_depth 1 so that it keeps only the current value of
+    each index, and bound it with max_instances; once that many indices are
+    held, samples of new indices are rejected (counted in samples_rejected
+    of the reader's stats()) rather than evicting old ones.
+
+        reader = participant.create_keyed_reader("Status", {"history_depth": 1, "max_instances": 10000})
+        cache = LatestValueCache(reader)
+        cache.get(42)
+    """
+
+    def __init__(self, reader, raw=False):
+        if not getattr(reader, 'keyed', False):
+            raise TypeError("LatestValueCache needs a keyed Reader (Participant.create_keyed_reader)")
+        self.reader = reader
+        self.raw = raw
+
+    def get(self, index, default=None):
+        value = self.reader.read_instance(index, self.raw)
+        return default if value is None else value
+
+    def __getitem__(self, index):
+        value = self.reader.read_instance(index, self.raw)
+        if value is None:
+            raise KeyError(index)
+        return value
+
+    def __contains__(self, index):
+        return self.reader.read_instance(index, True) is not None
+
+
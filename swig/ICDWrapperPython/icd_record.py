@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Record a HelloWorld topic to a memory-mapped log and replay it.
+
+A log is a directory of segments. Each segment is a preallocated, memory-mapped
+file of records, where a record is a receive timestamp (ns since the epoch), a
+length, and the sample's CDR payload as icd_cdr encodes it. A new segment is
+started when the current one is full. Next to each segment, an index file
+holds the (timestamp, offset) of every record. Timestamps never decrease, so
+seeking to a time is a binary search over the segments and then over one
+segment's index. If the recorder was killed, the records after the last
+flushed index entry are found again by scanning the segment. The first
+zero-length record marks its end.
+
+    python icd_record.py record Telemetry capture/ --duration 60
+    python icd_record.py info capture/
+    python icd_record.py replay capture/ --topic Telemetry --speed 4 --from 12.5
+
+From Python:
+
+    with icd_record.Recorder(participant.create_reader("Telemetry"), "capture") as recorder:
+        recorder.run(duration=60)
+    with icd_record.LogReader("capture") as log:
+        icd_record.Replayer(log, participant.create_writer("Telemetry"), speed=4).run()
+"""
+
+import argparse
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+import icd_cdr
+
+SEGMENT_SIZE = 64 << 20
+
+_MAGIC = b'ICDLOG\0\0'
+_VERSION = 1
+_FLAG_FIXED = 1
+# magic, version, flags
+_SEGMENT_HEADER = struct.Struct('<8sII')
+# timestamp_ns, payload length
+_RECORD = struct.Struct('<qI')
+# timestamp_ns, record offset
+_INDEX = struct.Struct('<qQ')
+_META = 'meta.json'
+
+# The names of ICDWrapper.TRANSPORTS, spelled out so that parsing the command
+# line (and the info subcommand) does not load the native module
+_TRANSPORT_NAMES = ('default', 'udp', 'shm', 'large_data')
+
+
+def _segment_path(path, number, suffix):
+    return os.path.join(path, 'segment-%06d.%s' % (number, suffix))
+
+
+class LogWriter(object):
+    """Append-only writer of a segmented log directory.
+
+    Records are written into a memory-mapped segment of segment_size bytes,
+    so an append is a memory copy. close() trims the last segment to its
+    used length. fixed selects HelloWorldFixed payloads; it is stored in
+    the log so replay picks the matching encoding.
+    """
+
+    def __init__(self, path, topic_name=None, fixed=False, segment_size=SEGMENT_SIZE):
+        if os.path.exists(os.path.join(path, _META)):
+            raise ValueError("%r already holds a log" % path)
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.fixed = fixed
+        self.segment_size = segment_size
+        self.count = 0
+        self.last_timestamp = None
+        with open(os.path.join(path, _META), 'w') as meta:
+            json.dump({'version': _VERSION, 'topic': topic_name,
+                       'type': 'HelloWorldFixed' if fixed else 'HelloWorld'}, meta)
+        self._number = -1
+        self._file = self._map = self._index = None
+        self._pos = 0
+
+    def _open_segment(self, min_size):
+        self._close_segment()
+        self._number += 1
+        size = max(self.segment_size, _SEGMENT_HEADER.size + min_size + _RECORD.size)
+        self._file = open(_segment_path(self.path, self._number, 'log'), 'w+b')
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        _SEGMENT_HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, _FLAG_FIXED if self.fixed else 0)
+        self._pos = _SEGMENT_HEADER.size
+        self._index = open(_segment_path(self.path, self._number, 'idx'), 'wb')
+
+    def _close_segment(self):
+        if self._map is None:
+            return
+        size = len(self._map)
+        self._map.flush()
+        self._map.close()
+        # Trim the unused space, keeping the zero-length end marker
+        self._file.truncate(min(self._pos + _RECORD.size, size))
+        self._file.close()
+        self._index.close()
+        self._file = self._map = self._index = None
+
+    def append(self, timestamp_ns, payload):
+        """Append one CDR payload. A timestamp before the previous one is raised
+        to it, so the index stays sorted even if the clock steps back."""
+        if self.last_timestamp is not None and timestamp_ns < self.last_timestamp:
+            timestamp_ns = self.last_timestamp
+        length = len(payload)
+        # Leave room for the end marker after the record
+        if self._map is None or self._pos + 2 * _RECORD.size + length > len(self._map):
+            self._open_segment(length)
+        pos = self._pos
+        _RECORD.pack_into(self._map, pos, timestamp_ns, length)
+        self._map[pos + _RECORD.size:pos + _RECORD.size + length] = payload
+        self._index.write(_INDEX.pack(timestamp_ns, pos))
+        self._pos = pos + _RECORD.size + length
+        self.last_timestamp = timestamp_ns
+        self.count += 1
+
+    def append_sample(self, timestamp_ns, index, message):
+        """Encode (index, message) as icd_cdr does and append it."""
+        encode = icd_cdr.encode_fixed if self.fixed else icd_cdr.encode
+        self.append(timestamp_ns, encode(index, message))
+
+    def flush(self):
+        """Write the mapped records and the index to disk."""
+        if self._map is not None:
+            self._map.flush()
+            self._index.flush()
+
+    def close(self):
+        self._close_segment()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _Segment(object):
+    """One read-only mapped segment and its (timestamps, offsets) index."""
+
+    def __init__(self, path, number):
+        self._file = open(_segment_path(path, number, 'log'), 'rb')
+        self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags = _SEGMENT_HEADER.unpack_from(self.map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("%s is not a version %d ICD log segment" % (self._file.name, _VERSION))
+        self.fixed = bool(flags & _FLAG_FIXED)
+        self.timestamps = array('q')
+        self.offsets = array('Q')
+        try:
+            with open(_segment_path(path, number, 'idx'), 'rb') as index:
+                data = index.read()
+        except FileNotFoundError:
+            data = b''
+        # A torn last entry is dropped; the scan below recovers its record
+        for timestamp, offset in _INDEX.iter_unpack(data[:len(data) - len(data) % _INDEX.size]):
+            self.timestamps.append(timestamp)
+            self.offsets.append(offset)
+        pos = _SEGMENT_HEADER.size
+        if self.offsets:
+            pos = self.offsets[-1] + _RECORD.size + _RECORD.unpack_from(self.map, self.offsets[-1])[1]
+        self._scan(pos)
+
+    def _scan(self, pos):
+        """Index the records from pos on that the index file is missing."""
+        end = len(self.map)
+        while pos + _RECORD.size <= end:
+            timestamp, length = _RECORD.unpack_from(self.map, pos)
+            if length == 0 or pos + _RECORD.size + length > end:
+                break
+            self.timestamps.append(timestamp)
+            self.offsets.append(pos)
+            pos += _RECORD.size + length
+
+    def payload(self, i):
+        pos = self.offsets[i]
+        length = _RECORD.unpack_from(self.map, pos)[1]
+        return self.map[pos + _RECORD.size:pos + _RECORD.size + length]
+
+    def close(self):
+        self.map.close()
+        self._file.close()
+
+
+class LogReader(object):
+    """Random access to a log directory written by LogWriter.
+
+        with LogReader("capture") as log:
+            for timestamp_ns, index, message in log.samples(start_ns=log.start_ns + 10**9):
+                ...
+    """
+
+    def __init__(self, path):
+        with open(os.path.join(path, _META)) as meta:
+            self.meta = json.load(meta)
+        self.path = path
+        self.topic_name = self.meta.get('topic')
+        self.fixed = self.meta.get('type') == 'HelloWorldFixed'
+        numbers = sorted(int(name[8:14]) for name in os.listdir(path)
+                         if name.startswith('segment-') and name.endswith('.log'))
+        self._segments = [segment for segment in (_Segment(path, number) for number in numbers) if segment.offsets]
+        # First timestamp of each segment, for the outer binary search
+        self._starts = [segment.timestamps[0] for segment in self._segments]
+
+    def __len__(self):
+        return sum(len(segment.offsets) for segment in self._segments)
+
+    @property
+    def start_ns(self):
+        """Timestamp of the first record, or None for an empty log."""
+        return self._starts[0] if self._segments else None
+
+    @property
+    def end_ns(self):
+        """Timestamp of the last record, or None for an empty log."""
+        return self._segments[-1].timestamps[-1] if self._segments else None
+
+    def seek(self, timestamp_ns):
+        """Position (segment, record) of the first record at or after timestamp_ns."""
+        # Start in the last segment that begins before timestamp_ns: records with
+        # equal timestamps (a polled batch) can continue across a segment boundary
+        segment = max(0, bisect.bisect_left(self._starts, timestamp_ns) - 1)
+        while segment < len(self._segments):
+            record = bisect.bisect_left(self._segments[segment].timestamps, timestamp_ns)
+            if record < len(self._segments[segment].timestamps):
+                return segment, record
+            segment += 1
+        return segment, 0
+
+    def records(self, start_ns=None, end_ns=None):
+        """Yield (timestamp_ns, payload) from start_ns up to and including end_ns.
+
+        payload is a bytes copy of the CDR payload.
+        """
+        segment, record = self.seek(start_ns) if start_ns is not None else (0, 0)
+        for current in self._segments[segment:]:
+            timestamps = current.timestamps
+            for i in range(record, len(timestamps)):
+                if end_ns is not None and timestamps[i] > end_ns:
+                    return
+                yield timestamps[i], current.payload(i)
+            record = 0
+
+    def samples(self, start_ns=None, end_ns=None, raw=False):
+        """Yield (timestamp_ns, index, message) decoded from the payloads."""
+        decode = icd_cdr.decode_fixed if self.fixed else icd_cdr.decode
+        for timestamp, payload in self.records(start_ns, end_ns):
+            index, message = decode(payload, raw)
+            yield timestamp, index, message
+
+    def close(self):
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+        self._starts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class Recorder(object):
+    """Drain a facade Reader into a log, timestamping samples as they are taken.
+
+    The timestamp is the time of the take, not the publication time, so
+    samples taken in one batch share it.
+    """
+
+    def __init__(self, reader, path, segment_size=SEGMENT_SIZE, batch=256):
+        self.reader = reader
+        self.batch = batch
+        self.log = LogWriter(path, reader.topic_name, reader.fixed, segment_size)
+
+    def poll(self, timeout_ms=100):
+        """Wait up to timeout_ms for data and record everything pending; returns the count."""
+        if not self.reader.wait_for_data(timeout_ms):
+            return 0
+        count = 0
+        while True:
+            samples = self.reader.take_batch(self.batch, raw=True)
+            if not samples:
+                return count
+            now = time.time_ns()
+            for index, message in samples:
+                self.log.append_sample(now, index, message)
+            count += len(samples)
+
+    def run(self, duration=None, max_samples=None):
+        """Record until duration seconds have passed, max_samples were recorded,
+        or KeyboardInterrupt; returns the number of samples recorded."""
+        deadline = time.monotonic() + duration if duration is not None else None
+        try:
+            while max_samples is None or self.log.count < max_samples:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                if self.poll():
+                    self.log.flush()
+        except KeyboardInterrupt:
+            pass
+        return self.log.count
+
+    def close(self):
+        self.log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class Replayer(object):
+    """Write the samples of a LogReader through a facade Writer.
+
+    With speed=1.0 samples are sent at their recorded inter-arrival times;
+    speed=4.0 replays four times faster, and speed=0 as fast as possible.
+    Samples that are due at the same moment are written as one batch. When
+    the writer takes only part of a batch (its history is full), the rest is
+    written again until retry_timeout seconds pass without progress, and then
+    RuntimeError is raised.
+    """
+
+    def __init__(self, log, writer, speed=1.0, batch=256, retry_timeout=5.0):
+        if speed < 0:
+            raise ValueError("speed must be >= 0")
+        if log.fixed != writer.fixed:
+            raise ValueError("log holds %s samples but the writer is %sfixed-size" % (
+                log.meta.get('type'), '' if writer.fixed else 'not '))
+        self.log = log
+        self.writer = writer
+        self.speed = speed
+        self.batch = batch
+        self.retry_timeout = retry_timeout
+
+    def _write(self, samples):
+        """Write every sample, retrying the rest after a partial batch; returns len(samples)."""
+        done = 0
+        deadline = None
+        while True:
+            count = self.writer.write_batch(samples[done:] if done else samples)
+            done += count
+            if done >= len(samples):
+                return done
+            now = time.perf_counter()
+            if count or deadline is None:
+                deadline = now + self.retry_timeout
+            elif now > deadline:
+                raise RuntimeError("the writer took %d of %d samples and no more within %g s" % (
+                    done, len(samples), self.retry_timeout))
+            time.sleep(0.001)
+
+    def run(self, start_ns=None, end_ns=None):
+        """Replay the records between start_ns and end_ns; returns the number written."""
+        pending = []
+        written = 0
+        origin = None
+        for timestamp, index, message in self.log.samples(start_ns, end_ns, raw=True):
+            if origin is None:
+                origin = (timestamp, time.perf_counter())
+            if self.speed:
+                due = origin[1] + (timestamp - origin[0]) / 1e9 / self.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    if pending:
+                        written += self._write(pending)
+                        pending = []
+                    time.sleep(delay)
+            pending.append((index, message))
+            if len(pending) >= self.batch:
+                written += self._write(pending)
+                pending = []
+        if pending:
+            written += self._write(pending)
+        return written
+
+
+def _seconds_to_ns(log, seconds):
+    """Absolute timestamp of an offset in seconds from the start of the log."""
+    return None if seconds is None or log.start_ns is None else log.start_ns + int(seconds * 1e9)
+
+
+def main():
+    import ICDWrapper
+
+    parser = argparse.ArgumentParser(description="Record a HelloWorld topic to a log and replay it.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help="record a topic into a new log directory")
+    record.add_argument('topic')
+    record.add_argument('path')
+    record.add_argument('--duration', type=float, help="seconds to record (default: until Ctrl+C)")
+    record.add_argument('--max-samples', type=int)
+    record.add_argument('--segment-mb', type=int, default=SEGMENT_SIZE >> 20)
+
+    replay = commands.add_parser('replay', help="publish the samples of a log")
+    replay.add_argument('path')
+    replay.add_argument('--topic', help="topic to publish on (default: the recorded one)")
+    replay.add_argument('--speed', type=float, default=1.0, help="time multiplier, 0 for as fast as possible")
+    replay.add_argument('--from', dest='start', type=float, help="seconds from the start of the log")
+    replay.add_argument('--to', dest='end', type=float, help="seconds from the start of the log")
+    replay.add_argument('--loop', action='store_true', help="replay until Ctrl+C")
+
+    info = commands.add_parser('info', help="summarize a log")
+    info.add_argument('path')
+
+    for command in (record, replay):
+        command.add_argument('--domain', type=int, default=0)
+        command.add_argument('--transport', default='default', choices=_TRANSPORT_NAMES)
+        command.add_argument('--qos', default='reliable', help="QOS_PROFILES name")
+
+    args = parser.parse_args()
+
+    if args.command == 'info':
+        with LogReader(args.path) as log:
+            span = (log.end_ns - log.start_ns) / 1e9 if len(log) else 0.0
+            print("topic     %s (%s)" % (log.topic_name, log.meta.get('type')))
+            print("records   %d over %.3f s" % (len(log), span))
+            if len(log):
+                print("start     %s" % time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(log.start_ns / 1e9)))
+        return 0
+
+    with ICDWrapper.Participant(args.domain, args.transport) as participant:
+        if args.command == 'record':
+            reader = participant.create_reader(args.topic, args.qos)
+            with Recorder(reader, args.path, args.segment_mb << 20) as recorder:
+                print("recording %s into %s (Ctrl+C to stop)" % (args.topic, args.path), file=sys.stderr)
+                count = recorder.run(args.duration, args.max_samples)
+            print("%d samples recorded" % count, file=sys.stderr)
+            return 0
+
+        with LogReader(args.path) as log:
+            topic = args.topic or log.topic_name
+            if not topic:
+                parser.error("the log has no topic name; pass --topic")
+            create = participant.create_fixed_writer if log.fixed else participant.create_writer
+            replayer = Replayer(log, create(topic, args.qos), args.speed)
+            # Let the subscribers match before the first sample goes out
+            time.sleep(1.0)
+            try:
+                while True:
+                    count = replayer.run(_seconds_to_ns(log, args.start), _seconds_to_ns(log, args.end))
+                    print("%d samples replayed on %s" % (count, topic), file=sys.stderr)
+                    if not args.loop:
+                        break
+            except KeyboardInterrupt:
+                pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -36,7 +36,7 @@ libraries = [
 
 # Define the extension module
 icd_module = Extension(
-    '_ICDWrapper',
+    '_icd_native',
     sources=[
         'ICD_wrap.cxx',  # This will be generated by SWIG
     ],
@@ -57,5 +57,5 @@ setup(
     author='DDS Example',
     description='Python wrapper for DDS facade using SWIG',
     ext_modules=[icd_module],
-    py_modules=['ICDWrapper'],
+    py_modules=['ICDWrapper', 'icd_native', 'icd_asyncio', 'icd_columns', 'icd_cdr', 'icd_record', 'icd_metrics'],
 )
@@ -85,6 +85,10 @@ def test_subscriber():
     
     try:
         while time.time() - start_time < 5.0:
+            # Block (GIL released) until data arrives instead of sleep-polling
+            if not ICDWrapper.dds_wait_for_data(100):
+                continue
+
             # Try taking with string method
             index_out = ICDWrapper.new_uintp()
             message = ICDWrapper.dds_take_string(index_out)
@@ -102,7 +106,6 @@ def test_subscriber():
                     messages_received += 1
             
             ICDWrapper.delete_uintp(index_out)
-            time.sleep(0.1)
     
     except Exception as e:
         print(f"✗ Error during subscription: {e}")
@@ -49,7 +49,7 @@ except ImportError as e:
     print("\nTroubleshooting tips:")
     print("1. Make sure FastDDS DLLs are in PATH")
     print("2. Make sure ICD.dll is in PATH") 
-    print("3. Check that _ICDWrapper.pyd was built correctly")
+    print("3. Check that _icd_native.pyd was built correctly")
     
 except Exception as e:
     print(f"✗ Unexpected error: {e}")
@@ -0,0 +1,37 @@
+"""
+Fixtures of the binding tests. Tests that need the native module are skipped
+when icd_native cannot be imported (build it first, see ../README.md); they
+create real DDS entities on the domain in ICD_TEST_DOMAIN (default 77).
+"""
+
+import itertools
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_sequence = itertools.count(1)
+
+
+@pytest.fixture
+def native():
+    return pytest.importorskip('icd_native')
+
+
+@pytest.fixture
+def domain():
+    return int(os.environ.get('ICD_TEST_DOMAIN', 77))
+
+
+@pytest.fixture
+def topic():
+    """topic(base) gives a topic name no other test (or concurrent run) uses."""
+    return lambda base: '%s_%d_%d' % (base, os.getpid(), next(_sequence))
+
+
+@pytest.fixture
+def participant(native, domain):
+    with native.Participant(domain) as participant:
+        yield participant
@@ -0,0 +1,31 @@
+"""Helpers shared by the binding tests."""
+
+import time
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll condition until it is true or timeout seconds pass; returns the last result."""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = condition()
+        if result or time.monotonic() > deadline:
+            return result
+        time.sleep(0.005)
+
+
+def wait_matched(writer, readers=1):
+    return wait_until(lambda: writer.stats()['matched_readers'] >= readers)
+
+
+def wait_unread(reader, count):
+    return wait_until(lambda: reader.stats()['unread_samples'] >= count)
+
+
+def take_all(reader, raw=False):
+    """Every (index, message) the reader holds, taken in batches."""
+    samples = []
+    while True:
+        batch = reader.take_batch(256, raw=raw)
+        if not batch:
+            return samples
+        samples.extend(batch)
@@ -0,0 +1,124 @@
+"""Columnar receive: Columns conversions and ColumnReceiver takes."""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import icd_columns
+from support import wait_matched, wait_unread
+
+
+def _columns(samples):
+    indices = np.array([index for index, _ in samples], np.uint32)
+    offsets = np.zeros(len(samples) + 1, np.uint32)
+    offsets[1:] = np.cumsum([len(message) for _, message in samples])
+    data = np.frombuffer(b''.join(message for _, message in samples), np.uint8).copy()
+    return icd_columns.Columns(indices, offsets, data)
+
+
+def test_columns_messages_and_lengths():
+    columns = _columns([(1, b'a'), (2, b''), (3, b'hello')])
+    assert len(columns) == 3
+    assert [columns.message(i) for i in range(3)] == [b'a', b'', b'hello']
+    assert columns.lengths().tolist() == [1, 0, 5]
+
+
+def test_columns_to_structured_pads_and_cuts():
+    structured = _columns([(7, b'ab'), (8, b'abcdef')]).to_structured(4)
+    assert structured['index'].tolist() == [7, 8]
+    assert structured['message'].tolist() == [b'ab', b'abcd']
+
+
+def test_columns_copy_is_independent():
+    columns = _columns([(1, b'xy')])
+    copy = columns.copy()
+    columns.data[0] = ord('z')
+    assert copy.message(0) == b'xy'
+
+
+class _Reader(object):
+    """Asks for each length in needed in turn (as a reader whose next message
+    keeps changing would), then takes one sample of the last length."""
+
+    def __init__(self, *needed):
+        self.needed = list(needed)
+        self.buffer_lens = []
+
+    def take_batch_into(self, indices, data, offsets):
+        self.buffer_lens.append(len(data))
+        length = self.needed[0]
+        if len(self.needed) > 1 or length > len(data):
+            self.needed = self.needed[1:] or self.needed
+            offsets[1] = length
+            return -1
+        indices[0] = 9
+        offsets[0], offsets[1] = 0, length
+        data[:length] = ord('x')
+        return 1
+
+
+def test_receiver_grows_until_the_message_fits():
+    reader = _Reader(100, 300)
+    receiver = icd_columns.ColumnReceiver(reader, max_samples=4, buffer_len=64)
+    columns = receiver.take()
+    assert reader.buffer_lens == [64, 128, 300]
+    assert len(columns) == 1
+    assert (int(columns.indices[0]), columns.message(0)) == (9, b'x' * 300)
+
+
+def test_receiver_refuses_messages_beyond_the_arrow_offset_range():
+    receiver = icd_columns.ColumnReceiver(_Reader(icd_columns.MAX_BUFFER_LEN + 1), max_samples=4, buffer_len=64)
+    with pytest.raises(ValueError):
+        receiver.take()
+
+
+def _pair(participant, name):
+    writer = participant.create_writer(name, 'keep_all')
+    reader = participant.create_reader(name, 'keep_all')
+    assert wait_matched(writer)
+    return writer, reader
+
+
+def test_receiver_takes_up_to_max_samples(participant, topic):
+    writer, reader = _pair(participant, topic('Columns'))
+    sent = [(index, b'm%d' % index) for index in range(10)]
+    assert writer.write_batch(sent) == len(sent)
+    assert wait_unread(reader, len(sent))
+
+    receiver = icd_columns.ColumnReceiver(reader, max_samples=4, buffer_len=1024)
+    taken = []
+    while True:
+        columns = receiver.take()
+        assert len(columns) <= 4
+        if not len(columns):
+            break
+        taken.extend((int(columns.indices[i]), columns.message(i)) for i in range(len(columns)))
+    assert taken == sent
+
+
+def test_receiver_ends_batch_at_full_buffer(participant, topic):
+    writer, reader = _pair(participant, topic('ColumnsFull'))
+    sent = [(index, bytes([65 + index]) * 40) for index in range(4)]
+    assert writer.write_batch(sent) == len(sent)
+    assert wait_unread(reader, len(sent))
+
+    receiver = icd_columns.ColumnReceiver(reader, max_samples=16, buffer_len=100)
+    first = receiver.take()
+    assert len(first) == 2
+    assert [first.message(i) for i in range(2)] == [message for _, message in sent[:2]]
+    second = receiver.take()
+    assert [second.message(i) for i in range(len(second))] == [message for _, message in sent[2:]]
+
+
+def test_receiver_grows_for_a_message_longer_than_the_buffer(participant, topic):
+    writer, reader = _pair(participant, topic('ColumnsGrow'))
+    large = bytes(range(256)) * 64
+    assert writer.write_batch([(1, b'small'), (2, large)]) == 2
+    assert wait_unread(reader, 2)
+
+    receiver = icd_columns.ColumnReceiver(reader, max_samples=16, buffer_len=64)
+    first = receiver.take()
+    assert [(int(first.indices[0]), first.message(0))] == [(1, b'small')]
+    second = receiver.take()
+    assert len(second) == 1
+    assert (int(second.indices[0]), second.message(0)) == (2, large)
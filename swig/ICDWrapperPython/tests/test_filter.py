@@ -0,0 +1,61 @@
+"""Content-filtered readers through the Python API."""
+
+import pytest
+
+from support import wait_matched, wait_until
+
+
+def _take_until(reader, sentinel):
+    """Indices taken before the sentinel message; one reliable writer delivers in order."""
+    indices = []
+    done = []
+
+    def poll():
+        while not done:
+            sample = reader.take()
+            if sample is None:
+                break
+            if sample[1] == sentinel:
+                done.append(True)
+            else:
+                indices.append(sample[0])
+        return bool(done)
+
+    assert wait_until(poll)
+    return indices
+
+
+def test_filtered_reader_receives_matching_samples(participant, topic):
+    name = topic('Filter')
+    writer = participant.create_writer(name, 'keep_all')
+    reader = participant.create_filtered_reader(name, 'index BETWEEN %0 AND %1', ('3', '5'), 'keep_all')
+    assert wait_matched(writer)
+    assert writer.write_batch([(index, 'sample') for index in range(10)]) == 10
+    assert writer.write(4, 'end')
+    assert _take_until(reader, 'end') == [3, 4, 5]
+
+    reader.set_filter_parameters(('7', '8'))
+    assert writer.write_batch([(index, 'sample') for index in range(10)]) == 10
+    assert writer.write(8, 'end')
+    assert _take_until(reader, 'end') == [7, 8]
+
+
+def test_invalid_parameters_raise_and_keep_the_previous_ones(participant, topic):
+    name = topic('FilterInvalid')
+    writer = participant.create_writer(name, 'keep_all')
+    reader = participant.create_filtered_reader(name, 'message LIKE %0', ("'alarm/%'",), 'keep_all')
+    assert wait_matched(writer)
+    with pytest.raises(ValueError):
+        reader.set_filter_parameters(())
+    assert writer.write(1, 'alarm/fire')
+    assert writer.write(2, 'status/ok')
+    assert writer.write(3, 'alarm/end')
+    assert _take_until(reader, 'alarm/end') == [1]
+
+
+def test_invalid_expression_and_unfiltered_readers(participant, topic):
+    with pytest.raises(RuntimeError):
+        participant.create_filtered_reader(topic('FilterBad'), 'index BETWEEN')
+    reader = participant.create_reader(topic('FilterNone'))
+    with pytest.raises(TypeError):
+        reader.set_filter_parameters(('1',))
@@ -0,0 +1,29 @@
+"""
+The ICDWrapper front module: importing it does not load icd_native, and the
+first use of a name does. The generated type support (HelloWorldPubSubType,
+the type-object registration functions) is reachable through it as well.
+"""
+
+import os
+import subprocess
+import sys
+
+_HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    return subprocess.run([sys.executable, '-c', code], cwd=_HERE, capture_output=True, text=True)
+
+
+def test_import_does_not_load_the_native_module():
+    result = _run("import sys, ICDWrapper\n"
+                  "assert 'icd_native' not in sys.modules\n")
+    assert result.returncode == 0, result.stderr
+
+
+def test_type_support_loads_on_first_use(native):
+    result = _run("import sys, ICDWrapper\n"
+                  "ICDWrapper.HelloWorldPubSubType\n"
+                  "assert 'icd_native' in sys.modules\n"
+                  "assert callable(ICDWrapper.register_HelloWorld_type_identifier)\n")
+    assert result.returncode == 0, result.stderr
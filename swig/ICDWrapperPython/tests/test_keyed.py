@@ -0,0 +1,62 @@
+"""Keyed readers: per-index reads and LatestValueCache, which reads in place."""
+
+import pytest
+
+from support import take_all, wait_matched, wait_until
+
+LATEST = {'reliability': 'reliable', 'history_depth': 1}
+
+
+def _pair(participant, name, qos=LATEST):
+    writer = participant.create_keyed_writer(name, qos)
+    reader = participant.create_keyed_reader(name, qos)
+    assert wait_matched(writer)
+    return writer, reader
+
+
+def test_read_instance_returns_latest_value_without_taking(participant, topic):
+    writer, reader = _pair(participant, topic('KeyedRead'))
+    assert writer.write(1, 'first')
+    assert writer.write(2, 'other')
+    assert writer.write(1, 'second')
+    assert wait_until(lambda: reader.read_instance(1) == 'second')
+    assert reader.read_instance(2) == 'other'
+    assert reader.read_instance(2, raw=True) == b'other'
+    assert reader.read_instance(3) is None
+    assert reader.lookup_instance(1)
+    assert not reader.lookup_instance(3)
+    # Reading left both current values in the reader
+    assert sorted(take_all(reader)) == [(1, 'second'), (2, 'other')]
+
+
+def test_read_instance_returns_long_messages_in_full(participant, topic):
+    writer, reader = _pair(participant, topic('KeyedLong'))
+    large = 'v' * 5000
+    assert writer.write(4, large)
+    assert wait_until(lambda: reader.read_instance(4) == large)
+
+
+def test_latest_value_cache_reads_current_values(participant, topic, native):
+    writer, reader = _pair(participant, topic('KeyedCache'), dict(LATEST, max_instances=20000))
+    cache = native.LatestValueCache(reader)
+    assert cache.get(7) is None
+    assert cache.get(7, 'missing') == 'missing'
+    assert 7 not in cache
+    with pytest.raises(KeyError):
+        cache[7]
+
+    for index in range(100):
+        assert writer.write(index, 'v%d' % index)
+    assert writer.write(7, 'updated')
+    assert wait_until(lambda: cache.get(7) == 'updated' and 99 in cache)
+    assert cache[42] == 'v42'
+    # The cache takes nothing: the reader still holds one sample per index
+    assert len(take_all(reader)) == 100
+
+
+def test_latest_value_cache_needs_a_keyed_reader(participant, topic, native):
+    reader = participant.create_reader(topic('KeyedPlain'))
+    with pytest.raises(TypeError):
+        native.LatestValueCache(reader)
+    with pytest.raises(TypeError):
+        reader.read_instance(1)
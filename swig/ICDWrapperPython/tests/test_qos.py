@@ -0,0 +1,75 @@
+"""make_qos profiles and overrides, and QoS as seen by endpoints."""
+
+import time
+
+import pytest
+
+from support import take_all, wait_matched, wait_unread
+
+
+def test_profile_fields(native):
+    qos = native.make_qos('reliable')
+    assert qos.reliability == native.DDS_RELIABILITY_RELIABLE
+    assert qos.history_kind == native.DDS_HISTORY_KEEP_LAST
+    assert qos.history_depth == 100
+    # Fields a profile does not set keep the Fast DDS default
+    assert qos.durability == native.DDS_QOS_DEFAULT
+    assert qos.max_samples == native.DDS_QOS_DEFAULT
+
+
+def test_overrides_apply_on_top_of_profile(native):
+    qos = native.make_qos('best_effort', history_depth=8, durability='transient_local')
+    assert qos.reliability == native.DDS_RELIABILITY_BEST_EFFORT
+    assert qos.history_depth == 8
+    assert qos.durability == native.DDS_DURABILITY_TRANSIENT_LOCAL
+
+
+def test_dict_and_constants(native):
+    qos = native.make_qos({'reliability': native.DDS_RELIABILITY_RELIABLE, 'max_samples': -1})
+    assert qos.reliability == native.DDS_RELIABILITY_RELIABLE
+    assert qos.max_samples == native.DDS_LENGTH_UNLIMITED
+
+
+def test_defaults_and_passthrough(native):
+    qos = native.make_qos()
+    assert (qos.reliability, qos.durability, qos.history_kind, qos.history_depth) == (0, 0, 0, 0)
+    assert native.make_qos(qos) is qos
+    with pytest.raises(TypeError):
+        native.make_qos(qos, history_depth=1)
+
+
+def test_invalid_input(native):
+    with pytest.raises(ValueError):
+        native.make_qos('no_such_profile')
+    with pytest.raises(ValueError):
+        native.make_qos(reliability='sometimes')
+    with pytest.raises(TypeError):
+        native.make_qos(no_such_field=1)
+
+
+def test_transient_local_reaches_late_reader(participant, topic):
+    name = topic('QosLate')
+    writer = participant.create_writer(name, 'transient_local')
+    for index in range(5):
+        assert writer.write(index, 'early %d' % index)
+
+    late = participant.create_reader(name, 'transient_local')
+    volatile = participant.create_reader(name, 'reliable')
+    assert wait_matched(writer, 2)
+    assert wait_unread(late, 5)
+    assert [index for index, _ in take_all(late)] == [0, 1, 2, 3, 4]
+    time.sleep(0.1)
+    assert take_all(volatile) == []
+
+
+def test_keep_last_reader_keeps_newest(participant, topic):
+    name = topic('QosKeepLast')
+    writer = participant.create_writer(name, 'keep_all')
+    reader = participant.create_reader(name, {'reliability': 'reliable', 'history_kind': 'keep_last',
+                                              'history_depth': 2})
+    assert wait_matched(writer)
+    for index in range(5):
+        assert writer.write(index, 'sample')
+    assert wait_unread(reader, 2)
+    time.sleep(0.2)
+    assert [index for index, _ in take_all(reader)] == [3, 4]
@@ -0,0 +1,110 @@
+"""icd_record logs and replay; none of these need the native module."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import icd_record
+
+
+class _Writer(object):
+    """Takes at most accept[i] samples on its i-th write_batch call, then all of them."""
+
+    fixed = False
+
+    def __init__(self, *accept):
+        self.accept = list(accept)
+        self.samples = []
+
+    def write_batch(self, samples):
+        samples = list(samples)
+        count = self.accept.pop(0) if self.accept else len(samples)
+        self.samples.extend(samples[:count])
+        return min(count, len(samples))
+
+
+def _log(tmp_path, count):
+    path = str(tmp_path / 'log')
+    with icd_record.LogWriter(path, 'Replay') as log:
+        for index in range(count):
+            log.append_sample(1000 + index, index, 'm%d' % index)
+    return path
+
+
+def test_log_round_trip(tmp_path):
+    with icd_record.LogReader(_log(tmp_path, 5)) as log:
+        assert len(log) == 5
+        assert log.topic_name == 'Replay'
+        assert list(log.samples()) == [(1000 + i, i, 'm%d' % i) for i in range(5)]
+
+
+def _segmented_log(tmp_path, timestamps):
+    # 120-byte segments hold three records of these samples each
+    path = str(tmp_path / 'segmented')
+    with icd_record.LogWriter(path, 'Replay', segment_size=120) as log:
+        for index, timestamp in enumerate(timestamps):
+            log.append_sample(timestamp, index, 'm%d' % index)
+    return path
+
+
+def test_segments_roll_over(tmp_path):
+    path = _segmented_log(tmp_path, range(1000, 1008))
+    assert len([name for name in os.listdir(path) if name.endswith('.log')]) == 3
+    with icd_record.LogReader(path) as log:
+        assert [index for _, index, _ in log.samples()] == list(range(8))
+
+
+def test_seek_finds_equal_timestamps_across_a_segment_boundary(tmp_path):
+    # A batch polled at once shares one timestamp, here split between two segments
+    with icd_record.LogReader(_segmented_log(tmp_path, [1000, 1000, 2000, 2000, 2000, 2000])) as log:
+        assert [index for _, index, _ in log.samples(2000)] == [2, 3, 4, 5]
+        assert [index for _, index, _ in log.samples(1000, 1000)] == [0, 1]
+        assert [index for _, index, _ in log.samples(1500)] == [2, 3, 4, 5]
+        assert list(log.samples(2001)) == []
+
+
+def test_clock_stepping_back_keeps_the_log_sorted(tmp_path):
+    with icd_record.LogReader(_segmented_log(tmp_path, [1000, 3000, 2000, 4000])) as log:
+        assert [timestamp for timestamp, _, _ in log.samples()] == [1000, 3000, 3000, 4000]
+        assert [index for _, index, _ in log.samples(3000)] == [1, 2, 3]
+
+
+def test_records_missing_from_the_index_are_recovered(tmp_path):
+    path = _segmented_log(tmp_path, range(1000, 1008))
+    # A crash can leave the index torn or not written at all
+    with open(os.path.join(path, 'segment-000000.idx'), 'r+b') as index:
+        index.truncate(icd_record._INDEX.size + 5)
+    os.remove(os.path.join(path, 'segment-000002.idx'))
+    with icd_record.LogReader(path) as log:
+        assert len(log) == 8
+        assert [index for _, index, _ in log.samples(1001)] == list(range(1, 8))
+        assert [index for _, index, _ in log.samples(1007)] == [7]
+
+
+def test_replayer_retries_the_rest_of_a_partial_batch(tmp_path):
+    writer = _Writer(3, 0, 2)
+    with icd_record.LogReader(_log(tmp_path, 10)) as log:
+        assert icd_record.Replayer(log, writer, speed=0).run() == 10
+    assert writer.samples == [(i, b'm%d' % i) for i in range(10)]
+
+
+def test_replayer_raises_when_the_writer_stops_taking_samples(tmp_path):
+    writer = _Writer(4, *[0] * 1000)
+    with icd_record.LogReader(_log(tmp_path, 10)) as log:
+        with pytest.raises(RuntimeError):
+            icd_record.Replayer(log, writer, speed=0, retry_timeout=0.05).run()
+    assert len(writer.samples) == 4
+
+
+def test_info_does_not_load_the_native_module(tmp_path):
+    path = _log(tmp_path, 3)
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = ("import sys, icd_record\n"
+            "sys.argv = ['icd_record', 'info', %r]\n"
+            "icd_record.main()\n"
+            "assert 'icd_native' not in sys.modules\n" % path)
+    result = subprocess.run([sys.executable, '-c', code], cwd=here, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert 'records   3' in result.stdout
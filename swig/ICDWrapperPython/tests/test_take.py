@@ -0,0 +1,46 @@
+"""Takes built on loaned samples return whole messages of any size."""
+
+from support import take_all, wait_matched, wait_unread
+
+
+def _pair(participant, name):
+    writer = participant.create_writer(name, 'keep_all')
+    reader = participant.create_reader(name, 'keep_all')
+    assert wait_matched(writer)
+    return writer, reader
+
+
+def test_take_returns_full_messages(participant, topic):
+    writer, reader = _pair(participant, topic('TakeFull'))
+    large = 'x' * 100000
+    assert writer.write(1, large)
+    assert writer.write(2, 'café')
+    assert wait_unread(reader, 2)
+    assert reader.take() == (1, large)
+    assert reader.take() == (2, 'café')
+    assert reader.take() is None
+
+
+def test_take_bytes_keeps_raw_bytes(participant, topic):
+    writer, reader = _pair(participant, topic('TakeBytes'))
+    payload = bytes(range(1, 256)) * 8
+    assert writer.write_batch([(5, payload)]) == 1
+    assert wait_unread(reader, 1)
+    assert reader.take_bytes() == (5, payload)
+    assert reader.take_bytes() is None
+
+
+def test_take_batch_and_samples(participant, topic):
+    writer, reader = _pair(participant, topic('TakeBatch'))
+    sent = [(index, 'm%d' % index * (index + 1) * 100) for index in range(10)]
+    assert writer.write_batch(sent) == len(sent)
+    assert wait_unread(reader, len(sent))
+
+    first = reader.take_batch(4)
+    assert first == sent[:4]
+    samples = reader.take_samples(3)
+    assert [(sample.index, sample.message) for sample in samples] == sent[4:7]
+    index, message = samples[0]
+    assert (index, message) == sent[4]
+    assert take_all(reader) == sent[7:]
+